@@ -0,0 +1,41 @@
+"""add_measurement_log_time_indexes
+
+Revision ID: a4c6e8f0b2d4
+Revises: f3b5d7e9a1c3
+Create Date: 2026-10-18 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c6e8f0b2d4'
+down_revision: Union[str, Sequence[str], None] = 'f3b5d7e9a1c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_animal_weight_logs_animal_measured',
+        'animal_weight_logs',
+        ['animal_id', 'measured_at'],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_animal_bcs_logs_animal_measured',
+        'animal_bcs_logs',
+        ['animal_id', 'measured_at'],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_animal_bcs_logs_animal_measured', table_name='animal_bcs_logs', if_exists=True)
+    op.drop_index('ix_animal_weight_logs_animal_measured', table_name='animal_weight_logs', if_exists=True)
@@ -0,0 +1,220 @@
+"""partition_audit_and_login_logs
+
+Revision ID: a7c1e9d4f2b3
+Revises: ff73ab44632b
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c1e9d4f2b3'
+down_revision: Union[str, Sequence[str], None] = 'ff73ab44632b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+AUDIT_COLUMNS = (
+    "id, organization_id, actor_user_id, action, entity_type, entity_id, "
+    "before, after, ip, user_agent, created_at"
+)
+LOGIN_COLUMNS = "id, user_id, email, ip, user_agent, success, failure_reason, created_at"
+
+# Partitions are created from the oldest existing row up to 3 months ahead;
+# LogPartitionService keeps extending the range from then on.
+CREATE_MONTHLY_PARTITIONS = """
+DO $$
+DECLARE
+    m date := date_trunc('month', coalesce((SELECT min(created_at) FROM {legacy}), now()))::date;
+    stop date := (date_trunc('month', now()) + interval '3 months')::date;
+BEGIN
+    WHILE m <= stop LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+            '{table}_p' || to_char(m, 'YYYY_MM'),
+            m::timestamp AT TIME ZONE 'UTC',
+            (m + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+        );
+        m := (m + interval '1 month')::date;
+    END LOOP;
+END $$;
+"""
+
+
+def _rename_to_legacy(table: str) -> None:
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+    op.execute(
+        f"ALTER TABLE {table}_legacy RENAME CONSTRAINT {table}_pkey TO {table}_legacy_pkey"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # --- audit_logs -------------------------------------------------------
+    _rename_to_legacy('audit_logs')
+    op.execute(
+        """
+        CREATE TABLE audit_logs (
+            id UUID NOT NULL,
+            organization_id UUID NOT NULL
+                REFERENCES organizations (id) ON DELETE CASCADE,
+            actor_user_id UUID REFERENCES users (id) ON DELETE SET NULL,
+            action VARCHAR(50) NOT NULL,
+            entity_type VARCHAR(100) NOT NULL,
+            entity_id UUID NOT NULL,
+            before JSONB,
+            after JSONB,
+            ip VARCHAR(45),
+            user_agent TEXT,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT audit_logs_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute(
+        CREATE_MONTHLY_PARTITIONS.format(table='audit_logs', legacy='audit_logs_legacy')
+    )
+    op.execute(
+        f"INSERT INTO audit_logs ({AUDIT_COLUMNS}) "
+        f"SELECT {AUDIT_COLUMNS} FROM audit_logs_legacy"
+    )
+    op.drop_table('audit_logs_legacy')
+    op.create_index('ix_audit_logs_organization_id', 'audit_logs', ['organization_id'])
+    op.create_index('ix_audit_logs_actor_user_id', 'audit_logs', ['actor_user_id'])
+    op.create_index('ix_audit_logs_entity_type', 'audit_logs', ['entity_type'])
+    op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'])
+    # GDPR export: WHERE organization_id = ? AND created_at >= ? ORDER BY created_at
+    op.create_index(
+        'ix_audit_logs_org_created_at', 'audit_logs', ['organization_id', 'created_at']
+    )
+
+    # --- login_logs -------------------------------------------------------
+    _rename_to_legacy('login_logs')
+    op.execute(
+        """
+        CREATE TABLE login_logs (
+            id UUID NOT NULL,
+            user_id UUID REFERENCES users (id) ON DELETE SET NULL,
+            email VARCHAR(255) NOT NULL,
+            ip VARCHAR(50),
+            user_agent VARCHAR(500),
+            success BOOLEAN NOT NULL,
+            failure_reason VARCHAR(50),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT login_logs_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute(
+        CREATE_MONTHLY_PARTITIONS.format(table='login_logs', legacy='login_logs_legacy')
+    )
+    op.execute(
+        f"INSERT INTO login_logs ({LOGIN_COLUMNS}) "
+        f"SELECT {LOGIN_COLUMNS} FROM login_logs_legacy"
+    )
+    op.drop_table('login_logs_legacy')
+    op.create_index('ix_login_logs_user_id', 'login_logs', ['user_id'])
+    op.create_index('ix_login_logs_email', 'login_logs', ['email'])
+    op.create_index('ix_login_logs_created_at', 'login_logs', ['created_at'])
+    # Login-log view: WHERE user_id IN (...) AND created_at >= ? ORDER BY created_at
+    op.create_index(
+        'ix_login_logs_user_created_at', 'login_logs', ['user_id', 'created_at']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # --- login_logs -------------------------------------------------------
+    op.execute("ALTER TABLE login_logs RENAME TO login_logs_partitioned")
+    op.execute(
+        "ALTER TABLE login_logs_partitioned "
+        "RENAME CONSTRAINT login_logs_pkey TO login_logs_partitioned_pkey"
+    )
+    op.drop_index('ix_login_logs_user_created_at', table_name='login_logs_partitioned')
+    op.drop_index('ix_login_logs_created_at', table_name='login_logs_partitioned')
+    op.drop_index('ix_login_logs_email', table_name='login_logs_partitioned')
+    op.drop_index('ix_login_logs_user_id', table_name='login_logs_partitioned')
+    op.create_table(
+        'login_logs',
+        sa.Column('id', sa.UUID(), primary_key=True),
+        sa.Column(
+            'user_id',
+            sa.UUID(),
+            sa.ForeignKey('users.id', ondelete='SET NULL'),
+            nullable=True,
+        ),
+        sa.Column('email', sa.String(255), nullable=False),
+        sa.Column('ip', sa.String(50), nullable=True),
+        sa.Column('user_agent', sa.String(500), nullable=True),
+        sa.Column('success', sa.Boolean(), nullable=False),
+        sa.Column('failure_reason', sa.String(50), nullable=True),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+    )
+    op.execute(
+        f"INSERT INTO login_logs ({LOGIN_COLUMNS}) "
+        f"SELECT {LOGIN_COLUMNS} FROM login_logs_partitioned"
+    )
+    op.execute("DROP TABLE login_logs_partitioned CASCADE")
+    op.create_index('ix_login_logs_user_id', 'login_logs', ['user_id'])
+    op.create_index('ix_login_logs_email', 'login_logs', ['email'])
+    op.create_index('ix_login_logs_created_at', 'login_logs', ['created_at'])
+
+    # --- audit_logs -------------------------------------------------------
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned")
+    op.execute(
+        "ALTER TABLE audit_logs_partitioned "
+        "RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey"
+    )
+    op.drop_index('ix_audit_logs_org_created_at', table_name='audit_logs_partitioned')
+    op.drop_index('ix_audit_logs_created_at', table_name='audit_logs_partitioned')
+    op.drop_index('ix_audit_logs_entity_type', table_name='audit_logs_partitioned')
+    op.drop_index('ix_audit_logs_actor_user_id', table_name='audit_logs_partitioned')
+    op.drop_index('ix_audit_logs_organization_id', table_name='audit_logs_partitioned')
+    op.create_table(
+        'audit_logs',
+        sa.Column('id', sa.UUID(), primary_key=True),
+        sa.Column(
+            'organization_id',
+            sa.UUID(),
+            sa.ForeignKey('organizations.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column(
+            'actor_user_id',
+            sa.UUID(),
+            sa.ForeignKey('users.id', ondelete='SET NULL'),
+            nullable=True,
+        ),
+        sa.Column('action', sa.String(50), nullable=False),
+        sa.Column('entity_type', sa.String(100), nullable=False),
+        sa.Column('entity_id', sa.UUID(), nullable=False),
+        sa.Column('before', postgresql.JSONB(), nullable=True),
+        sa.Column('after', postgresql.JSONB(), nullable=True),
+        sa.Column('ip', sa.String(45), nullable=True),
+        sa.Column('user_agent', sa.Text(), nullable=True),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+    )
+    op.execute(
+        f"INSERT INTO audit_logs ({AUDIT_COLUMNS}) "
+        f"SELECT {AUDIT_COLUMNS} FROM audit_logs_partitioned"
+    )
+    op.execute("DROP TABLE audit_logs_partitioned CASCADE")
+    op.create_index('ix_audit_logs_organization_id', 'audit_logs', ['organization_id'])
+    op.create_index('ix_audit_logs_actor_user_id', 'audit_logs', ['actor_user_id'])
+    op.create_index('ix_audit_logs_entity_type', 'audit_logs', ['entity_type'])
+    op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'])
@@ -0,0 +1,49 @@
+"""add_animal_population_snapshots
+
+Revision ID: a8c0e2f4b6d8
+Revises: f7b9d1e3a5c7
+Create Date: 2026-10-18 18:00:00.000000
+
+History is filled by the census scheduler on startup (or
+scripts/backfill_population_census.py).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c0e2f4b6d8'
+down_revision: Union[str, Sequence[str], None] = 'f7b9d1e3a5c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'animal_population_snapshots',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('organization_id', sa.UUID(), nullable=False),
+        sa.Column('snapshot_date', sa.Date(), nullable=False),
+        sa.Column('species', sa.String(50), nullable=False),
+        sa.Column('status', sa.String(50), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'uq_animal_population_org_day_group',
+        'animal_population_snapshots',
+        ['organization_id', 'snapshot_date', 'species', 'status'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_animal_population_org_day_group', table_name='animal_population_snapshots')
+    op.drop_table('animal_population_snapshots')
@@ -0,0 +1,36 @@
+"""add_feeding_completed_index
+
+Revision ID: b3d5f7a9c1e2
+Revises: a7c1e9d4f2b3
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d5f7a9c1e2'
+down_revision: Union[str, Sequence[str], None] = 'a7c1e9d4f2b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Consumption reports scan completed feeding tasks of one org by period
+    op.create_index(
+        'ix_tasks_feeding_completed',
+        'tasks',
+        ['organization_id', 'completed_at'],
+        postgresql_where=sa.text(
+            "type = 'feeding' AND status = 'completed' AND deleted_at IS NULL"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_feeding_completed', table_name='tasks')
@@ -0,0 +1,86 @@
+"""add_animal_timeline_indexes
+
+Revision ID: b5d7f9a1c3e5
+Revises: a4c6e8f0b2d4
+Create Date: 2026-10-18 23:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d7f9a1c3e5'
+down_revision: Union[str, Sequence[str], None] = 'a4c6e8f0b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_kennel_stays_animal_start',
+        'kennel_stays',
+        ['animal_id', 'start_at'],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_animal_vaccinations_animal_administered',
+        'animal_vaccinations',
+        ['animal_id', 'administered_at'],
+        unique=False,
+        if_not_exists=True,
+    )
+    # Timeline events of dated rows are ordered by UTC midnight
+    op.create_index(
+        'ix_animal_incidents_animal_timeline',
+        'animal_incidents',
+        ['animal_id', sa.text("(timezone('UTC', incident_date::timestamp))")],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_intakes_animal_timeline',
+        'intakes',
+        ['animal_id', sa.text("(timezone('UTC', intake_date::timestamp))")],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_walk_logs_animal_ids',
+        'walk_logs',
+        ['animal_ids'],
+        unique=False,
+        postgresql_using='gin',
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_document_instances_animal_timeline',
+        'document_instances',
+        ['animal_id', sa.text("(timezone('UTC', created_at))")],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_tasks_animal_timeline',
+        'tasks',
+        ['animal_id', sa.text('(coalesce(completed_at, due_at, created_at))')],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_animal_timeline', table_name='tasks', if_exists=True)
+    op.drop_index('ix_document_instances_animal_timeline', table_name='document_instances', if_exists=True)
+    op.drop_index('ix_walk_logs_animal_ids', table_name='walk_logs', if_exists=True)
+    op.drop_index('ix_intakes_animal_timeline', table_name='intakes', if_exists=True)
+    op.drop_index('ix_animal_incidents_animal_timeline', table_name='animal_incidents', if_exists=True)
+    op.drop_index('ix_animal_vaccinations_animal_administered', table_name='animal_vaccinations', if_exists=True)
+    op.drop_index('ix_kennel_stays_animal_start', table_name='kennel_stays', if_exists=True)
@@ -0,0 +1,55 @@
+"""add_animal_status_counters
+
+Revision ID: b9d1f3a5c7e9
+Revises: a8c0e2f4b6d8
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9d1f3a5c7e9'
+down_revision: Union[str, Sequence[str], None] = 'a8c0e2f4b6d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'animal_status_counters',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('organization_id', sa.UUID(), nullable=False),
+        sa.Column('species', sa.String(50), nullable=False),
+        sa.Column('status', sa.String(50), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'uq_animal_status_counters_org_species_status',
+        'animal_status_counters',
+        ['organization_id', 'species', 'status'],
+        unique=True,
+    )
+    op.execute(
+        """
+        INSERT INTO animal_status_counters (id, organization_id, species, status, count)
+        SELECT gen_random_uuid(), organization_id, species, status, COUNT(*)
+        FROM animals
+        WHERE deleted_at IS NULL
+        GROUP BY organization_id, species, status
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_animal_status_counters_org_species_status', table_name='animal_status_counters')
+    op.drop_table('animal_status_counters')
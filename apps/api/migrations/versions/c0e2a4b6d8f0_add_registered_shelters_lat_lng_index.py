@@ -0,0 +1,33 @@
+"""add_registered_shelters_lat_lng_index
+
+Revision ID: c0e2a4b6d8f0
+Revises: b9d1f3a5c7e9
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0e2a4b6d8f0'
+down_revision: Union[str, Sequence[str], None] = 'b9d1f3a5c7e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_registered_shelters_lat_lng',
+        'registered_shelters',
+        ['lat', 'lng'],
+        postgresql_where=sa.text('lat IS NOT NULL AND lng IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_registered_shelters_lat_lng', table_name='registered_shelters')
@@ -0,0 +1,89 @@
+"""add_typed_feeding_task_columns
+
+Revision ID: c4e6a8b0d2f4
+Revises: b3d5f7a9c1e2
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e6a8b0d2f4'
+down_revision: Union[str, Sequence[str], None] = 'b3d5f7a9c1e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+UUID_RE = "'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'"
+FEEDING_WHERE = "type = 'feeding' AND deleted_at IS NULL"
+COMPLETED_FEEDING_WHERE = "type = 'feeding' AND status = 'completed' AND deleted_at IS NULL"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('feeding_plan_id', sa.UUID(), nullable=True))
+    op.add_column('tasks', sa.Column('animal_id', sa.UUID(), nullable=True))
+    op.add_column('tasks', sa.Column('scheduled_time', sa.Time(), nullable=True))
+    op.add_column('tasks', sa.Column('amount_g', sa.Numeric(8, 2), nullable=True))
+
+    # Backfill from task_metadata; malformed values are left NULL rather than
+    # failing the migration. animal_id falls back to related_entity_id the
+    # same way the consumption reports did.
+    op.execute(
+        f"""
+        UPDATE tasks SET
+            feeding_plan_id = CASE
+                WHEN task_metadata->>'feeding_plan_id' ~ {UUID_RE}
+                THEN (task_metadata->>'feeding_plan_id')::uuid END,
+            animal_id = CASE
+                WHEN task_metadata->>'animal_id' ~ {UUID_RE}
+                THEN (task_metadata->>'animal_id')::uuid
+                WHEN type = 'feeding' THEN related_entity_id END,
+            scheduled_time = CASE
+                WHEN task_metadata->>'scheduled_time' ~ '^([01]?[0-9]|2[0-3]):[0-5][0-9]$'
+                THEN (task_metadata->>'scheduled_time')::time END,
+            amount_g = CASE
+                WHEN task_metadata->>'amount_g' ~ '^-?[0-9]+(\\.[0-9]+)?$'
+                 AND abs((task_metadata->>'amount_g')::numeric) < 1000000
+                THEN round((task_metadata->>'amount_g')::numeric, 2) END
+        WHERE task_metadata IS NOT NULL OR type = 'feeding'
+        """
+    )
+
+    # The JSONB-expression unique index is replaced by one on the typed column
+    op.drop_index('uq_feeding_task_window', table_name='tasks')
+    op.create_index(
+        'uq_feeding_task_plan_due',
+        'tasks',
+        ['organization_id', 'feeding_plan_id', 'due_at'],
+        unique=True,
+        postgresql_where=sa.text(FEEDING_WHERE),
+    )
+    op.create_index(
+        'ix_tasks_feeding_animal_completed',
+        'tasks',
+        ['animal_id', 'completed_at'],
+        postgresql_where=sa.text(COMPLETED_FEEDING_WHERE),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_feeding_animal_completed', table_name='tasks')
+    op.drop_index('uq_feeding_task_plan_due', table_name='tasks')
+    op.create_index(
+        'uq_feeding_task_window',
+        'tasks',
+        ['organization_id', 'type', 'related_entity_id',
+         sa.text("(task_metadata->>'feeding_plan_id')"), 'due_at'],
+        unique=True,
+        postgresql_where=sa.text(FEEDING_WHERE),
+    )
+    op.drop_column('tasks', 'amount_g')
+    op.drop_column('tasks', 'scheduled_time')
+    op.drop_column('tasks', 'animal_id')
+    op.drop_column('tasks', 'feeding_plan_id')
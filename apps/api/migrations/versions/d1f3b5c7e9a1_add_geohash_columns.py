@@ -0,0 +1,114 @@
+"""add_geohash_columns
+
+Revision ID: d1f3b5c7e9a1
+Revises: c0e2a4b6d8f0
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f3b5c7e9a1'
+down_revision: Union[str, Sequence[str], None] = 'c0e2a4b6d8f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same bisection as map_cluster_service.encode_geohash (PostGIS is not enabled)
+GEOHASH_ENCODE_SQL = """
+CREATE OR REPLACE FUNCTION geohash_encode(lat double precision, lng double precision, "precision" integer)
+RETURNS text
+LANGUAGE plpgsql IMMUTABLE STRICT PARALLEL SAFE
+AS $$
+DECLARE
+    base32 CONSTANT text := '0123456789bcdefghjkmnpqrstuvwxyz';
+    lat_lo double precision := -90;
+    lat_hi double precision := 90;
+    lng_lo double precision := -180;
+    lng_hi double precision := 180;
+    mid double precision;
+    hash text := '';
+    bits integer := 0;
+    value integer := 0;
+    even boolean := true;
+BEGIN
+    WHILE length(hash) < "precision" LOOP
+        IF even THEN
+            mid := (lng_lo + lng_hi) / 2;
+            IF lng >= mid THEN
+                value := value * 2 + 1;
+                lng_lo := mid;
+            ELSE
+                value := value * 2;
+                lng_hi := mid;
+            END IF;
+        ELSE
+            mid := (lat_lo + lat_hi) / 2;
+            IF lat >= mid THEN
+                value := value * 2 + 1;
+                lat_lo := mid;
+            ELSE
+                value := value * 2;
+                lat_hi := mid;
+            END IF;
+        END IF;
+        even := NOT even;
+        bits := bits + 1;
+        IF bits = 5 THEN
+            hash := hash || substr(base32, value + 1, 1);
+            bits := 0;
+            value := 0;
+        END IF;
+    END LOOP;
+    RETURN hash;
+END;
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(GEOHASH_ENCODE_SQL)
+    op.add_column(
+        'registered_shelters',
+        sa.Column(
+            'geohash',
+            sa.String(length=12),
+            sa.Computed('geohash_encode(lat, lng, 12)', persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        'findings',
+        sa.Column(
+            'geohash',
+            sa.String(length=12),
+            sa.Computed('geohash_encode(where_lat, where_lng, 12)', persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_registered_shelters_geohash',
+        'registered_shelters',
+        ['geohash'],
+        postgresql_ops={'geohash': 'text_pattern_ops'},
+    )
+    op.create_index(
+        'ix_findings_org_geohash',
+        'findings',
+        ['organization_id', 'geohash'],
+        postgresql_ops={'geohash': 'text_pattern_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_findings_org_geohash', table_name='findings')
+    op.drop_index('ix_registered_shelters_geohash', table_name='registered_shelters')
+    op.drop_column('findings', 'geohash')
+    op.drop_column('registered_shelters', 'geohash')
+    op.execute('DROP FUNCTION IF EXISTS geohash_encode(double precision, double precision, integer)')
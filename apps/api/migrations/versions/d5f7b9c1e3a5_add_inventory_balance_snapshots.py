@@ -0,0 +1,147 @@
+"""add_inventory_balance_snapshots
+
+Revision ID: d5f7b9c1e3a5
+Revises: c4e6a8b0d2f4
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f7b9c1e3a5'
+down_revision: Union[str, Sequence[str], None] = 'c4e6a8b0d2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Per-transaction movement; the item balance mirrors record_transaction
+# (OUT subtracts, everything else adds).
+MOVES_CTE = """
+    moves AS (
+        SELECT
+            t.organization_id,
+            t.item_id,
+            t.lot_id,
+            (t.created_at AT TIME ZONE 'UTC')::date AS day,
+            CASE WHEN t.direction = 'in' THEN t.quantity ELSE 0 END AS q_in,
+            CASE WHEN t.direction = 'out' THEN t.quantity ELSE 0 END AS q_out,
+            CASE WHEN t.reason = 'consumption' THEN t.quantity ELSE 0 END AS consumed,
+            CASE WHEN t.reason = 'consumption'
+                 THEN t.quantity * COALESCE(l.cost_per_unit, i.price_per_unit, 0)
+                 ELSE 0 END AS consumed_cost,
+            CASE WHEN t.direction = 'out' THEN -t.quantity ELSE t.quantity END AS delta
+        FROM inventory_transactions t
+        JOIN inventory_items i ON i.id = t.item_id
+        LEFT JOIN inventory_lots l ON l.id = t.lot_id
+    )
+"""
+
+
+def _backfill(key: str, current_sql: str, join_sql: str) -> None:
+    """Insert one snapshot per ``key`` (item_id or lot_id) and day.
+
+    Closing balances are anchored to today's stock and walked backwards, so
+    the latest snapshot always matches quantity_current / lot.quantity.
+    """
+    lot_expr = "d.lot_id" if key == "lot_id" else "NULL"
+    group_by = "item_id, lot_id" if key == "lot_id" else "item_id"
+    op.execute(
+        f"""
+        WITH {MOVES_CTE},
+        days AS (
+            SELECT organization_id, {group_by}, day,
+                   SUM(q_in) AS q_in, SUM(q_out) AS q_out,
+                   SUM(consumed) AS consumed, SUM(consumed_cost) AS consumed_cost,
+                   SUM(delta) AS net
+            FROM moves
+            WHERE {key} IS NOT NULL
+            GROUP BY organization_id, {group_by}, day
+        )
+        INSERT INTO inventory_balance_snapshots (
+            id, organization_id, item_id, lot_id, snapshot_date,
+            quantity_in, quantity_out, consumed_quantity, consumed_cost,
+            closing_quantity, created_at, updated_at
+        )
+        SELECT
+            gen_random_uuid(), d.organization_id, d.item_id, {lot_expr}, d.day,
+            d.q_in, d.q_out, d.consumed, ROUND(d.consumed_cost, 2),
+            COALESCE({current_sql}, 0)
+                - (SUM(d.net) OVER w_all - SUM(d.net) OVER w_upto),
+            now(), now()
+        FROM days d
+        {join_sql}
+        WINDOW w_all AS (PARTITION BY d.{key}),
+               w_upto AS (PARTITION BY d.{key} ORDER BY d.day)
+        """
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'inventory_balance_snapshots',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('organization_id', sa.UUID(), nullable=False),
+        sa.Column('item_id', sa.UUID(), nullable=False),
+        sa.Column('lot_id', sa.UUID(), nullable=True),
+        sa.Column('snapshot_date', sa.Date(), nullable=False),
+        sa.Column('quantity_in', sa.Numeric(12, 2), nullable=False, server_default='0'),
+        sa.Column('quantity_out', sa.Numeric(12, 2), nullable=False, server_default='0'),
+        sa.Column('consumed_quantity', sa.Numeric(12, 2), nullable=False, server_default='0'),
+        sa.Column('consumed_cost', sa.Numeric(12, 2), nullable=False, server_default='0'),
+        sa.Column('closing_quantity', sa.Numeric(12, 2), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['item_id'], ['inventory_items.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['lot_id'], ['inventory_lots.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'uq_inventory_snapshot_item_day',
+        'inventory_balance_snapshots',
+        ['item_id', 'snapshot_date'],
+        unique=True,
+        postgresql_where=sa.text('lot_id IS NULL'),
+    )
+    op.create_index(
+        'uq_inventory_snapshot_lot_day',
+        'inventory_balance_snapshots',
+        ['lot_id', 'snapshot_date'],
+        unique=True,
+        postgresql_where=sa.text('lot_id IS NOT NULL'),
+    )
+    op.create_index(
+        'ix_inventory_snapshots_org_day',
+        'inventory_balance_snapshots',
+        ['organization_id', 'snapshot_date'],
+    )
+    op.create_index(
+        'ix_inventory_transactions_org_created',
+        'inventory_transactions',
+        ['organization_id', 'created_at'],
+    )
+
+    _backfill(
+        key='item_id',
+        current_sql='i.quantity_current',
+        join_sql='JOIN inventory_items i ON i.id = d.item_id',
+    )
+    _backfill(
+        key='lot_id',
+        current_sql='l.quantity',
+        join_sql='JOIN inventory_lots l ON l.id = d.lot_id',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_inventory_transactions_org_created', table_name='inventory_transactions')
+    op.drop_index('ix_inventory_snapshots_org_day', table_name='inventory_balance_snapshots')
+    op.drop_index('uq_inventory_snapshot_lot_day', table_name='inventory_balance_snapshots')
+    op.drop_index('uq_inventory_snapshot_item_day', table_name='inventory_balance_snapshots')
+    op.drop_table('inventory_balance_snapshots')
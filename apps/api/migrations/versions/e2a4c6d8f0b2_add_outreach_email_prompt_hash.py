@@ -0,0 +1,28 @@
+"""add_outreach_email_prompt_hash
+
+Revision ID: e2a4c6d8f0b2
+Revises: d1f3b5c7e9a1
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a4c6d8f0b2'
+down_revision: Union[str, Sequence[str], None] = 'd1f3b5c7e9a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('outreach_emails', sa.Column('prompt_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('outreach_emails', 'prompt_hash')
@@ -0,0 +1,43 @@
+"""add_vaccination_expiry_indexes
+
+Revision ID: e6a8c0d2f4b6
+Revises: d5f7b9c1e3a5
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a8c0d2f4b6'
+down_revision: Union[str, Sequence[str], None] = 'd5f7b9c1e3a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_animal_vaccinations_org_valid_until',
+        'animal_vaccinations',
+        ['organization_id', 'valid_until'],
+        postgresql_where=sa.text('valid_until IS NOT NULL'),
+    )
+    op.create_index(
+        'uq_tasks_vaccination_reminder',
+        'tasks',
+        [sa.text("(task_metadata ->> 'vaccination_id')")],
+        unique=True,
+        postgresql_where=sa.text(
+            "type = 'medical' AND deleted_at IS NULL AND task_metadata ? 'vaccination_id'"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_tasks_vaccination_reminder', table_name='tasks')
+    op.drop_index('ix_animal_vaccinations_org_valid_until', table_name='animal_vaccinations')
@@ -0,0 +1,49 @@
+"""add_persisted_legal_deadlines
+
+Revision ID: f7b9d1e3a5c7
+Revises: e6a8c0d2f4b6
+Create Date: 2026-10-18 17:00:00.000000
+
+Existing animals are filled by scripts/backfill_legal_deadlines.py (the
+deadline rules live in Python and depend on org settings).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b9d1e3a5c7'
+down_revision: Union[str, Sequence[str], None] = 'e6a8c0d2f4b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('animals', sa.Column('legal_deadline_at', sa.Date(), nullable=True))
+    op.add_column('animals', sa.Column('legal_deadline_type', sa.String(20), nullable=True))
+    op.add_column('animals', sa.Column('legal_deadline_state', sa.String(20), nullable=True))
+    op.add_column('animals', sa.Column('legal_deadline_label', sa.String(100), nullable=True))
+    op.add_column(
+        'animals',
+        sa.Column('legal_deadline_missing_fields', postgresql.JSONB(), nullable=True),
+    )
+    op.create_index(
+        'ix_animals_org_legal_deadline',
+        'animals',
+        ['organization_id', 'legal_deadline_state', 'legal_deadline_at'],
+        postgresql_where=sa.text('deleted_at IS NULL AND legal_deadline_state IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_animals_org_legal_deadline', table_name='animals')
+    op.drop_column('animals', 'legal_deadline_missing_fields')
+    op.drop_column('animals', 'legal_deadline_label')
+    op.drop_column('animals', 'legal_deadline_state')
+    op.drop_column('animals', 'legal_deadline_type')
+    op.drop_column('animals', 'legal_deadline_at')
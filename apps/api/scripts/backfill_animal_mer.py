@@ -8,7 +8,7 @@ import os
 import sys
 import asyncio
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 api_dir = os.path.dirname(script_dir)
@@ -16,6 +16,7 @@ sys.path.insert(0, api_dir)
 sys.path.insert(0, os.path.join(api_dir, "src"))
 
 from src.app.core.config import settings
+from src.app.services.mer_recompute_service import MerRecomputeService
 
 
 async def main():
@@ -51,50 +52,15 @@ async def main():
         else:
             print("✓ Column already exists")
 
-    # Step 2: Calculate and update MER values (separate connection)
-    async with engine.begin() as conn:
-        # Get all animals with weight
+    # Step 2: Recompute MER values, writing back only the changed ones
+    Session = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    async with Session() as db:
         print("\nCalculating MER for all animals...")
-
-        result = await conn.execute(
-            text("""
-            SELECT id, weight_current_kg, species, altered_status
-            FROM animals 
-            WHERE weight_current_kg IS NOT NULL 
-            AND deleted_at IS NULL
-        """)
-        )
-        animals = result.fetchall()
-
-        updated = 0
-        for animal in animals:
-            animal_id, weight, species, altered = animal
-
-            if not weight or weight <= 0:
-                continue
-
-            # Calculate RER = 70 × weight^0.75
-            rer = 70 * (float(weight) ** 0.75)
-
-            # Activity factor
-            if species == "cat":
-                activity_factor = 1.2
-            elif altered == "intact":
-                activity_factor = 1.8  # intact dog
-            else:
-                activity_factor = 1.4  # neutered
-
-            mer = int(rer * activity_factor)
-
-            # Update
-            await conn.execute(
-                text("UPDATE animals SET mer_kcal_per_day = :mer WHERE id = :id"),
-                {"mer": mer, "id": animal_id},
-            )
-            updated += 1
-
+        updated = await MerRecomputeService(db).recompute()
+        await db.commit()
         print(f"✓ Updated {updated} animals with MER values")
 
+    async with engine.begin() as conn:
         # Show sample
         result = await conn.execute(
             text("""
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Fill the persisted legal deadline (animals.legal_deadline_*) for every
+organization. Safe to re-run; only changed animals are written.
+Run: python scripts/backfill_legal_deadlines.py
+"""
+
+import asyncio
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+api_dir = os.path.dirname(script_dir)
+sys.path.insert(0, api_dir)
+
+from sqlalchemy import select
+
+from src.app.db.session import AsyncSessionLocal
+from src.app.models.organization import Organization
+from src.app.services.legal_deadline_service import LegalDeadlineService
+
+
+async def main():
+    async with AsyncSessionLocal() as db:
+        org_ids = (await db.execute(select(Organization.id))).scalars().all()
+        total = 0
+        for org_id in org_ids:
+            updated = await LegalDeadlineService(db).refresh(org_id)
+            await db.commit()
+            total += updated
+            if updated:
+                print(f"  {org_id}: {updated} animals")
+        print(f"Updated {total} animals in {len(org_ids)} organizations")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
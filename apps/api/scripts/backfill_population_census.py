@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Fill the daily animal population census (animal_population_snapshots) up to
+yesterday for every organization. Without --rebuild only days that are not
+closed yet are written; --rebuild recomputes the whole history (e.g. after
+back-dated intakes or outcomes were entered).
+Run: python scripts/backfill_population_census.py [--rebuild]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+api_dir = os.path.dirname(script_dir)
+sys.path.insert(0, api_dir)
+
+from src.app.db.session import AsyncSessionLocal
+from src.app.services.population_census_service import PopulationCensusService
+
+
+async def main(rebuild: bool):
+    async with AsyncSessionLocal() as db:
+        inserted = await PopulationCensusService(db).close_pending(rebuild=rebuild)
+        await db.commit()
+    print(f"Wrote {inserted} snapshot rows")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rebuild", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.rebuild))
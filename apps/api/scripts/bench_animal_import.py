@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark: onboarding import of existing animals.
+
+Generates --rows synthetic animals (mixed species, breeds from the catalog,
+colors, microchips on half of them) and creates them for the first
+organization:
+
+- one AnimalService.create_animal per row (what POST /animals does);
+- validation + COPY batches of the animal import job.
+
+Each path runs in a transaction that is rolled back at the end, so the
+database is left untouched.
+
+Run: python scripts/bench_animal_import.py [--rows 5000] [--legacy-rows 500]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+api_dir = os.path.dirname(script_dir)
+sys.path.insert(0, api_dir)
+
+from sqlalchemy import pool, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.app.core.config import settings
+from src.app.schemas.animal import AnimalCreate
+from src.app.services.animal_import_service import (
+    BATCH_SIZE,
+    AnimalImportService,
+    load_catalogs,
+    microchips_of,
+    validate_rows,
+)
+from src.app.services.animal_service import AnimalService
+
+COLORS = ["black", "white", "brown", "tabby", "black-white", None]
+
+
+async def _fixtures(db: AsyncSession):
+    org_id, user_id = (
+        await db.execute(
+            text("SELECT organization_id, user_id FROM memberships ORDER BY created_at LIMIT 1")
+        )
+    ).one()
+    breeds = (
+        await db.execute(text("SELECT species, name, id FROM breeds WHERE species IN ('dog', 'cat')"))
+    ).all()
+    return org_id, user_id, breeds
+
+
+def _rows(count: int, breeds) -> list[dict]:
+    rng = random.Random(42)
+    run = rng.randrange(10**6)
+    rows = []
+    for i in range(count):
+        species, breed, _ = rng.choice(breeds) if breeds else (rng.choice(["dog", "cat"]), "", None)
+        rows.append(
+            {
+                "name": f"Bench {i}",
+                "species": species,
+                "sex": rng.choice(["male", "female", "unknown"]),
+                "breed": breed,
+                "color": rng.choice(COLORS) or "",
+                "weight_kg": f"{rng.uniform(2, 40):.1f}",
+                "microchip": f"9{run:06d}{i:08d}" if i % 2 else "",
+            }
+        )
+    return rows
+
+
+async def _legacy(db: AsyncSession, org_id, user_id, rows, breed_ids) -> int:
+    svc = AnimalService(db)
+    for row in rows:
+        breed_id = breed_ids.get((row["species"], row["breed"]))
+        await svc.create_animal(
+            org_id,
+            AnimalCreate(
+                name=row["name"],
+                species=row["species"],
+                sex=row["sex"],
+                color=row["color"] or None,
+                weight_current_kg=row["weight_kg"],
+                breeds=[{"breed_id": breed_id}] if breed_id else [],
+                identifiers=[{"type": "microchip", "value": row["microchip"]}]
+                if row["microchip"]
+                else [],
+            ),
+            actor_id=user_id,
+        )
+    return len(rows)
+
+
+async def _import(db: AsyncSession, org_id, rows) -> tuple[int, int]:
+    catalogs = await load_catalogs(db, org_id, microchips_of(rows))
+    records, errors = validate_rows(rows, catalogs)
+    svc = AnimalImportService(db)
+    for start in range(0, len(records), BATCH_SIZE):
+        await svc.insert_batch(org_id, records[start : start + BATCH_SIZE])
+    return len(records), len(errors)
+
+
+async def run(count: int, legacy_count: int) -> None:
+    engine = create_async_engine(
+        settings.DATABASE_URL_ASYNC,
+        poolclass=pool.NullPool,
+        connect_args={"statement_cache_size": 0},
+    )
+    Session = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with Session() as db:
+        org_id, user_id, breeds = await _fixtures(db)
+    rows = _rows(count, breeds)
+    breed_ids = {(species, name): breed_id for species, name, breed_id in breeds}
+    print(f"=== Animal import benchmark ({count} rows) ===")
+
+    if legacy_count:
+        async with Session() as db:
+            start = time.perf_counter()
+            created = await _legacy(db, org_id, user_id, rows[:legacy_count], breed_ids)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{'create_animal per row':>22} | {elapsed:8.2f} s | {created} rows"
+                f" | ~{elapsed / created * count:.0f} s extrapolated to {count}"
+            )
+            await db.rollback()
+
+    async with Session() as db:
+        start = time.perf_counter()
+        inserted, failed = await _import(db, org_id, rows)
+        print(
+            f"{'validate + COPY':>22} | {time.perf_counter() - start:8.2f} s"
+            f" | {inserted} rows, {failed} errors"
+        )
+        await db.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument(
+        "--legacy-rows",
+        type=int,
+        default=500,
+        help="rows timed through create_animal (extrapolated; 0 to skip)",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.legacy_rows))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark: DB round trips for purchase-order receive and task completion,
+with immediate audit flushes vs. the deferred per-commit batch insert.
+
+Everything runs inside one transaction that is rolled back at the end, so the
+database is left untouched.
+
+Run: python scripts/bench_audit_batching.py [--items 10] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from decimal import Decimal
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+api_dir = os.path.dirname(script_dir)
+sys.path.insert(0, api_dir)
+
+from sqlalchemy import event, pool, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.app.core.config import settings
+from src.app.models.organization import Organization
+from src.app.models.user import User
+from src.app.models.inventory_item import InventoryItem, InventoryCategory
+from src.app.models.inventory_lot import InventoryLot
+from src.app.models.purchase_order import PurchaseOrderItem
+from src.app.models.task import Task, TaskStatus, TaskType, TaskPriority
+from src.app.schemas.purchase_order import (
+    PurchaseOrderCreate,
+    PurchaseOrderItemCreate,
+    ReceivePurchaseOrder,
+    ReceivePurchaseOrderItem,
+)
+from src.app.services.audit_service import AuditService
+from src.app.services.purchase_service import PurchaseService
+from src.app.services.task_service import TaskService
+
+
+class RoundTripCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+async def _seed(db: AsyncSession, n_items: int):
+    org = Organization(id=uuid.uuid4(), name="Bench Org", slug=f"bench-{uuid.uuid4().hex[:8]}")
+    user = User(
+        id=uuid.uuid4(),
+        email=f"bench-{uuid.uuid4().hex[:8]}@example.com",
+        password_hash="x",
+        name="Bench",
+    )
+    db.add_all([org, user])
+    await db.flush()
+
+    items = []
+    for i in range(n_items):
+        item = InventoryItem(
+            id=uuid.uuid4(),
+            organization_id=org.id,
+            name=f"Bench item {i}",
+            category=InventoryCategory.FOOD,
+            unit="kg",
+            quantity_current=Decimal("0"),
+        )
+        items.append(item)
+    db.add_all(items)
+    await db.flush()
+    return org, user, items
+
+
+async def _create_po(db, audit, org, user, items):
+    svc = PurchaseService(db, audit)
+    po = await svc.create_purchase_order(
+        org.id,
+        user.id,
+        PurchaseOrderCreate(
+            supplier_name="Bench supplier",
+            items=[
+                PurchaseOrderItemCreate(inventory_item_id=i.id, quantity_ordered=Decimal("10"))
+                for i in items
+            ],
+        ),
+    )
+    po_items = (
+        await db.execute(
+            select(PurchaseOrderItem).where(PurchaseOrderItem.purchase_order_id == po.id)
+        )
+    ).scalars().all()
+    return po, po_items
+
+
+async def run(n_items: int, repeat: int) -> None:
+    engine = create_async_engine(
+        settings.DATABASE_URL_ASYNC,
+        poolclass=pool.NullPool,
+        connect_args={"statement_cache_size": 0},
+    )
+    Session = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    counter = RoundTripCounter(engine)
+
+    results: dict[str, dict[str, list]] = {}
+
+    for mode, deferred in (("immediate", False), ("deferred", True)):
+        results[mode] = {"receive": [], "complete": []}
+        for _ in range(repeat):
+            async with Session() as db:
+                audit = AuditService(db, deferred=deferred)
+                org, user, items = await _seed(db, n_items)
+                po, po_items = await _create_po(db, audit, org, user, items)
+                for item in items:
+                    db.add(InventoryLot(
+                        id=uuid.uuid4(),
+                        organization_id=org.id,
+                        item_id=item.id,
+                        lot_number="BENCH",
+                        quantity=Decimal("0"),
+                    ))
+                task = Task(
+                    id=uuid.uuid4(),
+                    organization_id=org.id,
+                    title="Bench task",
+                    type=TaskType.GENERAL,
+                    priority=TaskPriority.MEDIUM,
+                    status=TaskStatus.PENDING,
+                    linked_inventory_item_id=items[0].id,
+                    task_metadata={"quantity_to_deduct_g": 500},
+                )
+                db.add(task)
+                await db.flush()
+                await audit.flush_pending()
+
+                # -- purchase-order receive --
+                start_count, start = counter.count, time.perf_counter()
+                await PurchaseService(db, audit).receive_purchase_order(
+                    po.id,
+                    org.id,
+                    user.id,
+                    ReceivePurchaseOrder(items=[
+                        ReceivePurchaseOrderItem(
+                            item_id=p.id, quantity_received=Decimal("10"), lot_number="BENCH"
+                        )
+                        for p in po_items
+                    ]),
+                )
+                await audit.flush_pending()  # what commit would write
+                results[mode]["receive"].append(
+                    (counter.count - start_count, time.perf_counter() - start)
+                )
+
+                # -- task completion with FIFO inventory deduction --
+                start_count, start = counter.count, time.perf_counter()
+                await TaskService(db, audit).complete_task(task.id, org.id, user.id)
+                await audit.flush_pending()
+                results[mode]["complete"].append(
+                    (counter.count - start_count, time.perf_counter() - start)
+                )
+
+                await db.rollback()
+
+    await engine.dispose()
+
+    print(f"=== Audit batching benchmark ({n_items} PO lines, {repeat} runs) ===")
+    for op in ("receive", "complete"):
+        for mode in ("immediate", "deferred"):
+            runs = results[mode][op]
+            queries = sum(r[0] for r in runs) / len(runs)
+            ms = sum(r[1] for r in runs) / len(runs) * 1000
+            print(f"{op:>9} | {mode:>9} | round trips={queries:6.1f} | {ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.repeat))
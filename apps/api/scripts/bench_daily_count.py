@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark: /animals/stats/daily-count over 10 years of intake history.
+
+Seeds one organization with N animals whose intakes are spread over the
+last --years years (stays of 5-180 days, a few still in the shelter), then
+times the previous generate_series x intakes query against the census
+backfill and the snapshot-based daily counts (PopulationCensusService).
+
+Everything runs inside one transaction that is rolled back at the end, so the
+database is left untouched.
+
+Run: python scripts/bench_daily_count.py [--animals 20000] [--years 10] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+api_dir = os.path.dirname(script_dir)
+sys.path.insert(0, api_dir)
+
+from sqlalchemy import insert, pool, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.app.core.config import settings
+from src.app.models.animal import Animal, AnimalStatus
+from src.app.models.intake import Intake, IntakeReason
+from src.app.models.organization import Organization
+from src.app.services.population_census_service import PopulationCensusService
+
+LEGACY_SQL = """
+    SELECT d.day, COUNT(DISTINCT a.id)::int AS count
+    FROM generate_series(
+        CURRENT_DATE - (:days - 1) * INTERVAL '1 day',
+        CURRENT_DATE,
+        '1 day'::interval
+    ) AS d(day)
+    JOIN intakes i ON i.organization_id = :org_id
+        AND i.deleted_at IS NULL
+        AND i.intake_date <= d.day
+    JOIN animals a ON a.id = i.animal_id
+        AND a.deleted_at IS NULL
+        AND (a.outcome_date IS NULL OR a.outcome_date > d.day)
+    GROUP BY d.day
+    ORDER BY d.day ASC
+"""
+
+
+async def _seed(db: AsyncSession, n_animals: int, years: int) -> Organization:
+    org = Organization(id=uuid.uuid4(), name="Bench Org", slug=f"bench-{uuid.uuid4().hex[:8]}")
+    db.add(org)
+    await db.flush()
+
+    rng = random.Random(42)
+    today = date.today()
+    span = years * 365
+    animals, intakes = [], []
+    for i in range(n_animals):
+        intake_date = today - timedelta(days=rng.randrange(span))
+        stay = rng.randint(5, 180)
+        outcome = intake_date + timedelta(days=stay)
+        still_here = outcome > today or rng.random() < 0.01
+        animal_id = uuid.uuid4()
+        animals.append(
+            {
+                "id": animal_id,
+                "organization_id": org.id,
+                "name": f"Bench animal {i}",
+                "species": "dog" if i % 2 else "cat",
+                "status": AnimalStatus.AVAILABLE if still_here else AnimalStatus.ADOPTED,
+                "outcome_date": None if still_here else outcome,
+            }
+        )
+        intakes.append(
+            {
+                "id": uuid.uuid4(),
+                "organization_id": org.id,
+                "animal_id": animal_id,
+                "reason": IntakeReason.FOUND,
+                "intake_date": intake_date,
+            }
+        )
+    await db.execute(insert(Animal), animals)
+    await db.execute(insert(Intake), intakes)
+    await db.execute(text("ANALYZE animals"))
+    await db.execute(text("ANALYZE intakes"))
+    return org
+
+
+async def run(n_animals: int, years: int, repeat: int) -> None:
+    engine = create_async_engine(
+        settings.DATABASE_URL_ASYNC,
+        poolclass=pool.NullPool,
+        connect_args={"statement_cache_size": 0},
+    )
+    Session = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with Session() as db:
+        start = time.perf_counter()
+        org = await _seed(db, n_animals, years)
+        print(f"Seeded {n_animals} animals over {years} years in {time.perf_counter() - start:.1f}s")
+
+        svc = PopulationCensusService(db)
+        start = time.perf_counter()
+        first_day = date.today() - timedelta(days=years * 365)
+        rows = await svc.close_days(org.id, first_day, date.today() - timedelta(days=1))
+        print(f"Census backfill: {rows} snapshot rows in {time.perf_counter() - start:.2f}s")
+
+        async def legacy(days: int):
+            result = await db.execute(text(LEGACY_SQL), {"org_id": str(org.id), "days": days})
+            return result.fetchall()
+
+        cases = {
+            "legacy 90 days": lambda: legacy(90),
+            "legacy 365 days": lambda: legacy(365),
+            "snapshots 90 days": lambda: svc.daily_counts(org.id, 90),
+            "snapshots 365 days": lambda: svc.daily_counts(org.id, 365),
+        }
+
+        print(f"=== Daily count benchmark ({n_animals} animals, {years} years, {repeat} runs) ===")
+        for name, fn in cases.items():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                await fn()
+                timings.append(time.perf_counter() - start)
+            print(f"{name:>20} | avg {sum(timings) / len(timings) * 1000:8.1f} ms"
+                  f" | min {min(timings) * 1000:8.1f} ms")
+
+        await db.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--animals", type=int, default=20000)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.animals, args.years, args.repeat))
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Benchmark: feeding consumption reports over a year of completed feeding tasks.
+
+Seeds one organization with N animals, a few food items and two completed
+feeding tasks per animal per day for 365 days, then times the SQL-aggregated
+reports (FeedingReportService) against the previous approach of loading
+every Task row and aggregating task_metadata in Python.
+
+Everything runs inside one transaction that is rolled back at the end, so the
+database is left untouched.
+
+Run: python scripts/bench_feeding_reports.py [--animals 300] [--days 365] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+api_dir = os.path.dirname(script_dir)
+sys.path.insert(0, api_dir)
+
+from sqlalchemy import pool, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.app.core.config import settings
+from src.app.models.animal import Animal
+from src.app.models.inventory_item import InventoryCategory, InventoryItem
+from src.app.models.organization import Organization
+from src.app.models.task import Task, TaskStatus, TaskType
+from src.app.services.feeding_report_service import FeedingReportService
+
+N_FOODS = 5
+
+
+async def _seed(db: AsyncSession, n_animals: int, days: int) -> Organization:
+    org = Organization(id=uuid.uuid4(), name="Bench Org", slug=f"bench-{uuid.uuid4().hex[:8]}")
+    db.add(org)
+    await db.flush()
+
+    animals = [
+        Animal(
+            id=uuid.uuid4(),
+            organization_id=org.id,
+            name=f"Bench animal {i}",
+            species="dog" if i % 2 else "cat",
+        )
+        for i in range(n_animals)
+    ]
+    foods = [
+        InventoryItem(
+            id=uuid.uuid4(),
+            organization_id=org.id,
+            name=f"Bench food {i}",
+            category=InventoryCategory.FOOD,
+            unit="kg",
+        )
+        for i in range(N_FOODS)
+    ]
+    db.add_all(animals + foods)
+    await db.flush()
+
+    # Two feedings per animal per day, food chosen round-robin
+    await db.execute(
+        text(
+            """
+            INSERT INTO tasks (id, organization_id, title, type, priority, status,
+                               completed_at, due_at, task_metadata,
+                               related_entity_type, related_entity_id,
+                               animal_id, amount_g)
+            SELECT gen_random_uuid(), :org_id, 'Krmení', 'feeding', 'medium', 'completed',
+                   now() - d * interval '1 day', now() - d * interval '1 day',
+                   jsonb_build_object(
+                       'amount_g', 150 + (d % 7) * 10,
+                       'animal_id', a.id::text,
+                       'inventory_item_id', (CAST(:food_ids AS text[]))[1 + (d + slot) % :n_foods]
+                   ),
+                   'animal', a.id,
+                   a.id, 150 + (d % 7) * 10
+            FROM animals a
+            CROSS JOIN generate_series(0, :days - 1) AS d
+            CROSS JOIN generate_series(0, 1) AS slot
+            WHERE a.organization_id = :org_id
+            """
+        ),
+        {
+            "org_id": org.id,
+            "days": days,
+            "n_foods": N_FOODS,
+            "food_ids": [str(f.id) for f in foods],
+        },
+    )
+    await db.execute(text("ANALYZE tasks"))
+    return org
+
+
+async def _legacy_report(db: AsyncSession, organization_id, since) -> int:
+    """The previous implementation: load all tasks, aggregate in Python,
+    then load Animal and InventoryItem rows for names."""
+    tasks = (
+        await db.execute(
+            select(Task).where(
+                Task.organization_id == organization_id,
+                Task.type == TaskType.FEEDING,
+                Task.status == TaskStatus.COMPLETED,
+                Task.completed_at >= since,
+                Task.deleted_at.is_(None),
+            )
+        )
+    ).scalars().all()
+    consumption: dict = {}
+    for task in tasks:
+        metadata = task.task_metadata or {}
+        animal_id = metadata.get("animal_id")
+        food_id = metadata.get("inventory_item_id")
+        amount = float(metadata.get("amount_g") or 0)
+        by_food = consumption.setdefault(animal_id, {})
+        by_food[food_id] = by_food.get(food_id, 0.0) + amount
+    await db.execute(select(Animal).where(Animal.id.in_([uuid.UUID(a) for a in consumption])))
+    food_ids = {f for foods in consumption.values() for f in foods if f}
+    await db.execute(
+        select(InventoryItem).where(InventoryItem.id.in_([uuid.UUID(f) for f in food_ids]))
+    )
+    db.expunge_all()
+    return len(consumption)
+
+
+async def run(n_animals: int, days: int, repeat: int) -> None:
+    engine = create_async_engine(
+        settings.DATABASE_URL_ASYNC,
+        poolclass=pool.NullPool,
+        connect_args={"statement_cache_size": 0},
+    )
+    Session = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with Session() as db:
+        start = time.perf_counter()
+        org = await _seed(db, n_animals, days)
+        print(f"Seeded {n_animals * days * 2} tasks in {time.perf_counter() - start:.1f}s")
+
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        svc = FeedingReportService(db)
+        first_animal_id = (
+            await db.execute(select(Animal.id).where(Animal.organization_id == org.id).limit(1))
+        ).scalar_one()
+        cases = {
+            "legacy report (ORM + Python)": lambda: _legacy_report(db, org.id, since),
+            "report": lambda: svc.consumption_report(org.id, since),
+            "by-species": lambda: svc.consumption_by_species(org.id, since),
+            "by-item": lambda: svc.consumption_by_item(org.id, since),
+            "history (1 animal)": lambda: svc.animal_history(
+                org.id, first_animal_id, since
+            ),
+        }
+
+        print(f"=== Feeding report benchmark ({n_animals} animals, {days} days, {repeat} runs) ===")
+        for name, fn in cases.items():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                await fn()
+                timings.append(time.perf_counter() - start)
+            print(f"{name:>30} | avg {sum(timings) / len(timings) * 1000:8.1f} ms"
+                  f" | min {min(timings) * 1000:8.1f} ms")
+
+        await db.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--animals", type=int, default=300)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.animals, args.days, args.repeat))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Load test: morning burst on the kennels board.
+
+Fires --burst concurrent identical calls (each with its own session, like
+separate requests) at the heavy kennels board reads of the first
+organization:
+
+- GET /animals/kennels-data
+- GET /kennels
+- GET /stays/timeline
+
+once with request coalescing disabled and once enabled, and reports the
+number of SQL statements executed and the wall time of each burst.
+
+Run: python scripts/bench_kennels_burst.py [--burst 20] [--rounds 3]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+api_dir = os.path.dirname(script_dir)
+sys.path.insert(0, api_dir)
+
+from sqlalchemy import event, pool, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.app.api.routes.animals import get_kennels_data
+from src.app.api.routes.kennels import list_kennels
+from src.app.api.routes.stays import get_stays_timeline
+from src.app.core.config import settings
+from src.app.core.single_flight import flights
+
+# Query parameters as FastAPI passes them (defaults)
+ENDPOINTS = {
+    "/animals/kennels-data": (
+        get_kennels_data,
+        "db",
+        dict(zone_id=None, status=None, type=None, size_category=None, q=None),
+    ),
+    "/kennels": (
+        list_kennels,
+        "session",
+        dict(zone_id=None, status=None, type=None, size_category=None, search=None),
+    ),
+    "/stays/timeline": (get_stays_timeline, "session", dict(from_date=None, to_date=None)),
+}
+
+
+async def _burst(Session, endpoint, session_param, params, org_id, count) -> None:
+    async def call():
+        async with Session() as db:
+            await endpoint(
+                **params, **{session_param: db}, current_user=None, organization_id=org_id
+            )
+
+    await asyncio.gather(*(call() for _ in range(count)))
+
+
+async def run(burst: int, rounds: int) -> None:
+    engine = create_async_engine(
+        settings.DATABASE_URL_ASYNC,
+        pool_size=burst,
+        max_overflow=0,
+        poolclass=pool.AsyncAdaptedQueuePool,
+        connect_args={"statement_cache_size": 0},
+    )
+    Session = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count(*args):
+        nonlocal statements
+        statements += 1
+
+    async with Session() as db:
+        org_id = (
+            await db.execute(
+                text("SELECT organization_id FROM memberships ORDER BY created_at LIMIT 1")
+            )
+        ).scalar_one()
+
+    print(f"=== Kennels board burst ({burst} concurrent requests, {rounds} rounds) ===")
+    for path, (endpoint, session_param, params) in ENDPOINTS.items():
+        for enabled in (False, True):
+            settings.REQUEST_COALESCING_ENABLED = enabled
+            statements = 0
+            start = time.perf_counter()
+            for _ in range(rounds):
+                await _burst(Session, endpoint, session_param, params, org_id, burst)
+            elapsed = (time.perf_counter() - start) / rounds
+            print(
+                f"{path:>22} | coalescing {'on ' if enabled else 'off'} | "
+                f"{statements / rounds:6.1f} queries/burst | {elapsed * 1000:8.1f} ms/burst"
+            )
+    print(f"flights: {flights.stats.leaders} run, {flights.stats.followers} shared")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--burst", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.burst, args.rounds))
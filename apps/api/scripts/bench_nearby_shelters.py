@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: /registered-shelters/nearby over N shelters.
+
+Seeds N shelters spread over the Czech Republic, then times the previous
+full-scan query, the bounding-box SQL query and the in-process KD-tree
+(ShelterGeoService) for random points and radii, and checks that all three
+return the same shelters in the same order with the same distances.
+
+Everything runs inside one transaction that is rolled back at the end, so the
+database is left untouched.
+
+Run: python scripts/bench_nearby_shelters.py [--shelters 5000] [--queries 200]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+api_dir = os.path.dirname(script_dir)
+sys.path.insert(0, api_dir)
+
+from sqlalchemy import pool, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.app.core.config import settings
+from src.app.services.shelter_geo_service import (
+    DISTANCE_SQL,
+    SHELTER_COLUMNS,
+    SPECIES_FILTERS,
+    ShelterGeoService,
+    invalidate_shelter_geo_index,
+)
+
+
+async def _seed(db: AsyncSession, n_shelters: int) -> None:
+    await db.execute(
+        text(
+            """
+            INSERT INTO registered_shelters
+                (id, registration_number, name, address, region, lat, lng,
+                 accepts_dogs, accepts_cats, imported_at, created_at, updated_at)
+            SELECT gen_random_uuid(), 'BENCH-' || g, 'Bench shelter ' || g, 'Address', 'Bench',
+                   48.5 + random() * 2.6, 12.0 + random() * 6.9,
+                   random() < 0.7, random() < 0.6, now(), now(), now()
+            FROM generate_series(1, :n) AS g
+            """
+        ),
+        {"n": n_shelters},
+    )
+    await db.execute(text("ANALYZE registered_shelters"))
+
+
+async def _legacy(db: AsyncSession, lat, lng, radius_km, species):
+    """The previous implementation: distance for every row."""
+    result = await db.execute(
+        text(f"""
+            SELECT {SHELTER_COLUMNS}, distance_km
+            FROM (
+                SELECT {SHELTER_COLUMNS}, {DISTANCE_SQL} AS distance_km
+                FROM registered_shelters
+                WHERE lat IS NOT NULL AND lng IS NOT NULL
+                {SPECIES_FILTERS.get(species, "")}
+            ) _dist
+            WHERE distance_km <= :radius
+            ORDER BY distance_km, id
+        """),
+        {"lat": lat, "lng": lng, "radius": radius_km},
+    )
+    return [dict(row._mapping) for row in result.all()]
+
+
+async def run(n_shelters: int, n_queries: int) -> None:
+    engine = create_async_engine(
+        settings.DATABASE_URL_ASYNC,
+        poolclass=pool.NullPool,
+        connect_args={"statement_cache_size": 0},
+    )
+    Session = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with Session() as db:
+        await _seed(db, n_shelters)
+        invalidate_shelter_geo_index()
+        svc = ShelterGeoService(db)
+        start = time.perf_counter()
+        await svc.nearby(50.0, 15.0, 1)
+        print(f"Seeded {n_shelters} shelters; index built in {time.perf_counter() - start:.2f}s")
+
+        rng = random.Random(42)
+        queries = [
+            (
+                rng.uniform(48.5, 51.1),
+                rng.uniform(12.0, 18.9),
+                rng.choice([5, 25, 50]),
+                rng.choice([None, "dog", "cat"]),
+            )
+            for _ in range(n_queries)
+        ]
+        cases = {
+            "legacy full scan": lambda q: _legacy(db, *q),
+            "SQL bounding box": lambda q: svc.nearby_sql(*q),
+            "KD-tree": lambda q: svc.nearby(*q),
+        }
+
+        print(f"=== Nearby shelters benchmark ({n_shelters} shelters, {n_queries} queries) ===")
+        results = {}
+        for name, fn in cases.items():
+            start = time.perf_counter()
+            results[name] = [await fn(q) for q in queries]
+            elapsed = time.perf_counter() - start
+            print(f"{name:>18} | avg {elapsed / n_queries * 1000:8.2f} ms/query")
+
+        expected = results["legacy full scan"]
+        for name, rows in results.items():
+            assert rows == expected, f"{name} differs from the full scan"
+        print("All paths returned identical results")
+
+        await db.rollback()
+        invalidate_shelter_geo_index()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shelters", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.shelters, args.queries))
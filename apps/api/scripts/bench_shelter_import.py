@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: registered shelters CSV import.
+
+Imports the bundled utulky.csv (repeated --copies times with distinct
+registration numbers, to simulate a larger registry) with the previous
+row-by-row upsert and with the COPY-based ShelterImportService, then imports
+it again to time a refresh where nothing changed.
+
+Everything runs inside one transaction per path that is rolled back at the
+end, so the database is left untouched.
+
+Run: python scripts/bench_shelter_import.py [--csv ../../utulky.csv] [--copies 10]
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import sys
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+api_dir = os.path.dirname(script_dir)
+sys.path.insert(0, api_dir)
+
+from sqlalchemy import pool, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.app.core.config import settings
+from src.app.services.shelter_import_service import ShelterImportService, parse_rows
+
+LEGACY_SQL = """
+    INSERT INTO registered_shelters
+    (id, registration_number, name, address, region, activity_type, capacity, lat, lng, registration_date, imported_at, created_at, updated_at)
+    VALUES
+    (gen_random_uuid(), :reg_number, :name, :address, :region, :activity_type, :capacity, :lat, :lng, :reg_date, NOW(), NOW(), NOW())
+    ON CONFLICT (registration_number) DO UPDATE SET
+        name = EXCLUDED.name,
+        address = EXCLUDED.address,
+        region = EXCLUDED.region,
+        activity_type = EXCLUDED.activity_type,
+        capacity = EXCLUDED.capacity,
+        lat = EXCLUDED.lat,
+        lng = EXCLUDED.lng,
+        registration_date = EXCLUDED.registration_date,
+        imported_at = NOW(),
+        updated_at = NOW()
+"""
+
+
+def _load_rows(path: str, copies: int) -> list[dict]:
+    with open(path, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    expanded = []
+    for copy in range(copies):
+        for row in rows:
+            row = dict(row)
+            # Registration numbers are varchar(20); keep the suffix short
+            row["registrační číslo"] = f"B{copy:03d}-{row['registrační číslo']}"[:20]
+            expanded.append(row)
+    return expanded
+
+
+async def _legacy(db: AsyncSession, rows: list[dict]) -> int:
+    """The previous implementation: one upsert per row."""
+    count = 0
+    for record in parse_rows(rows, []):
+        _, reg_number, name, address, region, activity_type, capacity, lat, lng, reg_date = record
+        await db.execute(
+            text(LEGACY_SQL),
+            {
+                "reg_number": reg_number,
+                "name": name,
+                "address": address,
+                "region": region,
+                "activity_type": activity_type,
+                "capacity": capacity,
+                "lat": lat,
+                "lng": lng,
+                "reg_date": reg_date,
+            },
+        )
+        count += 1
+    return count
+
+
+async def run(csv_path: str, copies: int) -> None:
+    engine = create_async_engine(
+        settings.DATABASE_URL_ASYNC,
+        poolclass=pool.NullPool,
+        connect_args={"statement_cache_size": 0},
+    )
+    Session = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    rows = _load_rows(csv_path, copies)
+    print(f"=== Shelter import benchmark ({len(rows)} rows) ===")
+
+    async with Session() as db:
+        start = time.perf_counter()
+        count = await _legacy(db, rows)
+        print(f"{'legacy row-by-row':>20} | {time.perf_counter() - start:8.2f} s | {count} rows")
+        await db.rollback()
+
+    async with Session() as db:
+        svc = ShelterImportService(db)
+        for name in ("COPY + merge", "COPY + merge again"):
+            start = time.perf_counter()
+            summary = await svc.import_rows(rows)
+            print(
+                f"{name:>20} | {time.perf_counter() - start:8.2f} s"
+                f" | inserted {summary['inserted']}, updated {summary['updated']},"
+                f" unchanged {summary['unchanged']}"
+            )
+        await db.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--csv", default=os.path.join(api_dir, "..", "..", "utulky.csv"))
+    parser.add_argument("--copies", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.csv, args.copies))
@@ -7,6 +7,16 @@ Usage:
     python scripts/enrich_registered_shelters.py --limit 20
     python scripts/enrich_registered_shelters.py --only-search
     python scripts/enrich_registered_shelters.py --only-scrape
+    python scripts/enrich_registered_shelters.py --concurrency 16 --rate 0.5
+    python scripts/enrich_registered_shelters.py --fresh      # ignore the checkpoint
+
+Shelters are processed by a pool of --concurrency workers. Requests are
+rate-limited per host (--rate requests/second), so a slow or strict site
+only throttles the shelters that use it. Pages are cached in
+logs/page_cache with their ETag/Last-Modified and revalidated with a
+conditional GET on the next run. Each result is committed as soon as it is
+known and recorded in logs/enrich_checkpoint.json, so an interrupted run
+resumes with the shelters it had not finished.
 
 Search providers (auto-detected from env):
     - SERPAPI_KEY set  → SerpAPI
@@ -17,13 +27,14 @@ Search providers (auto-detected from env):
 import argparse
 import asyncio
 import io
+import json
 import logging
 import os
 import re
 import sys
 import time
 from datetime import datetime, timezone
-from urllib.parse import urljoin, urlparse
+from urllib.parse import unquote, urljoin, urlparse
 
 # Force UTF-8 output on Windows (console is cp1250 by default)
 if sys.stdout.encoding and sys.stdout.encoding.lower() != "utf-8":
@@ -38,13 +49,20 @@ sys.path.insert(0, os.path.join(api_dir, "src"))
 
 from src.app.core.config import settings
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 import phonenumbers
 from phonenumbers import PhoneNumberFormat
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.app.services.web_crawler import (
+    AsyncCrawler,
+    Checkpoint,
+    HostRateLimiter,
+    PageCache,
+    run_pool,
+)
 
 # ─── Logging setup ────────────────────────────────────────────────────────────
 
@@ -65,9 +83,12 @@ log = logging.getLogger(__name__)
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 HTTP_TIMEOUT = 10
-RATE_LIMIT_SLEEP = 5  # seconds between shelters
-RETRY_ATTEMPTS = 3
-RETRY_BACKOFF = [2, 4, 8]
+CONCURRENCY = 8  # shelters in flight
+HOST_RATE = 0.5  # requests per second to any one host
+HOST_BURST = 2
+PAGE_MAX_AGE = 24 * 3600  # cached pages younger than this are not re-requested
+CACHE_DIR = os.path.join(api_dir, "logs", "page_cache")
+CHECKPOINT_FILE = os.path.join(api_dir, "logs", "enrich_checkpoint.json")
 
 # Catalog/directory domains to filter out — not official shelter sites
 CATALOG_DOMAINS = {
@@ -98,98 +119,98 @@ PHONE_REGEX = re.compile(
 
 # ─── HTTP helpers ─────────────────────────────────────────────────────────────
 
-def _session() -> requests.Session:
-    s = requests.Session()
-    s.headers.update({"User-Agent": USER_AGENT})
-    return s
+def make_crawler(
+    client: httpx.AsyncClient,
+    rate: float = HOST_RATE,
+    cache_dir: str | None = CACHE_DIR,
+) -> AsyncCrawler:
+    return AsyncCrawler(
+        client,
+        HostRateLimiter(rate, HOST_BURST),
+        cache=PageCache(cache_dir) if cache_dir else None,
+        max_age=PAGE_MAX_AGE,
+    )
 
 
-def fetch_with_retry(url: str, session: requests.Session | None = None) -> requests.Response | None:
-    """Fetch URL with retry + exponential backoff. Returns None on failure."""
-    s = session or _session()
-    for attempt, backoff in enumerate(RETRY_BACKOFF, start=1):
-        try:
-            resp = s.get(url, timeout=HTTP_TIMEOUT, allow_redirects=True)
-            resp.raise_for_status()
-            return resp
-        except requests.exceptions.RequestException as exc:
-            if attempt < RETRY_ATTEMPTS:
-                log.debug("Attempt %d failed for %s: %s — retrying in %ds", attempt, url, exc, backoff)
-                time.sleep(backoff)
-            else:
-                log.debug("All %d attempts failed for %s: %s", RETRY_ATTEMPTS, url, exc)
-    return None
+def _client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        timeout=HTTP_TIMEOUT,
+        limits=httpx.Limits(max_connections=CONCURRENCY * 4),
+    )
 
 
 # ─── Search providers ─────────────────────────────────────────────────────────
 
-def search_serpapi(query: str, serpapi_key: str) -> list[str]:
+async def search_serpapi(crawler: AsyncCrawler, query: str, serpapi_key: str) -> list[str]:
     """Return top result URLs via SerpAPI."""
     try:
-        resp = requests.get(
+        page = await crawler.fetch(
             "https://serpapi.com/search",
             params={"q": query, "api_key": serpapi_key, "num": 5, "hl": "cs", "gl": "cz"},
-            timeout=HTTP_TIMEOUT,
+            use_cache=False,
         )
-        data = resp.json()
+        data = json.loads(page.text) if page else {}
         return [r["link"] for r in data.get("organic_results", [])[:5]]
     except Exception as exc:
         log.warning("SerpAPI error: %s", exc)
         return []
 
 
-def search_bing(query: str, bing_key: str) -> list[str]:
+async def search_bing(crawler: AsyncCrawler, query: str, bing_key: str) -> list[str]:
     """Return top result URLs via Bing Search API."""
     try:
-        resp = requests.get(
+        page = await crawler.fetch(
             "https://api.bing.microsoft.com/v7.0/search",
-            headers={"Ocp-Apim-Subscription-Key": bing_key},
             params={"q": query, "count": 5, "mkt": "cs-CZ"},
-            timeout=HTTP_TIMEOUT,
+            headers={"Ocp-Apim-Subscription-Key": bing_key},
+            use_cache=False,
         )
-        data = resp.json()
+        data = json.loads(page.text) if page else {}
         return [r["url"] for r in data.get("webPages", {}).get("value", [])[:5]]
     except Exception as exc:
         log.warning("Bing API error: %s", exc)
         return []
 
 
-def search_duckduckgo(query: str) -> list[str]:
-    """Return top result URLs by scraping DuckDuckGo HTML (no key needed)."""
-    from urllib.parse import unquote
-    try:
-        resp = requests.get(
-            "https://html.duckduckgo.com/html/",
-            params={"q": query},
-            headers={"User-Agent": USER_AGENT, "Accept-Language": "cs,en;q=0.9"},
-            timeout=HTTP_TIMEOUT,
-        )
-        soup = BeautifulSoup(resp.text, "html.parser")
-        urls = []
-
-        # DDG HTML: result links are <a class="result__a"> with redirect href containing uddg= param
-        for a in soup.select("a.result__a"):
-            href = a.get("href", "")
-            if href.startswith("http") and "duckduckgo.com" not in href:
-                urls.append(href)
-            elif "uddg=" in href:
+def _ddg_result_urls(html: str) -> list[str]:
+    soup = BeautifulSoup(html, "html.parser")
+    urls = []
+
+    # DDG HTML: result links are <a class="result__a"> with redirect href containing uddg= param
+    for a in soup.select("a.result__a"):
+        href = a.get("href", "")
+        if href.startswith("http") and "duckduckgo.com" not in href:
+            urls.append(href)
+        elif "uddg=" in href:
+            m = re.search(r"uddg=([^&]+)", href)
+            if m:
+                real = unquote(m.group(1))
+                if real.startswith("http"):
+                    urls.append(real)
+
+    # Fallback: any link with uddg param
+    if not urls:
+        for a in soup.find_all("a", href=True):
+            href = a["href"]
+            if "uddg=" in href:
                 m = re.search(r"uddg=([^&]+)", href)
                 if m:
                     real = unquote(m.group(1))
                     if real.startswith("http"):
                         urls.append(real)
+    return urls
 
-        # Fallback: any link with uddg param
-        if not urls:
-            for a in soup.find_all("a", href=True):
-                href = a["href"]
-                if "uddg=" in href:
-                    m = re.search(r"uddg=([^&]+)", href)
-                    if m:
-                        real = unquote(m.group(1))
-                        if real.startswith("http"):
-                            urls.append(real)
 
+async def search_duckduckgo(crawler: AsyncCrawler, query: str) -> list[str]:
+    """Return top result URLs by scraping DuckDuckGo HTML (no key needed)."""
+    try:
+        page = await crawler.fetch(
+            "https://html.duckduckgo.com/html/",
+            params={"q": query},
+            headers={"Accept-Language": "cs,en;q=0.9"},
+        )
+        urls = _ddg_result_urls(page.text) if page else []
         log.debug("DDG returned %d URLs for: %s", len(urls), query)
         return urls[:5]
     except Exception as exc:
@@ -197,19 +218,19 @@ def search_duckduckgo(query: str) -> list[str]:
         return []
 
 
-def web_search(query: str) -> list[str]:
+async def web_search(crawler: AsyncCrawler, query: str) -> list[str]:
     """Search using best available provider."""
     serpapi_key = os.environ.get("SERPAPI_KEY", "")
     bing_key = os.environ.get("BING_SEARCH_KEY", "")
     if serpapi_key:
         log.debug("Using SerpAPI")
-        return search_serpapi(query, serpapi_key)
+        return await search_serpapi(crawler, query, serpapi_key)
     elif bing_key:
         log.debug("Using Bing")
-        return search_bing(query, bing_key)
+        return await search_bing(crawler, query, bing_key)
     else:
         log.debug("Using DuckDuckGo")
-        return search_duckduckgo(query)
+        return await search_duckduckgo(crawler, query)
 
 
 # ─── Scoring helpers ──────────────────────────────────────────────────────────
@@ -320,9 +341,119 @@ def _normalize_phone(raw: str) -> str | None:
 
 # ─── Phase 1: Website search ──────────────────────────────────────────────────
 
+async def _execute(engine: AsyncEngine, sql: str, params: dict) -> None:
+    """Run one update in its own transaction, so finished shelters survive
+    an interrupted run."""
+    async with engine.begin() as conn:
+        await conn.execute(text(sql), params)
+
+
+async def search_shelter_website(
+    crawler: AsyncCrawler,
+    engine: AsyncEngine,
+    shelter_id,
+    name: str,
+    address: str | None,
+    stats: dict,
+) -> None:
+    city = _extract_city(address or "")
+    search_query = f'"{name}" {city} útulek zvířata web'
+    log.info("Searching: %s (%s)", name, city)
+
+    candidate_urls = await web_search(crawler, search_query)
+    pages = await asyncio.gather(*(crawler.fetch(url) for url in candidate_urls))
+
+    best_url = None
+    best_score = 0.0
+    catalog_urls: list[tuple[str, str]] = []  # (url, html) for phone fallback
+
+    for url, page in zip(candidate_urls, pages):
+        if not page:
+            continue
+
+        html = page.text
+
+        if is_catalog_domain(url):
+            # Keep catalog pages as phone fallback if they mention the shelter
+            score = score_candidate(url, html, name, city)
+            if score >= 0.3:
+                catalog_urls.append((url, html))
+            log.debug("  Catalog (score=%.2f): %s", score, url)
+            continue
+
+        score = score_candidate(url, html, name, city)
+        log.debug("  Score %.2f: %s", score, url)
+
+        if score > best_score:
+            best_score = score
+            best_url = url
+
+    if best_url and best_score >= 0.3:
+        log.info("  -> Website found for %s (score=%.2f): %s", name, best_score, best_url)
+        await _execute(
+            engine,
+            """
+                UPDATE registered_shelters
+                SET website = :url,
+                    search_confidence = :confidence,
+                    scrape_status = 'website_found'
+                WHERE id = :id
+            """,
+            {"url": best_url, "confidence": best_score, "id": shelter_id},
+        )
+        stats["website_found"] += 1
+        return
+
+    # No official website — try to extract phone from catalog results
+    phone_found = None
+    phone_source_url = None
+    for cat_url, cat_html in catalog_urls:
+        phones = extract_phones_from_html(cat_html, cat_url)
+        if phones:
+            phone_found = phones[0]
+            phone_source_url = cat_url
+            break
+
+    if phone_found:
+        log.info("  -> %s: no web, but phone found from catalog: %s (%s)", name, phone_found, phone_source_url)
+        await _execute(
+            engine,
+            """
+                UPDATE registered_shelters
+                SET phone = :phone,
+                    phone_source = :source,
+                    scrape_status = 'phone_from_catalog',
+                    last_checked = :now
+                WHERE id = :id
+            """,
+            {
+                "phone": phone_found,
+                "source": phone_source_url,
+                "now": datetime.now(timezone.utc),
+                "id": shelter_id,
+            },
+        )
+        stats["phone_from_catalog"] += 1
+    else:
+        log.info("  -> %s: no website, no phone found", name)
+        await _execute(
+            engine,
+            """
+                UPDATE registered_shelters
+                SET scrape_status = 'website_not_found'
+                WHERE id = :id
+            """,
+            {"id": shelter_id},
+        )
+        stats["website_not_found"] += 1
+
+
 async def phase1_search_websites(
-    conn,
+    engine: AsyncEngine,
+    crawler: AsyncCrawler,
+    checkpoint: Checkpoint,
     limit: int | None,
+    concurrency: int,
     stats: dict,
 ) -> None:
     """Find official websites for shelters that don't have one yet."""
@@ -334,114 +465,97 @@ async def phase1_search_websites(
         WHERE website IS NULL AND scrape_status IS NULL
         ORDER BY name
     """
-    if limit:
-        query += f" LIMIT {limit}"
-
-    result = await conn.execute(text(query))
-    rows = result.fetchall()
+    async with engine.connect() as conn:
+        rows = (await conn.execute(text(query))).fetchall()
+    done = checkpoint.done("search")
+    rows = [row for row in rows if str(row[0]) not in done][:limit]
     log.info("Found %d shelters to search", len(rows))
 
-    session = _session()
-
-    now = datetime.now(timezone.utc)
-
-    for shelter_id, name, address in rows:
+    async def worker(row) -> None:
+        shelter_id, name, address = row
         stats["processed"] += 1
-        city = _extract_city(address or "")
-        search_query = f'"{name}" {city} útulek zvířata web'
-        log.info("[%d/%d] Searching: %s (%s)", stats["processed"], len(rows), name, city)
-
         try:
-            candidate_urls = await asyncio.to_thread(web_search, search_query)
-
-            best_url = None
-            best_score = 0.0
-            catalog_urls: list[tuple[str, str]] = []  # (url, html) for phone fallback
-
-            for url in candidate_urls:
-                resp = await asyncio.to_thread(fetch_with_retry, url, session)
-                if not resp:
-                    continue
-
-                html = resp.text
-
-                if is_catalog_domain(url):
-                    # Keep catalog pages as phone fallback if they mention the shelter
-                    score = score_candidate(url, html, name, city)
-                    if score >= 0.3:
-                        catalog_urls.append((url, html))
-                    log.debug("  Catalog (score=%.2f): %s", score, url)
-                    continue
-
-                score = score_candidate(url, html, name, city)
-                log.debug("  Score %.2f: %s", score, url)
-
-                if score > best_score:
-                    best_score = score
-                    best_url = url
-
-            if best_url and best_score >= 0.3:
-                log.info("  -> Website found (score=%.2f): %s", best_score, best_url)
-                await conn.execute(
-                    text("""
-                        UPDATE registered_shelters
-                        SET website = :url,
-                            search_confidence = :confidence,
-                            scrape_status = 'website_found'
-                        WHERE id = :id
-                    """),
-                    {"url": best_url, "confidence": best_score, "id": shelter_id},
-                )
-                stats["website_found"] += 1
-            else:
-                # No official website — try to extract phone from catalog results
-                phone_found = None
-                phone_source_url = None
-                for cat_url, cat_html in catalog_urls:
-                    phones = extract_phones_from_html(cat_html, cat_url)
-                    if phones:
-                        phone_found = phones[0]
-                        phone_source_url = cat_url
-                        break
-
-                if phone_found:
-                    log.info("  -> No web, but phone found from catalog: %s (%s)", phone_found, phone_source_url)
-                    await conn.execute(
-                        text("""
-                            UPDATE registered_shelters
-                            SET phone = :phone,
-                                phone_source = :source,
-                                scrape_status = 'phone_from_catalog',
-                                last_checked = :now
-                            WHERE id = :id
-                        """),
-                        {"phone": phone_found, "source": phone_source_url, "now": now, "id": shelter_id},
-                    )
-                    stats["phone_from_catalog"] += 1
-                else:
-                    log.info("  -> No website, no phone found")
-                    await conn.execute(
-                        text("""
-                            UPDATE registered_shelters
-                            SET scrape_status = 'website_not_found'
-                            WHERE id = :id
-                        """),
-                        {"id": shelter_id},
-                    )
-                    stats["website_not_found"] += 1
-
+            await search_shelter_website(crawler, engine, shelter_id, name, address, stats)
+            checkpoint.mark("search", shelter_id)
         except Exception as exc:
             log.error("  ERROR processing shelter %s: %s", name, exc)
             stats["website_not_found"] += 1
 
-        await asyncio.sleep(RATE_LIMIT_SLEEP)
+    await run_pool(rows, worker, concurrency)
+    checkpoint.save()
 
 
 # ─── Phase 2: Phone scraping ──────────────────────────────────────────────────
 
+async def scrape_shelter_phone(
+    crawler: AsyncCrawler,
+    engine: AsyncEngine,
+    shelter_id,
+    name: str,
+    website: str,
+    stats: dict,
+) -> None:
+    log.info("Scraping phone: %s → %s", name, website)
+    phones: list[str] = []
+    phone_source: str | None = None
+
+    # Try homepage first
+    page = await crawler.fetch(website)
+    if page:
+        phones = extract_phones_from_html(page.text, website)
+        if phones:
+            phone_source = website
+
+    # Try contact sub-pages if homepage gave nothing
+    if not phones:
+        for subpage in CONTACT_SUBPAGES:
+            contact_url = urljoin(website.rstrip("/") + "/", subpage.lstrip("/"))
+            page = await crawler.fetch(contact_url)
+            if page:
+                phones = extract_phones_from_html(page.text, contact_url)
+                if phones:
+                    phone_source = contact_url
+                    break
+
+    now = datetime.now(timezone.utc)
+    if phones:
+        # Prefer the first found (tel: links take priority — already in list order)
+        phone = phones[0]
+        log.info("  -> %s: phone found: %s (from %s)", name, phone, phone_source)
+        await _execute(
+            engine,
+            """
+                UPDATE registered_shelters
+                SET phone = :phone,
+                    phone_source = :source,
+                    scrape_status = 'success',
+                    last_checked = :now
+                WHERE id = :id
+            """,
+            {"phone": phone, "source": phone_source, "now": now, "id": shelter_id},
+        )
+        stats["phone_found"] += 1
+    else:
+        log.info("  -> %s: no phone found", name)
+        await _execute(
+            engine,
+            """
+                UPDATE registered_shelters
+                SET scrape_status = 'phone_not_found',
+                    last_checked = :now
+                WHERE id = :id
+            """,
+            {"now": now, "id": shelter_id},
+        )
+        stats["phone_not_found"] += 1
+
+
 async def phase2_scrape_phones(
-    conn,
+    engine: AsyncEngine,
+    crawler: AsyncCrawler,
+    checkpoint: Checkpoint,
     limit: int | None,
+    concurrency: int,
     stats: dict,
 ) -> None:
     """Scrape phone numbers from known shelter websites."""
@@ -453,75 +567,23 @@ async def phase2_scrape_phones(
         WHERE website IS NOT NULL AND phone IS NULL
         ORDER BY name
     """
-    if limit:
-        query += f" LIMIT {limit}"
-
-    result = await conn.execute(text(query))
-    rows = result.fetchall()
+    async with engine.connect() as conn:
+        rows = (await conn.execute(text(query))).fetchall()
+    done = checkpoint.done("scrape")
+    rows = [row for row in rows if str(row[0]) not in done][:limit]
     log.info("Found %d shelters to scrape for phone", len(rows))
 
-    session = _session()
-    now = datetime.now(timezone.utc)
-
-    for shelter_id, name, website in rows:
-        log.info("Scraping phone: %s → %s", name, website)
-
+    async def worker(row) -> None:
+        shelter_id, name, website = row
         try:
-            phones: list[str] = []
-            phone_source: str | None = None
-
-            # Try homepage first
-            resp = await asyncio.to_thread(fetch_with_retry, website, session)
-            if resp:
-                phones = extract_phones_from_html(resp.text, website)
-                if phones:
-                    phone_source = website
-
-            # Try contact sub-pages if homepage gave nothing
-            if not phones:
-                for subpage in CONTACT_SUBPAGES:
-                    contact_url = urljoin(website.rstrip("/") + "/", subpage.lstrip("/"))
-                    resp = await asyncio.to_thread(fetch_with_retry, contact_url, session)
-                    if resp and resp.status_code == 200:
-                        phones = extract_phones_from_html(resp.text, contact_url)
-                        if phones:
-                            phone_source = contact_url
-                            break
-
-            if phones:
-                # Prefer the first found (tel: links take priority — already in list order)
-                phone = phones[0]
-                log.info("  -> Phone found: %s (from %s)", phone, phone_source)
-                await conn.execute(
-                    text("""
-                        UPDATE registered_shelters
-                        SET phone = :phone,
-                            phone_source = :source,
-                            scrape_status = 'success',
-                            last_checked = :now
-                        WHERE id = :id
-                    """),
-                    {"phone": phone, "source": phone_source, "now": now, "id": shelter_id},
-                )
-                stats["phone_found"] += 1
-            else:
-                log.info("  -> No phone found")
-                await conn.execute(
-                    text("""
-                        UPDATE registered_shelters
-                        SET scrape_status = 'phone_not_found',
-                            last_checked = :now
-                        WHERE id = :id
-                    """),
-                    {"now": now, "id": shelter_id},
-                )
-                stats["phone_not_found"] += 1
-
+            await scrape_shelter_phone(crawler, engine, shelter_id, name, website, stats)
+            checkpoint.mark("scrape", shelter_id)
         except Exception as exc:
             log.error("  ERROR scraping %s: %s", name, exc)
             stats["phone_not_found"] += 1
 
-        await asyncio.sleep(RATE_LIMIT_SLEEP)
+    await run_pool(rows, worker, concurrency)
+    checkpoint.save()
 
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
@@ -531,6 +593,10 @@ async def main() -> None:
     parser.add_argument("--limit", type=int, default=None, help="Max shelters to process per phase")
     parser.add_argument("--only-search", action="store_true", help="Run phase 1 (website search) only")
     parser.add_argument("--only-scrape", action="store_true", help="Run phase 2 (phone scraping) only")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY, help="Shelters processed in parallel")
+    parser.add_argument("--rate", type=float, default=HOST_RATE, help="Max requests per second per host")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the page cache")
+    parser.add_argument("--fresh", action="store_true", help="Ignore the checkpoint of previous runs")
     args = parser.parse_args()
 
     run_search = not args.only_scrape
@@ -542,6 +608,9 @@ async def main() -> None:
         sys.exit(1)
 
     engine = create_async_engine(database_url, echo=False)
+    checkpoint = Checkpoint(CHECKPOINT_FILE)
+    if args.fresh:
+        checkpoint.reset()
 
     stats = {
         "processed": 0,
@@ -554,19 +623,27 @@ async def main() -> None:
 
     start_time = time.monotonic()
 
-    async with engine.begin() as conn:
+    async with engine.connect() as conn:
         # Count already-processed shelters (skipped in phase 1)
         result = await conn.execute(
             text("SELECT COUNT(*) FROM registered_shelters WHERE scrape_status IS NOT NULL")
         )
-        already_done = result.scalar() or 0
-        stats["skipped"] = already_done
+        stats["skipped"] = result.scalar() or 0
 
-        if run_search:
-            await phase1_search_websites(conn, args.limit, stats)
+    async with _client() as client:
+        crawler = make_crawler(client, args.rate, None if args.no_cache else CACHE_DIR)
+        try:
+            if run_search:
+                await phase1_search_websites(
+                    engine, crawler, checkpoint, args.limit, args.concurrency, stats
+                )
 
-        if run_scrape:
-            await phase2_scrape_phones(conn, args.limit, stats)
+            if run_scrape:
+                await phase2_scrape_phones(
+                    engine, crawler, checkpoint, args.limit, args.concurrency, stats
+                )
+        finally:
+            checkpoint.save()
 
     elapsed = time.monotonic() - start_time
     total = stats["processed"]
@@ -583,6 +660,8 @@ async def main() -> None:
     print(f"  Telefon z katalogu:   {stats['phone_from_catalog']}")
     print(f"  Telefon nenalezeno:   {stats['phone_not_found']}")
     print(f"  Prumerna doba:        {avg:.1f}s / zaznam")
+    print(f"  HTTP pozadavku:       {crawler.stats['requests']}"
+          f" (304: {crawler.stats['not_modified']}, z cache: {crawler.stats['cache_hits']})")
     print("=" * 42 + "\n")
 
     log.info("Enrichment complete. Log saved to: %s", log_file)
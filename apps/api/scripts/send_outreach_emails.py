@@ -6,6 +6,14 @@ Usage:
     python scripts/send_outreach_emails.py --campaign-id <uuid>
     python scripts/send_outreach_emails.py --campaign-id <uuid> --dry-run   # preview only
     python scripts/send_outreach_emails.py --campaign-id <uuid> --limit 10
+    python scripts/send_outreach_emails.py --campaign-id <uuid> --concurrency 4 --batch-size 50
+
+Emails are claimed with SKIP LOCKED and committed one claim at a time, so
+several runners can share a campaign and an interrupted run can simply be
+started again. --rate should match the Resend account's request limit; with
+--batch-size > 1 emails go through the batch endpoint (one request per
+batch). Only single sends are keyed per email; an email of a batch that was
+in flight when a run crashed can be delivered twice.
 
 Requires:
     RESEND_API_KEY env variable
@@ -20,7 +28,6 @@ import os
 import sys
 import time
 import uuid
-from datetime import datetime, timezone
 
 # Force UTF-8 output on Windows
 if sys.stdout.encoding and sys.stdout.encoding.lower() != "utf-8":
@@ -36,6 +43,13 @@ from sqlalchemy.orm import sessionmaker, selectinload
 from src.app.core.config import settings
 from src.app.models.outreach import OutreachCampaign, OutreachEmail
 from src.app.models.registered_shelter import RegisteredShelter
+from src.app.services.outreach_sender import (
+    RESEND_API_URL,
+    RESEND_RATE,
+    OutreachSender,
+    ResendClient,
+)
+from src.app.services.web_crawler import TokenBucket
 
 logging.basicConfig(
     level=logging.INFO,
@@ -44,50 +58,25 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
-RESEND_API_URL = "https://api.resend.com/emails"
-
-
-async def send_via_resend(
-    http: httpx.AsyncClient,
-    api_key: str,
-    to_email: str,
-    from_email: str,
-    reply_to: str | None,
-    subject: str,
-    body_text: str,
-) -> str:
-    """Send email via Resend API. Returns message_id."""
-    payload = {
-        "from": from_email,
-        "to": [to_email],
-        "subject": subject,
-        "text": body_text,
-    }
-    if reply_to:
-        payload["reply_to"] = reply_to
-
-    resp = await http.post(
-        RESEND_API_URL,
-        json=payload,
-        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-        timeout=15,
-    )
-    resp.raise_for_status()
-    return resp.json().get("id", "")
-
-
-async def run(campaign_id: uuid.UUID, limit: int, dry_run: bool) -> None:
+async def run(
+    campaign_id: uuid.UUID,
+    limit: int,
+    dry_run: bool,
+    concurrency: int,
+    rate: float,
+    batch_size: int,
+) -> None:
     database_url = settings.DATABASE_URL_ASYNC
     if not database_url:
         log.error("DATABASE_URL_ASYNC not set")
         sys.exit(1)
 
     resend_key = os.environ.get("RESEND_API_KEY")
-    if not resend_key:
+    if not resend_key and not dry_run:
         log.error("RESEND_API_KEY not set")
         sys.exit(1)
 
-    engine = create_async_engine(database_url, echo=False)
+    engine = create_async_engine(database_url, echo=False, pool_size=max(5, concurrency))
     async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
     async with async_session() as db:
@@ -102,84 +91,44 @@ async def run(campaign_id: uuid.UUID, limit: int, dry_run: bool) -> None:
 
         log.info("Campaign: %s (from=%s)", campaign.name, campaign.from_email)
 
-        # Load approved emails
-        emails_q = (
-            select(OutreachEmail)
-            .where(
-                OutreachEmail.campaign_id == campaign_id,
-                OutreachEmail.status == "approved",
+        if dry_run:
+            emails_q = (
+                select(OutreachEmail)
+                .where(
+                    OutreachEmail.campaign_id == campaign_id,
+                    OutreachEmail.status == "approved",
+                )
+                .options(selectinload(OutreachEmail.shelter))
+                .limit(limit)
             )
-            .options(selectinload(OutreachEmail.shelter))
-            .limit(limit)
-        )
-        emails = (await db.execute(emails_q)).scalars().all()
-        log.info("Found %d approved emails to send", len(emails))
-
-        if not emails:
-            log.info("Nothing to send.")
-            return
-
-        stats = {"sent": 0, "failed": 0, "skipped_no_email": 0}
-        start = time.monotonic()
-
-        async with httpx.AsyncClient() as http:
+            emails = (await db.execute(emails_q)).scalars().all()
+            log.info("Found %d approved emails to send", len(emails))
             for i, email_obj in enumerate(emails, 1):
                 shelter = email_obj.shelter
-                shelter_email = getattr(shelter, "email", None)
-
-                if not shelter_email:
-                    log.warning("[%d/%d] Skipping %s — no email address", i, len(emails), shelter.name)
-                    email_obj.status = "skipped"
-                    email_obj.error_message = "No email address"
-                    stats["skipped_no_email"] += 1
-                    continue
-
+                shelter_email = getattr(shelter, "email", None) or "— no email address"
                 log.info("[%d/%d] %s → %s", i, len(emails), shelter.name, shelter_email)
                 log.info("  Subject: %s", email_obj.generated_subject)
+            log.info("[DRY RUN] Nothing was sent")
+            await engine.dispose()
+            return
 
-                if dry_run:
-                    log.info("  [DRY RUN] Would send — skipping actual delivery")
-                    stats["sent"] += 1
-                    continue
-
-                try:
-                    msg_id = await send_via_resend(
-                        http=http,
-                        api_key=resend_key,
-                        to_email=shelter_email,
-                        from_email=campaign.from_email,
-                        reply_to=campaign.reply_to,
-                        subject=email_obj.generated_subject,
-                        body_text=email_obj.generated_body,
-                    )
-                    email_obj.status = "sent"
-                    email_obj.sent_at = datetime.now(timezone.utc)
-                    email_obj.resend_message_id = msg_id
-                    campaign.sent_count = (campaign.sent_count or 0) + 1
-                    stats["sent"] += 1
-                    log.info("  ✓ Sent (msg_id=%s)", msg_id)
-
-                except Exception as e:
-                    log.error("  ✗ Failed: %s", e)
-                    email_obj.error_message = str(e)
-                    stats["failed"] += 1
-
-                # Flush every 5
-                if i % 5 == 0:
-                    await db.flush()
-
-                # Rate limit: Resend free tier = 100 emails/day, 2/sec
-                await asyncio.sleep(0.6)
-
-        if not dry_run:
-            await db.commit()
-
-        elapsed = time.monotonic() - start
-        log.info(
-            "\n%sDone in %.1fs — sent: %d, failed: %d, skipped: %d",
-            "[DRY RUN] " if dry_run else "",
-            elapsed, stats["sent"], stats["failed"], stats["skipped_no_email"]
+    start = time.monotonic()
+    async with httpx.AsyncClient() as http:
+        client = ResendClient(
+            http,
+            resend_key,
+            TokenBucket(rate),
+            base_url=os.environ.get("RESEND_API_URL", RESEND_API_URL),
         )
+        sender = OutreachSender(async_session, client, campaign, batch_size=batch_size)
+        stats = await sender.run(limit, concurrency)
+
+    elapsed = time.monotonic() - start
+    log.info(
+        "\nDone in %.1fs — sent: %d, failed: %d, skipped: %d",
+        elapsed, stats.sent, stats.failed, stats.skipped_no_email
+    )
+    await engine.dispose()
 
 
 def main() -> None:
@@ -187,6 +136,9 @@ def main() -> None:
     parser.add_argument("--campaign-id", required=True, help="UUID of the outreach campaign")
     parser.add_argument("--limit", type=int, default=100, help="Max emails to send per run")
     parser.add_argument("--dry-run", action="store_true", help="Preview only — do not send")
+    parser.add_argument("--concurrency", type=int, default=4, help="Emails in flight")
+    parser.add_argument("--rate", type=float, default=RESEND_RATE, help="Max API requests per second")
+    parser.add_argument("--batch-size", type=int, default=1, help="Emails per request (batch endpoint when > 1)")
     args = parser.parse_args()
 
     try:
@@ -195,7 +147,9 @@ def main() -> None:
         log.error("Invalid campaign-id UUID: %s", args.campaign_id)
         sys.exit(1)
 
-    asyncio.run(run(campaign_id, args.limit, args.dry_run))
+    asyncio.run(
+        run(campaign_id, args.limit, args.dry_run, args.concurrency, args.rate, args.batch_size)
+    )
 
 
 if __name__ == "__main__":
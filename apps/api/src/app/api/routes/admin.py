@@ -2,7 +2,7 @@ import uuid
 from io import BytesIO
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
 from pydantic import BaseModel
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,6 +24,16 @@ from src.app.models.role_permission import RolePermission
 from src.app.models.organization import Organization
 from src.app.core.security import hash_password, decode_token
 from src.app.api.dependencies.auth import oauth2_scheme, decode_token
+from src.app.schemas.map import MapCluster
+from src.app.services.map_cluster_service import BoundingBox, MapSource, viewport
+from src.app.services.shelter_geo_service import (
+    ShelterGeoService,
+    invalidate_shelter_geo_index,
+)
+from src.app.services.shelter_import_service import (
+    ShelterImportService,
+    missing_headers as shelter_import_missing_headers,
+)
 from src.app.services.supabase_storage_service import supabase_storage_service
 
 ALLOWED_IMAGE_TYPES = {
@@ -1391,84 +1401,14 @@ async def import_registered_shelters(
         )
 
     import csv
-    from datetime import datetime
-    from io import StringIO
-
-    # Read uploaded file content
-    try:
-        content = await file.read()
-        csv_content = content.decode("utf-8")
-    except UnicodeDecodeError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": "Encoding error",
-                "message": "CSV file must be UTF-8 encoded",
-            },
-        )
-
-    def parse_single_dms(dms: str) -> float | None:
-        """Parse single DMS coordinate like 49°8'42.980"N"""
-        try:
-            dms = dms.replace("°", " ").replace("'", " ").replace('"', " ").strip()
-            direction = None
-            if "N" in dms or "S" in dms:
-                direction = -1 if "S" in dms else 1
-                dms = dms.replace("N", "").replace("S", "").strip()
-            elif "E" in dms or "W" in dms:
-                direction = -1 if "W" in dms else 1
-                dms = dms.replace("E", "").replace("W", "").strip()
-            parts = dms.split()
-            if len(parts) < 3:
-                return None
-            degrees = float(parts[0])
-            minutes = float(parts[1]) if len(parts) > 1 else 0
-            seconds = float(parts[2]) if len(parts) > 2 else 0
-            decimal = degrees + (minutes / 60) + (seconds / 3600)
-            if direction:
-                decimal *= direction
-            return decimal
-        except (ValueError, IndexError) as e:
-            print(f"Error parsing DMS '{dms}': {e}")
-            return None
-
-    def parse_dms_to_decimal(dms_str: str) -> tuple[float | None, float | None]:
-        """Parse GPS from DMS format like: 49°8'42.980"N,15°0'6.507"E"""
-        if not dms_str:
-            return None, None
-        try:
-            parts = dms_str.split(",")
-            if len(parts) != 2:
-                return None, None
-            lat_str = parts[0].strip()
-            lng_str = parts[1].strip()
-            lat = parse_single_dms(lat_str)
-            lng = parse_single_dms(lng_str)
-            return lat, lng
-        except Exception as e:
-            print(f"Error parsing GPS '{dms_str}': {e}")
-            return None, None
-
-    def parse_date(date_str: str):
-        """Parse date from Czech format like 29.12.2017"""
-        if not date_str:
-            return None
-        try:
-            dt = datetime.strptime(date_str.strip(), "%d.%m.%Y")
-            return dt.date()  # Return date object, not isoformat string
-        except ValueError as e:
-            print(f"Error parsing date '{date_str}': {e}")
-            return None
+    from io import TextIOWrapper
 
-    # Validate CSV structure first
+    # Stream the upload; rows are parsed and staged in batches
+    csv_file = TextIOWrapper(file.file, encoding="utf-8", newline="")
     try:
-        csv_file = StringIO(csv_content)
         reader = csv.DictReader(csv_file)
         headers = reader.fieldnames
-
-        required_headers = ["registrační číslo", "název", "adresa", "kraj"]
-        missing_headers = [h for h in required_headers if h not in (headers or [])]
-
+        missing_headers = shelter_import_missing_headers(headers)
         if missing_headers:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -1478,104 +1418,23 @@ async def import_registered_shelters(
                     "found_columns": list(headers or []),
                 },
             )
+
+        summary = await ShelterImportService(db).import_rows(reader)
+        await db.commit()
+        invalidate_shelter_geo_index()
+        return summary
+
+    except HTTPException:
+        raise
     except UnicodeDecodeError:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                "error": "CSV encoding error",
-                "help": "File must be UTF-8 encoded",
+                "error": "Encoding error",
+                "message": "CSV file must be UTF-8 encoded",
             },
         )
-
-    # Import data
-    count = 0
-    errors = []
-    skipped = 0
-
-    try:
-        csv_file = StringIO(csv_content)
-        reader = csv.DictReader(csv_file)
-
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-            try:
-                # Extract and clean fields
-                reg_number = row.get("registrační číslo", "").strip().strip('"')
-                name = row.get("název", "").strip().strip('"')
-                address = row.get("adresa", "").strip().strip('"')
-                region = row.get("kraj", "").strip().strip('"')
-                activity_type = row.get("druh činnosti", "").strip().strip('"')
-                capacity = row.get("kapacita", "").strip().strip('"')
-                gps = row.get("GPS", "").strip().strip('"')
-                reg_date = row.get("datum registrace", "").strip().strip('"')
-
-                # Validate required fields
-                if not reg_number or not name:
-                    errors.append(
-                        {
-                            "row": row_num,
-                            "error": "Missing required fields (registration_number or name)",
-                        }
-                    )
-                    skipped += 1
-                    continue
-
-                # Parse GPS
-                lat, lng = parse_dms_to_decimal(gps)
-
-                # Parse date
-                parsed_date = parse_date(reg_date)
-
-                # Insert into database (upsert - update on conflict)
-                await db.execute(
-                    text("""
-                            INSERT INTO registered_shelters
-                            (id, registration_number, name, address, region, activity_type, capacity, lat, lng, registration_date, imported_at, created_at, updated_at)
-                            VALUES
-                            (gen_random_uuid(), :reg_number, :name, :address, :region, :activity_type, :capacity, :lat, :lng, :reg_date, NOW(), NOW(), NOW())
-                            ON CONFLICT (registration_number) DO UPDATE SET
-                                name = EXCLUDED.name,
-                                address = EXCLUDED.address,
-                                region = EXCLUDED.region,
-                                activity_type = EXCLUDED.activity_type,
-                                capacity = EXCLUDED.capacity,
-                                lat = EXCLUDED.lat,
-                                lng = EXCLUDED.lng,
-                                registration_date = EXCLUDED.registration_date,
-                                imported_at = NOW(),
-                                updated_at = NOW()
-                        """),
-                    {
-                        "reg_number": reg_number,
-                        "name": name,
-                        "address": address,
-                        "region": region,
-                        "activity_type": activity_type or None,
-                        "capacity": capacity or None,
-                        "lat": lat,
-                        "lng": lng,
-                        "reg_date": parsed_date,
-                    },
-                )
-                count += 1
-
-            except Exception as e:
-                errors.append({"row": row_num, "error": str(e)})
-                if len(errors) > 50:  # Limit error collection
-                    errors.append(
-                        {"error": "Too many errors, stopping error collection"}
-                    )
-                    break
-
-        await db.commit()
-
-        # Return detailed response
-        return {
-            "imported": count,
-            "skipped": skipped,
-            "errors": errors[:10] if errors else [],  # Return first 10 errors
-            "total_errors": len(errors),
-        }
-
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -1583,9 +1442,10 @@ async def import_registered_shelters(
             detail={
                 "error": "Import failed",
                 "message": str(e),
-                "imported_before_failure": count,
             },
         )
+    finally:
+        csv_file.detach()
 
 
 class CreateRegisteredShelterRequest(BaseModel):
@@ -1651,6 +1511,7 @@ async def create_registered_shelter(
         },
     )
     await db.commit()
+    invalidate_shelter_geo_index()
 
     return RegisteredShelterResponse(
         id=str(shelter_id),
@@ -1720,6 +1581,7 @@ async def update_registered_shelter(
         },
     )
     await db.commit()
+    invalidate_shelter_geo_index()
 
     return {"success": True}
 
@@ -1753,6 +1615,47 @@ async def get_shelters_for_map(
     ]
 
 
+SHELTER_MAP_SOURCE = MapSource(
+    from_clause="registered_shelters",
+    lat="lat",
+    lng="lng",
+    geohash="geohash",
+    id="id",
+    point_columns="id::text AS id, name, lat, lng",
+    where="lat IS NOT NULL AND lng IS NOT NULL",
+    point_order="name",
+)
+
+
+class ShelterMapViewport(BaseModel):
+    zoom: int
+    precision: Optional[int] = None
+    clusters: list[MapCluster]
+    points: list[ShelterMapPoint]
+    truncated: bool
+
+
+@router.get("/registered-shelters/map/clusters", response_model=ShelterMapViewport)
+async def get_shelters_map_viewport(
+    south: float = Query(..., ge=-90, le=90),
+    west: float = Query(..., ge=-180, le=180),
+    north: float = Query(..., ge=-90, le=90),
+    east: float = Query(..., ge=-180, le=180),
+    zoom: int = Query(..., ge=0, le=22),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Shelters inside the map viewport: geohash clusters, or individual
+    shelters from street-level zoom. A west edge greater than the east edge
+    means the viewport crosses the antimeridian."""
+    if south > north:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="south must not be greater than north",
+        )
+    return await viewport(db, SHELTER_MAP_SOURCE, BoundingBox(south, west, north, east), zoom)
+
+
 class NearbyShelter(BaseModel):
     id: str
     name: str
@@ -1772,51 +1675,26 @@ async def get_nearby_shelters(
     lng: float,
     radius_km: float = 25,
     species: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get shelters within radius of a GPS point using Haversine formula. Public endpoint."""
-    species_filter = ""
-    if species == "dog":
-        species_filter = "AND accepts_dogs = true"
-    elif species == "cat":
-        species_filter = "AND accepts_cats = true"
-
-    result = await db.execute(
-        text(f"""
-            SELECT id, name, address, lat, lng, distance_km, accepts_dogs, accepts_cats, phone, website
-            FROM (
-                SELECT id, name, address, lat, lng,
-                       (6371 * acos(
-                           LEAST(1.0, GREATEST(-1.0,
-                               cos(radians(:lat)) * cos(radians(lat)) *
-                               cos(radians(lng) - radians(:lng)) +
-                               sin(radians(:lat)) * sin(radians(lat))
-                           ))
-                       )) AS distance_km,
-                       accepts_dogs, accepts_cats, phone, website
-                FROM registered_shelters
-                WHERE lat IS NOT NULL AND lng IS NOT NULL
-                {species_filter}
-            ) _dist
-            WHERE distance_km <= :radius
-            ORDER BY distance_km
-        """),
-        {"lat": lat, "lng": lng, "radius": radius_km},
-    )
-    rows = result.fetchall()
+    """Get shelters within radius of a GPS point, nearest first. Public endpoint.
 
+    With ``limit`` only the k nearest shelters within the radius are returned.
+    """
+    rows = await ShelterGeoService(db).nearby(lat, lng, radius_km, species, limit)
     return [
         NearbyShelter(
-            id=str(row[0]),
-            name=row[1],
-            address=row[2],
-            lat=row[3],
-            lng=row[4],
-            distance_km=round(row[5], 2),
-            accepts_dogs=row[6],
-            accepts_cats=row[7],
-            phone=row[8],
-            website=row[9],
+            id=str(row["id"]),
+            name=row["name"],
+            address=row["address"],
+            lat=row["lat"],
+            lng=row["lng"],
+            distance_km=round(row["distance_km"], 2),
+            accepts_dogs=row["accepts_dogs"],
+            accepts_cats=row["accepts_cats"],
+            phone=row["phone"],
+            website=row["website"],
         )
         for row in rows
     ]
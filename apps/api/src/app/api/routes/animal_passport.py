@@ -1,7 +1,6 @@
 """Animal Passport API routes."""
 
 import uuid
-from datetime import date, timedelta
 
 from fastapi import (
     APIRouter,
@@ -21,7 +20,6 @@ from src.app.api.dependencies.auth import (
 from src.app.api.dependencies.db import get_db
 from src.app.models.animal import Animal
 from src.app.models.animal_passport import AnimalPassport, AnimalPassportDocument
-from src.app.models.animal_vaccination import AnimalVaccination
 from src.app.models.file import File as FileModel, StorageProvider
 from src.app.models.user import User
 from src.app.schemas.animal_passport import (
@@ -30,10 +28,10 @@ from src.app.schemas.animal_passport import (
     PassportResponse,
     PassportDocumentResponse,
     VaccinationExpirationSummary,
-    VaccinationExpiring,
 )
 from src.app.services.file_upload_service import file_upload_service
 from src.app.services.supabase_storage_service import supabase_storage_service
+from src.app.services.vaccination_service import VaccinationService
 
 
 router = APIRouter(prefix="/animals", tags=["passports"])
@@ -257,65 +255,5 @@ async def get_expiring_vaccinations(
     db: AsyncSession = Depends(get_db),
 ):
     """Get summary of vaccinations expiring within N days"""
-    today = date.today()
-    cutoff_date = today + timedelta(days=days)
-
-    # Get all vaccinations with valid_until for this org
-    query = (
-        select(AnimalVaccination, Animal.name, Animal.public_code)
-        .join(Animal, AnimalVaccination.animal_id == Animal.id)
-        .where(
-            Animal.organization_id == organization_id,
-            AnimalVaccination.valid_until.isnot(None),
-        )
-        .order_by(AnimalVaccination.valid_until.asc())
-    )
-
-    result = await db.execute(query)
-    rows = result.all()
-
-    expired = []
-    expiring_soon = []
-    expiring_later = []
-
-    for vacc, animal_name, animal_public_code in rows:
-        days_until = (vacc.valid_until - today).days
-
-        status = (
-            "expired"
-            if days_until < 0
-            else ("expiring_soon" if days_until <= days else "expiring_later")
-        )
-
-        item = VaccinationExpiring(
-            id=vacc.id,
-            animal_id=vacc.animal_id,
-            animal_name=animal_name,
-            animal_public_code=animal_public_code,
-            vaccine_type=vacc.vaccination_type,
-            administered_at=vacc.administered_at.date()
-            if hasattr(vacc.administered_at, "date")
-            else vacc.administered_at,
-            valid_until=vacc.valid_until,
-            days_until_expiration=days_until,
-            status=status,
-        )
-
-        if status == "expired":
-            expired.append(item)
-        elif status == "expiring_soon":
-            expiring_soon.append(item)
-        else:
-            expiring_later.append(item)
-
-    return VaccinationExpirationSummary(
-        total_vaccinations=len(rows),
-        expiring_within_14_days=len(
-            [v for v in rows if 0 <= (v[0].valid_until - today).days <= 14]
-        ),
-        expiring_within_30_days=len(
-            [v for v in rows if 0 <= (v[0].valid_until - today).days <= 30]
-        ),
-        expired=len(expired),
-        upcoming=expiring_soon + expired[:5],  # Show 5 most urgent expired
-    )
+    summary = await VaccinationService(db).expiry_summary(organization_id, days)
+    return VaccinationExpirationSummary(**summary)
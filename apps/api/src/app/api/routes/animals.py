@@ -1,7 +1,17 @@
 import uuid
-from datetime import date, datetime, timezone
-
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
 from pydantic import BaseModel, Field, field_validator
 from sqlalchemy import select, text, or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,14 +22,11 @@ from src.app.api.dependencies.auth import (
     require_permission,
 )
 from src.app.api.dependencies.db import get_db
+from src.app.core.read_cache import cached_read
+from src.app.core.single_flight import coalesce_requests
 from src.app.models.animal import Animal, Species
 from src.app.models.kennel import Kennel, Zone
-from src.app.services.legal_deadline import (
-    compute_legal_deadline,
-    compute_legal_deadline_from_settings,
-)
-from src.app.schemas.org_settings import get_org_settings
-from src.app.models.organization import Organization
+from src.app.services.legal_deadline import describe_legal_deadline
 from src.app.models.animal_identifier import AnimalIdentifier
 from src.app.models.animal_weight_log import AnimalWeightLog
 from src.app.models.animal_bcs_log import AnimalBCSLog
@@ -30,6 +37,7 @@ from src.app.models.user import User
 from src.app.schemas.animal import (
     AnimalCreate,
     AnimalIdentifierCreate,
+    AnimalImportJobResponse,
     AnimalListResponse,
     AnimalResponse,
     AnimalUpdate,
@@ -39,8 +47,14 @@ from src.app.schemas.animal import (
     BreedResponse,
 )
 from src.app.schemas.weight_log import WeightLogCreate, WeightLogResponse
+from src.app.schemas.animal_timeline import AnimalTimelineResponse
 from src.app.schemas.bcs_log import BCSLogCreate, BCSLogResponse
+from src.app.schemas.measurement_series import MeasurementSeriesResponse
 from src.app.services.animal_service import AnimalService
+from src.app.services.animal_timeline_service import EVENT_TYPES, AnimalTimelineService
+from src.app.services.measurement_series_service import MeasurementSeriesService
+from src.app.services.mer_recompute_service import mer_kcal_per_day
+from src.app.services.population_census_service import PopulationCensusService
 
 
 async def _build_animal_response(
@@ -48,7 +62,6 @@ async def _build_animal_response(
     db: AsyncSession,
     kennel_data: dict | None = None,
     intake_data: dict | None = None,
-    org_legal=None,
     breed_i18n_map: dict | None = None,
     color_i18n_map: dict | None = None,
 ) -> AnimalResponse:
@@ -166,44 +179,22 @@ async def _build_animal_response(
             "municipality_irrevocably_transferred"
         )
 
-    # For legal deadline computation: use intake data OR animal's own legal fields
-    # (animal's legal fields are for cases when there's no intake - e.g., animal staying with finder)
-    effective_notice_published_at = (
-        resp.notice_published_at or animal.legal_notice_published_at
-    )
-    effective_finder_claims_ownership = (
-        resp.finder_claims_ownership
-        if resp.finder_claims_ownership is not None
-        else animal.legal_finder_claims_ownership
-    )
-    effective_municipality_transferred = (
-        resp.municipality_irrevocably_transferred
-        if resp.municipality_irrevocably_transferred is not None
-        else animal.legal_municipality_transferred
-    )
-
-    # Compute legal deadline if this is a found animal and we have notice date
-    if effective_notice_published_at is not None:
-        if org_legal is not None:
-            deadline_info = compute_legal_deadline_from_settings(
-                announced_at=effective_notice_published_at,
-                received_at=resp.current_intake_date,
-                found_at=resp.current_intake_date,
-                finder_keeps=effective_finder_claims_ownership,
-                org_legal=org_legal,
-            )
-        else:
-            deadline_info = compute_legal_deadline(
-                notice_published_at=effective_notice_published_at,
-                shelter_received_at=resp.current_intake_date,
-                finder_claims_ownership=effective_finder_claims_ownership,
-                municipality_irrevocably_transferred=effective_municipality_transferred,
-            )
+    # Legal deadline is persisted on the animal (LegalDeadlineService);
+    # only the date-dependent parts are derived here
+    if animal.legal_deadline_state is not None:
+        deadline_info = describe_legal_deadline(
+            animal.legal_deadline_at,
+            animal.legal_deadline_type,
+            animal.legal_deadline_state,
+            animal.legal_deadline_label,
+            animal.legal_deadline_missing_fields,
+        )
         resp.legal_deadline_at = deadline_info.deadline_at
         resp.legal_deadline_type = deadline_info.deadline_type
         resp.legal_deadline_days_left = deadline_info.days_left
         resp.legal_deadline_state = deadline_info.deadline_state
         resp.legal_deadline_label = deadline_info.label
+        resp.legal_deadline_missing_fields = deadline_info.missing_fields
 
     # Compute website deadline state (if animal is published)
     resp.website_published_at = animal.website_published_at
@@ -368,6 +359,7 @@ async def list_animals_lightweight_for_kennels(
 
 
 @router.get("/kennels-data")
+@coalesce_requests
 async def get_kennels_data(
     zone_id: str | None = Query(None),
     status: str | None = Query(None),
@@ -494,8 +486,15 @@ async def list_animals(
     sex: str | None = Query(None),
     search: str | None = Query(None),
     available_for_intake: bool = Query(False),
-    sort_by: str | None = Query(None, description="Sort field: name, days_in_shelter, created_at"),
+    sort_by: str | None = Query(
+        None, description="Sort field: name, days_in_shelter, legal_deadline, created_at"
+    ),
     sort_order: str = Query("desc", description="Sort order: asc, desc"),
+    legal_deadline_state: str | None = Query(
+        None, description="running, expired or missing_data"
+    ),
+    legal_deadline_from: date | None = Query(None),
+    legal_deadline_to: date | None = Query(None),
     current_user: User = Depends(require_permission("animals.read")),
     organization_id: uuid.UUID = Depends(get_current_organization_id),
     db: AsyncSession = Depends(get_db),
@@ -515,6 +514,9 @@ async def list_animals(
             available_for_intake=available_for_intake,
             sort_by=sort_by,
             sort_order=sort_order,
+            legal_deadline_state=legal_deadline_state,
+            legal_deadline_from=legal_deadline_from,
+            legal_deadline_to=legal_deadline_to,
         )
         kennel_data = extra_data.get("kennels", {})
         intake_data = extra_data.get("intakes", {})
@@ -573,6 +575,121 @@ async def list_animals(
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+MAX_IMPORT_FILE_BYTES = 10 * 1024 * 1024
+
+
+async def _run_import_job(job_id: uuid.UUID, rows: list[dict]) -> None:
+    # Runs after the response is sent, with sessions of its own
+    from src.app.db.session import AsyncSessionLocal
+    from src.app.services.animal_import_service import run_import_job
+
+    await run_import_job(AsyncSessionLocal, job_id, rows)
+
+
+@router.post(
+    "/import",
+    response_model=AnimalImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def import_animals(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    dry_run: bool = Query(False, description="Only validate the file"),
+    current_user: User = Depends(require_permission("animals.write")),
+    organization_id: uuid.UUID = Depends(get_current_organization_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """Start a bulk import of animals from a CSV or XLSX file.
+
+    The file is parsed here; validation and inserts run in the background.
+    Poll ``GET /animals/import/{job_id}`` for progress and row errors.
+    """
+    from src.app.models.animal_import_job import AnimalImportJob
+    from src.app.services.animal_import_service import ImportFileError, read_rows
+
+    content = await file.read(MAX_IMPORT_FILE_BYTES + 1)
+    if len(content) > MAX_IMPORT_FILE_BYTES:
+        raise HTTPException(status_code=413, detail="File is larger than 10 MB")
+    try:
+        rows = read_rows(file.filename or "", content)
+    except ImportFileError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Cannot read file: {e}")
+    if not rows:
+        raise HTTPException(status_code=400, detail="The file has no rows")
+
+    job = AnimalImportJob(
+        organization_id=organization_id,
+        created_by_id=current_user.id,
+        filename=(file.filename or "")[:255] or None,
+        dry_run=dry_run,
+        total_rows=len(rows),
+        processed_rows=0,
+        inserted=0,
+        failed_rows=0,
+    )
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    background_tasks.add_task(_run_import_job, job.id, rows)
+    return AnimalImportJobResponse.model_validate(job)
+
+
+@router.get("/import/{job_id}", response_model=AnimalImportJobResponse)
+async def get_import_job(
+    job_id: uuid.UUID,
+    current_user: User = Depends(require_permission("animals.read")),
+    organization_id: uuid.UUID = Depends(get_current_organization_id),
+    db: AsyncSession = Depends(get_db),
+):
+    from src.app.models.animal_import_job import AnimalImportJob
+
+    job = (
+        await db.execute(
+            select(AnimalImportJob).where(
+                AnimalImportJob.id == job_id,
+                AnimalImportJob.organization_id == organization_id,
+            )
+        )
+    ).scalar_one_or_none()
+    if job is None:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return AnimalImportJobResponse.model_validate(job)
+
+
+@router.get("/measurements/series", response_model=MeasurementSeriesResponse)
+async def get_measurement_series(
+    animal_ids: list[uuid.UUID] = Query(..., max_length=200),
+    metric: str = Query("weight", pattern="^(weight|bcs)$"),
+    date_from: datetime | None = Query(None),
+    date_to: datetime | None = Query(None),
+    points: int = Query(100, ge=2, le=1000, description="Max points per animal"),
+    method: str = Query("avg", pattern="^(avg|lttb)$"),
+    current_user: User = Depends(require_permission("animals.read")),
+    organization_id: uuid.UUID = Depends(get_current_organization_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """Downsampled weight/BCS series of several animals (default: last year)."""
+    date_to = date_to or datetime.now(timezone.utc)
+    date_from = date_from or date_to - timedelta(days=365)
+    # Naive bounds are UTC
+    date_from, date_to = (
+        d if d.tzinfo else d.replace(tzinfo=timezone.utc) for d in (date_from, date_to)
+    )
+    if date_from >= date_to:
+        raise HTTPException(status_code=400, detail="date_from must be before date_to")
+    return await MeasurementSeriesService(db).series(
+        organization_id,
+        list(dict.fromkeys(animal_ids)),
+        metric,
+        date_from,
+        date_to,
+        points,
+        method,
+    )
+
+
 @router.get(
     "/{animal_id}",
     response_model=AnimalResponse,
@@ -589,10 +706,7 @@ async def get_animal(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Animal not found"
         )
-    # Load org settings for configurable legal deadline
-    org = await db.get(Organization, organization_id)
-    org_legal = get_org_settings(org).legal if org else None
-    return await _build_animal_response(animal, db, org_legal=org_legal)
+    return await _build_animal_response(animal, db)
 
 
 @router.patch(
@@ -686,15 +800,7 @@ async def log_weight(
     # Update the animal's current weight
     animal.weight_current_kg = data.weight_kg
     # Recalculate MER based on new weight
-    if animal.weight_current_kg and animal.weight_current_kg > 0:
-        rer = 70 * (float(animal.weight_current_kg) ** 0.75)
-        if animal.species.value == "cat":
-            activity_factor = 1.2
-        elif animal.altered_status.value in ("intact",):
-            activity_factor = 1.8
-        else:
-            activity_factor = 1.4
-        animal.mer_kcal_per_day = int(rer * activity_factor)
+    animal.mer_kcal_per_day = mer_kcal_per_day([animal])[0]
     await db.commit()
     await db.refresh(log)
     return WeightLogResponse.model_validate(log)
@@ -800,9 +906,8 @@ async def register_birth(
     Returns list of created offspring.
     """
     from sqlalchemy import text as sql_text
-    from src.app.models.animal import Animal, AgeGroup, AnimalStatus, AlteredStatus
-    from src.app.models.animal_breed import AnimalBreed
-    from src.app.models.kennel import KennelStay
+    from src.app.models.animal import AgeGroup, AnimalStatus, AlteredStatus
+    from src.app.models.intake import IntakeReason
 
     svc = AnimalService(db)
     mother = await svc.get_animal(organization_id, animal_id)
@@ -828,10 +933,18 @@ async def register_birth(
     # Get mother's breeds for offspring
     breed_ids = [ab.breed_id for ab in (mother.animal_breeds or [])]
 
-    created = []
+    color_names_cs = {
+        "red": "červený",
+        "blue": "modrý",
+        "green": "zelený",
+        "yellow": "žlutý",
+        "orange": "oranžový",
+        "purple": "fialový",
+        "pink": "růžový",
+        "brown": "hnědý",
+    }
+    litter = []
     for i in range(data.litter_count):
-        public_code = await svc._generate_public_code(organization_id)
-
         # Get collar color for this offspring
         collar_color = None
         if data.collar_colors and i < len(data.collar_colors):
@@ -852,82 +965,50 @@ async def register_birth(
             offspring_name = f"{mother.name} – {letters}"
         elif data.naming_scheme == "color" and collar_color:
             # Use color name in Czech (map to i18n keys)
-            color_names_cs = {
-                "red": "červený",
-                "blue": "modrý",
-                "green": "zelený",
-                "yellow": "žlutý",
-                "orange": "oranžový",
-                "purple": "fialový",
-                "pink": "růžový",
-                "brown": "hnědý",
-            }
             color_name = color_names_cs.get(collar_color, collar_color)
             offspring_name = f"{mother.name} – {color_name}"
         else:
             # Default: number (1, 2, 3, ...)
             offspring_name = f"{mother.name} – mládě {i + 1}"
 
-        offspring = Animal(
-            id=uuid.uuid4(),
-            organization_id=organization_id,
-            public_code=public_code,
-            name=offspring_name,
-            species=mother.species,
-            sex="unknown",
-            status=AnimalStatus.INTAKE,
-            altered_status=AlteredStatus.UNKNOWN,
-            age_group=AgeGroup.BABY,
-            birth_date_estimated=today,
-            public_visibility=False,
-            featured=False,
-            is_dewormed=False,
-            is_aggressive=False,
-            is_pregnant=False,
-            collar_color=collar_color,
-        )
-        db.add(offspring)
-        await db.flush()
-
-        # Create intake record for offspring (reason: birth)
-        from src.app.models.intake import Intake, IntakeReason as IR
-
-        birth_intake = Intake(
-            organization_id=organization_id,
-            animal_id=offspring.id,
-            reason=IR.BIRTH,
-            intake_date=today,
-            notes=f"Narozeno – {mother.name}",
-            created_by_id=current_user.id,
-        )
-        db.add(birth_intake)
-
-        # Copy breeds from mother
-        for breed_id in breed_ids:
-            db.add(AnimalBreed(animal_id=offspring.id, breed_id=breed_id))
-
-        # Place in mother's kennel (ignoring capacity)
-        if current_kennel_id:
-            db.add(
-                KennelStay(
-                    id=uuid.uuid4(),
-                    organization_id=organization_id,
-                    animal_id=offspring.id,
-                    kennel_id=current_kennel_id,
-                    start_at=datetime.now(timezone.utc),
-                    reason="Narozeno",
-                    moved_by=current_user.id,
-                )
-            )
-
-        created.append(
+        litter.append(
             {
-                "id": str(offspring.id),
-                "public_code": public_code,
-                "name": offspring.name,
+                "name": offspring_name,
+                "sex": "unknown",
+                "status": AnimalStatus.INTAKE,
+                "altered_status": AlteredStatus.UNKNOWN,
+                "age_group": AgeGroup.BABY,
+                "birth_date_estimated": today,
+                "public_visibility": False,
+                "featured": False,
+                "is_dewormed": False,
+                "is_aggressive": False,
+                "is_pregnant": False,
+                "collar_color": collar_color,
             }
         )
-        await db.flush()
+
+    # Offspring, birth intakes, mother's breeds and a stay in the mother's
+    # kennel (ignoring capacity), all written set-based
+    offspring = await svc.create_animals_batch(
+        organization_id,
+        litter,
+        species=mother.species,
+        breed_ids=breed_ids,
+        kennel_id=current_kennel_id,
+        stay_reason="Narozeno",
+        intake={
+            "reason": IntakeReason.BIRTH,
+            "intake_date": today,
+            "notes": f"Narozeno – {mother.name}",
+            "created_by_id": current_user.id,
+        },
+        actor_id=current_user.id,
+    )
+    created = [
+        {"id": str(animal.id), "public_code": animal.public_code, "name": animal.name}
+        for animal in offspring
+    ]
 
     # Clear expected litter date and unmark pregnant on mother
     mother.expected_litter_date = None
@@ -973,6 +1054,7 @@ async def log_bcs(
     db.add(log)
     # Update current BCS on animal
     animal.bcs = data.bcs
+    animal.mer_kcal_per_day = mer_kcal_per_day([animal])[0]
     await db.commit()
     await db.refresh(log)
     return BCSLogResponse.model_validate(log)
@@ -1054,6 +1136,44 @@ async def get_animal_kennel_history(
     ]
 
 
+@router.get("/{animal_id}/timeline", response_model=AnimalTimelineResponse)
+async def get_animal_timeline(
+    animal_id: uuid.UUID,
+    types: list[str] | None = Query(None, description="Event types to include"),
+    cursor: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(require_permission("animals.read")),
+    organization_id: uuid.UUID = Depends(get_current_organization_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """Newest-first activity timeline of an animal (stays, measurements,
+    vaccinations, walks, incidents, intakes, documents, tasks)."""
+    unknown = set(types or ()) - set(EVENT_TYPES)
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown event types: {', '.join(sorted(unknown))}"
+        )
+
+    exists = await db.scalar(
+        select(Animal.id).where(
+            Animal.id == animal_id,
+            Animal.organization_id == organization_id,
+            Animal.deleted_at.is_(None),
+        )
+    )
+    if exists is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Animal not found"
+        )
+
+    try:
+        return await AnimalTimelineService(db).timeline(
+            organization_id, animal_id, limit=limit, types=types, cursor=cursor
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
 # --- Daily count stats endpoint ---
 
 
@@ -1064,38 +1184,11 @@ async def get_daily_animal_count(
     organization_id: uuid.UUID = Depends(get_current_organization_id),
     db: AsyncSession = Depends(get_db),
 ):
-    """Return daily animal count for the last N days. Single query with generate_series."""
-    result = await db.execute(
-        text("""
-            SELECT
-                d.day,
-                COUNT(DISTINCT a.id)::int as count
-            FROM generate_series(
-                CURRENT_DATE - (:days - 1) * INTERVAL '1 day',
-                CURRENT_DATE,
-                '1 day'::interval
-            ) AS d(day)
-            JOIN intakes i ON i.organization_id = :org_id
-                AND i.deleted_at IS NULL
-                AND i.intake_date <= d.day
-            JOIN animals a ON a.id = i.animal_id
-                AND a.deleted_at IS NULL
-                AND (a.outcome_date IS NULL OR a.outcome_date > d.day)
-            GROUP BY d.day
-            ORDER BY d.day ASC
-        """),
-        {"org_id": str(organization_id), "days": days},
-    )
-    rows = result.fetchall()
-    return [
-        {
-            "date": row.day.strftime("%Y-%m-%d")
-            if hasattr(row.day, "strftime")
-            else str(row.day)[:10],
-            "count": row.count,
-        }
-        for row in rows
-    ]
+    """Return daily animal count for the last N days.
+
+    Closed days come from the daily population census; today is counted live.
+    """
+    return await PopulationCensusService(db).daily_counts(organization_id, days)
 
 
 # --- Identifier endpoints ---
@@ -1167,6 +1260,7 @@ breed_router = APIRouter(prefix="/breeds", tags=["breeds"])
 
 
 @breed_router.get("", response_model=list[BreedResponse])
+@cached_read("breeds")
 async def list_breeds(
     species: str | None = Query(None),
     locale: str = Query(default="cs"),
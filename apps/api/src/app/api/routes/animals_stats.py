@@ -4,12 +4,12 @@ import uuid
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.api.dependencies.auth import get_current_user, get_current_organization_id
 from src.app.api.dependencies.db import get_db
 from src.app.models.user import User
+from src.app.services.animal_counter_service import AnimalCounterService
 
 
 router = APIRouter(prefix="/animals", tags=["animals"])
@@ -20,6 +20,8 @@ class AnimalStatsResponse(BaseModel):
     available: int
     intake: int
     quarantine: int
+    by_species: dict[str, int] = {}
+    by_status: dict[str, int] = {}
 
 
 @router.get("/stats/counts", response_model=AnimalStatsResponse)
@@ -29,31 +31,24 @@ async def get_animal_counts(
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Get animal counts by status in a single optimized query.
+    Get animal counts by status, read from the per-organization counters.
 
-    Returns counts for all statuses in one DB query:
     - total: All animals (non-deleted)
     - available: Animals with status 'available'
     - intake: Animals with status 'intake'
     - quarantine: Animals with status 'quarantine'
+    - by_species / by_status: facet counts for the animal list filters
 
-    This replaces 4 separate API calls to /animals with status filter.
+    The counters are a handful of rows per organization, so this does not
+    depend on the number of animals.
     """
-    sql = text("""
-        SELECT 
-            COUNT(*) FILTER (WHERE deleted_at IS NULL) as total,
-            COUNT(*) FILTER (WHERE status = 'available' AND deleted_at IS NULL) as available,
-            COUNT(*) FILTER (WHERE status = 'intake' AND deleted_at IS NULL) as intake,
-            COUNT(*) FILTER (WHERE status = 'quarantine' AND deleted_at IS NULL) as quarantine
-        FROM animals 
-        WHERE organization_id = :org_id
-    """)
-    result = await db.execute(sql, {"org_id": str(organization_id)})
-    row = result.fetchone()
-
+    counts = await AnimalCounterService(db).counts(organization_id)
+    by_status = counts["by_status"]
     return AnimalStatsResponse(
-        total=row[0] or 0,
-        available=row[1] or 0,
-        intake=row[2] or 0,
-        quarantine=row[3] or 0,
+        total=counts["total"],
+        available=by_status.get("available", 0),
+        intake=by_status.get("intake", 0),
+        quarantine=by_status.get("quarantine", 0),
+        by_species=counts["by_species"],
+        by_status=by_status,
     )
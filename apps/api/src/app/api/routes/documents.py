@@ -10,6 +10,7 @@ from sqlalchemy.orm import selectinload
 
 from src.app.api.dependencies.auth import get_current_user
 from src.app.api.dependencies.db import get_db
+from src.app.core.read_cache import cached_read
 from src.app.models.user import User
 from src.app.models.document_template import DocumentTemplate, DocumentInstance
 from src.app.models.animal import Animal
@@ -33,6 +34,7 @@ router = APIRouter()
 
 
 @router.get("/document-templates", response_model=DocumentTemplateListResponse)
+@cached_read("document_templates", org_param="x_organization_id")
 async def list_templates(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
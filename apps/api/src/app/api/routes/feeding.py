@@ -11,6 +11,7 @@ from datetime import datetime, timedelta, timezone
 
 from src.app.api.dependencies.auth import get_current_user, get_current_organization_id
 from src.app.api.dependencies.db import get_db
+from src.app.core.read_cache import cached_read
 from src.app.models.user import User
 from src.app.models.food import FoodType
 from src.app.schemas.feeding import (
@@ -31,6 +32,7 @@ from src.app.schemas.feeding import (
     SpeciesConsumptionItem,
 )
 from src.app.services.feeding_service import FeedingService
+from src.app.services.feeding_report_service import FeedingReportService
 
 router = APIRouter(prefix="/feeding", tags=["feeding"])
 
@@ -186,6 +188,7 @@ async def get_feeding_plan(
 
 
 @router.get("/plans", response_model=FeedingPlanListResponse)
+@cached_read("feeding_plans")
 async def list_feeding_plans(
     animal_id: Optional[uuid.UUID] = Query(None, description="Filter by animal"),
     food_id: Optional[uuid.UUID] = Query(None, description="Filter by food item"),
@@ -604,6 +607,40 @@ async def get_todays_feeding_tasks(
     }
 
 
+CONSUMPTION_CSV_HEADERS = [
+    "animal_id",
+    "animal_name",
+    "public_code",
+    "species",
+    "food_name",
+    "total_grams",
+    "feeding_count",
+]
+
+
+async def _consumption_csv_lines(organization_id: uuid.UUID, since: datetime):
+    """Yield the consumption report as CSV, one line per row read."""
+    # The body is produced after the endpoint returns, when the request-scoped
+    # session may already be closed, so the export reads through its own.
+    from src.app.db.session import AsyncSessionLocal
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+
+    def _line(row: list) -> str:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerow(row)
+        return buf.getvalue()
+
+    yield _line(CONSUMPTION_CSV_HEADERS)
+    async with AsyncSessionLocal() as db:
+        async for row in FeedingReportService(db).stream_consumption_rows(
+            organization_id, since
+        ):
+            yield _line(row)
+
+
 # Get consumption report for all animals (for reports page)
 @router.get("/consumption/report")
 async def get_consumption_report(
@@ -618,171 +655,23 @@ async def get_consumption_report(
     Returns list of animals with their food consumption totals.
     Supports JSON or CSV format.
     """
-    from sqlalchemy import select, and_
-    from sqlalchemy.orm import selectinload
-    from src.app.models.task import Task, TaskStatus, TaskType
-    from src.app.models.animal import Animal
-    from src.app.models.inventory_item import InventoryItem
-
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
-    # Get all completed feeding tasks
-    stmt = select(Task).where(
-        and_(
-            Task.organization_id == organization_id,
-            Task.type == TaskType.FEEDING,
-            Task.status == TaskStatus.COMPLETED,
-            Task.completed_at >= cutoff,
-            Task.deleted_at.is_(None),
-        )
-    )
-    result = await db.execute(stmt)
-    tasks = result.scalars().all()
-
-    # Aggregate by animal and food
-    consumption: dict = {}  # animal_id -> { food_id -> data }
-
-    for task in tasks:
-        metadata = task.task_metadata or {}
-        amount_g = metadata.get("amount_g")
-        animal_id = metadata.get("animal_id") or (
-            str(task.related_entity_id) if task.related_entity_id else None
-        )
-        food_id = metadata.get("inventory_item_id")
-
-        if not animal_id or not amount_g:
-            continue
-
-        amount = float(amount_g)
-
-        if animal_id not in consumption:
-            consumption[animal_id] = {
-                "animal_id": animal_id,
-                "total_grams": 0.0,
-                "total_feedings": 0,
-                "by_food": {},
-            }
-
-        consumption[animal_id]["total_grams"] += amount
-        consumption[animal_id]["total_feedings"] += 1
-
-        if food_id:
-            if food_id not in consumption[animal_id]["by_food"]:
-                consumption[animal_id]["by_food"][food_id] = {
-                    "food_id": food_id,
-                    "total_grams": 0.0,
-                    "feeding_count": 0,
-                }
-            consumption[animal_id]["by_food"][food_id]["total_grams"] += amount
-            consumption[animal_id]["by_food"][food_id]["feeding_count"] += 1
-
-    # Load animal names
-    animal_ids = [uuid.UUID(aid) for aid in consumption.keys()]
-    if animal_ids:
-        animals_stmt = select(Animal).where(Animal.id.in_(animal_ids))
-        animals_result = await db.execute(animals_stmt)
-        animals = {str(a.id): a for a in animals_result.scalars().all()}
-    else:
-        animals = {}
-
-    # Load food names
-    food_ids = set()
-    for data in consumption.values():
-        food_ids.update(data["by_food"].keys())
-
-    if food_ids:
-        foods_stmt = select(InventoryItem).where(
-            InventoryItem.id.in_([uuid.UUID(fid) for fid in food_ids])
-        )
-        foods_result = await db.execute(foods_stmt)
-        foods = {str(f.id): f for f in foods_result.scalars().all()}
-    else:
-        foods = {}
-
-    # Build response
-    report_items = []
-    for animal_id, data in consumption.items():
-        animal = animals.get(animal_id)
-        by_food_list = []
-        for food_id, food_data in data["by_food"].items():
-            food = foods.get(food_id)
-            by_food_list.append(
-                {
-                    "food_id": food_id,
-                    "food_name": food.name if food else None,
-                    "total_grams": food_data["total_grams"],
-                    "feeding_count": food_data["feeding_count"],
-                }
-            )
-
-        report_items.append(
-            {
-                "animal_id": animal_id,
-                "animal_name": animal.name if animal else None,
-                "animal_public_code": animal.public_code if animal else None,
-                "species": animal.species.value
-                if animal and hasattr(animal.species, "value")
-                else (str(animal.species) if animal else None),
-                "total_grams": data["total_grams"],
-                "total_feedings": data["total_feedings"],
-                "by_food": by_food_list,
-            }
-        )
-
-    # Sort by total consumption descending
-    report_items.sort(key=lambda x: x["total_grams"], reverse=True)
-
     if format == "csv":
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(
-            [
-                "animal_id",
-                "animal_name",
-                "public_code",
-                "species",
-                "food_name",
-                "total_grams",
-                "feeding_count",
-            ]
-        )
-        for item in report_items:
-            if item["by_food"]:
-                for food_item in item["by_food"]:
-                    writer.writerow(
-                        [
-                            item["animal_id"],
-                            item["animal_name"],
-                            item["animal_public_code"],
-                            item["species"],
-                            food_item["food_name"],
-                            food_item["total_grams"],
-                            food_item["feeding_count"],
-                        ]
-                    )
-            else:
-                writer.writerow(
-                    [
-                        item["animal_id"],
-                        item["animal_name"],
-                        item["animal_public_code"],
-                        item["species"],
-                        "",
-                        0,
-                        0,
-                    ]
-                )
-
-        output.seek(0)
         filename = (
             f"feeding_consumption_{days}days_{datetime.now().strftime('%Y%m%d')}.csv"
         )
         return StreamingResponse(
-            iter([output.getvalue()]),
+            _consumption_csv_lines(organization_id, cutoff),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
 
+    # Aggregated in SQL, already sorted by total consumption descending
+    report_items = await FeedingReportService(db).consumption_report(
+        organization_id, cutoff
+    )
+
     return {
         "days": days,
         "period_start": cutoff.isoformat(),
@@ -809,68 +698,16 @@ async def get_animal_consumption_history(
     Get consumption history for a specific animal from completed feeding tasks.
     Returns total grams consumed per food item.
     """
-    from sqlalchemy import select, func, and_, cast, String
-    from src.app.models.task import Task, TaskStatus, TaskType
-    from src.app.models.inventory_item import InventoryItem
-
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
-    # Get completed feeding tasks for this animal
-    stmt = select(Task).where(
-        and_(
-            Task.organization_id == organization_id,
-            Task.type == TaskType.FEEDING,
-            Task.status == TaskStatus.COMPLETED,
-            Task.related_entity_id == animal_id,
-            Task.completed_at >= cutoff,
-            Task.deleted_at.is_(None),
-        )
+    history = await FeedingReportService(db).animal_history(
+        organization_id, animal_id, cutoff
     )
-    result = await db.execute(stmt)
-    tasks = result.scalars().all()
-
-    # Aggregate by food (inventory_item_id)
-    consumption_by_food: dict = {}
-    total_grams = 0.0
-    total_feedings = 0
-
-    for task in tasks:
-        metadata = task.task_metadata or {}
-        amount_g = metadata.get("amount_g")
-        inv_item_id = metadata.get("inventory_item_id")
-
-        if amount_g:
-            amount = float(amount_g)
-            total_grams += amount
-            total_feedings += 1
-
-            if inv_item_id:
-                if inv_item_id not in consumption_by_food:
-                    consumption_by_food[inv_item_id] = {
-                        "inventory_item_id": inv_item_id,
-                        "total_grams": 0.0,
-                        "feeding_count": 0,
-                        "food_name": None,
-                    }
-                consumption_by_food[inv_item_id]["total_grams"] += amount
-                consumption_by_food[inv_item_id]["feeding_count"] += 1
-
-    # Load food names
-    if consumption_by_food:
-        item_ids = [uuid.UUID(k) for k in consumption_by_food.keys()]
-        items_stmt = select(InventoryItem).where(InventoryItem.id.in_(item_ids))
-        items_result = await db.execute(items_stmt)
-        items = items_result.scalars().all()
-        for item in items:
-            if str(item.id) in consumption_by_food:
-                consumption_by_food[str(item.id)]["food_name"] = item.name
 
     return {
         "animal_id": str(animal_id),
         "days": days,
-        "total_grams": total_grams,
-        "total_feedings": total_feedings,
-        "by_food": list(consumption_by_food.values()),
+        **history,
     }
 
 
@@ -941,86 +778,10 @@ async def get_food_consumption_by_species(
     Get food consumption aggregated by species for the last N days.
     Uses completed feeding tasks to calculate actual consumption.
     """
-    from sqlalchemy import select, func, and_
-    from src.app.models.task import Task, TaskStatus, TaskType
-    from src.app.models.animal import Animal
-
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
-    # Get all completed feeding tasks in the period
-    stmt = select(Task).where(
-        and_(
-            Task.organization_id == organization_id,
-            Task.type == TaskType.FEEDING,
-            Task.status == TaskStatus.COMPLETED,
-            Task.completed_at >= cutoff,
-            Task.deleted_at.is_(None),
-        )
-    )
-    result = await db.execute(stmt)
-    tasks = result.scalars().all()
-
-    # Aggregate by animal first
-    animal_consumption: dict = {}  # animal_id -> total_grams
-
-    for task in tasks:
-        metadata = task.task_metadata or {}
-        amount_g = metadata.get("amount_g")
-        animal_id = metadata.get("animal_id") or (
-            str(task.related_entity_id) if task.related_entity_id else None
-        )
-
-        if not animal_id or not amount_g:
-            continue
-
-        amount = float(amount_g)
-
-        if animal_id not in animal_consumption:
-            animal_consumption[animal_id] = 0.0
-        animal_consumption[animal_id] += amount
-
-    # Load animals to get their species
-    if animal_consumption:
-        animal_ids = [uuid.UUID(aid) for aid in animal_consumption.keys()]
-        animals_stmt = select(Animal).where(Animal.id.in_(animal_ids))
-        animals_result = await db.execute(animals_stmt)
-        animals = {str(a.id): a for a in animals_result.scalars().all()}
-    else:
-        animals = {}
-
-    # Aggregate by species
-    species_consumption: dict = {}  # species -> { total_grams, animal_count }
-
-    for animal_id, total_grams in animal_consumption.items():
-        animal = animals.get(animal_id)
-        if animal:
-            species = (
-                animal.species.value
-                if hasattr(animal.species, "value")
-                else str(animal.species)
-            )
-        else:
-            species = "unknown"
-
-        if species not in species_consumption:
-            species_consumption[species] = {"total_grams": 0.0, "animal_ids": set()}
-
-        species_consumption[species]["total_grams"] += total_grams
-        species_consumption[species]["animal_ids"].add(animal_id)
-
-    # Build response
-    by_species = []
-    for species, data in species_consumption.items():
-        by_species.append(
-            SpeciesConsumptionItem(
-                species=species,
-                total_grams=data["total_grams"],
-                animal_count=len(data["animal_ids"]),
-            )
-        )
-
-    # Sort by total consumption descending
-    by_species.sort(key=lambda x: x.total_grams, reverse=True)
+    rows = await FeedingReportService(db).consumption_by_species(organization_id, cutoff)
+    by_species = [SpeciesConsumptionItem(**row) for row in rows]
 
     total_grams = sum(item.total_grams for item in by_species)
     total_animals = sum(item.animal_count for item in by_species)
@@ -1050,81 +811,23 @@ async def get_food_consumption_by_item(
     Get food consumption aggregated by inventory item (food type).
     Shows total grams consumed per food item across all animals.
     """
-    from sqlalchemy import select, and_
-    from src.app.models.task import Task, TaskStatus, TaskType
-    from src.app.models.inventory_item import InventoryItem
-
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
-    # Get all completed feeding tasks in the period
-    stmt = select(Task).where(
-        and_(
-            Task.organization_id == organization_id,
-            Task.type == TaskType.FEEDING,
-            Task.status == TaskStatus.COMPLETED,
-            Task.completed_at >= cutoff,
-            Task.deleted_at.is_(None),
-        )
-    )
-    result = await db.execute(stmt)
-    tasks = result.scalars().all()
-
-    # Aggregate by inventory_item_id
-    item_consumption: dict = {}  # item_id -> { total_grams, feeding_count, animal_ids }
-
-    for task in tasks:
-        metadata = task.task_metadata or {}
-        amount_g = metadata.get("amount_g")
-        item_id = metadata.get("inventory_item_id")
-        animal_id = metadata.get("animal_id") or (
-            str(task.related_entity_id) if task.related_entity_id else None
-        )
-
-        if not amount_g:
-            continue
-
-        amount = float(amount_g)
-
-        # Use "unassigned" for tasks without inventory_item_id
-        key = item_id or "unassigned"
-
-        if key not in item_consumption:
-            item_consumption[key] = {
-                "inventory_item_id": item_id,
-                "total_grams": 0.0,
-                "feeding_count": 0,
-                "animal_ids": set(),
-            }
-
-        item_consumption[key]["total_grams"] += amount
-        item_consumption[key]["feeding_count"] += 1
-        if animal_id:
-            item_consumption[key]["animal_ids"].add(animal_id)
-
-    # Load inventory item names
-    item_ids = [uuid.UUID(k) for k in item_consumption.keys() if k != "unassigned"]
-    if item_ids:
-        items_stmt = select(InventoryItem).where(InventoryItem.id.in_(item_ids))
-        items_result = await db.execute(items_stmt)
-        items = {str(i.id): i for i in items_result.scalars().all()}
-    else:
-        items = {}
-
-    # Build response
-    by_item = []
-    for key, data in item_consumption.items():
-        item = items.get(key) if key != "unassigned" else None
-        by_item.append({
-            "inventory_item_id": data["inventory_item_id"],
-            "item_name": item.name if item else ("Nepřiřazeno" if key == "unassigned" else None),
-            "total_grams": data["total_grams"],
-            "total_kg": round(data["total_grams"] / 1000, 2),
-            "feeding_count": data["feeding_count"],
-            "animal_count": len(data["animal_ids"]),
-        })
-
-    # Sort by total consumption descending
-    by_item.sort(key=lambda x: x["total_grams"], reverse=True)
+    rows = await FeedingReportService(db).consumption_by_item(organization_id, cutoff)
+
+    by_item = [
+        {
+            "inventory_item_id": row["inventory_item_id"],
+            "item_name": row["item_name"]
+            if row["inventory_item_id"]
+            else "Nepřiřazeno",
+            "total_grams": row["total_grams"],
+            "total_kg": round(row["total_grams"] / 1000, 2),
+            "feeding_count": row["feeding_count"],
+            "animal_count": row["animal_count"],
+        }
+        for row in rows
+    ]
 
     total_grams = sum(item["total_grams"] for item in by_item)
     total_feedings = sum(item["feeding_count"] for item in by_item)
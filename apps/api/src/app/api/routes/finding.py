@@ -25,6 +25,8 @@ from src.app.schemas.finding import (
     FindingUpdate,
     FindingWithAnimalResponse,
 )
+from src.app.schemas.map import MapCluster
+from src.app.services.map_cluster_service import BoundingBox, MapSource, viewport
 
 router = APIRouter(prefix="/findings", tags=["findings"])
 
@@ -52,6 +54,37 @@ class FindingsMapResponse(BaseModel):
     findings: list[FindingMapData]
 
 
+class FindingsMapViewport(BaseModel):
+    zoom: int
+    precision: int | None = None
+    clusters: list[MapCluster]
+    points: list[FindingMapData]
+    truncated: bool
+
+
+FINDING_STATUS_SQL = """
+    CASE
+        WHEN f.animal_id IS NOT NULL AND a.status IN ('adopted', 'deceased', 'lost') THEN 'past'
+        ELSE 'current'
+    END
+"""
+
+FINDINGS_MAP_SOURCE = MapSource(
+    from_clause="findings f",
+    lat="f.where_lat",
+    lng="f.where_lng",
+    geohash="f.geohash",
+    id="f.id",
+    point_columns=f"""
+        f.id, f.animal_id, a.name AS animal_name, a.public_code AS animal_public_code,
+        a.species, f.when_found, f.where_lat, f.where_lng, {FINDING_STATUS_SQL} AS status
+    """,
+    point_joins="LEFT JOIN animals a ON a.id = f.animal_id",
+    where="f.organization_id = CAST(:org_id AS uuid)",
+    point_order="f.when_found DESC",
+)
+
+
 def _to_response(finding: Finding) -> FindingResponse:
     return FindingResponse.model_validate(finding)
 
@@ -223,6 +256,33 @@ async def get_findings_map_data(
     return FindingsMapResponse(organization=organization, findings=findings)
 
 
+@router.get("/map-clusters", response_model=FindingsMapViewport)
+async def get_findings_map_viewport(
+    south: float = Query(..., ge=-90, le=90),
+    west: float = Query(..., ge=-180, le=180),
+    north: float = Query(..., ge=-90, le=90),
+    east: float = Query(..., ge=-180, le=180),
+    zoom: int = Query(..., ge=0, le=22),
+    current_user: User = Depends(require_permission("animals.read")),
+    organization_id: uuid.UUID = Depends(get_current_organization_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """Findings inside the map viewport: geohash clusters, or individual
+    findings from street-level zoom."""
+    if south > north:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="south must not be greater than north",
+        )
+    return await viewport(
+        db,
+        FINDINGS_MAP_SOURCE,
+        BoundingBox(south, west, north, east),
+        zoom,
+        {"org_id": str(organization_id)},
+    )
+
+
 @router.get("/{finding_id}", response_model=FindingWithAnimalResponse)
 async def get_finding(
     finding_id: uuid.UUID,
@@ -6,11 +6,8 @@ GDPR compliance endpoints:
 - GET /superadmin/gdpr/dpa/{org_id}  — Generate DPA for org (superadmin)
 """
 
-import csv
-import io
 import logging
 import uuid
-import zipfile
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -24,12 +21,10 @@ from src.app.api.dependencies.auth import (
     require_permission,
 )
 from src.app.api.dependencies.db import get_db
-from src.app.models.audit_log import AuditLog
-from src.app.models.contact import Contact
-from src.app.models.login_log import LoginLog
 from src.app.models.membership import Membership, MembershipStatus
 from src.app.models.organization import Organization
 from src.app.models.user import User
+from src.app.services.gdpr_export_service import GdprExportService, login_logs_query
 from src.app.templates.dpa_cs import render_dpa
 
 logger = logging.getLogger(__name__)
@@ -41,13 +36,9 @@ router = APIRouter(tags=["gdpr"])
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _csv_bytes(headers: list[str], rows: list[list]) -> bytes:
-    """Serialize rows to UTF-8 CSV bytes with BOM for Excel compatibility."""
-    buf = io.StringIO()
-    writer = csv.writer(buf)
-    writer.writerow(headers)
-    writer.writerows(rows)
-    return buf.getvalue().encode("utf-8-sig")
+# Audit and login logs are partitioned by month on created_at; every query
+# against them carries a created_at lower bound so Postgres prunes partitions.
+GDPR_LOG_WINDOW_DAYS = 365
 
 
 async def _require_superadmin(current_user: User = Depends(get_current_user)) -> User:
@@ -63,117 +54,33 @@ async def _require_superadmin(current_user: User = Depends(get_current_user)) ->
 # Admin endpoints (org.manage)
 # ---------------------------------------------------------------------------
 
+async def _stream_export(organization_id: uuid.UUID, since: datetime):
+    # The response body is produced after the endpoint returns, when the
+    # request-scoped session may already be closed, so the export reads
+    # through a session of its own.
+    from src.app.db.session import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        async for chunk in GdprExportService(db).stream_zip(organization_id, since):
+            yield chunk
+
+
 @router.get("/admin/gdpr/export")
 async def gdpr_export(
     _: User = Depends(require_permission("org.manage")),
     organization_id: uuid.UUID = Depends(get_current_organization_id),
-    db: AsyncSession = Depends(get_db),
 ):
     """
     Export all personal data for the organization as a ZIP file with 4 CSV files.
+    The archive is streamed while rows are read, so memory use does not grow
+    with the size of the export.
     Requires org.manage permission.
     """
-    twelve_months_ago = datetime.now(timezone.utc) - timedelta(days=365)
-
-    # --- contacts.csv ---
-    contacts_result = await db.execute(
-        select(Contact).where(Contact.organization_id == organization_id)
-    )
-    contacts = contacts_result.scalars().all()
-    contacts_csv = _csv_bytes(
-        ["id", "name", "type", "email", "phone", "address", "bank_account", "tax_id", "notes", "created_at"],
-        [
-            [
-                str(c.id), c.name, c.type, c.email or "", c.phone or "",
-                c.address or "", c.bank_account or "", c.tax_id or "",
-                (c.notes or "").replace("\n", " "), str(c.created_at),
-            ]
-            for c in contacts
-        ],
-    )
-
-    # --- users.csv (members of this org) ---
-    members_result = await db.execute(
-        select(Membership, User)
-        .join(User, User.id == Membership.user_id)
-        .where(
-            Membership.organization_id == organization_id,
-            Membership.status == MembershipStatus.ACTIVE,
-        )
-    )
-    members = members_result.all()
-    users_csv = _csv_bytes(
-        ["user_id", "name", "email", "phone", "membership_status", "joined_at"],
-        [
-            [
-                str(m.user_id), u.name, u.email, u.phone or "",
-                m.status.value, str(m.created_at),
-            ]
-            for m, u in members
-        ],
-    )
-
-    # --- audit_logs.csv (last 12 months) ---
-    audit_result = await db.execute(
-        select(AuditLog)
-        .where(
-            AuditLog.organization_id == organization_id,
-            AuditLog.created_at >= twelve_months_ago,
-        )
-        .order_by(AuditLog.created_at.desc())
-    )
-    audit_logs = audit_result.scalars().all()
-    audit_csv = _csv_bytes(
-        ["id", "actor_user_id", "action", "entity_type", "entity_id", "ip", "user_agent", "created_at"],
-        [
-            [
-                str(a.id), str(a.actor_user_id) if a.actor_user_id else "",
-                a.action, a.entity_type, str(a.entity_id) if a.entity_id else "",
-                a.ip or "", a.user_agent or "", str(a.created_at),
-            ]
-            for a in audit_logs
-        ],
-    )
-
-    # --- login_logs.csv (last 12 months, for org members only) ---
-    member_user_ids = [m.user_id for m, _ in members]
-    if member_user_ids:
-        login_result = await db.execute(
-            select(LoginLog)
-            .where(
-                LoginLog.user_id.in_(member_user_ids),
-                LoginLog.created_at >= twelve_months_ago,
-            )
-            .order_by(LoginLog.created_at.desc())
-        )
-        login_logs = login_result.scalars().all()
-    else:
-        login_logs = []
-
-    login_csv = _csv_bytes(
-        ["id", "user_id", "email", "ip", "success", "failure_reason", "created_at"],
-        [
-            [
-                str(ll.id), str(ll.user_id) if ll.user_id else "",
-                ll.email, ll.ip or "", str(ll.success),
-                ll.failure_reason or "", str(ll.created_at),
-            ]
-            for ll in login_logs
-        ],
-    )
-
-    # Build ZIP in memory
-    zip_buf = io.BytesIO()
-    with zipfile.ZipFile(zip_buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr("contacts.csv", contacts_csv)
-        zf.writestr("users.csv", users_csv)
-        zf.writestr("audit_logs.csv", audit_csv)
-        zf.writestr("login_logs.csv", login_csv)
-    zip_buf.seek(0)
+    twelve_months_ago = datetime.now(timezone.utc) - timedelta(days=GDPR_LOG_WINDOW_DAYS)
 
     filename = f"gdpr_export_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.zip"
     return StreamingResponse(
-        zip_buf,
+        _stream_export(organization_id, twelve_months_ago),
         media_type="application/zip",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -193,6 +100,7 @@ async def list_login_logs(
 ):
     """
     Paginated login logs for users who are members of this organization.
+    Defaults to the last 12 months when from_date is not given.
     Requires org.manage permission.
     """
     # Get all member user IDs
@@ -207,16 +115,15 @@ async def list_login_logs(
     if not member_user_ids:
         return {"items": [], "total": 0, "page": page, "size": size}
 
-    query = select(LoginLog).where(LoginLog.user_id.in_(member_user_ids))
-
-    if user_id is not None:
-        query = query.where(LoginLog.user_id == user_id)
-    if from_date is not None:
-        query = query.where(LoginLog.created_at >= from_date)
-    if to_date is not None:
-        query = query.where(LoginLog.created_at <= to_date)
-    if success is not None:
-        query = query.where(LoginLog.success == success)
+    if from_date is None:
+        from_date = datetime.now(timezone.utc) - timedelta(days=GDPR_LOG_WINDOW_DAYS)
+    query = login_logs_query(
+        member_user_ids,
+        since=from_date,
+        until=to_date,
+        user_id=user_id,
+        success=success,
+    )
 
     # Total count
     from sqlalchemy import func as sqlfunc
@@ -227,11 +134,9 @@ async def list_login_logs(
 
     # Paginated items
     items_result = await db.execute(
-        query.order_by(LoginLog.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
+        query.offset((page - 1) * size).limit(size)
     )
-    items = items_result.scalars().all()
+    items = items_result.all()
 
     return {
         "items": [
@@ -6,16 +6,25 @@ from datetime import date, datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.app.api.dependencies.auth import get_current_user, get_current_organization_id
 from src.app.api.dependencies.db import get_db
+from src.app.models.breed import Breed
 from src.app.models.intake import Intake, IntakeReason
 from src.app.models.user import User
-from src.app.models.animal import AnimalStatus
+from src.app.models.animal import AgeGroup, AnimalStatus, Sex, Species
+from src.app.services.animal_service import AnimalService
+from src.app.services.kennel_service import (
+    CapacityError,
+    InvalidStateError,
+    NotFoundError,
+    lock_kennel_for_placement,
+)
+from src.app.services.legal_deadline_service import LegalDeadlineService
 
 router = APIRouter(prefix="/intakes", tags=["intakes"])
 
@@ -64,6 +73,35 @@ class IntakeCreate(BaseModel):
         return self
 
 
+class IntakeBulkCreate(BaseModel):
+    """Several animals found or surrendered together (e.g. a litter), each
+    with its own intake record."""
+
+    count: int = Field(ge=1, le=100)
+    name_prefix: str = Field(min_length=1, max_length=200)
+    species: Species
+    breed_ids: List[str] = []
+    color: Optional[str] = None
+    sex: Sex = Sex.UNKNOWN
+    age_group: AgeGroup = AgeGroup.UNKNOWN
+    reason: IntakeReason
+    intake_date: date
+    kennel_id: Optional[str] = None
+    finder_person_id: Optional[str] = None
+    finder_notes: Optional[str] = None
+    notice_published_at: Optional[date] = None
+    finder_claims_ownership: Optional[bool] = None
+    municipality_irrevocably_transferred: Optional[bool] = None
+    notes: Optional[str] = None
+
+    @field_validator("reason")
+    @classmethod
+    def validate_not_hotel(cls, v):
+        if v == IntakeReason.HOTEL:
+            raise ValueError("hotel intakes cannot be created in bulk")
+        return v
+
+
 class IntakeUpdate(BaseModel):
     reason: Optional[IntakeReason] = None
     intake_date: Optional[date] = None
@@ -338,12 +376,110 @@ async def create_intake(
             animal.status = AnimalStatus.HOTEL
         else:
             animal.status = AnimalStatus.INTAKE
+        await db.flush()
+        await LegalDeadlineService(db).refresh(organization_id, [animal.id])
 
     await db.commit()
     await db.refresh(intake)
     return _to_response(intake)
 
 
+@router.post(
+    "/bulk", response_model=List[IntakeResponse], status_code=status.HTTP_201_CREATED
+)
+async def create_intakes_bulk(
+    data: IntakeBulkCreate,
+    current_user: User = Depends(get_current_user),
+    organization_id: uuid.UUID = Depends(get_current_organization_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """Register ``count`` new animals and their intakes in one transaction.
+
+    Animals are named "<name_prefix> 1..count" and share species, breeds,
+    color and kennel. The kennel must belong to the organization and have
+    room for all of them.
+    """
+    try:
+        breed_uuids = [uuid.UUID(b) for b in data.breed_ids]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid breed_ids")
+    try:
+        kennel_uuid = uuid.UUID(data.kennel_id) if data.kennel_id else None
+        finder_uuid = (
+            uuid.UUID(data.finder_person_id) if data.finder_person_id else None
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid kennel_id or finder_person_id")
+
+    if breed_uuids:
+        result = await db.execute(
+            select(Breed.id).where(Breed.id.in_(breed_uuids), Breed.species == data.species)
+        )
+        if set(result.scalars()) != set(breed_uuids):
+            raise HTTPException(
+                status_code=400, detail=f"Unknown breed_ids for species {data.species.value}"
+            )
+    if kennel_uuid:
+        try:
+            await lock_kennel_for_placement(
+                db,
+                organization_id=organization_id,
+                kennel_id=kennel_uuid,
+                species=data.species.value,
+                count=data.count,
+            )
+        except NotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except InvalidStateError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except CapacityError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+
+    animals = await AnimalService(db).create_animals_batch(
+        organization_id,
+        [
+            {
+                "name": f"{data.name_prefix} {i}",
+                "sex": data.sex.value,
+                "age_group": data.age_group.value,
+                "status": AnimalStatus.INTAKE,
+                "legal_notice_published_at": data.notice_published_at,
+                "legal_finder_claims_ownership": data.finder_claims_ownership,
+                "legal_municipality_transferred": data.municipality_irrevocably_transferred,
+            }
+            for i in range(1, data.count + 1)
+        ],
+        species=data.species.value,
+        breed_ids=breed_uuids,
+        color=data.color,
+        kennel_id=kennel_uuid,
+        stay_reason="intake",
+        intake={
+            "reason": data.reason,
+            "intake_date": data.intake_date,
+            "kennel_id": kennel_uuid,
+            "finder_person_id": finder_uuid,
+            "finder_notes": data.finder_notes,
+            "notice_published_at": data.notice_published_at,
+            "finder_claims_ownership": data.finder_claims_ownership,
+            "municipality_irrevocably_transferred": data.municipality_irrevocably_transferred,
+            "notes": data.notes,
+            "created_by_id": current_user.id,
+        },
+        actor_id=current_user.id,
+        estimate_weight=True,
+    )
+    animal_ids = [a.id for a in animals]
+    await LegalDeadlineService(db).refresh(organization_id, animal_ids)
+
+    result = await db.execute(
+        select(Intake).where(Intake.animal_id.in_(animal_ids))
+    )
+    intakes = {i.animal_id: i for i in result.scalars()}
+    await db.commit()
+    return [_to_response(intakes[a.id], a) for a in animals]
+
+
 @router.get("/{intake_id}", response_model=IntakeResponse)
 async def get_intake(
     intake_id: str,
@@ -428,6 +564,15 @@ async def update_intake(
     if data.notes is not None:
         intake.notes = data.notes
 
+    if intake.animal_id and (
+        data.intake_date is not None
+        or data.notice_published_at is not None
+        or data.finder_claims_ownership is not None
+        or data.municipality_irrevocably_transferred is not None
+    ):
+        await db.flush()
+        await LegalDeadlineService(db).refresh(organization_id, [intake.animal_id])
+
     await db.commit()
     await db.refresh(intake)
     return _to_response(intake)
@@ -459,6 +604,9 @@ async def delete_intake(
     from datetime import datetime as dt
 
     intake.deleted_at = dt.utcnow()  # type: ignore
+    if intake.animal_id:
+        await db.flush()
+        await LegalDeadlineService(db).refresh(organization_id, [intake.animal_id])
     await db.commit()
 
 
@@ -2,6 +2,7 @@
 
 import uuid
 import logging
+from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
@@ -27,8 +28,10 @@ from src.app.schemas.inventory import (
     InventoryTransactionCreate,
     InventoryTransactionResponse,
     InventoryStockResponse,
+    InventoryStockAtResponse,
 )
 from src.app.services.inventory_service import InventoryService
+from src.app.services.inventory_snapshot_service import InventorySnapshotService
 
 router = APIRouter(prefix="/inventory", tags=["inventory"])
 
@@ -457,3 +460,29 @@ async def get_low_stock_items(
         low_stock_only=True,
     )
     return items
+
+
+@router.get("/stock-at", response_model=List[InventoryStockAtResponse])
+async def get_stock_at(
+    on_date: date = Query(..., alias="date", description="End of this day (UTC)"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    organization_id: uuid.UUID = Depends(get_current_organization_id),
+):
+    """Stock of each item as of the end of the given date."""
+    category_enum = None
+    if category:
+        try:
+            category_enum = InventoryCategory(category)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid category: {category}",
+            )
+
+    return await InventorySnapshotService(db).stock_at(
+        organization_id=organization_id,
+        on_date=on_date,
+        category=category_enum,
+    )
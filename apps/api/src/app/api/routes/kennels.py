@@ -8,6 +8,8 @@ from sqlalchemy import select, func, text
 
 from src.app.api.dependencies.auth import get_current_user, get_current_organization_id
 from src.app.api.dependencies.db import get_db
+from src.app.core.read_cache import cached_read
+from src.app.core.single_flight import coalesce_requests
 from src.app.models.kennel import Kennel, KennelStay, Zone
 from src.app.models.user import User
 from src.app.models.animal import Animal
@@ -174,6 +176,7 @@ async def get_public_animal(
 
 
 @router.get("/zones")
+@cached_read("zones")
 async def list_zones(
     session: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -189,6 +192,8 @@ async def list_zones(
 
 
 @router.get("")
+@cached_read("kennels")
+@coalesce_requests
 async def list_kennels(
     session: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
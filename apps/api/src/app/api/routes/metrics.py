@@ -21,6 +21,7 @@ from src.app.api.dependencies.auth import (
 from src.app.api.dependencies.db import get_db
 from src.app.models.api_metric import ApiMetric
 from src.app.models.user import User
+from src.app.perf.cache import get_cache_metrics
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
@@ -156,3 +157,11 @@ async def get_recent_metrics(
     )
 
     return list(result.scalars().all())
+
+
+@router.get("/cache")
+async def get_cache_metrics_summary(
+    current_user: User = Depends(require_permission("metrics.read")),
+):
+    """Hit rates of the read cache in this API process, per resource."""
+    return get_cache_metrics().snapshot()
@@ -14,10 +14,12 @@ from src.app.api.dependencies.auth import (
     require_permission,
 )
 from src.app.api.dependencies.db import get_db
+from src.app.core.read_cache import cached_read
 from src.app.models.organization import Organization
 from src.app.models.user import User
 from src.app.schemas.org_settings import OrgSettings, get_org_settings
 from src.app.services.audit_service import AuditService
+from src.app.services.legal_deadline_service import LegalDeadlineService
 
 router = APIRouter(prefix="/organization", tags=["organization"])
 
@@ -95,6 +97,7 @@ async def update_current_organization(
 
 
 @router.get("/settings", response_model=OrgSettings)
+@cached_read("org_settings")
 async def get_organization_settings(
     current_user: User = Depends(get_current_user),
     organization_id: uuid.UUID = Depends(get_current_organization_id),
@@ -122,6 +125,9 @@ async def update_organization_settings(
     before = org.settings or {}
     org.settings = data.model_dump()
 
+    if before.get("legal") != org.settings.get("legal"):
+        await LegalDeadlineService(db).refresh(organization_id)
+
     audit = AuditService(db)
     await audit.log_action(
         organization_id=organization_id,
@@ -9,6 +9,7 @@ from sqlalchemy import select, or_, and_
 
 from src.app.api.dependencies.auth import get_current_user, get_current_organization_id
 from src.app.api.dependencies.db import get_db
+from src.app.core.single_flight import coalesce_requests
 from src.app.models.user import User
 from src.app.models.kennel import KennelStay, Kennel, Zone
 from src.app.models.animal import Animal
@@ -136,6 +137,7 @@ async def list_kennel_stays(
 
 
 @router.get("/timeline")
+@coalesce_requests
 async def get_stays_timeline(
     from_date: Optional[date] = Query(
         None, description="Start date (default: today - 7 days)"
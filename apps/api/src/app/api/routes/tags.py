@@ -7,6 +7,7 @@ from sqlalchemy import select, delete
 
 from src.app.api.dependencies.auth import get_current_user, get_current_organization_id
 from src.app.api.dependencies.db import get_db
+from src.app.core.read_cache import cached_read
 from src.app.models.tag import Tag
 from src.app.models.animal_tag import AnimalTag
 from src.app.models.animal import Animal
@@ -17,6 +18,7 @@ router = APIRouter(prefix="/tags", tags=["tags"])
 
 
 @router.get("", response_model=List[TagResponse])
+@cached_read("tags")
 async def list_tags(
     session: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -28,8 +30,7 @@ async def list_tags(
         .where(Tag.organization_id == organization_id)
         .order_by(Tag.name)
     )
-    tags = result.scalars().all()
-    return tags
+    return [TagResponse.model_validate(tag) for tag in result.scalars()]
 
 
 @router.post("", response_model=TagResponse, status_code=status.HTTP_201_CREATED)
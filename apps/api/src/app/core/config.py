@@ -54,6 +54,34 @@ class Settings(BaseSettings):
         12  # 12h rolling window — changes propagate quickly, minimal conflicts
     )
 
+    # Revaccination reminder tasks, created daily this many days before expiry
+    VACCINATION_REMINDER_DAYS: int = 14
+
+    # In-process KD-tree for /registered-shelters/nearby is rebuilt at most
+    # this often (and after imports); 0 queries Postgres instead
+    SHELTER_GEO_INDEX_TTL_SECONDS: int = 600
+
+    # Identical concurrent heavy reads (kennels board) share one in-flight
+    # computation per process; see src/app/core/single_flight.py
+    REQUEST_COALESCING_ENABLED: bool = True
+
+    # Read-through cache of rarely changing reads (kennels, zones, breeds,
+    # tags, feeding plans, org settings, document templates); entries are
+    # invalidated on commit, the TTL only bounds changes made outside the ORM
+    READ_CACHE_ENABLED: bool = True
+    READ_CACHE_MAX_ENTRIES: int = 2048
+    READ_CACHE_TTL_SECONDS: int = 300
+
+    # Audit Log Settings
+    AUDIT_COMPACT_DIFFS: bool = False  # Shrink large before/after payloads
+    AUDIT_DIFF_MAX_BYTES: int = 8192  # Compaction kicks in above this JSON size
+
+    # Log partition maintenance (audit_logs / login_logs, monthly partitions)
+    LOG_PARTITION_MONTHS_AHEAD: int = 3
+    AUDIT_LOG_RETENTION_MONTHS: int = 24
+    LOGIN_LOG_RETENTION_MONTHS: int = 13  # GDPR export covers the last 12 months
+    LOG_PARTITION_ARCHIVE: bool = False  # Detach into log_archive schema instead of DROP
+
     # Resend Email Settings
     RESEND_API_KEY: str = ""  # Set in production for sending emails
 
@@ -0,0 +1,235 @@
+"""Organization-scoped read-through cache for rarely changing reads.
+
+Kennel lists, zones, breeds, tags, feeding plans, org settings and document
+templates change rarely but were queried on every page view. Endpoints
+decorated with :func:`cached_read` keep their results keyed by
+``(endpoint, organization, parsed query params)`` plus the current version
+of the resource.
+
+Every ``(organization, resource)`` has a version counter; resources that
+also hold rows without an organization (breeds, global document templates)
+have a global one that is part of every organization's key. Versions are
+bumped by session hooks, so entries are never served after a change made
+through the ORM:
+
+- ``after_flush`` maps the flushed rows' tables to resources
+  (:data:`RESOURCE_TABLES`) and buffers the affected (organization,
+  resource) pairs on the session;
+- ``after_commit`` bumps their versions. Bumping only after the commit means
+  a read racing the transaction can only store old data under the old
+  version, which is never looked up again;
+- a rollback discards the buffer.
+
+Entries under old versions are never read again and age out of the LRU.
+Bulk statements, raw SQL and other processes (scripts) bypass the hooks;
+``READ_CACHE_TTL_SECONDS`` bounds how long such a change can go unseen.
+Versions and the default LRU backend live in this process, matching the
+single-process deployment (like the in-process shelter geo index).
+"""
+
+import functools
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.app.core.config import settings
+from src.app.core.single_flight import DEPENDENCY_PARAMS, flight_key
+from src.app.perf.cache import CacheMetrics, get_cache_metrics
+
+# Tables whose changes invalidate a resource
+RESOURCE_TABLES: Dict[str, Tuple[str, ...]] = {
+    # Occupancy and animal previews come from stays and animals
+    "kennels": ("kennels", "zones", "kennel_stays", "animals"),
+    "zones": ("zones",),
+    "breeds": ("breeds", "breeds_i18n"),
+    "tags": ("tags",),
+    "feeding_plans": ("feeding_plans", "animals", "foods"),
+    "org_settings": ("organizations",),
+    "document_templates": ("document_templates",),
+}
+TABLE_RESOURCES: Dict[str, Tuple[str, ...]] = {}
+for _resource, _tables in RESOURCE_TABLES.items():
+    for _table in _tables:
+        TABLE_RESOURCES[_table] = TABLE_RESOURCES.get(_table, ()) + (_resource,)
+
+GLOBAL = None  # scope of rows without an organization
+_BUFFER_KEY = "read_cache_changes"
+_MISSING = object()
+
+
+class LRUBackend:
+    """In-process LRU of at most ``max_entries`` entries, each kept for
+    ``ttl_seconds``."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        metrics: Optional[CacheMetrics] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.metrics = metrics
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """The value, or ``_MISSING``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            if self.metrics is not None:
+                self.metrics.evicted()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class ReadCache:
+    def __init__(self, backend=None, metrics: Optional[CacheMetrics] = None):
+        self.metrics = metrics or get_cache_metrics()
+        self.backend = backend or LRUBackend(
+            settings.READ_CACHE_MAX_ENTRIES,
+            settings.READ_CACHE_TTL_SECONDS,
+            metrics=self.metrics,
+        )
+        self._versions: Dict[Tuple[Optional[uuid.UUID], str], int] = defaultdict(int)
+
+    def version(self, organization_id: Optional[uuid.UUID], resource: str) -> Tuple[int, int]:
+        return self._versions[(organization_id, resource)], self._versions[(GLOBAL, resource)]
+
+    def bump(self, organization_id: Optional[uuid.UUID], resources: Iterable[str]) -> None:
+        for resource in resources:
+            self._versions[(organization_id, resource)] += 1
+            self.metrics.invalidated(resource)
+
+    def get(self, resource: str, key: Hashable) -> Any:
+        value = self.backend.get(key)
+        if value is _MISSING:
+            self.metrics.miss(resource)
+        else:
+            self.metrics.hit(resource)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self.backend.set(key, value)
+
+
+read_cache = ReadCache()
+
+
+def _scopes(obj: Any) -> Set[Optional[uuid.UUID]]:
+    """Organizations of a flushed row (old and new); GLOBAL when it has none
+    or it is not loaded."""
+    state = inspect(obj)
+    if state.mapper.persist_selectable.name == "organizations":
+        return {state.identity[0] if state.identity else GLOBAL}
+    if "organization_id" not in state.mapper.attrs:
+        return {GLOBAL}
+    history = state.attrs.organization_id.history
+    scopes = {org for org in chain(history.added, history.unchanged, history.deleted)}
+    if not scopes:
+        scopes = {state.dict.get("organization_id", GLOBAL)}
+    return scopes
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context) -> None:
+    changes = None
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        resources = TABLE_RESOURCES.get(table)
+        if not resources:
+            continue
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        if changes is None:
+            changes = session.info.setdefault(_BUFFER_KEY, defaultdict(set))
+        for scope in _scopes(obj):
+            changes[scope].update(resources)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_versions(session: Session) -> None:
+    changes = session.info.pop(_BUFFER_KEY, None)
+    if not changes:
+        return
+    for scope, resources in changes.items():
+        read_cache.bump(scope, resources)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_changes(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None and not transaction.nested:
+        session.info.pop(_BUFFER_KEY, None)
+
+
+def _organization_id(value: Any) -> Optional[uuid.UUID]:
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    return uuid.UUID(str(value))
+
+
+def cached_read(
+    resource: str,
+    *,
+    org_param: str = "organization_id",
+    ignore: Iterable[str] = DEPENDENCY_PARAMS,
+    cache: Optional[ReadCache] = None,
+):
+    """Decorator for async endpoints whose result depends only on the
+    organization (``org_param``, if any) and the query parameters.
+
+    Put it below the ``@router`` decorator. The cached object is returned to
+    every hit, so the endpoint must return fresh objects that nobody mutates
+    (dicts or pydantic models, not ORM instances).
+    """
+    ignored = set(ignore) | {org_param}
+
+    def decorator(endpoint):
+        name = f"{endpoint.__module__}.{endpoint.__qualname__}"
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            store = cache or read_cache
+            if not settings.READ_CACHE_ENABLED or args:
+                return await endpoint(*args, **kwargs)
+            try:
+                org_id = _organization_id(kwargs.get(org_param))
+            except ValueError:
+                return await endpoint(**kwargs)  # let the endpoint reject it
+            key = (
+                flight_key(name, org_id, kwargs, ignored),
+                store.version(org_id, resource),
+            )
+            value = store.get(resource, key)
+            if value is not _MISSING:
+                return value
+            value = await endpoint(**kwargs)
+            store.set(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
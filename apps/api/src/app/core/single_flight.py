@@ -0,0 +1,132 @@
+"""Coalescing of identical concurrent requests (single flight).
+
+When the shift opens the kennels board, the same heavy reads arrive for the
+same organization within milliseconds. Endpoints decorated with
+:func:`coalesce_requests` let concurrent identical calls in this process
+share one in-flight computation: the first call (leader) runs the endpoint,
+calls arriving while it runs (followers) await its result instead of running
+the same queries again. Nothing is cached; a call arriving after the leader
+finished runs again.
+
+Calls are identical when they hit the same endpoint for the same
+organization with the same parsed query parameters (dependency parameters
+such as the session or the current user are not part of the key). Auth
+dependencies still run for every request before it joins a flight, so only
+the endpoint body is shared. Endpoints opt in only if their response depends
+on nothing but the organization and the query parameters, and must not
+mutate the returned object.
+
+A leader's exception is raised in its followers too. If the leader is
+cancelled (client disconnect), followers start a new flight.
+"""
+
+import asyncio
+import functools
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Tuple
+
+from src.app.core.config import settings
+
+# Endpoint parameters that are dependencies, not query parameters
+DEPENDENCY_PARAMS = frozenset(
+    {"db", "session", "current_user", "organization_id", "request"}
+)
+
+
+@dataclass
+class FlightStats:
+    leaders: int = 0  # computations run
+    followers: int = 0  # calls served by another call's computation
+
+
+class SingleFlight:
+    def __init__(self):
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+        self.stats = FlightStats()
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Result of ``fn()``, shared with concurrent calls for ``key``."""
+        while True:
+            flight = self._flights.get(key)
+            if flight is None:
+                break
+            try:
+                # shield: cancelling a follower must not cancel the flight
+                result = await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if flight.cancelled():
+                    continue  # leader went away; run it ourselves
+                raise
+            self.stats.followers += 1
+            return result
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        self.stats.leaders += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            flight.exception()  # retrieved; followers may not exist
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+
+flights = SingleFlight()
+
+
+def _normalize(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(sorted((_normalize(v) for v in value), key=repr))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _normalize(v)) for k, v in value.items()))
+    return value
+
+
+def flight_key(
+    endpoint: str, organization_id: Any, params: Dict[str, Any], ignore: Iterable[str]
+) -> Tuple:
+    ignored = set(ignore)
+    return (
+        endpoint,
+        organization_id,
+        tuple(sorted((k, _normalize(v)) for k, v in params.items() if k not in ignored)),
+    )
+
+
+def coalesce_requests(
+    func: Callable[..., Awaitable[Any]] = None,
+    *,
+    ignore: Iterable[str] = DEPENDENCY_PARAMS,
+    group: SingleFlight = flights,
+):
+    """Decorator for async endpoints taking an ``organization_id`` keyword.
+
+    Put it below the ``@router`` decorator; the signature FastAPI sees is
+    unchanged.
+    """
+
+    def decorator(endpoint):
+        name = f"{endpoint.__module__}.{endpoint.__qualname__}"
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            if not settings.REQUEST_COALESCING_ENABLED or args:
+                return await endpoint(*args, **kwargs)
+            key = flight_key(name, kwargs.get("organization_id"), kwargs, ignore)
+            return await group.do(key, lambda: endpoint(**kwargs))
+
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
@@ -317,8 +317,121 @@ async def lifespan(app: FastAPI):
 
     _scheduler_task = asyncio.create_task(_feeding_task_loop())
 
+    async def _log_partition_loop():
+        """Create upcoming audit/login log partitions and retire expired ones (daily)."""
+        await asyncio.sleep(60)
+        while True:
+            try:
+                from src.app.db.session import AsyncSessionLocal
+                from src.app.services.log_partition_service import LogPartitionService
+
+                async with AsyncSessionLocal() as db:
+                    summary = await LogPartitionService(db).run_maintenance()
+                    await db.commit()
+                for table, changes in summary.items():
+                    if changes["created"] or changes["retired"]:
+                        print(
+                            f"[log-partitions] {table}: created={changes['created']} "
+                            f"retired={changes['retired']}"
+                        )
+            except Exception as e:
+                print(f"[log-partitions] error: {e}")
+            await asyncio.sleep(24 * 60 * 60)
+
+    _partition_task = asyncio.create_task(_log_partition_loop())
+
+    async def _revaccination_task_loop():
+        """Create tasks for vaccinations expiring soon (daily)."""
+        await asyncio.sleep(90)
+        while True:
+            try:
+                from src.app.db.session import AsyncSessionLocal
+                from src.app.services.vaccination_service import VaccinationService
+
+                async with AsyncSessionLocal() as db:
+                    created = await VaccinationService(db).create_revaccination_tasks(
+                        settings.VACCINATION_REMINDER_DAYS
+                    )
+                    await db.commit()
+                if created:
+                    print(f"[revaccination] created {created} tasks")
+            except Exception as e:
+                print(f"[revaccination] error: {e}")
+            await asyncio.sleep(24 * 60 * 60)
+
+    _revaccination_task = asyncio.create_task(_revaccination_task_loop())
+
+    async def _legal_deadline_loop():
+        """Flip elapsed legal deadlines from running to expired (daily)."""
+        await asyncio.sleep(120)
+        while True:
+            try:
+                from src.app.db.session import AsyncSessionLocal
+                from src.app.services.legal_deadline_service import LegalDeadlineService
+
+                async with AsyncSessionLocal() as db:
+                    expired = await LegalDeadlineService(db).expire_elapsed()
+                    await db.commit()
+                if expired:
+                    print(f"[legal-deadlines] {expired} deadlines expired")
+            except Exception as e:
+                print(f"[legal-deadlines] error: {e}")
+            await asyncio.sleep(24 * 60 * 60)
+
+    _legal_deadline_task = asyncio.create_task(_legal_deadline_loop())
+
+    async def _population_census_loop():
+        """Close finished days of the daily animal population census (hourly)."""
+        await asyncio.sleep(150)
+        while True:
+            try:
+                from src.app.db.session import AsyncSessionLocal
+                from src.app.services.population_census_service import (
+                    PopulationCensusService,
+                )
+
+                async with AsyncSessionLocal() as db:
+                    inserted = await PopulationCensusService(db).close_pending()
+                    await db.commit()
+                if inserted:
+                    print(f"[population-census] wrote {inserted} snapshot rows")
+            except Exception as e:
+                print(f"[population-census] error: {e}")
+            await asyncio.sleep(60 * 60)
+
+    _population_census_task = asyncio.create_task(_population_census_loop())
+
+    async def _animal_counter_loop():
+        """Reconcile per-organization animal counters with the animals table (every 6h)."""
+        await asyncio.sleep(180)
+        while True:
+            try:
+                from src.app.db.session import AsyncSessionLocal
+                from src.app.models.organization import Organization
+                from src.app.services.animal_counter_service import AnimalCounterService
+                from sqlalchemy import select as _select
+
+                async with AsyncSessionLocal() as db:
+                    org_ids = (await db.execute(_select(Organization.id))).scalars().all()
+                    svc = AnimalCounterService(db)
+                    for org_id in org_ids:
+                        corrected = await svc.reconcile(org_id)
+                        await db.commit()
+                        if corrected:
+                            print(f"[animal-counters] org {org_id}: corrected {corrected} rows")
+            except Exception as e:
+                print(f"[animal-counters] error: {e}")
+            await asyncio.sleep(6 * 60 * 60)
+
+    _animal_counter_task = asyncio.create_task(_animal_counter_loop())
+
     yield
 
+    _animal_counter_task.cancel()
+    _population_census_task.cancel()
+    _legal_deadline_task.cancel()
+    _revaccination_task.cancel()
+    _partition_task.cancel()
     _scheduler_task.cancel()
     await async_engine.dispose()
 
@@ -35,10 +35,14 @@ from src.app.models.feeding_log import FeedingLog
 from src.app.models.inventory_item import InventoryItem, InventoryCategory
 from src.app.models.inventory_lot import InventoryLot
 from src.app.models.inventory_transaction import InventoryTransaction, TransactionType
+from src.app.models.inventory_balance_snapshot import InventoryBalanceSnapshot
 from src.app.models.tag import Tag
 from src.app.models.animal_tag import AnimalTag
 from src.app.models.animal_weight_log import AnimalWeightLog
 from src.app.models.animal_bcs_log import AnimalBCSLog
+from src.app.models.animal_population_snapshot import AnimalPopulationSnapshot
+from src.app.models.animal_status_counter import AnimalStatusCounter
+from src.app.models.animal_import_job import AnimalImportJob, ImportJobStatus
 from src.app.models.file import (
     File,
     EntityFile,
@@ -107,11 +111,16 @@ __all__ = [
     "InventoryCategory",
     "InventoryLot",
     "InventoryTransaction",
+    "InventoryBalanceSnapshot",
     "TransactionType",
     "Tag",
     "AnimalTag",
     "AnimalWeightLog",
     "AnimalBCSLog",
+    "AnimalPopulationSnapshot",
+    "AnimalStatusCounter",
+    "AnimalImportJob",
+    "ImportJobStatus",
     "File",
     "EntityFile",
     "DefaultAnimalImage",
@@ -14,6 +14,7 @@ from sqlalchemy import (
     String,
     Text,
     JSON,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -84,6 +85,16 @@ class Animal(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
             "deleted_at",
             "created_at",
         ),
+        # List filtering/sorting by legal deadline
+        Index(
+            "ix_animals_org_legal_deadline",
+            "organization_id",
+            "legal_deadline_state",
+            "legal_deadline_at",
+            postgresql_where=text(
+                "deleted_at IS NULL AND legal_deadline_state IS NOT NULL"
+            ),
+        ),
     )
 
     organization_id: Mapped[str] = mapped_column(
@@ -218,6 +229,16 @@ class Animal(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
         Boolean, nullable=True
     )
 
+    # Materialized legal deadline (LegalDeadlineService.refresh); recomputed when
+    # intake/animal legal fields or org legal settings change, and running
+    # deadlines are flipped to "expired" nightly.
+    legal_deadline_at: Mapped[date | None] = mapped_column(Date, nullable=True)
+    legal_deadline_type: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    legal_deadline_state: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    legal_deadline_label: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    # Dates the deadline is missing (deadline_state "missing_data")
+    legal_deadline_missing_fields: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+
     # Relationships
     animal_breeds = relationship(
         "AnimalBreed",
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Integer, Text, func
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,8 @@ class AnimalBCSLog(Base):
     __tablename__ = "animal_bcs_logs"
     __table_args__ = (
         CheckConstraint("bcs >= 1 AND bcs <= 9", name="ck_animal_bcs_logs_bcs_range"),
+        # Per-animal history and time-series range scans
+        Index("ix_animal_bcs_logs_animal_measured", "animal_id", "measured_at"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
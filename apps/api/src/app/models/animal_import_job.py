@@ -0,0 +1,48 @@
+"""Bulk animal import jobs (CSV/XLSX onboarding of existing animals)."""
+
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.db.base import Base, UUIDPrimaryKeyMixin, TimestampMixin
+
+
+class ImportJobStatus(str, enum.Enum):
+    PENDING = "pending"        # uploaded, waiting for the worker
+    RUNNING = "running"        # validating / inserting batches
+    VALIDATED = "validated"    # dry run finished, nothing inserted
+    COMPLETED = "completed"
+    FAILED = "failed"          # aborted; batches committed before stay imported
+
+
+class AnimalImportJob(Base, UUIDPrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "animal_import_jobs"
+
+    organization_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    created_by_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
+    )
+    filename: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=ImportJobStatus.PENDING.value
+    )
+    dry_run: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    total_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    processed_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    inserted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # [{"row": 7, "field": "species", "error": "..."}], capped
+    errors: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -0,0 +1,44 @@
+"""Daily animal population census.
+
+One row per organization, day, species and status with the number of
+animals in the shelter at the end of that day (same definition as the
+live daily-count query: an intake on or before the day and no outcome by
+then). Written for closed days by PopulationCensusService; today is always
+counted live.
+"""
+
+import uuid
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.db.base import Base, UUIDPrimaryKeyMixin, TimestampMixin
+
+
+class AnimalPopulationSnapshot(Base, UUIDPrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "animal_population_snapshots"
+    __table_args__ = (
+        # Also serves the per-org date range scan of the daily-count endpoint
+        Index(
+            "uq_animal_population_org_day_group",
+            "organization_id",
+            "snapshot_date",
+            "species",
+            "status",
+            unique=True,
+        ),
+    )
+
+    organization_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    snapshot_date: Mapped[date] = mapped_column(Date, nullable=False)
+    species: Mapped[str] = mapped_column(String(50), nullable=False)
+    # Status at the time the day was closed (backfilled days use the status
+    # the animal had when the backfill ran)
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
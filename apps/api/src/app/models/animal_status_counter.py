@@ -0,0 +1,38 @@
+"""Per-organization animal counters by species and status.
+
+Kept current by the session hooks in
+``src.app.services.animal_counter_service`` (every ORM change of an
+animal's species, status or deleted_at adjusts the matching rows at commit)
+and periodically reconciled against ``animals``. Soft-deleted animals are
+not counted.
+"""
+
+import uuid
+
+from sqlalchemy import ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.db.base import Base, UUIDPrimaryKeyMixin, TimestampMixin
+
+
+class AnimalStatusCounter(Base, UUIDPrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "animal_status_counters"
+    __table_args__ = (
+        Index(
+            "uq_animal_status_counters_org_species_status",
+            "organization_id",
+            "species",
+            "status",
+            unique=True,
+        ),
+    )
+
+    organization_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    species: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
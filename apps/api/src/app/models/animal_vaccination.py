@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, date
 
-from sqlalchemy import DateTime, Date, ForeignKey, String, Text
+from sqlalchemy import DateTime, Date, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,6 +10,21 @@ from src.app.db.base import Base, UUIDPrimaryKeyMixin, TimestampMixin
 
 class AnimalVaccination(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "animal_vaccinations"
+    __table_args__ = (
+        # Expiry summary and revaccination reminders
+        Index(
+            "ix_animal_vaccinations_org_valid_until",
+            "organization_id",
+            "valid_until",
+            postgresql_where=text("valid_until IS NOT NULL"),
+        ),
+        # Animal timeline
+        Index(
+            "ix_animal_vaccinations_animal_administered",
+            "animal_id",
+            "administered_at",
+        ),
+    )
 
     organization_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
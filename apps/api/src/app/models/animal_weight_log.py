@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Numeric, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,6 +10,10 @@ from src.app.db.base import Base
 
 class AnimalWeightLog(Base):
     __tablename__ = "animal_weight_logs"
+    __table_args__ = (
+        # Per-animal history and time-series range scans
+        Index("ix_animal_weight_logs_animal_measured", "animal_id", "measured_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
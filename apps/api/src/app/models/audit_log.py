@@ -1,7 +1,7 @@
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, String, Text, ForeignKey, func
+from sqlalchemy import Index, DateTime, String, Text, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,6 +10,11 @@ from src.app.db.base import Base, UUIDPrimaryKeyMixin
 
 class AuditLog(Base, UUIDPrimaryKeyMixin):
     __tablename__ = "audit_logs"
+    # Monthly range partitions, maintained by LogPartitionService.
+    __table_args__ = (
+        Index("ix_audit_logs_org_created_at", "organization_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     organization_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -30,8 +35,11 @@ class AuditLog(Base, UUIDPrimaryKeyMixin):
     after: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     ip: Mapped[str | None] = mapped_column(String(45), nullable=True)
     user_agent: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Part of the primary key because it is the partition key.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         nullable=False,
         index=True,
@@ -7,7 +7,9 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     DateTime,
+    Index,
     Enum as SQLEnum,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
@@ -85,6 +87,14 @@ class DocumentInstance(Base):
     """
 
     __tablename__ = "document_instances"
+    __table_args__ = (
+        # Animal timeline (event time of a document)
+        Index(
+            "ix_document_instances_animal_timeline",
+            "animal_id",
+            text("(timezone('UTC', created_at))"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id = Column(
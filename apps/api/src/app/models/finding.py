@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Text
+from sqlalchemy import Computed, DateTime, Float, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,6 +10,15 @@ from src.app.db.base import Base, UUIDPrimaryKeyMixin, TimestampMixin
 
 class Finding(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "findings"
+    __table_args__ = (
+        # Viewport prefix filter of the map clusters
+        Index(
+            "ix_findings_org_geohash",
+            "organization_id",
+            "geohash",
+            postgresql_ops={"geohash": "text_pattern_ops"},
+        ),
+    )
 
     organization_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -25,6 +34,9 @@ class Finding(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     )
     where_lat: Mapped[float | None] = mapped_column(Float, nullable=True)
     where_lng: Mapped[float | None] = mapped_column(Float, nullable=True)
+    geohash: Mapped[str | None] = mapped_column(
+        String(12), Computed("geohash_encode(where_lat, where_lng, 12)", persisted=True)
+    )
     when_found: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
@@ -3,7 +3,7 @@ import uuid
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -19,6 +19,14 @@ class IncidentType(str, enum.Enum):
 
 class AnimalIncident(Base):
     __tablename__ = "animal_incidents"
+    __table_args__ = (
+        # Animal timeline (event time of an incident)
+        Index(
+            "ix_animal_incidents_animal_timeline",
+            "animal_id",
+            text("(timezone('UTC', incident_date::timestamp))"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id: Mapped[uuid.UUID] = mapped_column(
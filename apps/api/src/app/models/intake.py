@@ -2,7 +2,7 @@ import uuid
 from datetime import date
 from enum import Enum
 
-from sqlalchemy import Date, ForeignKey, String, Text, Boolean
+from sqlalchemy import Date, ForeignKey, Index, String, Text, Boolean, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,6 +22,15 @@ class IntakeReason(str, Enum):
 
 class Intake(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
     __tablename__ = "intakes"
+    __table_args__ = (
+        # Animal timeline (event time of an intake)
+        Index(
+            "ix_intakes_animal_timeline",
+            "animal_id",
+            text("(timezone('UTC', intake_date::timestamp))"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     organization_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -0,0 +1,68 @@
+"""Daily inventory balance snapshots.
+
+One row per item per day with movement (``lot_id`` NULL) and one row per lot
+per day with movement. Rows are upserted by InventoryService whenever a
+transaction is recorded, so the stock of an item on any date is the
+``closing_quantity`` of its latest snapshot on or before that date.
+"""
+
+import uuid
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Index, Numeric, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.db.base import Base, UUIDPrimaryKeyMixin, TimestampMixin
+
+
+class InventoryBalanceSnapshot(Base, UUIDPrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "inventory_balance_snapshots"
+    __table_args__ = (
+        # Item-level rows: lookup "latest snapshot <= date" per item
+        Index(
+            "uq_inventory_snapshot_item_day",
+            "item_id",
+            "snapshot_date",
+            unique=True,
+            postgresql_where=text("lot_id IS NULL"),
+        ),
+        Index(
+            "uq_inventory_snapshot_lot_day",
+            "lot_id",
+            "snapshot_date",
+            unique=True,
+            postgresql_where=text("lot_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_inventory_snapshots_org_day",
+            "organization_id",
+            "snapshot_date",
+        ),
+    )
+
+    organization_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    item_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("inventory_items.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    lot_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("inventory_lots.id", ondelete="CASCADE"),
+        nullable=True,
+    )
+    snapshot_date: Mapped[date] = mapped_column(Date, nullable=False)
+    # Movements during the day (item units)
+    quantity_in: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    quantity_out: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    consumed_quantity: Mapped[float] = mapped_column(
+        Numeric(12, 2), nullable=False, default=0
+    )
+    consumed_cost: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    # Balance at the end of the day
+    closing_quantity: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False)
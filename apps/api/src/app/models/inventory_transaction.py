@@ -42,6 +42,12 @@ class InventoryTransaction(Base, UUIDPrimaryKeyMixin, TimestampMixin):
             "related_entity_type",
             "related_entity_id",
         ),
+        # Date-range reports and history pages per organization
+        Index(
+            "ix_inventory_transactions_org_created",
+            "organization_id",
+            "created_at",
+        ),
     )
 
     organization_id: Mapped[uuid.UUID] = mapped_column(
@@ -193,6 +193,8 @@ class KennelStay(Base, UUIDPrimaryKeyMixin):
         Index("ix_kennel_stays_org_active", "organization_id", "end_at"),
         Index("ix_kennel_stays_kennel_active", "kennel_id", "end_at"),
         Index("ix_kennel_stays_animal_active", "animal_id", "end_at"),
+        # Animal timeline
+        Index("ix_kennel_stays_animal_start", "animal_id", "start_at"),
     )
 
     created_at: Mapped[datetime] = mapped_column(
@@ -1,7 +1,7 @@
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, ForeignKey, String, DateTime, func
+from sqlalchemy import Index, Boolean, ForeignKey, String, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,6 +10,11 @@ from src.app.db.base import Base
 
 class LoginLog(Base):
     __tablename__ = "login_logs"
+    # Monthly range partitions, maintained by LogPartitionService.
+    __table_args__ = (
+        Index("ix_login_logs_user_created_at", "user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -30,8 +35,12 @@ class LoginLog(Base):
     failure_reason: Mapped[str | None] = mapped_column(
         String(50), nullable=True
     )  # "wrong_password" | "user_not_found" | "inactive"
+    # Part of the primary key because it is the partition key.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         nullable=False,
+        index=True,
     )
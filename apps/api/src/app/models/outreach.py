@@ -71,6 +71,8 @@ class OutreachEmail(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     # Generated content
     generated_subject: Mapped[str | None] = mapped_column(Text, nullable=True)
     generated_body: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Hash of model + rendered prompt the draft was generated from
+    prompt_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     # Sending tracking
     sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
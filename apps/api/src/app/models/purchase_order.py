@@ -7,6 +7,9 @@ import uuid
 
 from src.app.db.base import Base
 
+# Orders whose remaining quantity is still expected to arrive
+OPEN_PO_STATUSES = ("ordered", "partially_received")
+
 
 class PurchaseOrder(Base):
     """Purchase order model for tracking supplier orders."""
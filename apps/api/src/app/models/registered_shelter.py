@@ -1,7 +1,7 @@
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Date, DateTime, Float, String, Text
+from sqlalchemy import Boolean, Computed, Date, DateTime, Float, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.app.db.base import Base, UUIDPrimaryKeyMixin, TimestampMixin
@@ -9,6 +9,21 @@ from src.app.db.base import Base, UUIDPrimaryKeyMixin, TimestampMixin
 
 class RegisteredShelter(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "registered_shelters"
+    __table_args__ = (
+        # Bounding-box prefilter of the nearby-shelters query
+        Index(
+            "ix_registered_shelters_lat_lng",
+            "lat",
+            "lng",
+            postgresql_where=text("lat IS NOT NULL AND lng IS NOT NULL"),
+        ),
+        # Viewport prefix filter of the map clusters
+        Index(
+            "ix_registered_shelters_geohash",
+            "geohash",
+            postgresql_ops={"geohash": "text_pattern_ops"},
+        ),
+    )
 
     registration_number: Mapped[str] = mapped_column(
         String(20), unique=True, nullable=False, index=True
@@ -20,6 +35,9 @@ class RegisteredShelter(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     capacity: Mapped[str | None] = mapped_column(Text, nullable=True)
     lat: Mapped[float | None] = mapped_column(Float, nullable=True)
     lng: Mapped[float | None] = mapped_column(Float, nullable=True)
+    geohash: Mapped[str | None] = mapped_column(
+        String(12), Computed("geohash_encode(lat, lng, 12)", persisted=True)
+    )
     registration_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     phone: Mapped[str | None] = mapped_column(String(50), nullable=True)
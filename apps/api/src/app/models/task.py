@@ -1,7 +1,7 @@
 import enum
 import uuid
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, time
+from typing import Any, Optional
 
 from sqlalchemy import (
     Boolean,
@@ -9,12 +9,15 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     Index,
+    Numeric,
     String,
     Text,
+    Time,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from src.app.db.base import Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin
 
@@ -42,6 +45,35 @@ class TaskStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
+def _parse_uuid(value: Any) -> Optional[uuid.UUID]:
+    if not value:
+        return None
+    try:
+        return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def _parse_time(value: Any) -> Optional[time]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(str(value), "%H:%M").time()
+    except ValueError:
+        return None
+
+
+def _parse_amount(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        amount = float(value)
+    except (TypeError, ValueError):
+        return None
+    # Out-of-range values (Numeric(8, 2)) stay in task_metadata only
+    return amount if abs(amount) < 1_000_000 else None
+
+
 class Task(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
     __tablename__ = "tasks"
     __table_args__ = (
@@ -55,6 +87,49 @@ class Task(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
         Index("ix_tasks_assigned_to", "assigned_to_id"),
         Index("ix_tasks_type", "type"),
         Index("ix_tasks_related_entity", "related_entity_type", "related_entity_id"),
+        # Consumption reports: completed feedings of an org within a period
+        Index(
+            "ix_tasks_feeding_completed",
+            "organization_id",
+            "completed_at",
+            postgresql_where=text(
+                "type = 'feeding' AND status = 'completed' AND deleted_at IS NULL"
+            ),
+        ),
+        # One task per plan slot; also serves plan recalculation lookups
+        Index(
+            "uq_feeding_task_plan_due",
+            "organization_id",
+            "feeding_plan_id",
+            "due_at",
+            unique=True,
+            postgresql_where=text("type = 'feeding' AND deleted_at IS NULL"),
+        ),
+        # Per-animal consumption history
+        Index(
+            "ix_tasks_feeding_animal_completed",
+            "animal_id",
+            "completed_at",
+            postgresql_where=text(
+                "type = 'feeding' AND status = 'completed' AND deleted_at IS NULL"
+            ),
+        ),
+        # Animal timeline (event time of a task)
+        Index(
+            "ix_tasks_animal_timeline",
+            "animal_id",
+            text("(coalesce(completed_at, due_at, created_at))"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # One revaccination reminder per vaccination
+        Index(
+            "uq_tasks_vaccination_reminder",
+            text("(task_metadata ->> 'vaccination_id')"),
+            unique=True,
+            postgresql_where=text(
+                "type = 'medical' AND deleted_at IS NULL AND task_metadata ? 'vaccination_id'"
+            ),
+        ),
     )
 
     organization_id: Mapped[uuid.UUID] = mapped_column(
@@ -118,6 +193,16 @@ class Task(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
         DateTime(timezone=True), nullable=True
     )
     task_metadata: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # Typed copies of the feeding keys in task_metadata, kept in sync by
+    # _sync_feeding_columns so they can be indexed and aggregated directly.
+    feeding_plan_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    animal_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    scheduled_time: Mapped[time | None] = mapped_column(Time, nullable=True)
+    amount_g: Mapped[float | None] = mapped_column(Numeric(8, 2), nullable=True)
     related_entity_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
     related_entity_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), nullable=True
@@ -135,6 +220,15 @@ class Task(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
     created_by = relationship("User", foreign_keys=[created_by_id])
     assigned_to = relationship("User", foreign_keys=[assigned_to_id])
 
+    @validates("task_metadata")
+    def _sync_feeding_columns(self, key: str, metadata: dict | None) -> dict | None:
+        values = metadata or {}
+        self.feeding_plan_id = _parse_uuid(values.get("feeding_plan_id"))
+        self.animal_id = _parse_uuid(values.get("animal_id"))
+        self.scheduled_time = _parse_time(values.get("scheduled_time"))
+        self.amount_g = _parse_amount(values.get("amount_g"))
+        return metadata
+
     @property
     def created_by_name(self) -> Optional[str]:
         return self.created_by.name if self.created_by else None
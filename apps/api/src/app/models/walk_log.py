@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Float, String, Text, ARRAY, Integer
+from sqlalchemy import DateTime, ForeignKey, Float, Index, String, Text, ARRAY, Integer
 from sqlalchemy.dialects.postgresql import UUID, ARRAY as PG_ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,6 +10,10 @@ from src.app.db.base import Base, UUIDPrimaryKeyMixin, TimestampMixin
 
 class WalkLog(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "walk_logs"
+    __table_args__ = (
+        # Walks of an animal (animal_ids @> ARRAY[...])
+        Index("ix_walk_logs_animal_ids", "animal_ids", postgresql_using="gin"),
+    )
 
     organization_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -17,6 +17,7 @@ from src.app.perf.logger import PerfLogger
 from src.app.perf.middleware import PerfMiddleware
 from src.app.perf.sql import setup_sql_listeners
 from src.app.perf.httpx import instrumented_async_client
+from src.app.perf.cache import get_cache_metrics
 
 __all__ = [
     "trace_id_var",
@@ -25,4 +26,5 @@ __all__ = [
     "PerfMiddleware",
     "setup_sql_listeners",
     "instrumented_async_client",
+    "get_cache_metrics",
 ]
@@ -0,0 +1,57 @@
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+
+class CacheMetrics:
+    """Hit/miss counters of the read cache, per resource (this process)."""
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "invalidations": 0}
+        )
+        self.evictions = 0
+
+    def hit(self, resource: str) -> None:
+        self._counts[resource]["hits"] += 1
+
+    def miss(self, resource: str) -> None:
+        self._counts[resource]["misses"] += 1
+
+    def invalidated(self, resource: str) -> None:
+        self._counts[resource]["invalidations"] += 1
+
+    def evicted(self) -> None:
+        self.evictions += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        resources = {}
+        hits = misses = 0
+        for resource, counts in sorted(self._counts.items()):
+            lookups = counts["hits"] + counts["misses"]
+            resources[resource] = {
+                **counts,
+                "hit_rate": round(counts["hits"] / lookups, 4) if lookups else None,
+            }
+            hits += counts["hits"]
+            misses += counts["misses"]
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else None,
+            "evictions": self.evictions,
+            "resources": resources,
+        }
+
+    def reset(self) -> None:
+        self._counts.clear()
+        self.evictions = 0
+
+
+_cache_metrics: Optional[CacheMetrics] = None
+
+
+def get_cache_metrics() -> CacheMetrics:
+    global _cache_metrics
+    if _cache_metrics is None:
+        _cache_metrics = CacheMetrics()
+    return _cache_metrics
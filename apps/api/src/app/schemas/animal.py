@@ -149,6 +149,7 @@ class AnimalResponse(AnimalCreate):
     legal_deadline_days_left: int | None = None
     legal_deadline_state: str | None = None
     legal_deadline_label: str | None = None
+    legal_deadline_missing_fields: list[str] = []
 
     # Website publication tracking (for found animals)
     website_published_at: date | None = None
@@ -221,3 +222,29 @@ class AnimalListResponse(BaseModel):
     page: int
     page_size: int
     has_more: bool = False
+
+
+# --- Bulk import schemas ---
+
+
+class AnimalImportRowError(BaseModel):
+    row: int
+    field: str
+    error: str
+
+
+class AnimalImportJobResponse(BaseModel):
+    id: uuid.UUID
+    filename: str | None = None
+    status: str
+    dry_run: bool
+    total_rows: int
+    processed_rows: int
+    inserted: int
+    failed_rows: int
+    errors: list[AnimalImportRowError] | None = None
+    error_message: str | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,18 @@
+import uuid
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class TimelineEvent(BaseModel):
+    id: uuid.UUID  # id of the source row
+    type: str  # kennel_stay, weight, bcs, vaccination, walk, incident, intake, document, task
+    occurred_at: datetime
+    ended_at: datetime | None = None  # stays and walks
+    data: dict[str, Any]
+
+
+class AnimalTimelineResponse(BaseModel):
+    items: list[TimelineEvent]
+    next_cursor: str | None = None  # pass as ?cursor= for the next (older) page
@@ -110,11 +110,22 @@ class InventoryStockResponse(BaseModel):
     total_quantity: float
     lots_count: int
     oldest_expiry: Optional[date]
+    quantity_on_order: float = 0
 
     class Config:
         from_attributes = True
 
 
+# Point-in-time stock (from daily balance snapshots)
+class InventoryStockAtResponse(BaseModel):
+    item_id: uuid.UUID
+    name: str
+    category: str
+    unit: Optional[str]
+    quantity: float
+    as_of: date
+
+
 # Inventory Lot schemas
 class InventoryLotBase(BaseModel):
     item_id: uuid.UUID
@@ -0,0 +1,11 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class MapCluster(BaseModel):
+    geohash: str
+    count: int
+    lat: float
+    lng: float
+    id: Optional[str] = None  # set for single-member cells
@@ -0,0 +1,27 @@
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SeriesPoint(BaseModel):
+    t: datetime
+    value: float
+    min: float | None = None  # bucket range (avg method)
+    max: float | None = None
+    count: int = 1  # measurements represented by the point
+
+
+class AnimalSeries(BaseModel):
+    animal_id: uuid.UUID
+    total: int  # measurements in the range before downsampling
+    points: list[SeriesPoint]
+
+
+class MeasurementSeriesResponse(BaseModel):
+    metric: str
+    method: str
+    date_from: datetime
+    date_to: datetime
+    bucket_seconds: float | None = None
+    series: list[AnimalSeries]
@@ -0,0 +1,247 @@
+"""Per-organization animal counters by species and status.
+
+``/animals/stats/counts`` used to scan the organization's animals on every
+call. The counts now live in ``animal_status_counters`` and are maintained by
+session hooks, so every code path that changes an animal through the ORM
+(intake create/close, adoption, births, incidents, edits, deletes) keeps them
+current without calling anything:
+
+- ``after_flush`` diffs species/status/deleted_at of the flushed animals and
+  buffers +1/-1 deltas on the session;
+- ``before_commit`` applies the buffer in one ordered multi-row upsert, so
+  the counter rows are only locked for the end of the transaction;
+- a rollback discards the buffer together with the change.
+
+Changes made with bulk UPDATE statements or raw SQL bypass the hooks; the
+periodic :meth:`AnimalCounterService.reconcile` corrects any drift.
+"""
+
+import uuid
+from collections import Counter
+from itertools import chain
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import and_, event, exists, func, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.app.models.animal import Animal
+from src.app.models.animal_status_counter import AnimalStatusCounter
+
+_BUFFER_KEY = "animal_counter_buffer"
+_COUNTED_ATTRS = ("organization_id", "species", "status", "deleted_at")
+_UNKNOWN = object()
+
+CounterKey = Tuple[uuid.UUID, str, str]
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _attr_value(state, attr: str, before: bool) -> Any:
+    """Value of ``attr`` before or after the flush, from attribute history."""
+    history = state.attrs[attr].history
+    if before:
+        if history.deleted:
+            return history.deleted[0]
+        if history.unchanged:
+            return history.unchanged[0]
+        if history.added:
+            # Overwritten without the previous value having been loaded
+            return _UNKNOWN
+    else:
+        if history.added:
+            return history.added[0]
+        if history.unchanged:
+            return history.unchanged[0]
+    return state.dict.get(attr, _UNKNOWN)
+
+
+def _counter_key(state, before: bool, pending: bool = False) -> Any:
+    values = {attr: _attr_value(state, attr, before) for attr in _COUNTED_ATTRS}
+    if pending and values["deleted_at"] is _UNKNOWN:
+        # Never set on a new animal, so inserted as NULL
+        values["deleted_at"] = None
+    if any(value is _UNKNOWN for value in values.values()):
+        return _UNKNOWN
+    if values["deleted_at"] is not None:
+        return None
+    return (
+        values["organization_id"],
+        _enum_value(values["species"]),
+        _enum_value(values["status"]),
+    )
+
+
+def _buffer(session: Session) -> Dict[str, Any]:
+    return session.info.setdefault(_BUFFER_KEY, {"deltas": Counter(), "recount": set()})
+
+
+def reconcile_statements(organization_id: uuid.UUID) -> List[Any]:
+    """Statements that make the organization's counters exact.
+
+    Existing counter rows are locked first so concurrent deltas wait for the
+    recount instead of being overwritten by it.
+    """
+    counter = AnimalStatusCounter
+    actual = (
+        select(
+            func.gen_random_uuid(),
+            Animal.organization_id,
+            Animal.species,
+            Animal.status,
+            func.count(),
+        )
+        .where(Animal.organization_id == organization_id, Animal.deleted_at.is_(None))
+        .group_by(Animal.organization_id, Animal.species, Animal.status)
+    )
+    upsert = insert(counter).from_select(
+        ["id", "organization_id", "species", "status", "count"], actual
+    )
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[counter.organization_id, counter.species, counter.status],
+        set_={"count": upsert.excluded["count"], "updated_at": func.now()},
+        where=counter.count != upsert.excluded["count"],
+    )
+    zero_missing = (
+        update(counter)
+        .where(
+            counter.organization_id == organization_id,
+            counter.count != 0,
+            ~exists().where(
+                and_(
+                    Animal.organization_id == counter.organization_id,
+                    Animal.species == counter.species,
+                    Animal.status == counter.status,
+                    Animal.deleted_at.is_(None),
+                )
+            ),
+        )
+        .values(count=0, updated_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    lock = select(counter.id).where(counter.organization_id == organization_id).with_for_update()
+    return [lock, upsert, zero_missing]
+
+
+def apply_deltas_statement(deltas: Dict[CounterKey, int]):
+    """One upsert adding ``deltas`` to the counters, rows in key order so
+    concurrent transactions lock them in the same order."""
+    rows = [
+        {"organization_id": org_id, "species": species, "status": status, "count": delta}
+        for (org_id, species, status), delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return None
+    stmt = insert(AnimalStatusCounter).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            AnimalStatusCounter.organization_id,
+            AnimalStatusCounter.species,
+            AnimalStatusCounter.status,
+        ],
+        set_={
+            "count": AnimalStatusCounter.count + stmt.excluded["count"],
+            "updated_at": func.now(),
+        },
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_counter_deltas(session: Session, flush_context) -> None:
+    changes = []
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, Animal):
+            continue
+        state = inspect(obj)
+        if obj in session.new:
+            before, after = None, _counter_key(state, before=False, pending=True)
+        elif obj in session.deleted:
+            before, after = _counter_key(state, before=True), None
+        else:
+            if not any(state.attrs[attr].history.has_changes() for attr in _COUNTED_ATTRS):
+                continue
+            before, after = _counter_key(state, before=True), _counter_key(state, before=False)
+        if before is _UNKNOWN or after is _UNKNOWN or before != after:
+            changes.append((state, before, after))
+    if not changes:
+        return
+
+    buffer = _buffer(session)
+    for state, before, after in changes:
+        if before is _UNKNOWN or after is _UNKNOWN:
+            org_id = state.dict.get("organization_id")
+            if org_id is not None:
+                buffer["recount"].add(org_id)
+            continue
+        if before is not None:
+            buffer["deltas"][before] -= 1
+        if after is not None:
+            buffer["deltas"][after] += 1
+
+
+@event.listens_for(Session, "before_commit")
+def _counters_before_commit(session: Session) -> None:
+    # Pending animal changes are collected by the after_flush hook
+    session.flush()
+    buffer = session.info.pop(_BUFFER_KEY, None)
+    if not buffer:
+        return
+    recount = buffer["recount"]
+    stmt = apply_deltas_statement(
+        {key: delta for key, delta in buffer["deltas"].items() if key[0] not in recount}
+    )
+    if stmt is not None:
+        session.execute(stmt)
+    for org_id in sorted(recount):
+        for reconcile_stmt in reconcile_statements(org_id):
+            session.execute(reconcile_stmt)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _counters_after_transaction_end(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    if transaction.parent is None and not transaction.nested:
+        session.info.pop(_BUFFER_KEY, None)
+
+
+class AnimalCounterService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def counts(self, organization_id: uuid.UUID) -> Dict[str, Any]:
+        """Totals by species and by status from the counter rows."""
+        result = await self.db.execute(
+            select(
+                AnimalStatusCounter.species,
+                AnimalStatusCounter.status,
+                AnimalStatusCounter.count,
+            ).where(
+                AnimalStatusCounter.organization_id == organization_id,
+                AnimalStatusCounter.count != 0,
+            )
+        )
+        by_species: Counter = Counter()
+        by_status: Counter = Counter()
+        for row in result.all():
+            by_species[row.species] += row.count
+            by_status[row.status] += row.count
+        return {
+            "total": sum(by_status.values()),
+            "by_species": dict(by_species),
+            "by_status": dict(by_status),
+        }
+
+    async def reconcile(self, organization_id: uuid.UUID) -> int:
+        """Recount the organization's animals into its counters. Returns the
+        number of counter rows that were wrong (0 when nothing drifted)."""
+        corrected = 0
+        for stmt in reconcile_statements(organization_id):
+            result = await self.db.execute(stmt)
+            if stmt.is_dml:
+                corrected += result.rowcount
+        return corrected
@@ -0,0 +1,601 @@
+"""Bulk import of existing animals when a shelter is onboarded.
+
+Creating animals one ``POST /animals`` at a time costs several round trips
+each (public code, breed lookup, default image, audit entry). An import job
+instead:
+
+- parses the whole CSV/XLSX file and validates every row up front, against
+  breed and color catalogs loaded once per job, so the job reports all row
+  errors before anything is written (``dry_run`` stops there);
+- inserts the valid rows in batches with ``COPY`` (animals, breed links and
+  microchips), allocating the batch's public codes with one query,
+  computing the batch's MER with one columnar call and resolving each
+  distinct species/breed/color default image once;
+- commits every batch together with the job's progress, which the client
+  polls, and adds the batch to the animal counters (``COPY`` bypasses the
+  session hooks).
+"""
+
+import csv
+import io
+import logging
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.animal import AgeGroup, AlteredStatus, AnimalStatus, Sex, Species
+from src.app.models.animal_identifier import IdentifierType
+from src.app.models.animal_import_job import AnimalImportJob, ImportJobStatus
+from src.app.services.animal_counter_service import apply_deltas_statement
+from src.app.services.animal_service import AnimalService
+from src.app.services.audit_service import AuditService
+from src.app.services.mer_calculator import calculate_mer_batch
+
+log = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+MAX_ROWS = 20000
+MAX_REPORTED_ERRORS = 500
+
+# Accepted column headers (lower case) -> field
+HEADER_ALIASES = {
+    "name": "name",
+    "jméno": "name",
+    "jmeno": "name",
+    "species": "species",
+    "druh": "species",
+    "sex": "sex",
+    "pohlaví": "sex",
+    "pohlavi": "sex",
+    "breed": "breed",
+    "plemeno": "breed",
+    "color": "color",
+    "barva": "color",
+    "birth_date": "birth_date",
+    "datum narození": "birth_date",
+    "datum narozeni": "birth_date",
+    "age_group": "age_group",
+    "věková skupina": "age_group",
+    "status": "status",
+    "stav": "status",
+    "altered_status": "altered_status",
+    "kastrace": "altered_status",
+    "weight_kg": "weight_kg",
+    "váha": "weight_kg",
+    "hmotnost": "weight_kg",
+    "microchip": "microchip",
+    "čip": "microchip",
+    "cip": "microchip",
+    "description": "description",
+    "popis": "description",
+}
+REQUIRED_FIELDS = ["name", "species"]
+
+SPECIES_ALIASES = {
+    "pes": "dog",
+    "fena": "dog",
+    "kočka": "cat",
+    "kocka": "cat",
+    "kocour": "cat",
+    "hlodavec": "rodent",
+    "králík": "rabbit",
+    "kralik": "rabbit",
+    "pták": "bird",
+    "ptak": "bird",
+    "jiné": "other",
+    "jine": "other",
+}
+SEX_ALIASES = {
+    "m": "male",
+    "samec": "male",
+    "f": "female",
+    "ž": "female",
+    "samice": "female",
+    "fena": "female",
+    "neznámé": "unknown",
+}
+ALTERED_ALIASES = {
+    "ano": "neutered",
+    "kastrovaný": "neutered",
+    "kastrovana": "neutered",
+    "kastrovaná": "spayed",
+    "ne": "intact",
+}
+
+# COPY column order for the animals table; timestamps use server defaults
+ANIMAL_COLUMNS = [
+    "id",
+    "organization_id",
+    "public_code",
+    "name",
+    "species",
+    "sex",
+    "status",
+    "altered_status",
+    "birth_date_estimated",
+    "age_group",
+    "color",
+    "size_estimated",
+    "weight_current_kg",
+    "weight_estimated_kg",
+    "mer_kcal_per_day",
+    "description",
+    "default_image_url",
+    "default_thumbnail_url",
+    "public_visibility",
+    "featured",
+    "is_dewormed",
+    "is_aggressive",
+    "is_pregnant",
+    "is_lactating",
+    "is_critical",
+    "is_diabetic",
+    "is_cancer",
+    "is_special_needs",
+]
+BREED_COLUMNS = ["animal_id", "breed_id"]
+IDENTIFIER_COLUMNS = ["id", "organization_id", "animal_id", "type", "value"]
+
+
+class ImportFileError(ValueError):
+    """The file cannot be imported at all (format, headers, size)."""
+
+
+# ── Parsing ──────────────────────────────────────────────────────────────────
+
+
+def _normalize_header(header: Any) -> Optional[str]:
+    if header is None:
+        return None
+    return HEADER_ALIASES.get(str(header).strip().lower())
+
+
+def _rows_from_table(headers: List[Any], rows: List[List[Any]]) -> List[Dict[str, Any]]:
+    fields = [_normalize_header(h) for h in headers]
+    missing = [f for f in REQUIRED_FIELDS if f not in fields]
+    if missing:
+        raise ImportFileError(f"Missing columns: {', '.join(missing)}")
+    parsed = []
+    for values in rows:
+        if not any(v not in (None, "") for v in values):
+            continue  # blank line
+        parsed.append({f: v for f, v in zip(fields, values) if f})
+    if len(parsed) > MAX_ROWS:
+        raise ImportFileError(f"Too many rows ({len(parsed)}), the limit is {MAX_ROWS}")
+    return parsed
+
+
+def read_csv(content: bytes) -> List[Dict[str, Any]]:
+    try:
+        data = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        data = content.decode("cp1250")  # Czech Excel exports
+    try:
+        dialect = csv.Sniffer().sniff(data[:4096], delimiters=";,\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.reader(io.StringIO(data, newline=""), dialect)
+    table = list(reader)
+    if not table:
+        raise ImportFileError("The file is empty")
+    return _rows_from_table(table[0], table[1:])
+
+
+def read_xlsx(content: bytes) -> List[Dict[str, Any]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFileError("XLSX import is not available, upload a CSV file")
+    workbook = load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+    table = [list(row) for row in workbook.active.iter_rows(values_only=True)]
+    workbook.close()
+    if not table:
+        raise ImportFileError("The file is empty")
+    return _rows_from_table(table[0], table[1:])
+
+
+def read_rows(filename: str, content: bytes) -> List[Dict[str, Any]]:
+    """Rows of an uploaded file keyed by field name (unknown columns are
+    dropped). Raises :class:`ImportFileError`."""
+    name = (filename or "").lower()
+    if name.endswith(".xlsx"):
+        return read_xlsx(content)
+    if name.endswith(".csv") or name.endswith(".txt"):
+        return read_csv(content)
+    raise ImportFileError("Unsupported file type, upload a .csv or .xlsx file")
+
+
+# ── Validation ───────────────────────────────────────────────────────────────
+
+
+@dataclass
+class ImportCatalogs:
+    """Lookups by lower-case name, loaded once per job."""
+
+    breeds: Dict[Tuple[str, str], uuid.UUID] = field(default_factory=dict)
+    colors: Dict[str, str] = field(default_factory=dict)
+    existing_microchips: set = field(default_factory=set)
+
+
+async def load_catalogs(
+    db: AsyncSession, organization_id: uuid.UUID, microchips: List[str]
+) -> ImportCatalogs:
+    catalogs = ImportCatalogs()
+    result = await db.execute(
+        text("""
+            SELECT b.species, lower(b.name) AS name, b.id FROM breeds b
+            UNION
+            SELECT b.species, lower(i.name), b.id
+            FROM breeds_i18n i JOIN breeds b ON b.id = i.breed_id
+        """)
+    )
+    for species, name, breed_id in result.all():
+        catalogs.breeds.setdefault((species, name), breed_id)
+
+    result = await db.execute(
+        text("""
+            SELECT code, lower(name) FROM color_i18n
+            WHERE organization_id IS NULL OR organization_id = :org_id
+        """),
+        {"org_id": organization_id},
+    )
+    for code, name in result.all():
+        catalogs.colors[code.lower()] = code
+        if name:
+            catalogs.colors.setdefault(name, code)
+
+    if microchips:
+        result = await db.execute(
+            text("""
+                SELECT value FROM animal_identifiers
+                WHERE organization_id = :org_id
+                  AND type = :type
+                  AND value = ANY(:values)
+            """),
+            {
+                "org_id": organization_id,
+                "type": IdentifierType.MICROCHIP.value,
+                "values": microchips,
+            },
+        )
+        catalogs.existing_microchips = {row[0] for row in result.all()}
+    return catalogs
+
+
+@dataclass
+class ImportRecord:
+    row: int
+    values: Dict[str, Any]  # animal columns
+    breed_id: Optional[uuid.UUID] = None
+    microchip: Optional[str] = None
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def _choice(value: str, enum_cls, aliases: Dict[str, str], default: str) -> Optional[str]:
+    if not value:
+        return default
+    value = value.lower()
+    value = aliases.get(value, value)
+    return value if value in {e.value for e in enum_cls} else None
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    value = _text(value)
+    for fmt in ("%Y-%m-%d", "%d.%m.%Y", "%d. %m. %Y"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(value)
+
+
+def microchips_of(rows: List[Dict[str, Any]]) -> List[str]:
+    return sorted({_text(r.get("microchip")) for r in rows} - {""})
+
+
+def validate_rows(
+    rows: List[Dict[str, Any]], catalogs: ImportCatalogs
+) -> Tuple[List[ImportRecord], List[Dict[str, Any]]]:
+    """Records for the valid rows and ``{"row", "field", "error"}`` entries
+    for every problem (a row with any error is not imported). Row numbers
+    count the header as row 1."""
+    records: List[ImportRecord] = []
+    errors: List[Dict[str, Any]] = []
+    seen_chips: Dict[str, int] = {}
+
+    for row_num, row in enumerate(rows, start=2):
+        row_errors = []
+
+        def error(field_name: str, message: str) -> None:
+            row_errors.append({"row": row_num, "field": field_name, "error": message})
+
+        name = _text(row.get("name"))
+        if not name:
+            error("name", "Name is required")
+        elif len(name) > 255:
+            error("name", "Name is longer than 255 characters")
+
+        species = _choice(_text(row.get("species")), Species, SPECIES_ALIASES, "")
+        if not _text(row.get("species")):
+            error("species", "Species is required")
+        elif not species:
+            error("species", f"Unknown species '{_text(row.get('species'))}'")
+        sex = _choice(_text(row.get("sex")), Sex, SEX_ALIASES, Sex.UNKNOWN.value)
+        if sex is None:
+            error("sex", f"Unknown sex '{_text(row.get('sex'))}'")
+        status = _choice(_text(row.get("status")), AnimalStatus, {}, AnimalStatus.INTAKE.value)
+        if status is None:
+            error("status", f"Unknown status '{_text(row.get('status'))}'")
+        altered = _choice(
+            _text(row.get("altered_status")),
+            AlteredStatus,
+            ALTERED_ALIASES,
+            AlteredStatus.UNKNOWN.value,
+        )
+        if altered is None:
+            error("altered_status", f"Unknown altered status '{_text(row.get('altered_status'))}'")
+        age_group = _choice(_text(row.get("age_group")), AgeGroup, {}, AgeGroup.UNKNOWN.value)
+        if age_group is None:
+            error("age_group", f"Unknown age group '{_text(row.get('age_group'))}'")
+
+        birth_date = None
+        if _text(row.get("birth_date")):
+            try:
+                birth_date = _parse_date(row.get("birth_date"))
+            except ValueError:
+                error("birth_date", f"Invalid date '{_text(row.get('birth_date'))}'")
+
+        weight = None
+        if _text(row.get("weight_kg")):
+            try:
+                weight = Decimal(_text(row.get("weight_kg")).replace(",", "."))
+            except InvalidOperation:
+                error("weight_kg", f"Invalid weight '{_text(row.get('weight_kg'))}'")
+            else:
+                if not 0 < weight < 10000:
+                    error("weight_kg", "Weight must be between 0 and 10000 kg")
+                weight = weight.quantize(Decimal("0.01"))
+
+        breed_id = None
+        breed_name = _text(row.get("breed"))
+        if breed_name and species:
+            breed_id = catalogs.breeds.get((species, breed_name.lower()))
+            if breed_id is None:
+                error("breed", f"Unknown {species} breed '{breed_name}'")
+
+        color = _text(row.get("color")) or None
+        if color:
+            color = catalogs.colors.get(color.lower(), color)
+
+        microchip = _text(row.get("microchip")) or None
+        if microchip:
+            if microchip in catalogs.existing_microchips:
+                error("microchip", f"Microchip {microchip} is already registered")
+            elif microchip in seen_chips:
+                error("microchip", f"Microchip {microchip} repeats row {seen_chips[microchip]}")
+            else:
+                seen_chips[microchip] = row_num
+
+        if row_errors:
+            errors.extend(row_errors)
+            continue
+        records.append(
+            ImportRecord(
+                row=row_num,
+                values={
+                    "name": name,
+                    "species": species,
+                    "sex": sex,
+                    "status": status,
+                    "altered_status": altered,
+                    "birth_date_estimated": birth_date,
+                    "age_group": age_group,
+                    "color": color,
+                    "weight_current_kg": weight,
+                    "description": _text(row.get("description")) or None,
+                },
+                breed_id=breed_id,
+                microchip=microchip,
+            )
+        )
+    return records, errors
+
+
+# ── Job ──────────────────────────────────────────────────────────────────────
+
+
+class AnimalImportService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._images: Dict[Tuple[str, Optional[uuid.UUID], Optional[str]], Any] = {}
+
+    async def _default_image(self, species: str, breed_id, color) -> Any:
+        key = (species, breed_id, color)
+        if key not in self._images:
+            self._images[key] = await AnimalService(self.db)._compute_default_image_url(
+                species=species, breed_ids=[breed_id] if breed_id else None, color=color
+            )
+        return self._images[key]
+
+    async def _copy(self, table: str, records: List[tuple], columns: List[str]) -> None:
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table, records=records, columns=columns
+        )
+
+    async def insert_batch(
+        self, organization_id: uuid.UUID, records: List[ImportRecord]
+    ) -> List[uuid.UUID]:
+        """COPY one batch of validated records. Does not commit."""
+        codes = await AnimalService(self.db)._allocate_public_codes(organization_id, len(records))
+        mers = calculate_mer_batch(
+            weights_kg=[r.values["weight_current_kg"] for r in records],
+            species=[r.values["species"] for r in records],
+            altered_statuses=[r.values["altered_status"] for r in records],
+            age_groups=[r.values["age_group"] for r in records],
+        )
+        animals, breeds, identifiers = [], [], []
+        deltas: Counter = Counter()
+        for public_code, mer, record in zip(codes, mers, records):
+            v = record.values
+            animal_id = uuid.uuid4()
+            image = await self._default_image(v["species"], record.breed_id, v["color"])
+            weight = v["weight_current_kg"]
+            animals.append(
+                (
+                    animal_id,
+                    organization_id,
+                    public_code,
+                    v["name"],
+                    v["species"],
+                    v["sex"],
+                    v["status"],
+                    v["altered_status"],
+                    v["birth_date_estimated"],
+                    v["age_group"],
+                    v["color"],
+                    "unknown",
+                    weight,
+                    None,
+                    round(mer) if mer is not None else None,
+                    v["description"],
+                    image.public_url if image else None,
+                    image.thumbnail_url if image else None,
+                    False,
+                    False,
+                    False,
+                    False,
+                    False,
+                    False,
+                    False,
+                    False,
+                    False,
+                    False,
+                )
+            )
+            if record.breed_id:
+                breeds.append((animal_id, record.breed_id))
+            if record.microchip:
+                identifiers.append(
+                    (
+                        uuid.uuid4(),
+                        organization_id,
+                        animal_id,
+                        IdentifierType.MICROCHIP.value,
+                        record.microchip,
+                    )
+                )
+            deltas[(organization_id, v["species"], v["status"])] += 1
+
+        await self._copy("animals", animals, ANIMAL_COLUMNS)
+        if breeds:
+            await self._copy("animal_breeds", breeds, BREED_COLUMNS)
+        if identifiers:
+            await self._copy("animal_identifiers", identifiers, IDENTIFIER_COLUMNS)
+        stmt = apply_deltas_statement(dict(deltas))
+        if stmt is not None:
+            await self.db.execute(stmt)
+        return [a[0] for a in animals]
+
+
+async def _update_job(db: AsyncSession, job_id: uuid.UUID, **values: Any) -> None:
+    await db.execute(
+        update(AnimalImportJob).where(AnimalImportJob.id == job_id).values(**values)
+    )
+
+
+async def run_import_job(
+    session_factory: Callable[[], AsyncSession],
+    job_id: uuid.UUID,
+    rows: List[Dict[str, Any]],
+    batch_size: int = BATCH_SIZE,
+) -> None:
+    """Validate and import ``rows`` for the job; progress is committed after
+    every batch. Batches committed before a failure stay imported."""
+    try:
+        async with session_factory() as db:
+            job = (
+                await db.execute(select(AnimalImportJob).where(AnimalImportJob.id == job_id))
+            ).scalar_one()
+            organization_id, actor_id, dry_run = job.organization_id, job.created_by_id, job.dry_run
+            await _update_job(db, job_id, status=ImportJobStatus.RUNNING.value)
+
+            catalogs = await load_catalogs(db, organization_id, microchips_of(rows))
+            records, errors = validate_rows(rows, catalogs)
+            failed = len({e["row"] for e in errors})
+            await _update_job(
+                db,
+                job_id,
+                total_rows=len(rows),
+                failed_rows=failed,
+                processed_rows=failed,
+                errors=errors[:MAX_REPORTED_ERRORS],
+            )
+            if dry_run:
+                await _update_job(
+                    db,
+                    job_id,
+                    status=ImportJobStatus.VALIDATED.value,
+                    processed_rows=len(rows),
+                    finished_at=datetime.now(timezone.utc),
+                )
+            await db.commit()
+        if dry_run:
+            return
+
+        inserted = 0
+        async with session_factory() as db:
+            service = AnimalImportService(db)
+            for start in range(0, len(records), batch_size):
+                batch = records[start : start + batch_size]
+                await service.insert_batch(organization_id, batch)
+                inserted += len(batch)
+                await _update_job(
+                    db,
+                    job_id,
+                    inserted=inserted,
+                    processed_rows=failed + inserted,
+                )
+                await db.commit()
+                log.info("Import %s: %d/%d animals", job_id, inserted, len(records))
+
+            await _update_job(
+                db,
+                job_id,
+                status=ImportJobStatus.COMPLETED.value,
+                finished_at=datetime.now(timezone.utc),
+            )
+            await AuditService(db).log_action(
+                organization_id=organization_id,
+                actor_user_id=actor_id,
+                action="import",
+                entity_type="animal_import_job",
+                entity_id=job_id,
+                after={"inserted": inserted, "failed_rows": failed, "total_rows": len(rows)},
+            )
+            await db.commit()
+    except Exception as exc:
+        log.exception("Animal import %s failed", job_id)
+        async with session_factory() as db:
+            await _update_job(
+                db,
+                job_id,
+                status=ImportJobStatus.FAILED.value,
+                error_message=str(exc)[:1000],
+                finished_at=datetime.now(timezone.utc),
+            )
+            await db.commit()
@@ -2,7 +2,7 @@ import uuid
 from datetime import date, datetime, timezone
 
 from fastapi import HTTPException
-from sqlalchemy import func, select, and_
+from sqlalchemy import BigInteger, cast, func, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from decimal import Decimal
@@ -13,9 +13,20 @@ from src.app.models.animal import Animal, AnimalStatus, Species, Sex
 from src.app.models.animal_breed import AnimalBreed
 from src.app.models.animal_identifier import AnimalIdentifier
 from src.app.models.breed import Breed
+from src.app.models.intake import Intake
 from src.app.models.kennel import KennelStay
 from src.app.schemas.animal import AnimalCreate, AnimalUpdate
+from src.app.services import animal_counter_service  # noqa: F401  registers the counter hooks
 from src.app.services.audit_service import AuditService
+from src.app.services.legal_deadline_service import LegalDeadlineService
+from src.app.services.mer_recompute_service import MER_INPUT_FIELDS, mer_kcal_per_day
+
+# Animal fields that feed the persisted legal deadline
+LEGAL_DEADLINE_INPUTS = {
+    "legal_notice_published_at",
+    "legal_finder_claims_ownership",
+    "legal_municipality_transferred",
+}
 
 
 def _animal_to_dict(animal: Animal) -> dict:
@@ -160,30 +171,43 @@ class AnimalService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    async def _generate_public_code(self, organization_id: uuid.UUID) -> str:
+    async def _allocate_public_codes(
+        self, organization_id: uuid.UUID, count: int
+    ) -> list[str]:
+        """Next ``count`` consecutive public codes of the current year."""
         year = datetime.now(timezone.utc).year
         prefix = f"A-{year}-"
         # Query globally: public_code has a global unique constraint,
         # so the sequence must be unique across all organizations.
         result = await self.db.execute(
-            select(Animal.public_code).where(
-                Animal.public_code.like(f"{prefix}%"),
-            )
+            select(
+                func.max(
+                    cast(func.substring(Animal.public_code, len(prefix) + 1), BigInteger)
+                )
+            ).where(Animal.public_code.op("~")(f"^{prefix}[0-9]+$"))
         )
-        codes = result.scalars().all()
-        if codes:
-            # Parse all numbers and find the max
-            nums = []
-            for code in codes:
-                try:
-                    if code:
-                        nums.append(int(code.split("-")[-1]))
-                except (ValueError, IndexError):
-                    pass
-            seq = max(nums) + 1 if nums else 1
-        else:
-            seq = 1
-        return f"{prefix}{seq:06d}"
+        last = result.scalar() or 0
+        return [f"{prefix}{seq:06d}" for seq in range(last + 1, last + 1 + count)]
+
+    async def _generate_public_code(self, organization_id: uuid.UUID) -> str:
+        return (await self._allocate_public_codes(organization_id, 1))[0]
+
+    @staticmethod
+    def _breed_weight_estimate(breed: Breed | None, sex) -> Decimal | None:
+        """Average adult weight of the breed for the sex, if known."""
+        if breed is None:
+            return None
+        sex = str(sex.value if hasattr(sex, "value") else sex)
+        if sex == "female" and breed.weight_female_min and breed.weight_female_max:
+            return (
+                Decimal(str(breed.weight_female_min))
+                + Decimal(str(breed.weight_female_max))
+            ) / 2
+        if sex in ("male", "unknown") and breed.weight_male_min and breed.weight_male_max:
+            return (
+                Decimal(str(breed.weight_male_min)) + Decimal(str(breed.weight_male_max))
+            ) / 2
+        return None
 
     async def create_animal(
         self,
@@ -244,29 +268,11 @@ class AnimalService:
                 breed_result = await self.db.execute(
                     select(Breed).where(Breed.id == data.breeds[0].breed_id)
                 )
-                breed = breed_result.scalar_one_or_none()
-                if breed:
-                    sex = str(data.sex) if hasattr(data.sex, "value") else data.sex
-                    if (
-                        sex == "female"
-                        and breed.weight_female_min
-                        and breed.weight_female_max
-                    ):
-                        avg = (
-                            Decimal(str(breed.weight_female_min))
-                            + Decimal(str(breed.weight_female_max))
-                        ) / 2
-                        animal.weight_estimated_kg = avg
-                    elif (
-                        sex in ("male", "unknown")
-                        and breed.weight_male_min
-                        and breed.weight_male_max
-                    ):
-                        avg = (
-                            Decimal(str(breed.weight_male_min))
-                            + Decimal(str(breed.weight_male_max))
-                        ) / 2
-                        animal.weight_estimated_kg = avg
+                estimate = self._breed_weight_estimate(
+                    breed_result.scalar_one_or_none(), data.sex
+                )
+                if estimate is not None:
+                    animal.weight_estimated_kg = estimate
                     await self.db.flush()
 
         # Add identifiers
@@ -321,6 +327,96 @@ class AnimalService:
         await self.db.refresh(animal)
         return animal
 
+    async def create_animals_batch(
+        self,
+        organization_id: uuid.UUID,
+        animals: list[dict],
+        species: str,
+        breed_ids: list[uuid.UUID] | None = None,
+        color: str | None = None,
+        kennel_id: uuid.UUID | None = None,
+        stay_reason: str | None = None,
+        intake: dict | None = None,
+        actor_id: uuid.UUID | None = None,
+        estimate_weight: bool = False,
+    ) -> list[Animal]:
+        """Create several animals of the same species/breeds/color at once.
+
+        ``animals`` holds the per-animal column values (name, sex, ...). Public
+        codes are allocated with one query and the default image is resolved
+        once for the shared species/breed/color. Animals and then their breed,
+        kennel stay and intake rows (``intake`` holds the shared Intake
+        values) are each written with one multi-row INSERT. With
+        ``estimate_weight`` animals without a weight get the breed average,
+        as in :meth:`create_animal`. Does not commit.
+        """
+        if not animals:
+            return []
+        breed_ids = breed_ids or []
+        species_value = (species.value if hasattr(species, "value") else species).lower()
+        codes = await self._allocate_public_codes(organization_id, len(animals))
+        default_img = await self._compute_default_image_url(
+            species=species_value, breed_ids=breed_ids, color=color
+        )
+        breed = None
+        if breed_ids and estimate_weight:
+            breed_result = await self.db.execute(select(Breed).where(Breed.id == breed_ids[0]))
+            breed = breed_result.scalar_one_or_none()
+
+        created = []
+        for public_code, values in zip(codes, animals):
+            animal = Animal(
+                id=uuid.uuid4(),
+                organization_id=organization_id,
+                public_code=public_code,
+                species=species_value,
+                color=color,
+                default_image_url=default_img.public_url if default_img else None,
+                default_thumbnail_url=default_img.thumbnail_url if default_img else None,
+                **values,
+            )
+            if breed and animal.weight_estimated_kg is None and animal.weight_current_kg is None:
+                animal.weight_estimated_kg = self._breed_weight_estimate(breed, animal.sex)
+            created.append(animal)
+        self.db.add_all(created)
+        await self.db.flush()
+
+        dependents: list = []
+        for animal in created:
+            dependents.extend(
+                AnimalBreed(animal_id=animal.id, breed_id=breed_id) for breed_id in breed_ids
+            )
+            if kennel_id:
+                dependents.append(
+                    KennelStay(
+                        id=uuid.uuid4(),
+                        organization_id=organization_id,
+                        animal_id=animal.id,
+                        kennel_id=kennel_id,
+                        start_at=datetime.now(timezone.utc),
+                        reason=stay_reason,
+                        moved_by=actor_id,
+                    )
+                )
+            if intake is not None:
+                dependents.append(
+                    Intake(organization_id=organization_id, animal_id=animal.id, **intake)
+                )
+        self.db.add_all(dependents)
+        await self.db.flush()
+
+        if actor_id:
+            for animal in created:
+                await self.audit.log_action(
+                    organization_id=organization_id,
+                    actor_user_id=actor_id,
+                    action="create",
+                    entity_type="animal",
+                    entity_id=animal.id,
+                    after=_animal_to_dict(animal),
+                )
+        return created
+
     async def get_animal(
         self,
         organization_id: uuid.UUID,
@@ -354,6 +450,9 @@ class AnimalService:
         available_for_intake: bool = False,
         sort_by: str | None = None,
         sort_order: str = "desc",
+        legal_deadline_state: str | None = None,
+        legal_deadline_from: date | None = None,
+        legal_deadline_to: date | None = None,
     ) -> tuple[list[Animal], int, bool, dict]:
         from sqlalchemy.orm import selectinload
         from sqlalchemy import text
@@ -375,6 +474,14 @@ class AnimalService:
         if available_for_intake:
             base = base.where(Animal.status.not_in(["intake", "hotel"]))
 
+        # Persisted legal deadline (ix_animals_org_legal_deadline)
+        if legal_deadline_state:
+            base = base.where(Animal.legal_deadline_state == legal_deadline_state)
+        if legal_deadline_from:
+            base = base.where(Animal.legal_deadline_at >= legal_deadline_from)
+        if legal_deadline_to:
+            base = base.where(Animal.legal_deadline_at <= legal_deadline_to)
+
         # Determine sort order
         from sqlalchemy import desc as sql_desc, asc as sql_asc
         order_func = sql_desc if sort_order == "desc" else sql_asc
@@ -412,6 +519,12 @@ class AnimalService:
                 )
                 .order_by(order_func(intake_subq.c.max_intake_date).nulls_last())
             )
+        elif sort_by == "legal_deadline":
+            items_q = base.options(
+                selectinload(Animal.animal_breeds).joinedload(AnimalBreed.breed),
+                selectinload(Animal.identifiers),
+                selectinload(Animal.tags),
+            ).order_by(order_func(Animal.legal_deadline_at).nulls_last(), Animal.id)
         elif sort_by == "name":
             items_q = base.options(
                 selectinload(Animal.animal_breeds).joinedload(AnimalBreed.breed),
@@ -563,28 +676,15 @@ class AnimalService:
         for field, value in update_data.items():
             setattr(animal, field, value)
 
-        # Recalculate MER when health flags or related fields change
-        health_flag_fields = {
-            "is_critical",
-            "is_diabetic",
-            "is_cancer",
-            "is_pregnant",
-            "is_lactating",
-            "altered_status",
-            "weight_current_kg",
-        }
-        if update_data.keys() & health_flag_fields and animal.weight_current_kg:
-            rer = 70 * (float(animal.weight_current_kg) ** 0.75)
-            if animal.species.value == "cat":
-                activity_factor = 1.2
-            elif animal.altered_status.value in ("intact",):
-                activity_factor = 1.8
-            else:
-                activity_factor = 1.4
-            animal.mer_kcal_per_day = int(rer * activity_factor)
+        # Recalculate MER when its inputs (weight, BCS, health flags, ...) change
+        if update_data.keys() & MER_INPUT_FIELDS:
+            animal.mer_kcal_per_day = mer_kcal_per_day([animal])[0]
 
         await self.db.flush()
 
+        if update_data.keys() & LEGAL_DEADLINE_INPUTS:
+            await LegalDeadlineService(self.db).refresh(organization_id, [animal.id])
+
         # Recompute default_image_url if species, breed, or color changed
         # Only if no real photo exists (primary_photo_url is null)
         if animal.primary_photo_url is None:
@@ -0,0 +1,367 @@
+"""Activity timeline of one animal.
+
+Kennel stays, weights, BCS, vaccinations, walks, incidents, intakes,
+documents and tasks are read with one ``UNION ALL`` query in a common event
+shape (``id``, ``type``, ``occurred_at``, ``ended_at``, ``data``), newest
+first. Pages are keyset-paginated on ``(occurred_at, id)``: the cursor is
+pushed into every branch, each branch is limited to one page and served by
+an index on ``(animal_id, <its occurred_at expression>)``, so deep pages cost
+the same as the first. Dates (incidents, intakes) count as UTC midnight.
+
+Feeding tasks are left out; they are generated daily and have their own
+consumption history.
+"""
+
+import base64
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    String,
+    cast,
+    func,
+    literal_column,
+    null,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.animal_bcs_log import AnimalBCSLog
+from src.app.models.animal_vaccination import AnimalVaccination
+from src.app.models.animal_weight_log import AnimalWeightLog
+from src.app.models.document_template import DocumentInstance
+from src.app.models.incident import AnimalIncident
+from src.app.models.intake import Intake
+from src.app.models.kennel import Kennel, KennelStay
+from src.app.models.task import Task, TaskType
+from src.app.models.walk_log import WalkLog
+
+Cursor = Tuple[datetime, uuid.UUID]
+
+
+def encode_cursor(occurred_at: datetime, event_id: uuid.UUID) -> str:
+    raw = f"{occurred_at.isoformat()}|{event_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Raises ValueError for a malformed cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        occurred_at, event_id = raw.split("|")
+        return datetime.fromisoformat(occurred_at), uuid.UUID(event_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def _event(
+    type_: str,
+    id_col,
+    occurred_at,
+    ended_at,
+    data: Dict[str, Any],
+):
+    """SELECT list of one source in the common event shape."""
+    pairs = [x for key, value in data.items() for x in (literal_column(f"'{key}'"), value)]
+    return (
+        id_col.label("id"),
+        literal_column(f"'{type_}'", String).label("type"),
+        occurred_at.label("occurred_at"),
+        (ended_at if ended_at is not None else cast(null(), DateTime(timezone=True))).label(
+            "ended_at"
+        ),
+        func.jsonb_build_object(*pairs).label("data"),
+    )
+
+
+def _utc(column):
+    """timestamptz of a naive UTC timestamp (or of a date at UTC midnight).
+
+    Unlike a cast to timestamptz this does not depend on the session
+    TimeZone, so the timeline indexes can be built on it.
+    """
+    if isinstance(column.type, Date):
+        column = cast(column, DateTime())
+    return func.timezone(literal_column("'UTC'"), column)
+
+
+def _kennel_stays(animal_id, organization_id):
+    return (
+        select(
+            *_event(
+                "kennel_stay",
+                KennelStay.id,
+                KennelStay.start_at,
+                KennelStay.end_at,
+                {
+                    "kennel_id": KennelStay.kennel_id,
+                    "kennel_code": Kennel.code,
+                    "reason": KennelStay.reason,
+                },
+            )
+        )
+        .join(Kennel, Kennel.id == KennelStay.kennel_id)
+        .where(
+            KennelStay.animal_id == animal_id,
+            KennelStay.organization_id == organization_id,
+        ),
+        KennelStay.start_at,
+        KennelStay.id,
+    )
+
+
+def _weights(animal_id, organization_id):
+    return (
+        select(
+            *_event(
+                "weight",
+                AnimalWeightLog.id,
+                AnimalWeightLog.measured_at,
+                None,
+                {"weight_kg": AnimalWeightLog.weight_kg, "notes": AnimalWeightLog.notes},
+            )
+        ).where(AnimalWeightLog.animal_id == animal_id),
+        AnimalWeightLog.measured_at,
+        AnimalWeightLog.id,
+    )
+
+
+def _bcs(animal_id, organization_id):
+    return (
+        select(
+            *_event(
+                "bcs",
+                AnimalBCSLog.id,
+                AnimalBCSLog.measured_at,
+                None,
+                {"bcs": AnimalBCSLog.bcs, "notes": AnimalBCSLog.notes},
+            )
+        ).where(AnimalBCSLog.animal_id == animal_id),
+        AnimalBCSLog.measured_at,
+        AnimalBCSLog.id,
+    )
+
+
+def _vaccinations(animal_id, organization_id):
+    return (
+        select(
+            *_event(
+                "vaccination",
+                AnimalVaccination.id,
+                AnimalVaccination.administered_at,
+                None,
+                {
+                    "vaccination_type": AnimalVaccination.vaccination_type,
+                    "lot_number": AnimalVaccination.lot_number,
+                    "valid_until": AnimalVaccination.valid_until,
+                    "notes": AnimalVaccination.notes,
+                },
+            )
+        ).where(
+            AnimalVaccination.animal_id == animal_id,
+            AnimalVaccination.organization_id == organization_id,
+        ),
+        AnimalVaccination.administered_at,
+        AnimalVaccination.id,
+    )
+
+
+def _walks(animal_id, organization_id):
+    return (
+        select(
+            *_event(
+                "walk",
+                WalkLog.id,
+                WalkLog.started_at,
+                WalkLog.ended_at,
+                {
+                    "walk_type": WalkLog.walk_type,
+                    "status": WalkLog.status,
+                    "duration_minutes": WalkLog.duration_minutes,
+                    "distance_km": WalkLog.distance_km,
+                    "notes": WalkLog.notes,
+                },
+            )
+        ).where(
+            WalkLog.animal_ids.contains(array([animal_id], type_=PG_UUID(as_uuid=True))),
+            WalkLog.organization_id == organization_id,
+        ),
+        WalkLog.started_at,
+        WalkLog.id,
+    )
+
+
+def _incidents(animal_id, organization_id):
+    # Same expression as ix_animal_incidents_animal_timeline
+    occurred_at = _utc(AnimalIncident.incident_date)
+    return (
+        select(
+            *_event(
+                "incident",
+                AnimalIncident.id,
+                occurred_at,
+                None,
+                {
+                    "incident_type": AnimalIncident.incident_type,
+                    "description": AnimalIncident.description,
+                    "resolved": AnimalIncident.resolved,
+                },
+            )
+        ).where(
+            AnimalIncident.animal_id == animal_id,
+            AnimalIncident.organization_id == organization_id,
+        ),
+        occurred_at,
+        AnimalIncident.id,
+    )
+
+
+def _intakes(animal_id, organization_id):
+    # Same expression as ix_intakes_animal_timeline
+    occurred_at = _utc(Intake.intake_date)
+    return (
+        select(
+            *_event(
+                "intake",
+                Intake.id,
+                occurred_at,
+                None,
+                {
+                    "reason": Intake.reason,
+                    "kennel_id": Intake.kennel_id,
+                    "notes": Intake.notes,
+                },
+            )
+        ).where(
+            Intake.animal_id == animal_id,
+            Intake.organization_id == organization_id,
+            Intake.deleted_at.is_(None),
+        ),
+        occurred_at,
+        Intake.id,
+    )
+
+
+def _documents(animal_id, organization_id):
+    # Same expression as ix_document_instances_animal_timeline
+    occurred_at = _utc(DocumentInstance.created_at)
+    return (
+        select(
+            *_event(
+                "document",
+                DocumentInstance.id,
+                occurred_at,
+                None,
+                {
+                    "template_id": DocumentInstance.template_id,
+                    "status": DocumentInstance.status,
+                    "pdf_url": DocumentInstance.pdf_url,
+                },
+            )
+        ).where(
+            DocumentInstance.animal_id == animal_id,
+            DocumentInstance.organization_id == organization_id,
+        ),
+        occurred_at,
+        DocumentInstance.id,
+    )
+
+
+def _tasks(animal_id, organization_id):
+    # Same expression as ix_tasks_animal_timeline
+    occurred_at = func.coalesce(Task.completed_at, Task.due_at, Task.created_at)
+    return (
+        select(
+            *_event(
+                "task",
+                Task.id,
+                occurred_at,
+                None,
+                {
+                    "title": Task.title,
+                    "task_type": Task.type,
+                    "status": Task.status,
+                    "priority": Task.priority,
+                },
+            )
+        ).where(
+            Task.animal_id == animal_id,
+            Task.organization_id == organization_id,
+            Task.deleted_at.is_(None),
+            Task.type != TaskType.FEEDING,
+        ),
+        occurred_at,
+        Task.id,
+    )
+
+
+SOURCES: Dict[str, Callable] = {
+    "kennel_stay": _kennel_stays,
+    "weight": _weights,
+    "bcs": _bcs,
+    "vaccination": _vaccinations,
+    "walk": _walks,
+    "incident": _incidents,
+    "intake": _intakes,
+    "document": _documents,
+    "task": _tasks,
+}
+EVENT_TYPES = tuple(SOURCES)
+
+
+def timeline_query(
+    animal_id: uuid.UUID,
+    organization_id: uuid.UUID,
+    limit: int,
+    types: Optional[Sequence[str]] = None,
+    cursor: Optional[Cursor] = None,
+):
+    """One page (``limit`` rows) of the union, older than ``cursor``."""
+    branches = []
+    for type_ in types or EVENT_TYPES:
+        stmt, occurred_at, id_col = SOURCES[type_](animal_id, organization_id)
+        if cursor is not None:
+            stmt = stmt.where(tuple_(occurred_at, id_col) < tuple_(*cursor))
+        branches.append(
+            stmt.order_by(occurred_at.desc(), id_col.desc()).limit(limit)
+        )
+    events = union_all(*branches).subquery("events")
+    return (
+        select(events)
+        .order_by(events.c.occurred_at.desc(), events.c.id.desc())
+        .limit(limit)
+    )
+
+
+class AnimalTimelineService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def timeline(
+        self,
+        organization_id: uuid.UUID,
+        animal_id: uuid.UUID,
+        limit: int = 50,
+        types: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Newest-first page of events with the cursor of the next page
+        (None on the last page). Raises ValueError for a bad cursor."""
+        after = decode_cursor(cursor) if cursor else None
+        result = await self.db.execute(
+            timeline_query(animal_id, organization_id, limit + 1, types, after)
+        )
+        rows = result.all()
+        items: List[Dict[str, Any]] = [dict(row._mapping) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = encode_cursor(last["occurred_at"], last["id"])
+        return {"items": items, "next_cursor": next_cursor}
@@ -1,13 +1,102 @@
+"""Audit trail writer.
+
+Entries are buffered on the session and written with one multi-row INSERT in
+a ``before_commit`` hook, so services can log several actions per operation
+without a flush round trip in the middle of the transaction.
+"""
+
+import json
 import uuid
+from datetime import datetime, timezone
+from typing import Any
 
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
 
+from src.app.core.config import settings
 from src.app.models.audit_log import AuditLog
 
+_BUFFER_KEY = "audit_log_buffer"
+_MISSING = object()
+
+
+def _json_size(value: Any) -> int:
+    if value is None:
+        return 0
+    return len(json.dumps(value, default=str, ensure_ascii=False))
+
+
+def compact_diff(
+    before: dict | None,
+    after: dict | None,
+    max_bytes: int,
+) -> tuple[dict | None, dict | None]:
+    """Shrink a before/after pair that exceeds ``max_bytes`` of JSON.
+
+    Keys whose value is identical on both sides are dropped first; if the
+    pair is still too large, individual oversized values are replaced with a
+    short ``"<N bytes omitted>"`` marker.
+    """
+    if _json_size(before) + _json_size(after) <= max_bytes:
+        return before, after
+
+    if before is not None and after is not None:
+        changed = {
+            key
+            for key in before.keys() | after.keys()
+            if before.get(key, _MISSING) != after.get(key, _MISSING)
+        }
+        before = {k: v for k, v in before.items() if k in changed}
+        after = {k: v for k, v in after.items() if k in changed}
+
+    if _json_size(before) + _json_size(after) <= max_bytes:
+        return before, after
+
+    value_limit = max(max_bytes // 16, 64)
+
+    def _trim(data: dict | None) -> dict | None:
+        if data is None:
+            return None
+        trimmed = {}
+        for key, value in data.items():
+            size = _json_size(value)
+            trimmed[key] = f"<{size} bytes omitted>" if size > value_limit else value
+        return trimmed
+
+    return _trim(before), _trim(after)
+
+
+def _write_buffered_entries(session: Session) -> int:
+    """Insert every buffered audit row for ``session`` in one statement."""
+    rows = session.info.pop(_BUFFER_KEY, None)
+    if not rows:
+        return 0
+    # Audited entities may still be pending; flush them first so the
+    # organization/user foreign keys resolve.
+    session.flush()
+    session.execute(insert(AuditLog), rows)
+    return len(rows)
+
+
+@event.listens_for(Session, "before_commit")
+def _audit_before_commit(session: Session) -> None:
+    _write_buffered_entries(session)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _audit_after_transaction_end(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    # A rolled back (or closed) outer transaction discards its pending entries.
+    if transaction.parent is None and not transaction.nested:
+        session.info.pop(_BUFFER_KEY, None)
+
 
 class AuditService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, deferred: bool = True):
         self.db = db
+        self.deferred = deferred
 
     async def log_action(
         self,
@@ -20,19 +109,45 @@ class AuditService:
         after: dict | None = None,
         ip: str | None = None,
         user_agent: str | None = None,
+        compact: bool | None = None,
     ) -> AuditLog:
-        log = AuditLog(
-            id=uuid.uuid4(),
-            organization_id=organization_id,
-            actor_user_id=actor_user_id,
-            action=action,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            before=before,
-            after=after,
-            ip=ip,
-            user_agent=user_agent,
-        )
-        self.db.add(log)
-        await self.db.flush()
-        return log
+        """Record an audit entry.
+
+        With ``deferred=True`` (default) the entry is written when the session
+        commits; a rollback discards it together with the audited change.
+        """
+        if compact is None:
+            compact = settings.AUDIT_COMPACT_DIFFS
+        if compact:
+            before, after = compact_diff(before, after, settings.AUDIT_DIFF_MAX_BYTES)
+
+        row = {
+            "id": uuid.uuid4(),
+            "organization_id": organization_id,
+            "actor_user_id": actor_user_id,
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "before": before,
+            "after": after,
+            "ip": ip,
+            "user_agent": user_agent,
+            "created_at": datetime.now(timezone.utc),
+        }
+
+        if not self.deferred:
+            log = AuditLog(**row)
+            self.db.add(log)
+            await self.db.flush()
+            return log
+
+        self.db.info.setdefault(_BUFFER_KEY, []).append(row)
+        return AuditLog(**row)
+
+    async def flush_pending(self) -> int:
+        """Write buffered entries now (e.g. before reading them back in the same
+        transaction). Returns the number of rows inserted."""
+        return await self.db.run_sync(_write_buffered_entries)
+
+    def pending_count(self) -> int:
+        return len(self.db.info.get(_BUFFER_KEY, ()))
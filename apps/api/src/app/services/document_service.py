@@ -12,14 +12,13 @@ from sqlalchemy.orm import selectinload
 from src.app.models.animal import Animal
 from src.app.models.animal_identifier import AnimalIdentifier, IdentifierType
 from src.app.models.intake import Intake
-from src.app.models.inventory_item import InventoryCategory, InventoryItem
-from src.app.models.inventory_lot import InventoryLot
-from src.app.models.inventory_transaction import InventoryTransaction, TransactionReason, TransactionType
+from src.app.models.inventory_item import InventoryCategory
 from src.app.models.organization import Organization
 from src.app.models.contact import Contact
 from src.app.models.user import User
 from src.app.models.document_template import DocumentTemplate, DocumentInstance, DocumentStatus
 from src.app.models.breed_i18n import BreedI18n
+from src.app.services.inventory_snapshot_service import InventorySnapshotService
 
 
 SEX_LABELS: dict[str, dict[str, str]] = {
@@ -434,51 +433,18 @@ class DocumentService:
         organization_id: UUID,
         year: int,
     ) -> list[dict[str, Any]]:
-        """Fetch aggregated food consumption (OUT/CONSUMPTION/FOOD) for the given year."""
+        """Fetch food consumption per month and item for the given year from the
+        daily inventory snapshots."""
         CZECH_MONTHS = {
             1: "Leden", 2: "Únor", 3: "Březen", 4: "Duben",
             5: "Květen", 6: "Červen", 7: "Červenec", 8: "Srpen",
             9: "Září", 10: "Říjen", 11: "Listopad", 12: "Prosinec",
         }
 
-        query = (
-            select(
-                func.extract("month", InventoryTransaction.created_at).label("month_num"),
-                InventoryItem.name.label("item_name"),
-                InventoryItem.food_type.label("food_type"),
-                InventoryItem.unit.label("unit"),
-                InventoryItem.unit_weight_g.label("unit_weight_g"),
-                func.sum(InventoryTransaction.quantity).label("total_qty"),
-                func.sum(
-                    InventoryTransaction.quantity
-                    * func.coalesce(InventoryLot.cost_per_unit, InventoryItem.price_per_unit, 0)
-                ).label("total_cost"),
-            )
-            .join(InventoryItem, InventoryTransaction.item_id == InventoryItem.id)
-            .outerjoin(InventoryLot, InventoryTransaction.lot_id == InventoryLot.id)
-            .where(
-                InventoryTransaction.organization_id == organization_id,
-                InventoryTransaction.direction == TransactionType.OUT,
-                InventoryTransaction.reason == TransactionReason.CONSUMPTION,
-                InventoryItem.category == InventoryCategory.FOOD,
-                extract("year", InventoryTransaction.created_at) == year,
-            )
-            .group_by(
-                func.extract("month", InventoryTransaction.created_at),
-                InventoryItem.name,
-                InventoryItem.food_type,
-                InventoryItem.unit,
-                InventoryItem.unit_weight_g,
-            )
-            .order_by(
-                func.extract("month", InventoryTransaction.created_at),
-                InventoryItem.name,
-            )
+        db_rows = await InventorySnapshotService(self.db).monthly_consumption(
+            organization_id, year, category=InventoryCategory.FOOD
         )
 
-        result = await self.db.execute(query)
-        db_rows = result.all()
-
         data: list[dict[str, Any]] = []
         for row in db_rows:
             month_num = int(row.month_num)
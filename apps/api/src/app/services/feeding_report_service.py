@@ -0,0 +1,287 @@
+"""Feeding consumption reports aggregated in Postgres.
+
+Completed feeding tasks record what was fed in the typed ``amount_g`` and
+``animal_id`` columns (the inventory item is still only in
+``task_metadata``). The reports select those values per task in a subquery
+and GROUP BY over it, joining only the name columns they need, so no
+Task/Animal/InventoryItem ORM rows are loaded.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from sqlalchemy import Select, and_, cast, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.animal import Animal
+from src.app.models.inventory_item import InventoryItem
+from src.app.models.task import Task, TaskStatus, TaskType
+
+
+def _meta_text(key: str):
+    return func.nullif(Task.task_metadata[key].astext, literal_column("''"))
+
+
+# Per-task report dimensions. animal_id falls back to the related entity for
+# tasks created before the metadata carried it.
+AMOUNT_G = Task.amount_g
+ANIMAL_ID = func.coalesce(Task.animal_id, Task.related_entity_id)
+FOOD_ID = cast(_meta_text("inventory_item_id"), UUID(as_uuid=True))
+
+
+# Rows fetched per round trip when the consumption report is streamed.
+CONSUMPTION_YIELD_PER = 1000
+
+
+def _species_value(species) -> Optional[str]:
+    if species is None:
+        return None
+    return species.value if hasattr(species, "value") else str(species)
+
+
+class FeedingReportService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _feedings(
+        self,
+        organization_id: uuid.UUID,
+        since: datetime,
+        animal_id: Optional[uuid.UUID] = None,
+    ):
+        """One row per completed feeding task with a non-zero amount."""
+        conditions = [
+            Task.organization_id == organization_id,
+            Task.type == TaskType.FEEDING,
+            Task.status == TaskStatus.COMPLETED,
+            Task.completed_at >= since,
+            Task.deleted_at.is_(None),
+            AMOUNT_G != 0,
+        ]
+        if animal_id is not None:
+            conditions.append(
+                or_(
+                    Task.animal_id == animal_id,
+                    and_(Task.animal_id.is_(None), Task.related_entity_id == animal_id),
+                )
+            )
+        return (
+            select(
+                ANIMAL_ID.label("animal_id"),
+                FOOD_ID.label("food_id"),
+                AMOUNT_G.label("amount_g"),
+            )
+            .where(and_(*conditions))
+            .subquery("feedings")
+        )
+
+    def _consumption_rows(self, organization_id: uuid.UUID, since: datetime) -> Select:
+        """One row per animal and food, largest consumers first."""
+        fed = self._feedings(organization_id, since)
+        per_food = (
+            select(
+                fed.c.animal_id,
+                fed.c.food_id,
+                func.sum(fed.c.amount_g).label("total_grams"),
+                func.count().label("feeding_count"),
+            )
+            .where(fed.c.animal_id.isnot(None))
+            .group_by(fed.c.animal_id, fed.c.food_id)
+            .subquery("per_food")
+        )
+        animal_total = func.sum(per_food.c.total_grams).over(
+            partition_by=per_food.c.animal_id
+        )
+        return (
+            select(
+                per_food.c.animal_id,
+                Animal.name.label("animal_name"),
+                Animal.public_code,
+                Animal.species,
+                per_food.c.food_id,
+                InventoryItem.name.label("food_name"),
+                per_food.c.total_grams,
+                per_food.c.feeding_count,
+                animal_total.label("animal_total_grams"),
+            )
+            .outerjoin(Animal, Animal.id == per_food.c.animal_id)
+            .outerjoin(InventoryItem, InventoryItem.id == per_food.c.food_id)
+            .order_by(animal_total.desc(), per_food.c.animal_id, per_food.c.total_grams.desc())
+        )
+
+    async def consumption_report(
+        self, organization_id: uuid.UUID, since: datetime
+    ) -> List[Dict[str, Any]]:
+        """Per-animal totals with a per-food breakdown, largest consumers first."""
+        result = await self.db.execute(self._consumption_rows(organization_id, since))
+
+        items: List[Dict[str, Any]] = []
+        for row in result.all():
+            animal_id = str(row.animal_id)
+            if not items or items[-1]["animal_id"] != animal_id:
+                items.append(
+                    {
+                        "animal_id": animal_id,
+                        "animal_name": row.animal_name,
+                        "animal_public_code": row.public_code,
+                        "species": _species_value(row.species),
+                        "total_grams": 0.0,
+                        "total_feedings": 0,
+                        "by_food": [],
+                    }
+                )
+            item = items[-1]
+            item["total_grams"] += float(row.total_grams)
+            item["total_feedings"] += int(row.feeding_count)
+            if row.food_id is not None:
+                item["by_food"].append(
+                    {
+                        "food_id": str(row.food_id),
+                        "food_name": row.food_name,
+                        "total_grams": float(row.total_grams),
+                        "feeding_count": int(row.feeding_count),
+                    }
+                )
+        return items
+
+    async def stream_consumption_rows(
+        self,
+        organization_id: uuid.UUID,
+        since: datetime,
+        yield_per: int = CONSUMPTION_YIELD_PER,
+    ) -> AsyncIterator[List[Any]]:
+        """The consumption report flattened to one row per animal and food,
+        read through a server-side cursor.
+
+        Rows are ``[animal_id, animal_name, public_code, species, food_name,
+        total_grams, feeding_count]``. Feedings without an inventory item get
+        no row of their own; an animal fed only that way gets a single row
+        with an empty food and zero totals.
+        """
+        result = await self.db.stream(
+            self._consumption_rows(organization_id, since).execution_options(
+                yield_per=yield_per
+            )
+        )
+        try:
+            animal_cols: Optional[List[Any]] = None
+            has_food = False
+            async for row in result:
+                animal_id = str(row.animal_id)
+                if animal_cols is None or animal_cols[0] != animal_id:
+                    if animal_cols is not None and not has_food:
+                        yield animal_cols + ["", 0, 0]
+                    animal_cols = [
+                        animal_id,
+                        row.animal_name,
+                        row.public_code,
+                        _species_value(row.species),
+                    ]
+                    has_food = False
+                if row.food_id is not None:
+                    has_food = True
+                    yield animal_cols + [
+                        row.food_name,
+                        float(row.total_grams),
+                        int(row.feeding_count),
+                    ]
+            if animal_cols is not None and not has_food:
+                yield animal_cols + ["", 0, 0]
+        finally:
+            await result.close()
+
+    async def animal_history(
+        self, organization_id: uuid.UUID, animal_id: uuid.UUID, since: datetime
+    ) -> Dict[str, Any]:
+        """Totals for one animal, broken down by inventory item."""
+        fed = self._feedings(organization_id, since, animal_id=animal_id)
+        result = await self.db.execute(
+            select(
+                fed.c.food_id,
+                InventoryItem.name.label("food_name"),
+                func.sum(fed.c.amount_g).label("total_grams"),
+                func.count().label("feeding_count"),
+            )
+            .outerjoin(InventoryItem, InventoryItem.id == fed.c.food_id)
+            .group_by(fed.c.food_id, InventoryItem.name)
+        )
+
+        total_grams = 0.0
+        total_feedings = 0
+        by_food = []
+        for row in result.all():
+            total_grams += float(row.total_grams)
+            total_feedings += int(row.feeding_count)
+            if row.food_id is not None:
+                by_food.append(
+                    {
+                        "inventory_item_id": str(row.food_id),
+                        "total_grams": float(row.total_grams),
+                        "feeding_count": int(row.feeding_count),
+                        "food_name": row.food_name,
+                    }
+                )
+        return {
+            "total_grams": total_grams,
+            "total_feedings": total_feedings,
+            "by_food": by_food,
+        }
+
+    async def consumption_by_species(
+        self, organization_id: uuid.UUID, since: datetime
+    ) -> List[Dict[str, Any]]:
+        """Grams and distinct animals per species; unknown animals are
+        reported as species ``"unknown"``."""
+        fed = self._feedings(organization_id, since)
+        total_grams = func.sum(fed.c.amount_g)
+        result = await self.db.execute(
+            select(
+                Animal.species,
+                total_grams.label("total_grams"),
+                func.count(func.distinct(fed.c.animal_id)).label("animal_count"),
+            )
+            .outerjoin(Animal, Animal.id == fed.c.animal_id)
+            .where(fed.c.animal_id.isnot(None))
+            .group_by(Animal.species)
+            .order_by(total_grams.desc())
+        )
+        return [
+            {
+                "species": _species_value(row.species) or "unknown",
+                "total_grams": float(row.total_grams),
+                "animal_count": int(row.animal_count),
+            }
+            for row in result.all()
+        ]
+
+    async def consumption_by_item(
+        self, organization_id: uuid.UUID, since: datetime
+    ) -> List[Dict[str, Any]]:
+        """Grams, feedings and distinct animals per inventory item; tasks
+        without an item are grouped under ``inventory_item_id = None``."""
+        fed = self._feedings(organization_id, since)
+        total_grams = func.sum(fed.c.amount_g)
+        result = await self.db.execute(
+            select(
+                fed.c.food_id,
+                InventoryItem.name.label("item_name"),
+                total_grams.label("total_grams"),
+                func.count().label("feeding_count"),
+                func.count(func.distinct(fed.c.animal_id)).label("animal_count"),
+            )
+            .outerjoin(InventoryItem, InventoryItem.id == fed.c.food_id)
+            .group_by(fed.c.food_id, InventoryItem.name)
+            .order_by(total_grams.desc())
+        )
+        return [
+            {
+                "inventory_item_id": str(row.food_id) if row.food_id else None,
+                "item_name": row.item_name,
+                "total_grams": float(row.total_grams),
+                "feeding_count": int(row.feeding_count),
+                "animal_count": int(row.animal_count),
+            }
+            for row in result.all()
+        ]
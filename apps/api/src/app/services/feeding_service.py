@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func, update
 from sqlalchemy.orm import selectinload
 from typing import List, Optional, Dict, Any
-from datetime import datetime, date, timezone, timedelta
+from datetime import datetime, date, time, timezone, timedelta
 import uuid
 
 from src.app.models.feeding_plan import FeedingPlan
@@ -189,7 +189,7 @@ class FeedingService:
             and_(
                 Task.organization_id == organization_id,
                 Task.type == TaskType.FEEDING,
-                Task.task_metadata["feeding_plan_id"].astext == str(plan.id),
+                Task.feeding_plan_id == plan.id,
                 Task.status == TaskStatus.PENDING,
                 Task.due_at > now,
                 Task.deleted_at.is_(None),
@@ -207,14 +207,18 @@ class FeedingService:
         new_amounts = new_schedule.get("amounts", [])
 
         # Build new amount per time slot
-        new_amount_by_time: Dict[str, Optional[float]] = {}
+        new_amount_by_time: Dict[time, Optional[float]] = {}
         for idx, t in enumerate(new_times):
+            try:
+                slot = datetime.strptime(t, "%H:%M").time()
+            except ValueError:
+                continue
             if new_amounts and idx < len(new_amounts):
-                new_amount_by_time[t] = float(new_amounts[idx])
+                new_amount_by_time[slot] = float(new_amounts[idx])
             elif plan.amount_g and new_times:
-                new_amount_by_time[t] = float(plan.amount_g) / len(new_times)
+                new_amount_by_time[slot] = float(plan.amount_g) / len(new_times)
             else:
-                new_amount_by_time[t] = None
+                new_amount_by_time[slot] = None
 
         # Check plan end_date — tasks beyond end_date should be cancelled
         plan_end_dt: Optional[datetime] = None
@@ -232,7 +236,7 @@ class FeedingService:
             if task.manually_modified:
                 continue
 
-            scheduled_time = (task.task_metadata or {}).get("scheduled_time")
+            scheduled_time = task.scheduled_time
 
             # Cancel if task is beyond new plan end_date
             if plan_end_dt and task.due_at > plan_end_dt:
@@ -324,23 +328,22 @@ class FeedingService:
             return []
 
         # 2. Load all existing feeding tasks for this window in ONE query
-        existing_stmt = select(Task.task_metadata, Task.due_at).where(
+        existing_stmt = select(Task.feeding_plan_id, Task.due_at).where(
             and_(
                 Task.organization_id == organization_id,
                 Task.type == TaskType.FEEDING,
                 Task.due_at >= from_dt,
                 Task.due_at <= to_dt,
+                Task.feeding_plan_id.isnot(None),
                 Task.deleted_at.is_(None),
             )
         )
         existing_result = await self.db.execute(existing_stmt)
-        existing_rows = existing_result.all()
 
         # Build a set of (feeding_plan_id, due_at) for O(1) lookup
-        existing_keys: set[tuple[str, datetime]] = set()
-        for metadata, due_at in existing_rows:
-            if metadata and "feeding_plan_id" in metadata:
-                existing_keys.add((metadata["feeding_plan_id"], due_at))
+        existing_keys: set[tuple[uuid.UUID, datetime]] = set(
+            (plan_id, due_at) for plan_id, due_at in existing_result.all()
+        )
 
         # 3. Compute which tasks need to be created
         tasks_to_create: List[Task] = []
@@ -372,7 +375,7 @@ class FeedingService:
                         continue
 
                     # Idempotency check — pure Python, no DB query
-                    if (str(plan.id), due_at) in existing_keys:
+                    if (plan.id, due_at) in existing_keys:
                         continue
 
                     if amounts and idx < len(amounts):
@@ -413,7 +416,7 @@ class FeedingService:
                     )
                     tasks_to_create.append(task)
                     # Track in-memory to avoid duplicates within this batch
-                    existing_keys.add((str(plan.id), due_at))
+                    existing_keys.add((plan.id, due_at))
 
             current_date += timedelta(days=1)
 
@@ -503,7 +506,7 @@ class FeedingService:
                 if deduct_item_id is not None or food_name_fallback is not None:
                     from src.app.services.inventory_service import InventoryService
 
-                    inv_service = InventoryService(self.db)
+                    inv_service = InventoryService(self.db, self.audit)
                     try:
                         deductions = await inv_service.deduct_for_feeding(
                             organization_id=organization_id,
@@ -558,19 +561,18 @@ class FeedingService:
         if task.status == TaskStatus.COMPLETED:
             raise ValueError(f"Task {task_id} is already completed")
 
-        animal_id = (task.task_metadata or {}).get("animal_id") or task.related_entity_id
+        animal_id = task.animal_id or task.related_entity_id
         if not animal_id:
             raise ValueError("Task does not have animal_id")
 
-        amount_g_raw = (task.task_metadata or {}).get("amount_g")
         inv_item_id_str = (task.task_metadata or {}).get("inventory_item_id")
 
         log_result = await self.log_feeding(
             organization_id=organization_id,
-            animal_id=uuid.UUID(animal_id) if isinstance(animal_id, str) else animal_id,
+            animal_id=animal_id,
             fed_by_user_id=completed_by_user_id,
             notes=notes,
-            amount_g_override=float(amount_g_raw) if amount_g_raw is not None else None,
+            amount_g_override=float(task.amount_g) if task.amount_g is not None else None,
             inventory_item_id=uuid.UUID(inv_item_id_str) if inv_item_id_str else None,
             auto_deduct_inventory=True,
         )
@@ -585,7 +587,7 @@ class FeedingService:
 
         from src.app.services.task_service import TaskService
 
-        task_service = TaskService(self.db)
+        task_service = TaskService(self.db, self.audit)
         completed_task, _ = await task_service.complete_task(
             task_id=task_id,
             organization_id=organization_id,
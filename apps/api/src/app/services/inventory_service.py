@@ -15,13 +15,20 @@ from src.app.models.inventory_transaction import (
     TransactionReason,
     REASON_TO_DIRECTION,
 )
+from src.app.models.purchase_order import (
+    OPEN_PO_STATUSES,
+    PurchaseOrder,
+    PurchaseOrderItem,
+)
 from src.app.services.audit_service import AuditService
+from src.app.services.inventory_snapshot_service import InventorySnapshotService
 
 
 class InventoryService:
     def __init__(self, db: AsyncSession, audit_service: Optional[AuditService] = None):
         self.db = db
         self.audit = audit_service or AuditService(db)
+        self.snapshots = InventorySnapshotService(db)
 
     async def create_item(
         self,
@@ -256,15 +263,8 @@ class InventoryService:
         else:  # ADJUST
             quantity_delta = quantity
 
-        # Get current item to check if we can deduct
-        item_stmt = select(InventoryItem).where(
-            and_(
-                InventoryItem.id == item_id,
-                InventoryItem.organization_id == organization_id,
-            )
-        )
-        item_result = await self.db.execute(item_stmt)
-        item = item_result.scalar_one_or_none()
+        # Get current item (locked) to check if we can deduct
+        item = await self._lock_item(organization_id, item_id)
 
         if not item:
             raise ValueError(f"Inventory item not found: {item_id}")
@@ -297,8 +297,14 @@ class InventoryService:
         item.quantity_current = new_quantity
 
         # Update lot quantity if lot_id provided
+        lot = None
         if lot_id:
-            lot_stmt = select(InventoryLot).where(InventoryLot.id == lot_id)
+            lot_stmt = (
+                select(InventoryLot)
+                .where(InventoryLot.id == lot_id)
+                .with_for_update()
+                .execution_options(populate_existing=True)
+            )
             lot_result = await self.db.execute(lot_stmt)
             lot = lot_result.scalar_one_or_none()
 
@@ -311,6 +317,7 @@ class InventoryService:
                     lot.quantity = quantity
 
         await self.db.flush()
+        await self.snapshots.record(item, [transaction], [lot] if lot else [])
 
         if user_id:
             await self.audit.log_action(
@@ -329,40 +336,57 @@ class InventoryService:
 
         return transaction
 
-    async def deduct_for_feeding(
+    async def _lock_item(
         self,
         organization_id: uuid.UUID,
-        amount_g: float,
-        feeding_log_id: uuid.UUID,
-        user_id: uuid.UUID,
-        food_name: Optional[str] = None,
-        item_id: Optional[uuid.UUID] = None,
-    ) -> List[Dict[str, Any]]:
-        """
-        Deduct inventory for feeding using FIFO across multiple lots.
-        Returns list of deduction dicts (one per lot used).
-        Lookup priority: item_id > food_name (case-insensitive name match).
+        item_id: uuid.UUID,
+    ) -> Optional[InventoryItem]:
+        """Load an item with a row lock (and fresh values).
+
+        Stock-changing paths lock the item before any of its lots, so
+        concurrent deductions of the same item serialize instead of
+        overselling, and lock order is the same everywhere (no deadlocks).
         """
-        if item_id:
-            item = await self.get_item_by_id(item_id, organization_id)
-            if not item:
-                raise ValueError(f"Inventory item not found: {item_id}")
-        elif food_name:
-            item_stmt = select(InventoryItem).where(
+        stmt = (
+            select(InventoryItem)
+            .where(
                 and_(
+                    InventoryItem.id == item_id,
                     InventoryItem.organization_id == organization_id,
-                    func.lower(InventoryItem.name) == func.lower(food_name),
-                    InventoryItem.category == InventoryCategory.FOOD,
                 )
             )
-            item_result = await self.db.execute(item_stmt)
-            item = item_result.scalar_one_or_none()
-            if not item:
-                raise ValueError(f"No inventory item found for food: {food_name}")
-        else:
-            raise ValueError("Either item_id or food_name must be provided")
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
 
-        # Find all lots with stock (FIFO: earliest expiry first)
+    @staticmethod
+    def _grams_to_item_units(item: InventoryItem, amount_g: float) -> float:
+        if item.unit_weight_g:
+            # Unit is countable (e.g. cans of 400 g each): 200 g / 400 g = 0.5 cans
+            return amount_g / float(item.unit_weight_g)
+        if item.unit == 'g':
+            return amount_g  # deduct raw grams
+        # 'kg' and fallback: g → kg
+        return amount_g / 1000.0
+
+    async def _deduct_fifo(
+        self,
+        organization_id: uuid.UUID,
+        item: InventoryItem,
+        quantity: float,
+        note: str,
+        related_entity_type: str,
+        related_entity_id: uuid.UUID,
+        user_id: Optional[uuid.UUID],
+    ) -> List[Dict[str, Any]]:
+        """Consume ``quantity`` (item units) from the item's lots, earliest
+        expiry first. ``item`` must already be locked via ``_lock_item``.
+
+        Lots are locked in FIFO order, the allocation is computed in memory
+        and all lot updates and transactions are written in a single flush.
+        """
         lot_stmt = (
             select(InventoryLot)
             .where(
@@ -371,42 +395,57 @@ class InventoryService:
                     InventoryLot.quantity > 0,
                 )
             )
-            .order_by(InventoryLot.expires_at.asc().nullslast())
+            .order_by(InventoryLot.expires_at.asc().nullslast(), InventoryLot.id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
         )
         lots = (await self.db.execute(lot_stmt)).scalars().all()
 
         if not lots:
             raise ValueError(f"No stock available for item: {item.name}")
 
-        # Convert grams to the item's native unit
-        if item.unit_weight_g:
-            # Unit is countable (e.g. cans of 400 g each): 200 g / 400 g = 0.5 cans
-            remaining = amount_g / float(item.unit_weight_g)
-        elif item.unit == 'g':
-            remaining = amount_g          # deduct raw grams
-        elif item.unit == 'kg':
-            remaining = amount_g / 1000.0  # g → kg
-        else:
-            remaining = amount_g / 1000.0  # fallback: assume kg
-
-        deductions = []
-
+        remaining = quantity
+        allocations = []
         for lot in lots:
             if remaining <= 0:
                 break
             to_deduct = min(float(lot.quantity), remaining)
+            allocations.append((lot, to_deduct))
+            remaining -= to_deduct
+        if remaining > 1e-9:
+            # All or nothing: never record a partial consumption
+            raise ValueError(
+                f"Insufficient stock in lots for item: {item.name}. "
+                f"Requested: {quantity}, Available: {quantity - remaining}"
+            )
+
+        total = sum(to_deduct for _, to_deduct in allocations)
+        new_quantity = float(item.quantity_current or 0) - total
+        if new_quantity < 0:
+            raise ValueError(
+                f"Cannot {TransactionReason.CONSUMPTION.value}: stock would be negative. "
+                f"Current: {item.quantity_current}, Requested: {total}"
+            )
+
+        deductions = []
+        transactions = []
+        for lot, to_deduct in allocations:
             lot_emptied = (float(lot.quantity) - to_deduct) < 0.001  # practically 0
-            transaction = await self.record_transaction(
+            lot.quantity = max(0, float(lot.quantity) - to_deduct)
+            transaction = InventoryTransaction(
+                id=uuid.uuid4(),
                 organization_id=organization_id,
                 item_id=item.id,
                 lot_id=lot.id,
+                direction=TransactionType.OUT,
                 reason=TransactionReason.CONSUMPTION,
                 quantity=to_deduct,
-                note=f"Fed animal (feeding_log #{feeding_log_id})",
-                related_entity_type="feeding_log",
-                related_entity_id=feeding_log_id,
-                user_id=user_id,
+                note=note,
+                related_entity_type=related_entity_type,
+                related_entity_id=related_entity_id,
+                created_by_user_id=user_id,
             )
+            transactions.append(transaction)
             deductions.append({
                 "lot": lot,
                 "lot_id": lot.id,
@@ -416,10 +455,74 @@ class InventoryService:
                 "lot_emptied": lot_emptied,
                 "transaction": transaction,
             })
-            remaining -= to_deduct
+
+        item.quantity_current = new_quantity
+        self.db.add_all(transactions)
+        await self.db.flush()
+        await self.snapshots.record(item, transactions, [lot for lot, _ in allocations])
+
+        if user_id:
+            for transaction in transactions:
+                await self.audit.log_action(
+                    organization_id=organization_id,
+                    actor_user_id=user_id,
+                    action="create",
+                    entity_type="inventory_transaction",
+                    entity_id=transaction.id,
+                    after={
+                        "reason": transaction.reason.value,
+                        "direction": transaction.direction.value,
+                        "quantity": transaction.quantity,
+                        "item_id": str(item.id),
+                    },
+                )
 
         return deductions
 
+    async def deduct_for_feeding(
+        self,
+        organization_id: uuid.UUID,
+        amount_g: float,
+        feeding_log_id: uuid.UUID,
+        user_id: uuid.UUID,
+        food_name: Optional[str] = None,
+        item_id: Optional[uuid.UUID] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Deduct inventory for feeding using FIFO across multiple lots.
+        Returns list of deduction dicts (one per lot used).
+        Lookup priority: item_id > food_name (case-insensitive name match).
+        """
+        if item_id:
+            item = await self._lock_item(organization_id, item_id)
+            if not item:
+                raise ValueError(f"Inventory item not found: {item_id}")
+        elif food_name:
+            item_stmt = select(InventoryItem.id).where(
+                and_(
+                    InventoryItem.organization_id == organization_id,
+                    func.lower(InventoryItem.name) == func.lower(food_name),
+                    InventoryItem.category == InventoryCategory.FOOD,
+                )
+            )
+            item_result = await self.db.execute(item_stmt)
+            found_id = item_result.scalar_one_or_none()
+            item = await self._lock_item(organization_id, found_id) if found_id else None
+            if not item:
+                raise ValueError(f"No inventory item found for food: {food_name}")
+        else:
+            raise ValueError("Either item_id or food_name must be provided")
+
+        return await self._deduct_fifo(
+            organization_id=organization_id,
+            item=item,
+            quantity=self._grams_to_item_units(item, amount_g),
+            note=f"Fed animal (feeding_log #{feeding_log_id})",
+            related_entity_type="feeding_log",
+            related_entity_id=feeding_log_id,
+            user_id=user_id,
+        )
+
     async def deduct_for_task(
         self,
         organization_id: uuid.UUID,
@@ -437,66 +540,29 @@ class InventoryService:
         - If unit is 'g': deduct raw grams
         - If unit is 'kg': convert g to kg
         """
-        item = await self.get_item_by_id(item_id, organization_id)
+        item = await self._lock_item(organization_id, item_id)
         if not item:
             raise ValueError(f"Inventory item not found: {item_id}")
 
-        # Find all lots with stock (FIFO: earliest expiry first)
-        lot_stmt = (
-            select(InventoryLot)
-            .where(
-                and_(
-                    InventoryLot.item_id == item.id,
-                    InventoryLot.quantity > 0,
-                )
-            )
-            .order_by(InventoryLot.expires_at.asc().nullslast())
+        deductions = await self._deduct_fifo(
+            organization_id=organization_id,
+            item=item,
+            quantity=self._grams_to_item_units(item, amount_g),
+            note=f"Task completed (task #{task_id})",
+            related_entity_type="task",
+            related_entity_id=task_id,
+            user_id=user_id,
         )
-        lots = (await self.db.execute(lot_stmt)).scalars().all()
-
-        if not lots:
-            raise ValueError(f"No stock available for item: {item.name}")
-
-        # Convert grams to the item's native unit
-        if item.unit_weight_g:
-            # Unit is countable (e.g. cans of 400g each): 200g / 400g = 0.5 cans
-            remaining = amount_g / float(item.unit_weight_g)
-        elif item.unit == 'g':
-            remaining = amount_g
-        elif item.unit == 'kg':
-            remaining = amount_g / 1000.0
-        else:
-            remaining = amount_g / 1000.0  # fallback: assume kg
-
-        deductions = []
-
-        for lot in lots:
-            if remaining <= 0:
-                break
-            to_deduct = min(float(lot.quantity), remaining)
-            lot_emptied = (float(lot.quantity) - to_deduct) < 0.001
-
-            transaction = await self.record_transaction(
-                organization_id=organization_id,
-                item_id=item.id,
-                lot_id=lot.id,
-                reason=TransactionReason.CONSUMPTION,
-                quantity=to_deduct,
-                note=f"Task completed (task #{task_id})",
-                related_entity_type="task",
-                related_entity_id=task_id,
-                user_id=user_id,
-            )
-            deductions.append({
-                "lot_id": lot.id,
-                "lot_number": lot.lot_number,
-                "quantity_deducted": to_deduct,
-                "lot_emptied": lot_emptied,
-                "transaction_id": transaction.id,
-            })
-            remaining -= to_deduct
-
-        return deductions
+        return [
+            {
+                "lot_id": d["lot_id"],
+                "lot_number": d["lot_number"],
+                "quantity_deducted": d["quantity_deducted"],
+                "lot_emptied": d["lot_emptied"],
+                "transaction_id": d["transaction"].id,
+            }
+            for d in deductions
+        ]
 
     async def get_items_with_stock(
         self,
@@ -504,46 +570,76 @@ class InventoryService:
         category: Optional[InventoryCategory] = None,
         low_stock_only: bool = False,
     ) -> List[Dict[str, Any]]:
-        """Get inventory items with aggregated stock information."""
-        # Build base query
-        conditions = [InventoryItem.organization_id == organization_id]
-        if category:
-            conditions.append(InventoryItem.category == category)
-
-        items_stmt = select(InventoryItem).where(and_(*conditions))
-        items_result = await self.db.execute(items_stmt)
-        items = items_result.scalars().all()
+        """Get inventory items with aggregated stock information.
 
-        result = []
-        for item in items:
-            # Get total quantity across all lots
-            lots_stmt = select(
+        Lot totals and the quantity still on open purchase orders (same rule
+        as ``PurchaseService.get_on_the_way_quantity``) are aggregated per
+        item in subqueries and joined to the items, so the listing is a
+        single query. The low-stock filter is applied in SQL as well.
+        """
+        lots = (
+            select(
+                InventoryLot.item_id,
                 func.sum(InventoryLot.quantity).label("total_quantity"),
                 func.count(InventoryLot.id).label("lots_count"),
                 func.min(InventoryLot.expires_at).label("oldest_expiry"),
-            ).where(InventoryLot.item_id == item.id)
-            lots_result = await self.db.execute(lots_stmt)
-            lots_data = lots_result.one()
-
-            total_quantity = float(lots_data.total_quantity or 0)
-
-            # Apply low stock filter
-            if low_stock_only:
-                if item.reorder_threshold is None:
-                    continue
-                if total_quantity >= item.reorder_threshold:
-                    continue
-
-            result.append(
-                {
-                    "item": item,
-                    "total_quantity": total_quantity,
-                    "lots_count": lots_data.lots_count,
-                    "oldest_expiry": lots_data.oldest_expiry,
-                }
             )
+            .where(InventoryLot.organization_id == organization_id)
+            .group_by(InventoryLot.item_id)
+            .subquery("lot_totals")
+        )
+        on_order = (
+            select(
+                PurchaseOrderItem.inventory_item_id.label("item_id"),
+                func.sum(
+                    func.greatest(
+                        PurchaseOrderItem.quantity_ordered
+                        - PurchaseOrderItem.quantity_received,
+                        0,
+                    )
+                ).label("quantity_on_order"),
+            )
+            .join(PurchaseOrder, PurchaseOrderItem.purchase_order_id == PurchaseOrder.id)
+            .where(
+                PurchaseOrder.organization_id == organization_id,
+                PurchaseOrder.status.in_(OPEN_PO_STATUSES),
+            )
+            .group_by(PurchaseOrderItem.inventory_item_id)
+            .subquery("on_order")
+        )
+        total_quantity = func.coalesce(lots.c.total_quantity, 0)
+
+        conditions = [InventoryItem.organization_id == organization_id]
+        if category:
+            conditions.append(InventoryItem.category == category)
+        if low_stock_only:
+            conditions.append(InventoryItem.reorder_threshold.isnot(None))
+            conditions.append(total_quantity < InventoryItem.reorder_threshold)
+
+        stmt = (
+            select(
+                InventoryItem,
+                total_quantity.label("total_quantity"),
+                func.coalesce(lots.c.lots_count, 0).label("lots_count"),
+                lots.c.oldest_expiry,
+                func.coalesce(on_order.c.quantity_on_order, 0).label("quantity_on_order"),
+            )
+            .outerjoin(lots, lots.c.item_id == InventoryItem.id)
+            .outerjoin(on_order, on_order.c.item_id == InventoryItem.id)
+            .where(and_(*conditions))
+        )
+        result = await self.db.execute(stmt)
 
-        return result
+        return [
+            {
+                "item": row.InventoryItem,
+                "total_quantity": float(row.total_quantity),
+                "lots_count": row.lots_count,
+                "oldest_expiry": row.oldest_expiry,
+                "quantity_on_order": float(row.quantity_on_order),
+            }
+            for row in result.all()
+        ]
 
     async def get_transaction_history(
         self,
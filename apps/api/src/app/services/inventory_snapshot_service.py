@@ -0,0 +1,217 @@
+"""Daily inventory balance snapshots.
+
+InventoryService calls :meth:`InventorySnapshotService.record` after every
+stock change; the day's item and lot rows are upserted with the movement
+totals added and the closing balance replaced. Point-in-time stock and
+monthly movement reports then read a handful of snapshot rows instead of
+replaying ``inventory_transactions``.
+"""
+
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.inventory_balance_snapshot import InventoryBalanceSnapshot
+from src.app.models.inventory_item import InventoryCategory, InventoryItem
+from src.app.models.inventory_lot import InventoryLot
+from src.app.models.inventory_transaction import (
+    InventoryTransaction,
+    TransactionReason,
+    TransactionType,
+)
+
+
+def _movement_row(
+    item: InventoryItem,
+    lot_id: Optional[uuid.UUID],
+    transactions: Sequence[InventoryTransaction],
+    costs: Dict[Optional[uuid.UUID], float],
+    closing_quantity,
+    day: date,
+) -> Dict[str, Any]:
+    quantity_in = quantity_out = consumed_quantity = consumed_cost = 0.0
+    for txn in transactions:
+        quantity = float(txn.quantity)
+        if txn.direction == TransactionType.IN:
+            quantity_in += quantity
+        elif txn.direction == TransactionType.OUT:
+            quantity_out += quantity
+        if txn.reason == TransactionReason.CONSUMPTION:
+            consumed_quantity += quantity
+            consumed_cost += quantity * costs.get(txn.lot_id, costs[None])
+    return {
+        "id": uuid.uuid4(),
+        "organization_id": item.organization_id,
+        "item_id": item.id,
+        "lot_id": lot_id,
+        "snapshot_date": day,
+        "quantity_in": quantity_in,
+        "quantity_out": quantity_out,
+        "consumed_quantity": consumed_quantity,
+        "consumed_cost": round(consumed_cost, 2),
+        "closing_quantity": float(closing_quantity or 0),
+    }
+
+
+def _upsert(rows: List[Dict[str, Any]], lot_level: bool):
+    stmt = insert(InventoryBalanceSnapshot).values(rows)
+    snap = InventoryBalanceSnapshot
+    if lot_level:
+        index_elements = [snap.lot_id, snap.snapshot_date]
+        index_where = snap.lot_id.isnot(None)
+    else:
+        index_elements = [snap.item_id, snap.snapshot_date]
+        index_where = snap.lot_id.is_(None)
+    return stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        index_where=index_where,
+        set_={
+            "quantity_in": snap.quantity_in + stmt.excluded.quantity_in,
+            "quantity_out": snap.quantity_out + stmt.excluded.quantity_out,
+            "consumed_quantity": snap.consumed_quantity + stmt.excluded.consumed_quantity,
+            "consumed_cost": snap.consumed_cost + stmt.excluded.consumed_cost,
+            "closing_quantity": stmt.excluded.closing_quantity,
+            "updated_at": func.now(),
+        },
+    )
+
+
+class InventorySnapshotService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record(
+        self,
+        item: InventoryItem,
+        transactions: Sequence[InventoryTransaction],
+        lots: Sequence[InventoryLot] = (),
+        day: Optional[date] = None,
+    ) -> None:
+        """Fold ``transactions`` (already applied to ``item``/``lots``) into
+        today's snapshots. ``item`` and ``lots`` must be locked by the caller
+        so closing balances are written in commit order."""
+        if not transactions:
+            return
+        day = day or datetime.now(timezone.utc).date()
+        fallback_cost = float(item.price_per_unit or 0)
+        costs: Dict[Optional[uuid.UUID], float] = {None: fallback_cost}
+        for lot in lots:
+            costs[lot.id] = (
+                float(lot.cost_per_unit) if lot.cost_per_unit is not None else fallback_cost
+            )
+
+        await self.db.execute(
+            _upsert(
+                [_movement_row(item, None, transactions, costs, item.quantity_current, day)],
+                lot_level=False,
+            )
+        )
+        lot_rows = [
+            _movement_row(
+                item,
+                lot.id,
+                [t for t in transactions if t.lot_id == lot.id],
+                costs,
+                lot.quantity,
+                day,
+            )
+            for lot in lots
+        ]
+        if lot_rows:
+            await self.db.execute(_upsert(lot_rows, lot_level=True))
+
+    async def stock_at(
+        self,
+        organization_id: uuid.UUID,
+        on_date: date,
+        category: Optional[InventoryCategory] = None,
+    ) -> List[Dict[str, Any]]:
+        """Closing stock of every item as of the end of ``on_date``.
+
+        Uses the latest item-level snapshot on or before the date (one index
+        probe per item); items with no movement by then are omitted.
+        """
+        snap = InventoryBalanceSnapshot
+        latest = (
+            select(snap.item_id, snap.snapshot_date, snap.closing_quantity)
+            .distinct(snap.item_id)
+            .where(
+                snap.organization_id == organization_id,
+                snap.lot_id.is_(None),
+                snap.snapshot_date <= on_date,
+            )
+            .order_by(snap.item_id, snap.snapshot_date.desc())
+            .subquery("latest")
+        )
+        conditions = [InventoryItem.organization_id == organization_id]
+        if category:
+            conditions.append(InventoryItem.category == category)
+        result = await self.db.execute(
+            select(
+                InventoryItem.id,
+                InventoryItem.name,
+                InventoryItem.category,
+                InventoryItem.unit,
+                latest.c.snapshot_date,
+                latest.c.closing_quantity,
+            )
+            .join(latest, latest.c.item_id == InventoryItem.id)
+            .where(and_(*conditions))
+            .order_by(InventoryItem.name)
+        )
+        return [
+            {
+                "item_id": row.id,
+                "name": row.name,
+                "category": row.category,
+                "unit": row.unit,
+                "quantity": float(row.closing_quantity),
+                "as_of": row.snapshot_date,
+            }
+            for row in result.all()
+        ]
+
+    async def monthly_consumption(
+        self,
+        organization_id: uuid.UUID,
+        year: int,
+        category: Optional[InventoryCategory] = None,
+    ):
+        """Consumed quantity and cost per item and month of ``year``."""
+        snap = InventoryBalanceSnapshot
+        month = func.extract("month", snap.snapshot_date)
+        conditions = [
+            snap.organization_id == organization_id,
+            snap.lot_id.is_(None),
+            snap.snapshot_date >= date(year, 1, 1),
+            snap.snapshot_date < date(year + 1, 1, 1),
+            snap.consumed_quantity > 0,
+        ]
+        if category:
+            conditions.append(InventoryItem.category == category)
+        result = await self.db.execute(
+            select(
+                month.label("month_num"),
+                InventoryItem.name.label("item_name"),
+                InventoryItem.food_type.label("food_type"),
+                InventoryItem.unit.label("unit"),
+                InventoryItem.unit_weight_g.label("unit_weight_g"),
+                func.sum(snap.consumed_quantity).label("total_qty"),
+                func.sum(snap.consumed_cost).label("total_cost"),
+            )
+            .join(InventoryItem, snap.item_id == InventoryItem.id)
+            .where(and_(*conditions))
+            .group_by(
+                month,
+                InventoryItem.name,
+                InventoryItem.food_type,
+                InventoryItem.unit,
+                InventoryItem.unit_weight_g,
+            )
+            .order_by(month, InventoryItem.name)
+        )
+        return result.all()
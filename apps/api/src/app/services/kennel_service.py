@@ -74,6 +74,51 @@ async def _get_active_occupancy(session: AsyncSession, kennel_id: uuid.UUID) ->
     return int((await session.execute(q)).scalar() or 0)
 
 
+async def lock_kennel_for_placement(
+    session: AsyncSession,
+    *,
+    organization_id: uuid.UUID,
+    kennel_id: uuid.UUID,
+    species: str,
+    count: int = 1,
+    allow_overflow: bool = False,
+) -> tuple[Kennel, int, int]:
+    """
+    Lock the organization's kennel that ``count`` animals of ``species`` are
+    about to be placed in and check that it can take them.
+
+    Returns:
+        The kennel, its active occupancy and its capacity for the species
+    """
+    kennel_q = (
+        select(Kennel)
+        .where(
+            Kennel.id == kennel_id,
+            Kennel.organization_id == organization_id,
+            Kennel.deleted_at.is_(None),
+        )
+        .with_for_update()
+    )
+    kennel = (await session.execute(kennel_q)).scalar_one_or_none()
+    if not kennel:
+        raise NotFoundError("Target kennel not found")
+
+    if kennel.status in ("maintenance", "closed"):
+        raise InvalidStateError(f"Kennel is not available (status={kennel.status})")
+
+    # Check if kennel is in planned maintenance period
+    if _is_in_maintenance(kennel):
+        raise InvalidStateError("Kennel is in planned maintenance period")
+
+    occupied = await _get_active_occupancy(session, kennel.id)
+    max_for_species = _species_capacity(kennel, species)
+
+    if not allow_overflow and occupied + count > max_for_species:
+        raise CapacityError(f"Kennel capacity exceeded ({occupied}/{max_for_species})")
+
+    return kennel, occupied, max_for_species
+
+
 async def move_animal(
     session: AsyncSession,
     *,
@@ -146,29 +191,14 @@ async def move_animal(
             }
         # else: fall through → steps 5-7 create the new stay in target kennel
 
-    # 5) Lock target kennel row
-    kennel_q = (
-        select(Kennel)
-        .where(Kennel.id == target_kennel_id, Kennel.organization_id == organization_id)
-        .with_for_update()
+    # 5-6) Lock target kennel row, check its state and capacity
+    kennel, occupied, max_for_species = await lock_kennel_for_placement(
+        session,
+        organization_id=organization_id,
+        kennel_id=target_kennel_id,
+        species=animal.species,
+        allow_overflow=allow_overflow,
     )
-    kennel = (await session.execute(kennel_q)).scalar_one_or_none()
-    if not kennel:
-        raise NotFoundError("Target kennel not found")
-
-    if kennel.status in ("maintenance", "closed"):
-        raise InvalidStateError(f"Kennel is not available (status={kennel.status})")
-
-    # Check if kennel is in planned maintenance period
-    if _is_in_maintenance(kennel):
-        raise InvalidStateError("Kennel is in planned maintenance period")
-
-    # 6) Check capacity (count active stays)
-    occupied = await _get_active_occupancy(session, kennel.id)
-    max_for_species = _species_capacity(kennel, animal.species)
-
-    if not allow_overflow and occupied >= max_for_species:
-        raise CapacityError(f"Kennel capacity exceeded ({occupied}/{max_for_species})")
 
     # 7) Create new stay
     new_stay = KennelStay(
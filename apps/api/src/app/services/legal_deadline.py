@@ -206,6 +206,79 @@ def compute_legal_deadline_from_settings(
     )
 
 
+def compute_animal_legal_deadline(
+    intake_notice_published_at: Optional[date],
+    intake_date: Optional[date],
+    intake_finder_claims_ownership: Optional[bool],
+    intake_municipality_transferred: Optional[bool],
+    animal_notice_published_at: Optional[date],
+    animal_finder_claims_ownership: Optional[bool],
+    animal_municipality_transferred: Optional[bool],
+    org_legal: Optional["OrgSettingsLegal"] = None,
+) -> Optional[LegalDeadlineInfo]:
+    """Deadline for an animal from its latest intake, falling back to the
+    animal's own legal fields (animals staying with the finder have no intake).
+
+    Returns None when no notice publication date is known.
+    """
+    notice_published_at = intake_notice_published_at or animal_notice_published_at
+    if notice_published_at is None:
+        return None
+    finder_claims_ownership = (
+        intake_finder_claims_ownership
+        if intake_finder_claims_ownership is not None
+        else animal_finder_claims_ownership
+    )
+    municipality_transferred = (
+        intake_municipality_transferred
+        if intake_municipality_transferred is not None
+        else animal_municipality_transferred
+    )
+    if org_legal is not None:
+        return compute_legal_deadline_from_settings(
+            announced_at=notice_published_at,
+            received_at=intake_date,
+            found_at=intake_date,
+            finder_keeps=finder_claims_ownership,
+            org_legal=org_legal,
+        )
+    return compute_legal_deadline(
+        notice_published_at=notice_published_at,
+        shelter_received_at=intake_date,
+        finder_claims_ownership=finder_claims_ownership,
+        municipality_irrevocably_transferred=municipality_transferred,
+    )
+
+
+def describe_legal_deadline(
+    deadline_at: Optional[date],
+    deadline_type: Optional[str],
+    deadline_state: str,
+    label: Optional[str],
+    missing_fields: Optional[list[str]] = None,
+) -> LegalDeadlineInfo:
+    """Rebuild deadline info from the values persisted on the animal.
+
+    ``days_left``, the label and running/expired depend on today's date, so
+    they are derived here for dated deadlines; undated ones (missing data,
+    no deadline) are returned as stored, with their missing fields.
+    """
+    if deadline_at is not None:
+        return _build_deadline_info(
+            deadline_at=deadline_at,
+            deadline_type=deadline_type or "unknown",
+            label_base=label or "",
+        )
+    return LegalDeadlineInfo(
+        deadline_at=None,
+        deadline_type=deadline_type or "unknown",
+        days_left=None,
+        deadline_state=deadline_state,
+        label=label or "",
+        missing_fields=list(missing_fields or []),
+    )
+
+
 def _resolve_start_date(
     rule_start: str,
     fallback_start: str,
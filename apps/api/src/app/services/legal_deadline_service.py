@@ -0,0 +1,148 @@
+"""Persisted legal deadlines for found animals.
+
+The deadline depends on the animal's latest intake, the animal's own legal
+fields and the organization's legal settings, so it is stored on the animal
+(``legal_deadline_*``) and refreshed whenever one of those inputs changes.
+That lets the animal list filter and sort by deadline through an index.
+Only running -> expired depends on the calendar; :meth:`expire_elapsed` does
+that nightly in one UPDATE.
+"""
+
+import uuid
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.animal import Animal
+from src.app.models.intake import Intake
+from src.app.models.organization import Organization
+from src.app.schemas.org_settings import get_org_settings
+from src.app.services.legal_deadline import compute_animal_legal_deadline
+
+DEADLINE_COLUMNS = (
+    "legal_deadline_at",
+    "legal_deadline_type",
+    "legal_deadline_state",
+    "legal_deadline_label",
+    "legal_deadline_missing_fields",
+)
+
+
+class LegalDeadlineService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def refresh(
+        self,
+        organization_id: uuid.UUID,
+        animal_ids: Optional[Iterable[uuid.UUID]] = None,
+    ) -> int:
+        """Recompute the stored deadline of ``animal_ids`` (default: every
+        animal of the organization that has or had one).
+
+        Inputs are read in one query and only changed rows are written, in a
+        single executemany UPDATE. Returns the number of animals updated.
+        """
+        org = await self.db.get(Organization, organization_id)
+        org_legal = get_org_settings(org).legal if org else None
+
+        intake_conditions = [
+            Intake.organization_id == organization_id,
+            Intake.deleted_at.is_(None),
+            Intake.animal_id.isnot(None),
+        ]
+        animal_conditions = [
+            Animal.organization_id == organization_id,
+            Animal.deleted_at.is_(None),
+        ]
+        if animal_ids is not None:
+            animal_ids = list(animal_ids)
+            if not animal_ids:
+                return 0
+            intake_conditions.append(Intake.animal_id.in_(animal_ids))
+            animal_conditions.append(Animal.id.in_(animal_ids))
+
+        latest_intake = (
+            select(
+                Intake.animal_id,
+                Intake.intake_date,
+                Intake.notice_published_at,
+                Intake.finder_claims_ownership,
+                Intake.municipality_irrevocably_transferred,
+            )
+            .distinct(Intake.animal_id)
+            .where(and_(*intake_conditions))
+            .order_by(Intake.animal_id, Intake.intake_date.desc())
+            .subquery("latest_intake")
+        )
+        if animal_ids is None:
+            # Animals without any notice date (and no stored deadline) stay empty
+            animal_conditions.append(
+                or_(
+                    latest_intake.c.notice_published_at.isnot(None),
+                    Animal.legal_notice_published_at.isnot(None),
+                    Animal.legal_deadline_state.isnot(None),
+                )
+            )
+
+        result = await self.db.execute(
+            select(
+                Animal.id,
+                Animal.legal_notice_published_at,
+                Animal.legal_finder_claims_ownership,
+                Animal.legal_municipality_transferred,
+                *(getattr(Animal, column) for column in DEADLINE_COLUMNS),
+                latest_intake.c.intake_date,
+                latest_intake.c.notice_published_at,
+                latest_intake.c.finder_claims_ownership,
+                latest_intake.c.municipality_irrevocably_transferred,
+            )
+            .outerjoin(latest_intake, latest_intake.c.animal_id == Animal.id)
+            .where(and_(*animal_conditions))
+        )
+
+        updates = []
+        for row in result.all():
+            info = compute_animal_legal_deadline(
+                intake_notice_published_at=row.notice_published_at,
+                intake_date=row.intake_date,
+                intake_finder_claims_ownership=row.finder_claims_ownership,
+                intake_municipality_transferred=row.municipality_irrevocably_transferred,
+                animal_notice_published_at=row.legal_notice_published_at,
+                animal_finder_claims_ownership=row.legal_finder_claims_ownership,
+                animal_municipality_transferred=row.legal_municipality_transferred,
+                org_legal=org_legal,
+            )
+            values = {
+                "legal_deadline_at": info.deadline_at if info else None,
+                "legal_deadline_type": info.deadline_type if info else None,
+                "legal_deadline_state": info.deadline_state if info else None,
+                # Labels of dated deadlines change daily; they are derived on read
+                "legal_deadline_label": (
+                    info.label if info and info.deadline_at is None else None
+                ),
+                "legal_deadline_missing_fields": (info.missing_fields or None) if info else None,
+            }
+            if any(getattr(row, column) != values[column] for column in DEADLINE_COLUMNS):
+                updates.append({"id": row.id, **values})
+
+        if updates:
+            await self.db.execute(update(Animal), updates)
+        return len(updates)
+
+    async def expire_elapsed(self, today: Optional[date] = None) -> int:
+        """Mark running deadlines that ended before ``today`` as expired,
+        across all organizations. Returns the number of animals updated."""
+        today = today or date.today()
+        result = await self.db.execute(
+            update(Animal)
+            .where(
+                Animal.legal_deadline_state == "running",
+                Animal.legal_deadline_at < today,
+            )
+            .values(legal_deadline_state="expired")
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
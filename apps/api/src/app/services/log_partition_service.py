@@ -0,0 +1,158 @@
+"""Monthly range-partition maintenance for append-only log tables.
+
+``audit_logs`` and ``login_logs`` are partitioned by ``created_at`` into one
+partition per calendar month (``<table>_pYYYY_MM``). This service creates
+partitions ahead of time and retires partitions past the retention period by
+dropping them (or detaching them into the ``log_archive`` schema), which is
+O(1) compared to row-by-row DELETEs.
+"""
+
+import re
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.config import settings
+
+ARCHIVE_SCHEMA = "log_archive"
+
+# Whitelist of partitioned tables -> retention setting name. Table names are
+# interpolated into DDL, so only these are ever accepted.
+PARTITIONED_LOG_TABLES: Dict[str, str] = {
+    "audit_logs": "AUDIT_LOG_RETENTION_MONTHS",
+    "login_logs": "LOGIN_LOG_RETENTION_MONTHS",
+}
+
+
+def add_months(month: date, months: int) -> date:
+    """Return the first day of the month ``months`` after ``month``."""
+    index = month.year * 12 + (month.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_start(value: date | datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+
+def parse_partition_month(table: str, name: str) -> Optional[date]:
+    match = re.fullmatch(rf"{re.escape(table)}_p(\d{{4}})_(\d{{2}})", name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def _utc_bound(month: date) -> str:
+    return datetime(month.year, month.month, 1, tzinfo=timezone.utc).isoformat()
+
+
+def _check_table(table: str) -> None:
+    if table not in PARTITIONED_LOG_TABLES:
+        raise ValueError(f"Table is not a partitioned log table: {table}")
+
+
+class LogPartitionService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def list_partitions(self, table: str) -> List[str]:
+        """Names of the partitions currently attached to ``table``."""
+        _check_table(table)
+        result = await self.db.execute(
+            text(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                JOIN pg_namespace ns ON ns.oid = parent.relnamespace
+                WHERE parent.relname = :table AND ns.nspname = current_schema()
+                ORDER BY child.relname
+                """
+            ),
+            {"table": table},
+        )
+        return list(result.scalars().all())
+
+    async def ensure_future_partitions(
+        self,
+        table: str,
+        months_ahead: Optional[int] = None,
+        today: Optional[date] = None,
+    ) -> List[str]:
+        """Create partitions from the current month up to ``months_ahead``
+        months ahead. Idempotent; returns the names of partitions created."""
+        _check_table(table)
+        if months_ahead is None:
+            months_ahead = settings.LOG_PARTITION_MONTHS_AHEAD
+        current = month_start(today or datetime.now(timezone.utc).date())
+
+        existing = set(await self.list_partitions(table))
+        created: List[str] = []
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            name = partition_name(table, month)
+            if name in existing:
+                continue
+            await self.db.execute(
+                text(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+                    f"FOR VALUES FROM ('{_utc_bound(month)}') "
+                    f"TO ('{_utc_bound(add_months(month, 1))}')"
+                )
+            )
+            created.append(name)
+        return created
+
+    async def expire_partitions(
+        self,
+        table: str,
+        retention_months: Optional[int] = None,
+        archive: Optional[bool] = None,
+        today: Optional[date] = None,
+    ) -> List[str]:
+        """Drop (or archive) partitions whose whole month lies before the
+        retention cutoff. Returns the names of partitions retired."""
+        _check_table(table)
+        if retention_months is None:
+            retention_months = getattr(settings, PARTITIONED_LOG_TABLES[table])
+        if archive is None:
+            archive = settings.LOG_PARTITION_ARCHIVE
+        cutoff = add_months(
+            month_start(today or datetime.now(timezone.utc).date()), -retention_months
+        )
+
+        retired: List[str] = []
+        for name in await self.list_partitions(table):
+            month = parse_partition_month(table, name)
+            # Only partitions entirely older than the cutoff month are retired
+            if month is None or add_months(month, 1) > cutoff:
+                continue
+            if archive:
+                await self.db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+                await self.db.execute(
+                    text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"')
+                )
+                await self.db.execute(
+                    text(f'ALTER TABLE "{name}" SET SCHEMA {ARCHIVE_SCHEMA}')
+                )
+            else:
+                await self.db.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
+            retired.append(name)
+        return retired
+
+    async def run_maintenance(self) -> Dict[str, Dict[str, List[str]]]:
+        """Create upcoming partitions and retire expired ones for every
+        partitioned log table."""
+        summary: Dict[str, Dict[str, List[str]]] = {}
+        for table in PARTITIONED_LOG_TABLES:
+            summary[table] = {
+                "created": await self.ensure_future_partitions(table),
+                "retired": await self.expire_partitions(table),
+            }
+        return summary
@@ -0,0 +1,194 @@
+"""Viewport clustering for map endpoints.
+
+Map screens used to download every geocoded point. The viewport endpoints
+take a bounding box and zoom level instead and return one aggregate per
+geohash cell (count and centroid), switching to individual points only
+from :data:`POINTS_MIN_ZOOM`. The payload is therefore bounded by the number
+of cells on screen, not by the size of the dataset.
+
+Clustering reads the precomputed ``geohash`` column (a generated column,
+``geohash_encode(lat, lng, 12)``, so every write path maintains it):
+
+- the cells are ``left(geohash, precision)`` for the zoom's precision, so
+  no per-row encoding happens at query time;
+- the geohash cell enclosing the whole viewport becomes a ``LIKE 'prefix%'``
+  condition on the ``text_pattern_ops`` index, next to the exact lat/lng box.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+GEOHASH_PRECISION = 12
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Individual points from this zoom level on (roughly street level)
+POINTS_MIN_ZOOM = 14
+# Upper bound on individual points per viewport
+MAX_POINTS = 2000
+
+
+def encode_geohash(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Geohash of a point; same algorithm as the ``geohash_encode`` SQL function."""
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    chars = []
+    bits = value = 0
+    even = True
+    while len(chars) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            if lng >= mid:
+                value = value * 2 + 1
+                lng_lo = mid
+            else:
+                value *= 2
+                lng_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                value = value * 2 + 1
+                lat_lo = mid
+            else:
+                value *= 2
+                lat_hi = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(GEOHASH_BASE32[value])
+            bits = value = 0
+    return "".join(chars)
+
+
+def precision_for_zoom(zoom: int) -> int:
+    """Geohash precision whose cells are a few dozen pixels at ``zoom``
+    (web mercator zoom levels; precision 1 at world view, 7 at zoom 13)."""
+    return min(GEOHASH_PRECISION, max(1, (zoom + 1) // 2))
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    south: float
+    west: float
+    north: float
+    east: float
+
+    @property
+    def crosses_antimeridian(self) -> bool:
+        return self.west > self.east
+
+    def enclosing_geohash(self) -> str:
+        """Longest geohash prefix whose cell contains the whole box."""
+        if self.crosses_antimeridian:
+            return ""
+        corners = [
+            encode_geohash(lat, lng)
+            for lat in (self.south, self.north)
+            for lng in (self.west, self.east)
+        ]
+        prefix = corners[0]
+        for corner in corners[1:]:
+            while not corner.startswith(prefix):
+                prefix = prefix[:-1]
+        return prefix
+
+
+@dataclass(frozen=True)
+class MapSource:
+    """A geocoded dataset as SQL fragments (trusted, defined in code).
+
+    ``point_joins`` is only added to the points query, so clustering does not
+    pay for joins that only supply point details.
+    """
+
+    from_clause: str
+    lat: str
+    lng: str
+    geohash: str
+    id: str
+    point_columns: str
+    point_joins: str = ""
+    where: str = "TRUE"
+    point_order: str = "1"
+
+
+def _viewport_filter(source: MapSource, box: BoundingBox, params: Dict[str, Any]) -> str:
+    params.update(
+        south=box.south, north=box.north, west=box.west, east=box.east
+    )
+    lng_op = "OR" if box.crosses_antimeridian else "AND"
+    conditions = [
+        source.where,
+        f"{source.lat} BETWEEN :south AND :north",
+        f"({source.lng} >= :west {lng_op} {source.lng} <= :east)",
+    ]
+    prefix = box.enclosing_geohash()
+    if prefix:
+        params["geohash_prefix"] = prefix + "%"
+        conditions.append(f"{source.geohash} LIKE :geohash_prefix")
+    return " AND ".join(f"({c})" for c in conditions)
+
+
+async def viewport(
+    db: AsyncSession,
+    source: MapSource,
+    box: BoundingBox,
+    zoom: int,
+    params: Optional[Dict[str, Any]] = None,
+    max_points: int = MAX_POINTS,
+) -> Dict[str, Any]:
+    """Clusters (below :data:`POINTS_MIN_ZOOM`) or points inside ``box``.
+
+    Clusters carry the geohash cell, member count, centroid and, for
+    single-member cells, the member id. Points are capped at ``max_points``
+    (``truncated`` tells the client to zoom in).
+    """
+    params = dict(params or {})
+    where = _viewport_filter(source, box, params)
+
+    if zoom >= POINTS_MIN_ZOOM:
+        params["limit"] = max_points + 1
+        result = await db.execute(
+            text(f"""
+                SELECT {source.point_columns}
+                FROM {source.from_clause} {source.point_joins}
+                WHERE {where}
+                ORDER BY {source.point_order}
+                LIMIT :limit
+            """),
+            params,
+        )
+        points = [dict(row._mapping) for row in result.all()]
+        return {
+            "zoom": zoom,
+            "precision": None,
+            "clusters": [],
+            "points": points[:max_points],
+            "truncated": len(points) > max_points,
+        }
+
+    precision = precision_for_zoom(zoom)
+    params["precision"] = precision
+    result = await db.execute(
+        text(f"""
+            SELECT left({source.geohash}, :precision) AS geohash,
+                   count(*)::int AS count,
+                   avg({source.lat}) AS lat,
+                   avg({source.lng}) AS lng,
+                   CASE WHEN count(*) = 1 THEN min({source.id}::text) END AS id
+            FROM {source.from_clause}
+            WHERE {where}
+            GROUP BY 1
+            ORDER BY 1
+        """),
+        params,
+    )
+    return {
+        "zoom": zoom,
+        "precision": precision,
+        "clusters": [dict(row._mapping) for row in result.all()],
+        "points": [],
+        "truncated": False,
+    }
@@ -0,0 +1,204 @@
+"""Downsampled weight and BCS time series for several animals.
+
+Charts of a kennel or litter used to fetch the raw history of every animal
+separately. Here one query reads the range for all requested animals
+(served by the ``(animal_id, measured_at)`` indexes) and each series is cut
+down to at most ``points`` points:
+
+- ``avg``: fixed-width time buckets aggregated in SQL (mean, min, max and
+  count per bucket, placed at the mean time of its measurements), so only
+  the buckets leave the database;
+- ``lttb``: Largest-Triangle-Three-Buckets over the raw measurements, which
+  keeps real values and the visual shape (peaks and drops) of the series.
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy import Float, cast, func, literal, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.animal import Animal
+from src.app.models.animal_bcs_log import AnimalBCSLog
+from src.app.models.animal_weight_log import AnimalWeightLog
+
+METHODS = ("avg", "lttb")
+
+
+@dataclass(frozen=True)
+class Metric:
+    model: Any
+    value: Any
+
+
+METRICS: Dict[str, Metric] = {
+    "weight": Metric(AnimalWeightLog, AnimalWeightLog.weight_kg),
+    "bcs": Metric(AnimalBCSLog, AnimalBCSLog.bcs),
+}
+
+Point = Tuple[datetime, float]
+
+
+def lttb(points: Sequence[Point], threshold: int) -> List[Point]:
+    """Largest-Triangle-Three-Buckets downsampling of time-ordered points.
+
+    Keeps the first and last point and, from each of ``threshold - 2``
+    buckets between them, the point forming the largest triangle with the
+    previously kept point and the average of the next bucket.
+    """
+    n = len(points)
+    if threshold >= n:
+        return list(points)
+    if threshold < 3:  # no buckets between the ends
+        return [points[0], points[-1]][: max(threshold, 0)]
+    xs = [p[0].timestamp() for p in points]
+    ys = [p[1] for p in points]
+
+    sampled = [points[0]]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        span = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / span
+        avg_y = sum(ys[avg_start:avg_end]) / span
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        ax, ay = xs[a], ys[a]
+        best, best_area = range_start, -1.0
+        for j in range(range_start, range_end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        sampled.append(points[best])
+        a = best
+    sampled.append(points[-1])
+    return sampled
+
+
+def bucket_seconds(date_from: datetime, date_to: datetime, points: int) -> float:
+    return max((date_to - date_from).total_seconds() / points, 1.0)
+
+
+def _range_filter(metric: Metric, organization_id, animal_ids, date_from, date_to):
+    model = metric.model
+    return (
+        model.animal_id.in_(animal_ids),
+        model.measured_at >= date_from,
+        model.measured_at < date_to,
+        Animal.organization_id == organization_id,
+    )
+
+
+def bucket_query(
+    metric: Metric,
+    organization_id: uuid.UUID,
+    animal_ids: Sequence[uuid.UUID],
+    date_from: datetime,
+    date_to: datetime,
+    width: float,
+):
+    model = metric.model
+    epoch = func.extract("epoch", model.measured_at)
+    bucket = func.floor(
+        (epoch - literal(date_from.timestamp())) / literal(width)
+    ).label("bucket")
+    value = cast(metric.value, Float)
+    return (
+        select(
+            model.animal_id,
+            bucket,
+            func.to_timestamp(func.avg(epoch)).label("t"),
+            func.avg(value).label("value"),
+            func.min(value).label("min"),
+            func.max(value).label("max"),
+            func.count().label("count"),
+        )
+        .join(Animal, Animal.id == model.animal_id)
+        .where(*_range_filter(metric, organization_id, animal_ids, date_from, date_to))
+        # By the output alias so the bucket expression is computed once
+        .group_by(model.animal_id, literal_column("bucket"))
+        .order_by(model.animal_id, literal_column("bucket"))
+    )
+
+
+def raw_query(
+    metric: Metric,
+    organization_id: uuid.UUID,
+    animal_ids: Sequence[uuid.UUID],
+    date_from: datetime,
+    date_to: datetime,
+):
+    model = metric.model
+    return (
+        select(model.animal_id, model.measured_at, cast(metric.value, Float).label("value"))
+        .join(Animal, Animal.id == model.animal_id)
+        .where(*_range_filter(metric, organization_id, animal_ids, date_from, date_to))
+        .order_by(model.animal_id, model.measured_at)
+    )
+
+
+class MeasurementSeriesService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def series(
+        self,
+        organization_id: uuid.UUID,
+        animal_ids: Sequence[uuid.UUID],
+        metric: str,
+        date_from: datetime,
+        date_to: datetime,
+        points: int,
+        method: str = "avg",
+    ) -> Dict[str, Any]:
+        """Series per requested animal of the organization (animals without
+        measurements in the range get an empty series)."""
+        m = METRICS[metric]
+        series: Dict[uuid.UUID, Dict[str, Any]] = {
+            animal_id: {"animal_id": animal_id, "total": 0, "points": []}
+            for animal_id in animal_ids
+        }
+        width = None
+        if method == "avg":
+            width = bucket_seconds(date_from, date_to, points)
+            result = await self.db.execute(
+                bucket_query(m, organization_id, animal_ids, date_from, date_to, width)
+            )
+            for row in result.all():
+                entry = series[row.animal_id]
+                entry["total"] += row.count
+                entry["points"].append(
+                    {
+                        "t": row.t,
+                        "value": row.value,
+                        "min": row.min,
+                        "max": row.max,
+                        "count": row.count,
+                    }
+                )
+        else:
+            result = await self.db.execute(
+                raw_query(m, organization_id, animal_ids, date_from, date_to)
+            )
+            raw: Dict[uuid.UUID, List[Point]] = {}
+            for row in result.all():
+                raw.setdefault(row.animal_id, []).append((row.measured_at, row.value))
+            for animal_id, animal_points in raw.items():
+                series[animal_id]["total"] = len(animal_points)
+                series[animal_id]["points"] = [
+                    {"t": t, "value": value} for t, value in lttb(animal_points, points)
+                ]
+
+        return {
+            "metric": metric,
+            "method": method,
+            "date_from": date_from,
+            "date_to": date_to,
+            "bucket_seconds": width,
+            "series": list(series.values()),
+        }
@@ -11,6 +11,7 @@ a full transparent snapshot so the UI can show each factor with its label.
 """
 
 from datetime import datetime, timezone
+from typing import Any, Callable, Sequence
 
 
 # ---------------------------------------------------------------------------
@@ -129,6 +130,22 @@ WEIGHT_GOAL_FACTORS: dict[str, tuple[float, str]] = {
 # ---------------------------------------------------------------------------
 
 
+def _activity_entry(species: str, altered_status: str, age_group: str) -> tuple[float, str]:
+    activity_key = f"{altered_status}_{age_group}"
+    if species == "cat":
+        return (
+            _ACTIVITY_CAT.get(activity_key)
+            or _ACTIVITY_CAT.get(f"unknown_{age_group}")
+            or (1.2, "Kočka")
+        )
+    # dog and all other species use dog table as default
+    return (
+        _ACTIVITY_DOG.get(activity_key)
+        or _ACTIVITY_DOG.get(f"unknown_{age_group}")
+        or (1.4, "Pes")
+    )
+
+
 def calculate_mer(
     weight_kg: float,
     species: str,  # dog / cat / rodent / bird / other
@@ -154,22 +171,7 @@ def calculate_mer(
     rer = 70.0 * (weight_kg**0.75)
 
     # --- Activity factor (species + altered_status + age_group) ---
-    activity_key = f"{altered_status}_{age_group}"
-    if species == "cat":
-        activity_entry = (
-            _ACTIVITY_CAT.get(activity_key)
-            or _ACTIVITY_CAT.get(f"unknown_{age_group}")
-            or (1.2, "Kočka")
-        )
-    else:
-        # dog and all other species use dog table as default
-        activity_entry = (
-            _ACTIVITY_DOG.get(activity_key)
-            or _ACTIVITY_DOG.get(f"unknown_{age_group}")
-            or (1.4, "Pes")
-        )
-
-    activity_val, activity_label = activity_entry
+    activity_val, activity_label = _activity_entry(species, altered_status, age_group)
 
     # --- BCS factor ---
     bcs_factor: dict | None = None
@@ -242,3 +244,97 @@ def calculate_mer(
         "food_recommendation": food_recommendation,
         "calculated_at": datetime.now(timezone.utc).isoformat(),
     }
+
+
+# ---------------------------------------------------------------------------
+# Batch calculator
+# ---------------------------------------------------------------------------
+
+
+def _column(values: Sequence | None, default, n: int) -> Sequence:
+    return values if values is not None else [default] * n
+
+
+def _lookup(keys: Sequence, resolve: Callable[[Any], Any]) -> list:
+    """Factor per row; ``resolve`` runs once per distinct key, not per row."""
+    table = {key: resolve(key) for key in set(keys)}
+    return [table[key] for key in keys]
+
+
+def calculate_mer_batch(
+    weights_kg: Sequence[float | None],
+    species: Sequence[str],
+    altered_statuses: Sequence[str],
+    age_groups: Sequence[str],
+    bcs: Sequence[int | None] | None = None,
+    health_modifiers: Sequence[str] | None = None,
+    environments: Sequence[str] | None = None,
+    breed_sizes: Sequence[str] | None = None,
+    weight_goals: Sequence[str] | None = None,
+) -> list[float | None]:
+    """``mer_kcal`` of :func:`calculate_mer` for many animals at once.
+
+    Inputs are columns (one entry per animal; the optional ones default to
+    bcs None, healthy, indoor, unknown size, maintain). Each factor column is
+    looked up from its table once per distinct value and the columns are
+    multiplied in the same order as the scalar function, so results are
+    identical to it. Rows without a positive weight give None.
+    """
+    n = len(weights_kg)
+    activity = _lookup(
+        list(zip(species, altered_statuses, age_groups)),
+        lambda key: _activity_entry(*key)[0],
+    )
+    bcs_col = _lookup(
+        _column(bcs, None, n),
+        lambda b: BCS_FACTORS[b][0] if b is not None and 1 <= b <= 9 else None,
+    )
+    health = _lookup(
+        _column(health_modifiers, "healthy", n),
+        lambda h: HEALTH_FACTORS.get(h, HEALTH_FACTORS["healthy"])[0],
+    )
+    env = _lookup(
+        _column(environments, "indoor", n),
+        lambda e: ENVIRONMENT_FACTORS.get(e, ENVIRONMENT_FACTORS["indoor"])[0],
+    )
+    size = _lookup(
+        _column(breed_sizes, "unknown", n),
+        lambda s: BREED_SIZE_FACTORS.get(s, BREED_SIZE_FACTORS["unknown"])[0],
+    )
+    goal = _lookup(
+        _column(weight_goals, "maintain", n),
+        lambda g: WEIGHT_GOAL_FACTORS.get(g, WEIGHT_GOAL_FACTORS["maintain"])[0],
+    )
+
+    result: list[float | None] = []
+    for w, a, b, h, e, s, g in zip(weights_kg, activity, bcs_col, health, env, size, goal):
+        if w is None or w <= 0:
+            result.append(None)
+            continue
+        total = a
+        if b is not None:
+            total *= b
+        total *= h * e * s * g
+        result.append(round(70.0 * (float(w) ** 0.75) * total, 1))
+    return result
+
+
+def health_modifier_for(
+    is_lactating: bool = False,
+    is_pregnant: bool = False,
+    is_critical: bool = False,
+    is_cancer: bool = False,
+    is_diabetic: bool = False,
+) -> str:
+    """Health modifier implied by the animal's health flags (strongest first)."""
+    if is_lactating:
+        return "lactating"
+    if is_pregnant:
+        return "pregnant"
+    if is_critical:
+        return "critical"
+    if is_cancer:
+        return "cancer"
+    if is_diabetic:
+        return "diabetes"
+    return "healthy"
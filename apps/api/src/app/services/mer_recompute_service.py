@@ -0,0 +1,119 @@
+"""Stored ``animals.mer_kcal_per_day`` values.
+
+The stored value is :func:`calculate_mer` for the animal's weight, species,
+altered status, age group, BCS and health flags (indoor, unknown size,
+maintain), rounded to whole kcal. Single animals are recomputed when those
+inputs change; :class:`MerRecomputeService` recomputes many at once with
+:func:`calculate_mer_batch` and writes only the changed values back with one
+``UPDATE ... FROM (VALUES ...)`` per batch.
+"""
+
+import uuid
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import Integer, column, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.animal import Animal
+from src.app.services.mer_calculator import calculate_mer_batch, health_modifier_for
+
+MER_BATCH_SIZE = 5000
+MER_INPUT_COLUMNS = (
+    Animal.weight_current_kg,
+    Animal.species,
+    Animal.altered_status,
+    Animal.age_group,
+    Animal.bcs,
+    Animal.is_lactating,
+    Animal.is_pregnant,
+    Animal.is_critical,
+    Animal.is_cancer,
+    Animal.is_diabetic,
+)
+# Animal fields whose change requires a recompute
+MER_INPUT_FIELDS = {c.key for c in MER_INPUT_COLUMNS}
+
+
+def _value(v: Any) -> Any:
+    return getattr(v, "value", v)
+
+
+def mer_kcal_per_day(animals: Sequence[Any]) -> List[Optional[int]]:
+    """Stored MER for animals (ORM objects or rows with the
+    :data:`MER_INPUT_COLUMNS` attributes); None without a weight."""
+    mers = calculate_mer_batch(
+        weights_kg=[float(a.weight_current_kg) if a.weight_current_kg else None for a in animals],
+        species=[_value(a.species) for a in animals],
+        altered_statuses=[_value(a.altered_status) or "unknown" for a in animals],
+        age_groups=[_value(a.age_group) or "unknown" for a in animals],
+        bcs=[a.bcs for a in animals],
+        health_modifiers=[
+            health_modifier_for(
+                is_lactating=bool(a.is_lactating),
+                is_pregnant=bool(a.is_pregnant),
+                is_critical=bool(a.is_critical),
+                is_cancer=bool(a.is_cancer),
+                is_diabetic=bool(a.is_diabetic),
+            )
+            for a in animals
+        ],
+    )
+    return [round(m) if m is not None else None for m in mers]
+
+
+def update_statement(changes: Sequence[tuple]):
+    """``UPDATE animals ... FROM (VALUES (id, mer), ...)`` for ``changes``."""
+    rows = values(
+        column("id", UUID(as_uuid=True)), column("mer", Integer), name="mer_values"
+    ).data(list(changes))
+    return (
+        update(Animal)
+        .where(Animal.id == rows.c.id)
+        # A derived value; keep updated_at for clients syncing on it
+        .values(mer_kcal_per_day=rows.c.mer, updated_at=Animal.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+class MerRecomputeService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def recompute(
+        self,
+        organization_id: Optional[uuid.UUID] = None,
+        animal_ids: Optional[Sequence[uuid.UUID]] = None,
+        batch_size: int = MER_BATCH_SIZE,
+    ) -> int:
+        """Recompute stored MER of live animals (all, one organization's, or
+        the given ones), reading them in id order batches. Returns the
+        number of animals whose value changed. Does not commit."""
+        base = select(Animal.id, Animal.mer_kcal_per_day, *MER_INPUT_COLUMNS).where(
+            Animal.deleted_at.is_(None)
+        )
+        if organization_id is not None:
+            base = base.where(Animal.organization_id == organization_id)
+        if animal_ids is not None:
+            base = base.where(Animal.id.in_(animal_ids))
+
+        changed = 0
+        last_id = None
+        while True:
+            stmt = base.order_by(Animal.id).limit(batch_size)
+            if last_id is not None:
+                stmt = stmt.where(Animal.id > last_id)
+            rows = (await self.db.execute(stmt)).all()
+            if not rows:
+                return changed
+            last_id = rows[-1].id
+            changes = [
+                (row.id, mer)
+                for row, mer in zip(rows, mer_kcal_per_day(rows))
+                if mer != row.mer_kcal_per_day
+            ]
+            if changes:
+                await self.db.execute(update_statement(changes))
+                changed += len(changes)
+            if len(rows) < batch_size:
+                return changed
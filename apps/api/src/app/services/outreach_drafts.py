@@ -0,0 +1,263 @@
+"""Generation of personalized outreach email drafts with the Claude API.
+
+Shelters are processed by a bounded pool of workers and every draft is
+committed on its own, so a long campaign makes progress even if the run is
+interrupted: the next run only picks up shelters that have no email in the
+campaign yet.
+
+Each draft stores ``prompt_hash``, a hash of the model and the rendered
+prompt (campaign templates + the shelter fields they use). ``--regenerate``
+skips drafts whose hash is unchanged, so only shelters whose data or
+campaign template changed are sent to the model again.
+"""
+
+import hashlib
+import logging
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.outreach import EmailStatus, OutreachCampaign, OutreachEmail
+from src.app.models.registered_shelter import RegisteredShelter
+from src.app.services.web_crawler import run_pool
+
+log = logging.getLogger(__name__)
+
+MODEL = "claude-opus-4-6"
+MAX_TOKENS = 1024
+REGENERATE_STATUSES = (EmailStatus.PENDING.value, EmailStatus.DRAFT.value)
+
+# Default prompt used when campaign has no body_template
+DEFAULT_PROMPT = """Napiš personalizovaný email na útulok pro zvířata.
+
+Informace o útulku:
+- Název: {shelter_name}
+- Region: {shelter_region}
+- Adresa: {shelter_address}
+- Druhy zvířat: {shelter_species}
+- Web: {shelter_website}
+
+Předmět emailu (šablona): {subject_template}
+
+Požadavky na email:
+- Piš česky, přátelsky ale profesionálně
+- Email by měl být krátký (200-300 slov)
+- Zmíň, že PawShelter/SQLpet je česká aplikace přímo pro útulky
+- Zdůrazni klíčové benefity: správa zvířat, evidence krmení/léků, adoptivní proces, mobilní app pro dobrovolníky
+- Nezmiňuj cenu – první fáze je bezplatná
+- Zakončit výzvou k akci: "Rádi vám ukážeme demo zdarma" nebo odkaz na registraci
+- Podpis: Petr Šimek, zakladatel PawShelter (pets-log.com)
+
+Vrať POUZE tělo emailu v prostém textu (bez hlavičky předmětu, bez markdown formátování).
+"""
+
+
+def render_prompt(campaign: OutreachCampaign, shelter: RegisteredShelter) -> Tuple[str, str]:
+    """Subject and model prompt for one shelter."""
+    species_parts = []
+    if getattr(shelter, "accepts_dogs", None):
+        species_parts.append("psi")
+    if getattr(shelter, "accepts_cats", None):
+        species_parts.append("kočky")
+    species_str = ", ".join(species_parts) if species_parts else "neurčeno"
+
+    # Fill subject template
+    subject = campaign.subject_template.format(
+        shelter_name=shelter.name,
+        shelter_region=shelter.region or "",
+    )
+
+    prompt_template = campaign.body_template or DEFAULT_PROMPT
+    prompt = prompt_template.format(
+        shelter_name=shelter.name,
+        shelter_region=shelter.region or "neurčen",
+        shelter_address=shelter.address or "neurčena",
+        shelter_species=species_str,
+        shelter_website=shelter.website or "neuvedeno",
+        subject_template=subject,
+    )
+    return subject, prompt
+
+
+def prompt_hash(model: str, subject: str, prompt: str) -> str:
+    return hashlib.sha256("\x1f".join((model, subject, prompt)).encode()).hexdigest()
+
+
+@dataclass
+class DraftTarget:
+    shelter: RegisteredShelter
+    email_id: Optional[uuid.UUID] = None  # existing draft (regenerate mode)
+    prompt_hash: Optional[str] = None  # hash the existing draft was built from
+
+
+@dataclass
+class DraftStats:
+    generated: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    errors: Counter = field(default_factory=Counter)
+    started: float = field(default_factory=time.monotonic)
+
+    def summary(self) -> str:
+        elapsed = time.monotonic() - self.started
+        rate = self.generated / elapsed * 60 if elapsed else 0.0
+        text = (
+            f"Done in {elapsed:.1f}s — generated: {self.generated} ({rate:.1f}/min), "
+            f"unchanged: {self.unchanged}, failed: {self.failed}, "
+            f"tokens in/out: {self.input_tokens}/{self.output_tokens}"
+        )
+        if self.errors:
+            text += " — errors: " + ", ".join(f"{name} x{n}" for name, n in self.errors.most_common())
+        return text
+
+
+async def load_targets(
+    db: AsyncSession, campaign_id: uuid.UUID, limit: int, regenerate: bool
+) -> List[DraftTarget]:
+    """Shelters to generate drafts for, in a stable order."""
+    if not regenerate:
+        # Shelters with email AND not yet in this campaign
+        existing_q = select(OutreachEmail.shelter_id).where(
+            OutreachEmail.campaign_id == campaign_id
+        )
+        shelters_q = (
+            select(RegisteredShelter)
+            .where(
+                RegisteredShelter.id.not_in(existing_q),
+                RegisteredShelter.email.isnot(None),
+            )
+            .order_by(RegisteredShelter.name, RegisteredShelter.id)
+            .limit(limit)
+        )
+        return [DraftTarget(shelter) for shelter in (await db.execute(shelters_q)).scalars()]
+
+    # Re-generate only existing "pending" or "draft" ones
+    rows = await db.execute(
+        select(OutreachEmail.id, OutreachEmail.prompt_hash, RegisteredShelter)
+        .join(RegisteredShelter, RegisteredShelter.id == OutreachEmail.shelter_id)
+        .where(
+            OutreachEmail.campaign_id == campaign_id,
+            OutreachEmail.status.in_(REGENERATE_STATUSES),
+        )
+        .order_by(RegisteredShelter.name, OutreachEmail.id)
+        .limit(limit)
+    )
+    return [DraftTarget(shelter, email_id, hash_) for email_id, hash_, shelter in rows.all()]
+
+
+class DraftGenerator:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        client: Any,  # anthropic.AsyncAnthropic or a stand-in with .messages.create
+        campaign: OutreachCampaign,
+        model: str = MODEL,
+    ):
+        self.session_factory = session_factory
+        self.client = client
+        self.campaign = campaign
+        self.model = model
+        self.stats = DraftStats()
+
+    async def _complete(self, prompt: str) -> str:
+        message = await self.client.messages.create(
+            model=self.model,
+            max_tokens=MAX_TOKENS,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        usage = getattr(message, "usage", None)
+        if usage is not None:
+            self.stats.input_tokens += usage.input_tokens
+            self.stats.output_tokens += usage.output_tokens
+        return message.content[0].text.strip()
+
+    async def _save(self, target: DraftTarget, values: dict) -> None:
+        async with self.session_factory() as db:
+            if target.email_id:
+                # Only while still a draft; it may have been approved meanwhile
+                await db.execute(
+                    update(OutreachEmail)
+                    .where(
+                        OutreachEmail.id == target.email_id,
+                        OutreachEmail.status.in_(REGENERATE_STATUSES),
+                    )
+                    .values(
+                        **values,
+                        generation_attempts=OutreachEmail.generation_attempts + 1,
+                    )
+                )
+            else:
+                db.add(
+                    OutreachEmail(
+                        campaign_id=self.campaign.id,
+                        shelter_id=target.shelter.id,
+                        generation_attempts=1,
+                        **values,
+                    )
+                )
+            await db.commit()
+
+    async def _fail(self, target: DraftTarget, e: Exception) -> None:
+        log.error("  ✗ Failed for %s: %s", target.shelter.name, e)
+        self.stats.failed += 1
+        self.stats.errors[type(e).__name__] += 1
+        values = {"error_message": str(e)}
+        if not target.email_id:
+            values["status"] = EmailStatus.PENDING.value
+        await self._save(target, values)
+
+    async def process(self, target: DraftTarget) -> None:
+        shelter = target.shelter
+        try:
+            subject, prompt = render_prompt(self.campaign, shelter)
+            key = prompt_hash(self.model, subject, prompt)
+        except Exception as e:
+            # Template errors (unknown placeholder, ...) are recorded like
+            # failed completions
+            await self._fail(target, e)
+            return
+        if target.email_id and target.prompt_hash == key:
+            self.stats.unchanged += 1
+            return
+
+        try:
+            body = await self._complete(prompt)
+        except Exception as e:
+            await self._fail(target, e)
+            return
+
+        await self._save(
+            target,
+            {
+                "status": EmailStatus.DRAFT.value,
+                "generated_subject": subject,
+                "generated_body": body,
+                "prompt_hash": key,
+                "error_message": None,
+            },
+        )
+        self.stats.generated += 1
+        log.info("  ✓ Generated for %s (%d words)", shelter.name, len(body.split()))
+
+    async def run(self, targets: List[DraftTarget], concurrency: int) -> DraftStats:
+        await run_pool(targets, self.process, concurrency)
+        async with self.session_factory() as db:
+            total = await db.scalar(
+                select(func.count(OutreachEmail.id)).where(
+                    OutreachEmail.campaign_id == self.campaign.id
+                )
+            )
+            await db.execute(
+                update(OutreachCampaign)
+                .where(OutreachCampaign.id == self.campaign.id)
+                .values(total_targets=total or 0)
+            )
+            await db.commit()
+        return self.stats
@@ -0,0 +1,240 @@
+"""Delivery of approved outreach emails through the Resend API.
+
+Each worker claims a few approved emails with ``FOR UPDATE SKIP LOCKED``,
+sends them and commits their new status in the same transaction, so:
+
+- several runners can work on one campaign without sending an email twice;
+- a crash only loses the in-flight claim, which is released by the rollback
+  and retried by the next run.
+
+A single send carries the ``Idempotency-Key`` ``outreach-<email id>``, so
+Resend does not deliver it again when it is retried after a lost response,
+whether by the same request or by a later run. A batch request has one key
+for the whole batch, derived from its email ids. Its own retries are
+deduplicated, but a later run may claim the emails in different batches, so
+an email of a batch that was in flight during a crash can be delivered
+twice. Use ``batch_size=1`` where that matters.
+
+Requests are paced by a token bucket set to the provider's rate limit (a
+batch send is one request), and 429/5xx responses are retried with backoff.
+"""
+
+import asyncio
+import hashlib
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+import httpx
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.app.models.outreach import EmailStatus, OutreachCampaign, OutreachEmail
+from src.app.services.web_crawler import RETRY_STATUSES, TokenBucket
+
+log = logging.getLogger(__name__)
+
+RESEND_API_URL = "https://api.resend.com"
+RESEND_RATE = 2.0  # requests per second (Resend default limit)
+RESEND_BATCH_MAX = 100
+RETRY_BACKOFF = (1, 2, 4, 8)
+
+
+class TransientSendError(Exception):
+    pass
+
+
+class ResendClient:
+    def __init__(
+        self,
+        http: httpx.AsyncClient,
+        api_key: str,
+        bucket: TokenBucket,
+        base_url: str = RESEND_API_URL,
+        retry_backoff: Sequence[float] = RETRY_BACKOFF,
+    ):
+        self.http = http
+        self.api_key = api_key
+        self.bucket = bucket
+        self.base_url = base_url.rstrip("/")
+        self.retry_backoff = retry_backoff
+
+    async def _post(self, path: str, payload: Any, idempotency_key: str) -> Any:
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Idempotency-Key": idempotency_key,
+        }
+        for attempt in range(len(self.retry_backoff) + 1):
+            await self.bucket.acquire()
+            delay = self.retry_backoff[attempt] if attempt < len(self.retry_backoff) else None
+            try:
+                resp = await self.http.post(
+                    f"{self.base_url}{path}", json=payload, headers=headers, timeout=15
+                )
+            except httpx.TransportError as exc:
+                error: Exception = TransientSendError(str(exc))
+            else:
+                if resp.status_code not in RETRY_STATUSES:
+                    resp.raise_for_status()
+                    return resp.json()
+                error = TransientSendError(f"HTTP {resp.status_code}")
+                retry_after = resp.headers.get("Retry-After", "")
+                if delay is not None and retry_after.isdigit():
+                    delay = max(delay, int(retry_after))
+            if delay is None:
+                raise error
+            log.debug("Retrying %s in %ss: %s", path, delay, error)
+            await asyncio.sleep(delay)
+
+    async def send(self, message: Dict[str, Any], idempotency_key: str) -> str:
+        """Send one email; returns the Resend message id."""
+        data = await self._post("/emails", message, idempotency_key)
+        return data.get("id", "")
+
+    async def send_batch(self, messages: List[Dict[str, Any]], idempotency_key: str) -> List[str]:
+        """Send up to :data:`RESEND_BATCH_MAX` emails in one request; returns
+        the message ids in input order."""
+        data = await self._post("/emails/batch", messages, idempotency_key)
+        return [item.get("id", "") for item in data.get("data", [])]
+
+
+def idempotency_key(email_ids: Sequence[uuid.UUID]) -> str:
+    """``outreach-<id>`` for one email, a digest of the ids for a batch."""
+    if len(email_ids) == 1:
+        return f"outreach-{email_ids[0]}"
+    digest = hashlib.sha256(",".join(sorted(str(i) for i in email_ids)).encode()).hexdigest()
+    return f"outreach-{digest[:48]}"
+
+
+def claim_statement(campaign_id: uuid.UUID, size: int, exclude: Set[uuid.UUID]):
+    """Approved emails of the campaign no other runner holds, locked until
+    the claiming transaction ends."""
+    stmt = (
+        select(OutreachEmail)
+        .where(
+            OutreachEmail.campaign_id == campaign_id,
+            OutreachEmail.status == EmailStatus.APPROVED.value,
+        )
+        .order_by(OutreachEmail.created_at, OutreachEmail.id)
+        .limit(size)
+        .options(selectinload(OutreachEmail.shelter))
+        .with_for_update(skip_locked=True, of=OutreachEmail)
+    )
+    if exclude:
+        stmt = stmt.where(OutreachEmail.id.notin_(exclude))
+    return stmt
+
+
+@dataclass
+class SendStats:
+    sent: int = 0
+    failed: int = 0
+    skipped_no_email: int = 0
+    attempted: Set[uuid.UUID] = field(default_factory=set)
+
+
+class OutreachSender:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        client: ResendClient,
+        campaign: OutreachCampaign,
+        batch_size: int = 1,
+    ):
+        self.session_factory = session_factory
+        self.client = client
+        self.campaign = campaign
+        self.batch_size = min(max(1, batch_size), RESEND_BATCH_MAX)
+        self.stats = SendStats()
+
+    def _message(self, email: OutreachEmail) -> Dict[str, Any]:
+        message = {
+            "from": self.campaign.from_email,
+            "to": [email.shelter.email],
+            "subject": email.generated_subject,
+            "text": email.generated_body,
+        }
+        if self.campaign.reply_to:
+            message["reply_to"] = self.campaign.reply_to
+        return message
+
+    async def _deliver(self, emails: List[OutreachEmail]) -> None:
+        key = idempotency_key([e.id for e in emails])
+        if len(emails) == 1:
+            message_ids = [await self.client.send(self._message(emails[0]), key)]
+        else:
+            message_ids = await self.client.send_batch([self._message(e) for e in emails], key)
+        sent_at = datetime.now(timezone.utc)
+        for email, message_id in zip(emails, message_ids):
+            email.status = EmailStatus.SENT.value
+            email.sent_at = sent_at
+            email.resend_message_id = message_id
+            email.error_message = None
+
+    async def send_next(self, limit: int) -> int:
+        """Claim, send and commit up to ``batch_size`` emails (at most
+        ``limit``). Returns how many emails were claimed; 0 when none are
+        left."""
+        size = min(self.batch_size, limit)
+        async with self.session_factory() as db:
+            async with db.begin():
+                emails = list(
+                    (await db.execute(
+                        claim_statement(self.campaign.id, size, self.stats.attempted)
+                    )).scalars()
+                )
+                if not emails:
+                    return 0
+                self.stats.attempted.update(e.id for e in emails)
+
+                deliverable = []
+                for email in emails:
+                    if email.shelter.email:
+                        deliverable.append(email)
+                    else:
+                        log.warning("Skipping %s — no email address", email.shelter.name)
+                        email.status = EmailStatus.SKIPPED.value
+                        email.error_message = "No email address"
+                        self.stats.skipped_no_email += 1
+                if not deliverable:
+                    return len(emails)
+
+                try:
+                    await self._deliver(deliverable)
+                except Exception as exc:
+                    # Stays approved with the error; retried by the next run
+                    log.error("Failed to send %d email(s): %s", len(deliverable), exc)
+                    for email in deliverable:
+                        email.error_message = str(exc)
+                    self.stats.failed += len(deliverable)
+                else:
+                    await db.execute(
+                        update(OutreachCampaign)
+                        .where(OutreachCampaign.id == self.campaign.id)
+                        .values(sent_count=OutreachCampaign.sent_count + len(deliverable))
+                    )
+                    self.stats.sent += len(deliverable)
+                    for email in deliverable:
+                        log.info("✓ %s → %s", email.shelter.name, email.shelter.email)
+        return len(emails)
+
+    async def run(self, limit: int, concurrency: int) -> SendStats:
+        """Send up to ``limit`` emails with ``concurrency`` workers."""
+        remaining = limit
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                size = min(self.batch_size, remaining)
+                remaining -= size
+                claimed = await self.send_next(size)
+                remaining += size - claimed
+                if not claimed:
+                    return
+
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        return self.stats
@@ -0,0 +1,225 @@
+"""Daily animal population census.
+
+``/animals/stats/daily-count`` used to join ``generate_series`` over the
+requested days against every intake and animal of the organization. Closed
+days are now stored in ``animal_population_snapshots`` (per species and
+status) by the scheduler, so the endpoint reads one row group per day and
+only counts today, and any day after the last snapshot (before the nightly
+run, or after a failed one), live. "Today" is the database's CURRENT_DATE,
+as in the original query.
+
+The census is computed set-based: each animal contributes +1 on its first
+intake day and -1 on its outcome day, and a running sum over the day grid
+gives the population, so a range costs O(animals + days) rather than
+O(days x intakes).
+"""
+
+import uuid
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.animal_population_snapshot import AnimalPopulationSnapshot
+from src.app.models.intake import Intake
+from src.app.models.organization import Organization
+
+# Animals in the shelter at the end of each day of [:start, :end], per
+# species and status. An animal is present from its first (non-deleted)
+# intake until the day before its outcome_date.
+CENSUS_SQL = """
+    WITH stays AS (
+        SELECT a.species,
+               a.status,
+               GREATEST(MIN(i.intake_date), CAST(:start AS date)) AS first_day,
+               a.outcome_date
+        FROM animals a
+        JOIN intakes i ON i.animal_id = a.id
+            AND i.organization_id = CAST(:org_id AS uuid)
+            AND i.deleted_at IS NULL
+        WHERE a.deleted_at IS NULL
+        GROUP BY a.id
+        HAVING MIN(i.intake_date) <= CAST(:end AS date)
+           AND (a.outcome_date IS NULL
+                OR a.outcome_date > GREATEST(MIN(i.intake_date), CAST(:start AS date)))
+    ),
+    deltas AS (
+        SELECT species, status, first_day AS day, 1 AS delta FROM stays
+        UNION ALL
+        SELECT species, status, outcome_date, -1 FROM stays
+        WHERE outcome_date <= CAST(:end AS date)
+    ),
+    per_day AS (
+        SELECT species, status, day, SUM(delta) AS delta
+        FROM deltas
+        GROUP BY species, status, day
+    ),
+    grid AS (
+        SELECT g.species, g.status, d::date AS day
+        FROM (SELECT DISTINCT species, status FROM stays) g
+        CROSS JOIN generate_series(
+            CAST(:start AS date), CAST(:end AS date), interval '1 day'
+        ) AS d
+    ),
+    census AS (
+        SELECT grid.day, grid.species, grid.status,
+               SUM(COALESCE(per_day.delta, 0)) OVER (
+                   PARTITION BY grid.species, grid.status ORDER BY grid.day
+               ) AS count
+        FROM grid
+        LEFT JOIN per_day ON per_day.species = grid.species
+            AND per_day.status = grid.status
+            AND per_day.day = grid.day
+    )
+    SELECT day, species, status, count::int AS count
+    FROM census
+    WHERE count > 0
+"""
+
+
+class PopulationCensusService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _today(self) -> date:
+        return (await self.db.execute(select(func.current_date()))).scalar_one()
+
+    async def census(
+        self, organization_id: uuid.UUID, start: date, end: date
+    ) -> List[Any]:
+        """Live census rows (day, species, status, count) for ``start..end``."""
+        result = await self.db.execute(
+            text(CENSUS_SQL),
+            {"org_id": organization_id, "start": start, "end": end},
+        )
+        return result.all()
+
+    async def close_days(
+        self, organization_id: uuid.UUID, start: date, end: date
+    ) -> int:
+        """Write (or rewrite) the snapshots of ``start..end``. Returns the
+        number of snapshot rows inserted."""
+        params = {"org_id": organization_id, "start": start, "end": end}
+        await self.db.execute(
+            text(
+                """
+                DELETE FROM animal_population_snapshots
+                WHERE organization_id = CAST(:org_id AS uuid)
+                  AND snapshot_date BETWEEN CAST(:start AS date) AND CAST(:end AS date)
+                """
+            ),
+            params,
+        )
+        result = await self.db.execute(
+            text(
+                f"""
+                INSERT INTO animal_population_snapshots (
+                    id, organization_id, snapshot_date, species, status, count,
+                    created_at, updated_at
+                )
+                SELECT gen_random_uuid(), CAST(:org_id AS uuid), c.day, c.species,
+                       c.status, c.count, now(), now()
+                FROM ({CENSUS_SQL}) AS c
+                """
+            ),
+            params,
+        )
+        return result.rowcount
+
+    async def close_pending(
+        self, until: Optional[date] = None, rebuild: bool = False
+    ) -> int:
+        """Close every day up to ``until`` (default: yesterday) that has no
+        snapshot yet, for all organizations. Organizations without snapshots
+        are backfilled from their first intake; ``rebuild`` recomputes the
+        whole history. Returns the number of snapshot rows inserted."""
+        until = until or await self._today() - timedelta(days=1)
+        snap = AnimalPopulationSnapshot
+        last_closed = (
+            select(func.max(snap.snapshot_date))
+            .where(snap.organization_id == Organization.id)
+            .scalar_subquery()
+        )
+        first_intake = (
+            select(func.min(Intake.intake_date))
+            .where(Intake.organization_id == Organization.id, Intake.deleted_at.is_(None))
+            .scalar_subquery()
+        )
+        orgs = (
+            await self.db.execute(
+                select(
+                    Organization.id,
+                    last_closed.label("last_closed"),
+                    first_intake.label("first_intake"),
+                )
+            )
+        ).all()
+
+        inserted = 0
+        for org in orgs:
+            if org.first_intake is None:
+                continue
+            if org.last_closed is None or rebuild:
+                start = org.first_intake
+            else:
+                start = org.last_closed + timedelta(days=1)
+            if start > until:
+                continue
+            inserted += await self.close_days(org.id, start, until)
+        return inserted
+
+    async def daily_counts(
+        self, organization_id: uuid.UUID, days: int, today: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """Animals in the shelter per day for the last ``days`` days; days
+        with no animals are omitted.
+
+        Days up to the organization's last snapshot are read from the
+        snapshots (a closed day without rows had no animals); later days
+        are counted live.
+        """
+        snap = AnimalPopulationSnapshot
+        state = (
+            await self.db.execute(
+                select(
+                    func.current_date().label("today"),
+                    select(func.max(snap.snapshot_date))
+                    .where(snap.organization_id == organization_id)
+                    .scalar_subquery()
+                    .label("last_closed"),
+                )
+            )
+        ).one()
+        today = today or state.today
+        start = today - timedelta(days=days - 1)
+        last_closed = min(state.last_closed or start - timedelta(days=1), today - timedelta(days=1))
+
+        counts = []
+        if last_closed >= start:
+            result = await self.db.execute(
+                select(snap.snapshot_date, func.sum(snap.count).label("count"))
+                .where(
+                    and_(
+                        snap.organization_id == organization_id,
+                        snap.snapshot_date >= start,
+                        snap.snapshot_date <= last_closed,
+                    )
+                )
+                .group_by(snap.snapshot_date)
+                .order_by(snap.snapshot_date)
+            )
+            counts = [
+                {"date": row.snapshot_date.strftime("%Y-%m-%d"), "count": int(row.count)}
+                for row in result.all()
+            ]
+
+        live: Dict[date, int] = {}
+        live_start = max(start, last_closed + timedelta(days=1))
+        for row in await self.census(organization_id, live_start, today):
+            live[row.day] = live.get(row.day, 0) + row.count
+        counts.extend(
+            {"date": day.strftime("%Y-%m-%d"), "count": count}
+            for day, count in sorted(live.items())
+        )
+        return counts
@@ -7,7 +7,7 @@ from datetime import datetime
 from decimal import Decimal
 import uuid
 
-from src.app.models.purchase_order import PurchaseOrder, PurchaseOrderItem
+from src.app.models.purchase_order import OPEN_PO_STATUSES, PurchaseOrder, PurchaseOrderItem
 from src.app.models.inventory_item import InventoryItem
 from src.app.models.inventory_lot import InventoryLot
 from src.app.models.inventory_transaction import TransactionReason
@@ -343,7 +343,7 @@ class PurchaseService:
                 and_(
                     PurchaseOrderItem.inventory_item_id == item_id,
                     PurchaseOrder.organization_id == organization_id,
-                    PurchaseOrder.status.in_(["ordered", "partially_received"]),
+                    PurchaseOrder.status.in_(OPEN_PO_STATUSES),
                 )
             )
         )
@@ -0,0 +1,281 @@
+"""Geo lookups over registered shelters.
+
+``/registered-shelters/nearby`` used to evaluate the spherical law of
+cosines for every row of ``registered_shelters``. Two cheaper paths now
+produce the same rows in the same order:
+
+- SQL: a lat/lng bounding box around the query point (served by
+  ``ix_registered_shelters_lat_lng``) prefilters the rows before the exact
+  distance is computed;
+- in process: a KD-tree over the shelters' unit vectors finds candidates
+  within the matching chord length. It is a few thousand points, rebuilt
+  after imports and at most every ``SHELTER_GEO_INDEX_TTL_SECONDS``. The
+  index only holds ids and coordinates; the candidates' rows are read from
+  the database, so details changed elsewhere (e.g. phone and website by the
+  enrichment script) are never served stale.
+
+Both paths compute the final distance with the same formula as the original
+query (:func:`distance_km` mirrors the SQL expression operation by
+operation) and order by (distance, id), so results are identical.
+"""
+
+import math
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.config import settings
+
+EARTH_RADIUS_KM = 6371
+# Candidate searches are widened by ~6 m: acos() of a near-1 cosine is only
+# accurate to ~1e-8 rad, so the exact filter may accept points a few cm
+# beyond the true radius and the prefilter must not drop them.
+CANDIDATE_MARGIN = 1e-6
+
+# Same expression as the original nearby query; :lat/:lng is the query point
+DISTANCE_SQL = """
+    (6371 * acos(
+        LEAST(1.0, GREATEST(-1.0,
+            cos(radians(:lat)) * cos(radians(lat)) *
+            cos(radians(lng) - radians(:lng)) +
+            sin(radians(:lat)) * sin(radians(lat))
+        ))
+    ))
+"""
+
+SHELTER_COLUMNS = "id, name, address, lat, lng, accepts_dogs, accepts_cats, phone, website"
+
+SPECIES_FILTERS = {
+    "dog": "AND accepts_dogs = true",
+    "cat": "AND accepts_cats = true",
+}
+
+
+def distance_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance, evaluated exactly like :data:`DISTANCE_SQL`."""
+    cos_angle = math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.cos(
+        math.radians(lng2) - math.radians(lng1)
+    ) + math.sin(math.radians(lat1)) * math.sin(math.radians(lat2))
+    return EARTH_RADIUS_KM * math.acos(min(1.0, max(-1.0, cos_angle)))
+
+
+def bounding_box(
+    lat: float, lng: float, radius_km: float
+) -> Optional[Tuple[float, float, float, float]]:
+    """(min_lat, max_lat, min_lng, max_lng) containing every point within
+    ``radius_km``, or None when the circle reaches a pole or the
+    antimeridian (no useful box)."""
+    angle = radius_km / EARTH_RADIUS_KM + CANDIDATE_MARGIN
+    min_lat = lat - math.degrees(angle)
+    max_lat = lat + math.degrees(angle)
+    if min_lat <= -90 or max_lat >= 90:
+        return None
+    lng_delta = math.degrees(math.asin(min(1.0, math.sin(angle) / math.cos(math.radians(lat)))))
+    min_lng, max_lng = lng - lng_delta, lng + lng_delta
+    if min_lng < -180 or max_lng > 180:
+        return None
+    return min_lat, max_lat, min_lng, max_lng
+
+
+def _unit_vector(lat: float, lng: float) -> Tuple[float, float, float]:
+    rlat, rlng = math.radians(lat), math.radians(lng)
+    return (
+        math.cos(rlat) * math.cos(rlng),
+        math.cos(rlat) * math.sin(rlng),
+        math.sin(rlat),
+    )
+
+
+class KDTree:
+    """Static 3-d tree with radius queries (pure Python; no scipy here)."""
+
+    def __init__(self, points: Sequence[Tuple[float, float, float]]):
+        self._points = list(points)
+        # (point index, split axis, left node, right node); -1 = no child
+        self._nodes: List[Tuple[int, int, int, int]] = []
+        self._root = self._build(list(range(len(self._points))), 0)
+
+    def _build(self, indices: List[int], depth: int) -> int:
+        if not indices:
+            return -1
+        axis = depth % 3
+        indices.sort(key=lambda i: self._points[i][axis])
+        mid = len(indices) // 2
+        node = len(self._nodes)
+        self._nodes.append((indices[mid], axis, -1, -1))
+        left = self._build(indices[:mid], depth + 1)
+        right = self._build(indices[mid + 1:], depth + 1)
+        self._nodes[node] = (indices[mid], axis, left, right)
+        return node
+
+    def within(self, query: Tuple[float, float, float], radius: float) -> List[int]:
+        """Indices of all points at Euclidean distance <= ``radius``."""
+        found = []
+        radius_sq = radius * radius
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                continue
+            index, axis, left, right = self._nodes[node]
+            point = self._points[index]
+            if (
+                (query[0] - point[0]) ** 2
+                + (query[1] - point[1]) ** 2
+                + (query[2] - point[2]) ** 2
+            ) <= radius_sq:
+                found.append(index)
+            diff = query[axis] - point[axis]
+            # Equal coordinates may sit on either side of the split
+            if diff <= radius:
+                stack.append(left)
+            if diff >= -radius:
+                stack.append(right)
+        return found
+
+
+@dataclass
+class ShelterPoint:
+    id: uuid.UUID
+    lat: float
+    lng: float
+
+
+class ShelterGeoIndex:
+    def __init__(self, shelters: Sequence[ShelterPoint]):
+        self.shelters = list(shelters)
+        self.tree = KDTree([_unit_vector(s.lat, s.lng) for s in self.shelters])
+        self.built_at = time.monotonic()
+
+    def candidates(self, lat: float, lng: float, radius_km: float) -> List[uuid.UUID]:
+        """Ids of every shelter within ``radius_km`` (and a few beyond it)."""
+        angle = min(radius_km / EARTH_RADIUS_KM, math.pi)
+        chord = 2 * math.sin(angle / 2) + CANDIDATE_MARGIN
+        return [
+            self.shelters[index].id
+            for index in self.tree.within(_unit_vector(lat, lng), chord)
+        ]
+
+
+def nearest(
+    rows: Sequence[Dict[str, Any]],
+    lat: float,
+    lng: float,
+    radius_km: float,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Shelter rows within ``radius_km``, ordered by (distance, id), with
+    their ``distance_km``."""
+    results = []
+    for row in rows:
+        distance = distance_km(lat, lng, row["lat"], row["lng"])
+        if distance <= radius_km:
+            results.append((distance, row))
+    results.sort(key=lambda item: (item[0], item[1]["id"]))
+    if limit is not None:
+        results = results[:limit]
+    return [{**row, "distance_km": distance} for distance, row in results]
+
+
+_index: Optional[ShelterGeoIndex] = None
+
+
+def invalidate_shelter_geo_index() -> None:
+    """Drop the in-process index; call after shelters or coordinates change."""
+    global _index
+    _index = None
+
+
+class ShelterGeoService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _load_index(self) -> ShelterGeoIndex:
+        global _index
+        ttl = settings.SHELTER_GEO_INDEX_TTL_SECONDS
+        if _index is None or time.monotonic() - _index.built_at >= ttl:
+            result = await self.db.execute(
+                text("""
+                    SELECT id, lat, lng
+                    FROM registered_shelters
+                    WHERE lat IS NOT NULL AND lng IS NOT NULL
+                """)
+            )
+            _index = ShelterGeoIndex([ShelterPoint(*row) for row in result.all()])
+        return _index
+
+    async def _rows(self, ids: Sequence[uuid.UUID], species: Optional[str]) -> List[Dict[str, Any]]:
+        result = await self.db.execute(
+            text(f"""
+                SELECT {SHELTER_COLUMNS}
+                FROM registered_shelters
+                WHERE id = ANY(:ids) AND lat IS NOT NULL AND lng IS NOT NULL
+                {SPECIES_FILTERS.get(species, "")}
+            """),
+            {"ids": list(ids)},
+        )
+        return [dict(row._mapping) for row in result.all()]
+
+    async def nearby(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        species: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Shelters within ``radius_km`` of the point, nearest first; with
+        ``limit`` only the k nearest. Uses the in-process index unless it is
+        disabled (TTL 0)."""
+        if settings.SHELTER_GEO_INDEX_TTL_SECONDS > 0:
+            index = await self._load_index()
+            ids = index.candidates(lat, lng, radius_km)
+            if not ids:
+                return []
+            return nearest(await self._rows(ids, species), lat, lng, radius_km, limit)
+        return await self.nearby_sql(lat, lng, radius_km, species, limit)
+
+    async def nearby_sql(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        species: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Same result as :meth:`nearby`, computed in Postgres with a
+        bounding-box prefilter."""
+        params: Dict[str, Any] = {"lat": lat, "lng": lng, "radius": radius_km}
+        box_filter = ""
+        box = bounding_box(lat, lng, radius_km)
+        if box is not None:
+            box_filter = (
+                "AND lat BETWEEN :min_lat AND :max_lat AND lng BETWEEN :min_lng AND :max_lng"
+            )
+            params.update(zip(("min_lat", "max_lat", "min_lng", "max_lng"), box))
+        limit_clause = ""
+        if limit is not None:
+            limit_clause = "LIMIT :limit"
+            params["limit"] = limit
+
+        result = await self.db.execute(
+            text(f"""
+                SELECT {SHELTER_COLUMNS}, distance_km
+                FROM (
+                    SELECT {SHELTER_COLUMNS}, {DISTANCE_SQL} AS distance_km
+                    FROM registered_shelters
+                    WHERE lat IS NOT NULL AND lng IS NOT NULL
+                    {box_filter}
+                    {SPECIES_FILTERS.get(species, "")}
+                ) _dist
+                WHERE distance_km <= :radius
+                ORDER BY distance_km, id
+                {limit_clause}
+            """),
+            params,
+        )
+        return [dict(row._mapping) for row in result.all()]
@@ -0,0 +1,261 @@
+"""Bulk import of the registered-shelters CSV (state veterinary registry).
+
+The import used to issue one upsert per CSV row. Now the CSV is streamed and
+parsed in batches, each batch is copied into a temporary staging table with
+``COPY``, and a single ``INSERT ... ON CONFLICT`` merges the staging table
+into ``registered_shelters``. The merge also reports which registration
+numbers were inserted, updated or already identical.
+
+Rows repeating a registration number are merged once, with the last
+occurrence winning (as with the previous row-by-row upserts).
+"""
+
+import csv
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+REQUIRED_HEADERS = ["registrační číslo", "název", "adresa", "kraj"]
+BATCH_SIZE = 1000
+
+STAGING_TABLE = "registered_shelters_import"
+STAGING_COLUMNS = [
+    "seq",
+    "registration_number",
+    "name",
+    "address",
+    "region",
+    "activity_type",
+    "capacity",
+    "lat",
+    "lng",
+    "registration_date",
+]
+# Columns the registry owns; phone, website and notes are maintained by hand
+MERGED_COLUMNS = STAGING_COLUMNS[1:]
+# varchar limits of registered_shelters; longer values would abort the COPY
+MAX_LENGTHS = {
+    "registration_number": 20,
+    "name": 255,
+    "region": 100,
+    "activity_type": 255,
+}
+
+ShelterRecord = Tuple[Any, ...]  # values in STAGING_COLUMNS order
+
+
+def parse_single_dms(dms: str) -> float | None:
+    """Parse single DMS coordinate like 49°8'42.980"N"""
+    try:
+        dms = dms.replace("°", " ").replace("'", " ").replace('"', " ").strip()
+        direction = None
+        if "N" in dms or "S" in dms:
+            direction = -1 if "S" in dms else 1
+            dms = dms.replace("N", "").replace("S", "").strip()
+        elif "E" in dms or "W" in dms:
+            direction = -1 if "W" in dms else 1
+            dms = dms.replace("E", "").replace("W", "").strip()
+        parts = dms.split()
+        if len(parts) < 3:
+            return None
+        degrees = float(parts[0])
+        minutes = float(parts[1]) if len(parts) > 1 else 0
+        seconds = float(parts[2]) if len(parts) > 2 else 0
+        decimal = degrees + (minutes / 60) + (seconds / 3600)
+        if direction:
+            decimal *= direction
+        return decimal
+    except (ValueError, IndexError) as e:
+        print(f"Error parsing DMS '{dms}': {e}")
+        return None
+
+
+def parse_dms_to_decimal(dms_str: str) -> tuple[float | None, float | None]:
+    """Parse GPS from DMS format like: 49°8'42.980"N,15°0'6.507"E"""
+    if not dms_str:
+        return None, None
+    parts = dms_str.split(",")
+    if len(parts) != 2:
+        return None, None
+    return parse_single_dms(parts[0].strip()), parse_single_dms(parts[1].strip())
+
+
+def parse_date(date_str: str) -> date | None:
+    """Parse date from Czech format like 29.12.2017"""
+    if not date_str:
+        return None
+    try:
+        return datetime.strptime(date_str.strip(), "%d.%m.%Y").date()
+    except ValueError as e:
+        print(f"Error parsing date '{date_str}': {e}")
+        return None
+
+
+def missing_headers(fieldnames: Optional[List[str]]) -> List[str]:
+    return [h for h in REQUIRED_HEADERS if h not in (fieldnames or [])]
+
+
+def _field(row: Dict[str, Any], name: str) -> str:
+    return (row.get(name) or "").strip().strip('"')
+
+
+def parse_rows(
+    reader: Iterable[Dict[str, Any]], errors: List[Dict[str, Any]]
+) -> Iterator[ShelterRecord]:
+    """Staging records for the CSV rows; rows without a registration number
+    or name, or with a value too long for its column, are skipped and
+    reported in ``errors``."""
+    for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
+        reg_number = _field(row, "registrační číslo")
+        name = _field(row, "název")
+        if not reg_number or not name:
+            errors.append(
+                {
+                    "row": row_num,
+                    "error": "Missing required fields (registration_number or name)",
+                }
+            )
+            continue
+        lat, lng = parse_dms_to_decimal(_field(row, "GPS"))
+        record = (
+            row_num,
+            reg_number,
+            name,
+            _field(row, "adresa"),
+            _field(row, "kraj"),
+            _field(row, "druh činnosti") or None,
+            _field(row, "kapacita") or None,
+            lat,
+            lng,
+            parse_date(_field(row, "datum registrace")),
+        )
+        too_long = [
+            column
+            for column, value in zip(STAGING_COLUMNS, record)
+            if column in MAX_LENGTHS and value and len(value) > MAX_LENGTHS[column]
+        ]
+        if too_long:
+            errors.append(
+                {
+                    "row": row_num,
+                    "error": "Value too long for "
+                    + ", ".join(f"{c} (max {MAX_LENGTHS[c]})" for c in too_long),
+                }
+            )
+            continue
+        yield record
+
+
+def merge_sql() -> str:
+    """Merge of the staging table; returns one row of diff counts.
+
+    All CTEs see the table as it was before the statement, so ``previous``
+    holds the old values of the rows the upsert is about to change.
+    """
+    columns = ", ".join(MERGED_COLUMNS)
+    source_columns = ", ".join(f"s.{c}" for c in MERGED_COLUMNS)
+    changed = " OR ".join(f"r.{c} IS DISTINCT FROM s.{c}" for c in MERGED_COLUMNS)
+    excluded_changed = " OR ".join(
+        f"registered_shelters.{c} IS DISTINCT FROM EXCLUDED.{c}" for c in MERGED_COLUMNS
+    )
+    updates = ",\n                ".join(
+        f"{c} = EXCLUDED.{c}" for c in MERGED_COLUMNS if c != "registration_number"
+    )
+    return f"""
+        WITH source AS (
+            SELECT DISTINCT ON (registration_number) {columns}
+            FROM {STAGING_TABLE}
+            ORDER BY registration_number, seq DESC
+        ),
+        previous AS (
+            SELECT s.registration_number, ({changed}) AS changed
+            FROM source s
+            JOIN registered_shelters r ON r.registration_number = s.registration_number
+        ),
+        merged AS (
+            INSERT INTO registered_shelters
+                (id, {columns}, imported_at, created_at, updated_at)
+            SELECT gen_random_uuid(), {source_columns}, NOW(), NOW(), NOW()
+            FROM source s
+            ON CONFLICT (registration_number) DO UPDATE SET
+                {updates},
+                imported_at = NOW(),
+                updated_at = CASE WHEN {excluded_changed}
+                    THEN NOW() ELSE registered_shelters.updated_at END
+            RETURNING registration_number
+        )
+        SELECT
+            count(*) FILTER (WHERE p.registration_number IS NULL)::int AS inserted,
+            count(*) FILTER (WHERE p.changed)::int AS updated,
+            count(*) FILTER (WHERE NOT p.changed)::int AS unchanged
+        FROM merged m
+        LEFT JOIN previous p ON p.registration_number = m.registration_number
+    """
+
+
+class ShelterImportService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _create_staging_table(self) -> None:
+        await self.db.execute(
+            text(f"""
+                CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+                    seq integer NOT NULL,
+                    registration_number varchar(20) NOT NULL,
+                    name varchar(255) NOT NULL,
+                    address text NOT NULL,
+                    region varchar(100) NOT NULL,
+                    activity_type varchar(255),
+                    capacity text,
+                    lat double precision,
+                    lng double precision,
+                    registration_date date
+                ) ON COMMIT DROP
+            """)
+        )
+        await self.db.execute(text(f"TRUNCATE {STAGING_TABLE}"))
+
+    async def _copy(self, records: List[ShelterRecord]) -> None:
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            STAGING_TABLE, records=records, columns=STAGING_COLUMNS
+        )
+
+    async def import_rows(
+        self, reader: Iterable[Dict[str, Any]], batch_size: int = BATCH_SIZE
+    ) -> Dict[str, Any]:
+        """Stage and merge the rows of a ``csv.DictReader``. Does not commit;
+        the staging table is dropped at commit."""
+        errors: List[Dict[str, Any]] = []
+        await self._create_staging_table()
+        records = parse_rows(reader, errors)
+        staged = 0
+        while batch := list(islice(records, batch_size)):
+            await self._copy(batch)
+            staged += len(batch)
+
+        summary = {"inserted": 0, "updated": 0, "unchanged": 0}
+        if staged:
+            result = await self.db.execute(text(merge_sql()))
+            summary.update(result.one()._mapping)
+        return {
+            **summary,
+            "imported": summary["inserted"] + summary["updated"] + summary["unchanged"],
+            "skipped": len(errors),
+            "errors": errors[:10],
+            "total_errors": len(errors),
+        }
+
+    async def import_csv(self, lines: Iterable[str], batch_size: int = BATCH_SIZE) -> Dict[str, Any]:
+        """Import from an iterable of CSV lines (an open text file). Raises
+        ValueError when required columns are missing."""
+        reader = csv.DictReader(lines)
+        missing = missing_headers(reader.fieldnames)
+        if missing:
+            raise ValueError(f"Missing CSV columns: {', '.join(missing)}")
+        return await self.import_rows(reader, batch_size)
@@ -158,7 +158,7 @@ class TaskService:
             quantity_to_deduct_g = (task.task_metadata or {}).get("quantity_to_deduct_g")
             if quantity_to_deduct_g is not None and float(quantity_to_deduct_g) > 0:
                 from src.app.services.inventory_service import InventoryService
-                inv_service = InventoryService(self.db)
+                inv_service = InventoryService(self.db, self.audit)
                 try:
                     inventory_deductions = await inv_service.deduct_for_task(
                         organization_id=organization_id,
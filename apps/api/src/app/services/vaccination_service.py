@@ -0,0 +1,207 @@
+"""Vaccination expiry summary and revaccination reminder tasks.
+
+Both read ``animal_vaccinations`` through the partial
+(organization_id, valid_until) index, bounded by date, instead of loading
+every vaccination of the organization.
+"""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import DateTime, String, and_, cast, func, literal, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from src.app.models.animal import Animal, AnimalStatus
+from src.app.models.animal_vaccination import AnimalVaccination
+from src.app.models.inventory_lot import InventoryLot
+from src.app.models.task import Task, TaskPriority, TaskStatus, TaskType
+
+# Animals that have left the shelter do not need revaccination reminders
+INACTIVE_ANIMAL_STATUSES = (
+    AnimalStatus.DECEASED,
+    AnimalStatus.ADOPTED,
+    AnimalStatus.TRANSFERRED,
+    AnimalStatus.RETURNED_TO_OWNER,
+    AnimalStatus.EUTHANIZED,
+    AnimalStatus.ESCAPED,
+)
+# How many already-expired vaccinations the summary lists
+EXPIRED_PREVIEW = 5
+
+
+def _vaccination_item(row, today: date, days: int) -> Dict[str, Any]:
+    days_until = (row.valid_until - today).days
+    if days_until < 0:
+        status = "expired"
+    elif days_until <= days:
+        status = "expiring_soon"
+    else:
+        status = "expiring_later"
+    return {
+        "id": row.id,
+        "animal_id": row.animal_id,
+        "animal_name": row.animal_name,
+        "animal_public_code": row.public_code,
+        "vaccine_type": row.vaccination_type,
+        "administered_at": row.administered_at.date(),
+        "valid_until": row.valid_until,
+        "days_until_expiration": days_until,
+        "status": status,
+    }
+
+
+class VaccinationService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def expiry_summary(
+        self,
+        organization_id: uuid.UUID,
+        days: int,
+        today: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """Counts of expired / soon-expiring vaccinations, plus the ones
+        expiring within ``days`` and the first few already expired."""
+        today = today or date.today()
+        valid_until = AnimalVaccination.valid_until
+        counts = (
+            await self.db.execute(
+                select(
+                    func.count().label("total"),
+                    func.count().filter(valid_until < today).label("expired"),
+                    func.count()
+                    .filter(valid_until.between(today, today + timedelta(days=14)))
+                    .label("within_14"),
+                    func.count()
+                    .filter(valid_until.between(today, today + timedelta(days=30)))
+                    .label("within_30"),
+                ).where(
+                    AnimalVaccination.organization_id == organization_id,
+                    valid_until.isnot(None),
+                )
+            )
+        ).one()
+
+        listing = (
+            select(
+                AnimalVaccination.id,
+                AnimalVaccination.animal_id,
+                AnimalVaccination.vaccination_type,
+                AnimalVaccination.administered_at,
+                valid_until,
+                Animal.name.label("animal_name"),
+                Animal.public_code,
+            )
+            .join(Animal, AnimalVaccination.animal_id == Animal.id)
+            .where(
+                AnimalVaccination.organization_id == organization_id,
+                valid_until.isnot(None),
+            )
+            .order_by(valid_until.asc(), AnimalVaccination.id)
+        )
+        expiring = (
+            await self.db.execute(
+                listing.where(valid_until.between(today, today + timedelta(days=days)))
+            )
+        ).all()
+        expired = (
+            await self.db.execute(
+                listing.where(valid_until < today).limit(EXPIRED_PREVIEW)
+            )
+        ).all()
+
+        return {
+            "total_vaccinations": counts.total,
+            "expiring_within_14_days": counts.within_14,
+            "expiring_within_30_days": counts.within_30,
+            "expired": counts.expired,
+            "upcoming": [_vaccination_item(r, today, days) for r in expiring + expired],
+        }
+
+    async def create_revaccination_tasks(
+        self,
+        days_ahead: int,
+        today: Optional[date] = None,
+        organization_id: Optional[uuid.UUID] = None,
+    ) -> int:
+        """Create a medical task for every vaccination expiring within
+        ``days_ahead`` days, in one INSERT ... SELECT.
+
+        Vaccinations already superseded by a newer one of the same type, and
+        animals no longer in care, are skipped. The unique index on
+        ``task_metadata->>'vaccination_id'`` makes repeated runs no-ops.
+        Returns the number of tasks created.
+        """
+        today = today or datetime.now(timezone.utc).date()
+        newer = aliased(AnimalVaccination)
+        superseded = (
+            select(newer.id)
+            .where(
+                newer.animal_id == AnimalVaccination.animal_id,
+                newer.vaccination_type == AnimalVaccination.vaccination_type,
+                newer.administered_at > AnimalVaccination.administered_at,
+            )
+            .exists()
+        )
+        conditions = [
+            AnimalVaccination.valid_until.between(today, today + timedelta(days=days_ahead)),
+            Animal.deleted_at.is_(None),
+            Animal.status.notin_(INACTIVE_ANIMAL_STATUSES),
+            ~superseded,
+        ]
+        if organization_id is not None:
+            conditions.append(AnimalVaccination.organization_id == organization_id)
+
+        source = (
+            select(
+                func.gen_random_uuid(),
+                AnimalVaccination.organization_id,
+                (literal("Přeočkování: ") + AnimalVaccination.vaccination_type),
+                literal(TaskType.MEDICAL.value),
+                literal(TaskPriority.HIGH.value),
+                literal(TaskStatus.PENDING.value),
+                # Due at the start of the expiry day (UTC)
+                func.timezone("UTC", cast(AnimalVaccination.valid_until, DateTime)),
+                func.jsonb_build_object(
+                    literal_column("'vaccination_id'"), cast(AnimalVaccination.id, String),
+                    literal_column("'vaccination_type'"), AnimalVaccination.vaccination_type,
+                    literal_column("'animal_id'"), cast(AnimalVaccination.animal_id, String),
+                    literal_column("'valid_until'"), cast(AnimalVaccination.valid_until, String),
+                ),
+                literal("animal"),
+                AnimalVaccination.animal_id,
+                AnimalVaccination.animal_id,
+                InventoryLot.item_id,
+            )
+            .select_from(AnimalVaccination)
+            .join(Animal, Animal.id == AnimalVaccination.animal_id)
+            .outerjoin(InventoryLot, InventoryLot.id == AnimalVaccination.lot_id)
+            .where(and_(*conditions))
+        )
+        stmt = (
+            insert(Task)
+            .from_select(
+                [
+                    Task.id,
+                    Task.organization_id,
+                    Task.title,
+                    Task.type,
+                    Task.priority,
+                    Task.status,
+                    Task.due_at,
+                    Task.task_metadata,
+                    Task.related_entity_type,
+                    Task.related_entity_id,
+                    Task.animal_id,
+                    Task.linked_inventory_item_id,
+                ],
+                source,
+            )
+            .on_conflict_do_nothing()
+            .returning(Task.id)
+        )
+        result = await self.db.execute(stmt)
+        return len(result.all())
@@ -0,0 +1,243 @@
+"""Polite asynchronous HTTP fetching for the enrichment scripts.
+
+- :class:`HostRateLimiter`: one token bucket per host, so many shelters can be
+  crawled concurrently without hitting any single site (or search engine)
+  faster than ``rate`` requests per second;
+- :class:`PageCache`: pages on disk with their ``ETag``/``Last-Modified``
+  validators. Re-runs send conditional GETs and reuse the body on 304;
+- :class:`Checkpoint`: ids already processed by a script, flushed to disk as
+  it goes, so an interrupted run resumes where it stopped;
+- :func:`run_pool`: a bounded worker pool over a list of items.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Sequence, Set
+from urllib.parse import urlparse
+
+import httpx
+
+log = logging.getLogger(__name__)
+
+RETRY_BACKOFF = (2, 4, 8)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HostRateLimiter:
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    async def acquire(self, url: str) -> None:
+        host = urlparse(url).netloc.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        await bucket.acquire()
+
+
+@dataclass
+class Page:
+    url: str  # final URL after redirects
+    status: int
+    text: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+    from_cache: bool = False
+
+
+class PageCache:
+    """One JSON file per requested URL under ``directory``."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    def get(self, key: str) -> Optional[Page]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return Page(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def put(self, key: str, page: Page) -> None:
+        path = self._path(key)
+        data = {**asdict(page), "from_cache": False}
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+
+class AsyncCrawler:
+    """GET with per-host rate limiting, retries and an optional page cache.
+
+    Cached pages younger than ``max_age`` seconds are returned without a
+    request; older ones are revalidated with a conditional GET.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        limiter: HostRateLimiter,
+        cache: Optional[PageCache] = None,
+        max_age: float = 0,
+        retry_backoff: Sequence[float] = RETRY_BACKOFF,
+    ):
+        self.client = client
+        self.limiter = limiter
+        self.cache = cache
+        self.max_age = max_age
+        self.retry_backoff = retry_backoff
+        self.stats = {"requests": 0, "not_modified": 0, "cache_hits": 0, "failed": 0}
+
+    async def fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        use_cache: bool = True,
+    ) -> Optional[Page]:
+        """Page at ``url`` or None when it could not be fetched (4xx, or
+        still failing after the retries)."""
+        key = str(httpx.URL(url, params=params))
+        cached = self.cache.get(key) if self.cache and use_cache else None
+        if cached and time.time() - cached.fetched_at < self.max_age:
+            self.stats["cache_hits"] += 1
+            cached.from_cache = True
+            return cached
+
+        request_headers = dict(headers or {})
+        if cached:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        attempts = len(self.retry_backoff) or 1
+        for attempt in range(attempts):
+            await self.limiter.acquire(url)
+            self.stats["requests"] += 1
+            try:
+                resp = await self.client.get(
+                    url, params=params, headers=request_headers, follow_redirects=True
+                )
+            except httpx.HTTPError as exc:
+                log.debug("Attempt %d failed for %s: %s", attempt + 1, key, exc)
+            else:
+                if resp.status_code == 304 and cached:
+                    self.stats["not_modified"] += 1
+                    cached.fetched_at = time.time()
+                    self.cache.put(key, cached)
+                    cached.from_cache = True
+                    return cached
+                if resp.is_success:
+                    page = Page(
+                        url=str(resp.url),
+                        status=resp.status_code,
+                        text=resp.text,
+                        etag=resp.headers.get("ETag"),
+                        last_modified=resp.headers.get("Last-Modified"),
+                        fetched_at=time.time(),
+                    )
+                    if self.cache and use_cache:
+                        self.cache.put(key, page)
+                    return page
+                if resp.status_code not in RETRY_STATUSES:
+                    log.debug("HTTP %d for %s", resp.status_code, key)
+                    break
+                log.debug("Attempt %d got HTTP %d for %s", attempt + 1, resp.status_code, key)
+            if attempt + 1 < attempts:
+                await asyncio.sleep(self.retry_backoff[attempt])
+
+        self.stats["failed"] += 1
+        return None
+
+
+class Checkpoint:
+    """Processed ids per phase in a JSON file, rewritten every ``every`` marks."""
+
+    def __init__(self, path: str, every: int = 10):
+        self.path = path
+        self.every = every
+        self._pending = 0
+        self._done: Dict[str, Set[str]] = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                self._done = {phase: set(ids) for phase, ids in json.load(f).items()}
+        except (OSError, ValueError):
+            pass
+
+    def done(self, phase: str) -> Set[str]:
+        return self._done.setdefault(phase, set())
+
+    def mark(self, phase: str, item_id: Any) -> None:
+        self.done(phase).add(str(item_id))
+        self._pending += 1
+        if self._pending >= self.every:
+            self.save()
+
+    def save(self) -> None:
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({phase: sorted(ids) for phase, ids in self._done.items()}, f)
+        os.replace(tmp, self.path)
+        self._pending = 0
+
+    def reset(self) -> None:
+        self._done = {}
+        self.save()
+
+
+async def run_pool(
+    items: Iterable[Any], worker: Callable[[Any], Awaitable[None]], concurrency: int
+) -> None:
+    """Run ``worker`` over ``items`` with at most ``concurrency`` in flight.
+    Exceptions from a worker are logged and do not stop the pool."""
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in items:
+        queue.put_nowait(item)
+
+    async def consume() -> None:
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                await worker(item)
+            except Exception:
+                log.exception("Worker failed for %r", item)
+
+    await asyncio.gather(*(consume() for _ in range(max(1, concurrency))))
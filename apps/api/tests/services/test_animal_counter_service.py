@@ -0,0 +1,156 @@
+"""Unit tests for the animal status counters"""
+
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.app.models.animal import Animal, AnimalStatus, Species
+from src.app.services import animal_counter_service
+from src.app.services.animal_counter_service import (
+    AnimalCounterService,
+    apply_deltas_statement,
+    reconcile_statements,
+)
+
+ORG_ID = uuid4()
+
+
+@pytest.fixture
+def mock_db():
+    return AsyncMock(spec=AsyncSession)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _loaded_animal(status=AnimalStatus.INTAKE, species=Species.DOG, deleted_at=None):
+    """An animal as if loaded from the database (no pending history)."""
+    animal = Animal()
+    for attr, value in (
+        ("organization_id", ORG_ID),
+        ("species", species),
+        ("status", status),
+        ("deleted_at", deleted_at),
+    ):
+        set_committed_value(animal, attr, value)
+    return animal
+
+
+def _flush(new=(), dirty=(), deleted=()):
+    session = SimpleNamespace(new=list(new), dirty=list(dirty), deleted=list(deleted), info={})
+    animal_counter_service._collect_counter_deltas(session, None)
+    return session.info.get(animal_counter_service._BUFFER_KEY)
+
+
+class TestCollectDeltas:
+    def test_new_animal_is_counted(self):
+        animal = Animal(organization_id=ORG_ID, species=Species.CAT, status=AnimalStatus.INTAKE)
+
+        buffer = _flush(new=[animal])
+
+        assert buffer["deltas"] == {(ORG_ID, "cat", "intake"): 1}
+
+    def test_status_change_moves_one_animal(self):
+        animal = _loaded_animal()
+        animal.status = AnimalStatus.ADOPTED
+
+        buffer = _flush(dirty=[animal])
+
+        assert buffer["deltas"] == {
+            (ORG_ID, "dog", "intake"): -1,
+            (ORG_ID, "dog", "adopted"): 1,
+        }
+
+    def test_soft_delete_and_hard_delete_uncount(self):
+        soft = _loaded_animal()
+        soft.deleted_at = datetime.now(timezone.utc)
+        hard = _loaded_animal(status=AnimalStatus.AVAILABLE)
+
+        buffer = _flush(dirty=[soft], deleted=[hard])
+
+        assert buffer["deltas"] == {
+            (ORG_ID, "dog", "intake"): -1,
+            (ORG_ID, "dog", "available"): -1,
+        }
+
+    def test_unrelated_edit_and_string_status_are_ignored(self):
+        renamed = _loaded_animal()
+        renamed.name = "Rex"
+        same_status = _loaded_animal()
+        same_status.status = "intake"
+
+        assert _flush(dirty=[renamed, same_status]) is None
+
+    def test_unknown_previous_value_triggers_recount(self):
+        animal = Animal()
+        set_committed_value(animal, "organization_id", ORG_ID)
+        animal.status = AnimalStatus.ADOPTED  # species/status never loaded
+
+        buffer = _flush(dirty=[animal])
+
+        assert buffer["recount"] == {ORG_ID}
+        assert not buffer["deltas"]
+
+
+class TestStatements:
+    def test_deltas_upsert_adds_in_key_order(self):
+        other_org = uuid4()
+        stmt = apply_deltas_statement(
+            {
+                (max(ORG_ID, other_org), "dog", "intake"): 1,
+                (min(ORG_ID, other_org), "cat", "adopted"): -1,
+                (ORG_ID, "dog", "hold"): 0,
+            }
+        )
+
+        sql = _sql(stmt)
+        assert "ON CONFLICT (organization_id, species, status) DO UPDATE" in sql
+        assert "count = (animal_status_counters.count + excluded.count)" in sql
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert params["organization_id_m0"] == min(ORG_ID, other_org)
+        assert "organization_id_m2" not in params
+
+    def test_no_rows_no_statement(self):
+        assert apply_deltas_statement({(ORG_ID, "dog", "intake"): 0}) is None
+
+    def test_reconcile_locks_then_recounts(self):
+        lock, upsert, zero_missing = (_sql(s) for s in reconcile_statements(ORG_ID))
+
+        assert "FOR UPDATE" in lock
+        assert "count(*)" in upsert
+        assert "WHERE animal_status_counters.count != excluded.count" in upsert
+        assert "NOT (EXISTS" in zero_missing
+
+
+class TestCounts:
+    @pytest.mark.asyncio
+    async def test_totals_by_species_and_status(self, mock_db):
+        result = MagicMock()
+        result.all.return_value = [
+            SimpleNamespace(species="dog", status="available", count=5),
+            SimpleNamespace(species="dog", status="intake", count=2),
+            SimpleNamespace(species="cat", status="available", count=3),
+        ]
+        mock_db.execute.return_value = result
+
+        counts = await AnimalCounterService(mock_db).counts(ORG_ID)
+
+        assert counts == {
+            "total": 10,
+            "by_species": {"dog": 7, "cat": 3},
+            "by_status": {"available": 8, "intake": 2},
+        }
+
+    @pytest.mark.asyncio
+    async def test_reconcile_reports_corrected_rows(self, mock_db):
+        mock_db.execute = AsyncMock(
+            side_effect=[MagicMock(), MagicMock(rowcount=2), MagicMock(rowcount=1)]
+        )
+
+        assert await AnimalCounterService(mock_db).reconcile(ORG_ID) == 3
@@ -0,0 +1,186 @@
+"""Unit tests for the bulk animal import"""
+
+import pytest
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.services import animal_import_service
+from src.app.services.animal_import_service import (
+    ANIMAL_COLUMNS,
+    AnimalImportService,
+    ImportCatalogs,
+    ImportFileError,
+    ImportRecord,
+    read_rows,
+    validate_rows,
+)
+
+ORG_ID = uuid4()
+LABRADOR_ID = uuid4()
+
+
+@pytest.fixture
+def catalogs():
+    return ImportCatalogs(
+        breeds={("dog", "labrador"): LABRADOR_ID, ("dog", "labradorský retrívr"): LABRADOR_ID},
+        colors={"black": "black", "černá": "black"},
+        existing_microchips={"203000000000001"},
+    )
+
+
+def test_read_csv_with_czech_headers_and_semicolons():
+    content = (
+        "Jméno;Druh;Pohlaví;Plemeno;Barva;Neznámý sloupec\n"
+        "Rex;pes;samec;Labrador;černá;x\n"
+        ";;;;;\n"
+        "Micka;kočka;samice;;;\n"
+    ).encode("utf-8-sig")
+
+    rows = read_rows("animals.csv", content)
+
+    assert rows == [
+        {"name": "Rex", "species": "pes", "sex": "samec", "breed": "Labrador", "color": "černá"},
+        {"name": "Micka", "species": "kočka", "sex": "samice", "breed": "", "color": ""},
+    ]
+
+
+def test_read_csv_requires_name_and_species():
+    with pytest.raises(ImportFileError, match="species"):
+        read_rows("animals.csv", b"name,sex\nRex,male\n")
+
+
+def test_read_rows_rejects_unknown_file_type():
+    with pytest.raises(ImportFileError):
+        read_rows("animals.pdf", b"%PDF")
+
+
+def test_validate_rows_resolves_catalogs(catalogs):
+    rows = [
+        {
+            "name": "Rex",
+            "species": "Pes",
+            "sex": "samec",
+            "breed": "Labradorský retrívr",
+            "color": "Černá",
+            "birth_date": "1.2.2020",
+            "weight_kg": "25,5",
+            "microchip": "203000000000002",
+        }
+    ]
+
+    records, errors = validate_rows(rows, catalogs)
+
+    assert errors == []
+    [record] = records
+    assert record.row == 2
+    assert record.breed_id == LABRADOR_ID
+    assert record.microchip == "203000000000002"
+    assert record.values["species"] == "dog"
+    assert record.values["sex"] == "male"
+    assert record.values["color"] == "black"
+    assert record.values["status"] == "intake"
+    assert record.values["birth_date_estimated"] == date(2020, 2, 1)
+    assert record.values["weight_current_kg"] == Decimal("25.50")
+
+
+def test_validate_rows_reports_every_error(catalogs):
+    rows = [
+        {"name": "", "species": "dragon"},
+        {"name": "Rex", "species": "dog", "breed": "Unknown", "weight_kg": "heavy"},
+        {"name": "Max", "species": "dog", "microchip": "203000000000001"},
+        {"name": "A", "species": "cat", "microchip": "111"},
+        {"name": "B", "species": "cat", "microchip": "111"},
+        {"name": "C", "species": "cat", "birth_date": "yesterday", "status": "lost"},
+    ]
+
+    records, errors = validate_rows(rows, catalogs)
+
+    assert [r.values["name"] for r in records] == ["A"]
+    assert [(e["row"], e["field"]) for e in errors] == [
+        (2, "name"),
+        (2, "species"),
+        (3, "weight_kg"),
+        (3, "breed"),
+        (4, "microchip"),
+        (6, "microchip"),
+        (7, "status"),
+        (7, "birth_date"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_insert_batch_copies_rows_and_updates_counters(monkeypatch):
+    mock_db = AsyncMock(spec=AsyncSession)
+    driver = MagicMock()
+    driver.copy_records_to_table = AsyncMock()
+    raw = MagicMock(driver_connection=driver)
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+    mock_db.connection.return_value = connection
+
+    image = SimpleNamespace(public_url="https://img/dog.jpg", thumbnail_url="https://img/dog_t.jpg")
+    compute_image = AsyncMock(return_value=image)
+    monkeypatch.setattr(
+        animal_import_service.AnimalService, "_compute_default_image_url", compute_image
+    )
+    monkeypatch.setattr(
+        animal_import_service.AnimalService,
+        "_allocate_public_codes",
+        AsyncMock(return_value=["A-2026-000001", "A-2026-000002", "A-2026-000003"]),
+    )
+
+    def record(row, name, species="dog", breed_id=LABRADOR_ID, microchip=None, weight=None):
+        return ImportRecord(
+            row=row,
+            values={
+                "name": name,
+                "species": species,
+                "sex": "male",
+                "status": "intake",
+                "altered_status": "intact",
+                "birth_date_estimated": None,
+                "age_group": "adult",
+                "color": "black",
+                "weight_current_kg": weight,
+                "description": None,
+            },
+            breed_id=breed_id,
+            microchip=microchip,
+        )
+
+    records = [
+        record(2, "Rex", microchip="123", weight=Decimal("10")),
+        record(3, "Max"),
+        record(4, "Micka", species="cat", breed_id=None),
+    ]
+    service = AnimalImportService(mock_db)
+
+    ids = await service.insert_batch(ORG_ID, records)
+
+    assert len(ids) == 3
+    # Dog/labrador/black resolved once, cat/black once
+    assert compute_image.await_count == 2
+    calls = {c.args[0]: c.kwargs for c in driver.copy_records_to_table.await_args_list}
+    assert list(calls) == ["animals", "animal_breeds", "animal_identifiers"]
+
+    animals = calls["animals"]["records"]
+    assert calls["animals"]["columns"] == ANIMAL_COLUMNS
+    assert all(len(row) == len(ANIMAL_COLUMNS) for row in animals)
+    rex = dict(zip(ANIMAL_COLUMNS, animals[0]))
+    assert rex["public_code"] == "A-2026-000001"
+    assert rex["default_image_url"] == "https://img/dog.jpg"
+    assert rex["mer_kcal_per_day"] == round(70 * 10**0.75 * 1.8)  # intact adult dog
+    assert dict(zip(ANIMAL_COLUMNS, animals[1]))["mer_kcal_per_day"] is None
+
+    assert calls["animal_breeds"]["records"] == [(ids[0], LABRADOR_ID), (ids[1], LABRADOR_ID)]
+    [chip] = calls["animal_identifiers"]["records"]
+    assert chip[2:] == (ids[0], "microchip", "123")
+
+    # One counter upsert for the batch
+    mock_db.execute.assert_awaited_once()
+    params = mock_db.execute.await_args.args[0].compile().params
+    assert sorted(v for k, v in params.items() if k.startswith("count")) == [1, 2]
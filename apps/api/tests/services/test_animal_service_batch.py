@@ -0,0 +1,148 @@
+"""Unit tests for batch animal creation (litters, bulk intakes)"""
+
+import pytest
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.animal_breed import AnimalBreed
+from src.app.models.intake import Intake, IntakeReason
+from src.app.models.kennel import KennelStay
+from src.app.services.animal_service import AnimalService
+
+ORG_ID = uuid4()
+USER_ID = uuid4()
+
+
+@pytest.fixture
+def mock_db():
+    return AsyncMock(spec=AsyncSession)
+
+
+def _scalar_result(value):
+    result = MagicMock()
+    result.scalar.return_value = value
+    result.scalar_one_or_none.return_value = value
+    return result
+
+
+def _service(mock_db, default_image=None):
+    svc = AnimalService(mock_db)
+    svc.audit = AsyncMock()
+    svc._compute_default_image_url = AsyncMock(return_value=default_image)
+    return svc
+
+
+def _added(mock_db, call_index):
+    return mock_db.add_all.call_args_list[call_index].args[0]
+
+
+@pytest.mark.asyncio
+async def test_allocate_public_codes_continues_from_max(mock_db):
+    mock_db.execute.return_value = _scalar_result(41)
+
+    codes = await AnimalService(mock_db)._allocate_public_codes(ORG_ID, 3)
+
+    year = datetime.now(timezone.utc).year
+    assert codes == [f"A-{year}-000042", f"A-{year}-000043", f"A-{year}-000044"]
+    assert mock_db.execute.await_count == 1
+    sql = str(mock_db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "max(CAST(SUBSTRING(animals.public_code" in sql
+    assert "animals.public_code ~" in sql
+
+
+@pytest.mark.asyncio
+async def test_allocate_public_codes_starts_at_one(mock_db):
+    mock_db.execute.return_value = _scalar_result(None)
+
+    codes = await AnimalService(mock_db)._allocate_public_codes(ORG_ID, 1)
+
+    assert codes[0].endswith("-000001")
+
+
+@pytest.mark.asyncio
+async def test_batch_creates_animals_and_dependents_in_two_flushes(mock_db):
+    mock_db.execute.return_value = _scalar_result(9)
+    image = SimpleNamespace(public_url="https://img/x.jpg", thumbnail_url="https://img/x_t.jpg")
+    svc = _service(mock_db, default_image=image)
+    breed_ids = [uuid4(), uuid4()]
+    kennel_id = uuid4()
+
+    animals = await svc.create_animals_batch(
+        ORG_ID,
+        [{"name": f"Kotě {i}", "sex": "female"} for i in range(1, 4)],
+        species="cat",
+        breed_ids=breed_ids,
+        color="black",
+        kennel_id=kennel_id,
+        stay_reason="Narozeno",
+        intake={
+            "reason": IntakeReason.BIRTH,
+            "intake_date": date(2026, 10, 18),
+            "created_by_id": USER_ID,
+        },
+        actor_id=USER_ID,
+    )
+
+    # One code query; the default image is resolved once for the whole batch
+    assert mock_db.execute.await_count == 1
+    svc._compute_default_image_url.assert_awaited_once_with(
+        species="cat", breed_ids=breed_ids, color="black"
+    )
+    assert mock_db.flush.await_count == 2
+    assert mock_db.add_all.call_count == 2
+
+    assert _added(mock_db, 0) == animals
+    assert [a.name for a in animals] == ["Kotě 1", "Kotě 2", "Kotě 3"]
+    assert [a.public_code[-6:] for a in animals] == ["000010", "000011", "000012"]
+    assert all(a.default_image_url == "https://img/x.jpg" for a in animals)
+    assert all(a.organization_id == ORG_ID and a.color == "black" for a in animals)
+
+    dependents = _added(mock_db, 1)
+    breeds = [d for d in dependents if isinstance(d, AnimalBreed)]
+    stays = [d for d in dependents if isinstance(d, KennelStay)]
+    intakes = [d for d in dependents if isinstance(d, Intake)]
+    assert len(breeds) == 6
+    assert {(b.animal_id, b.breed_id) for b in breeds} == {
+        (a.id, b) for a in animals for b in breed_ids
+    }
+    assert [s.animal_id for s in stays] == [a.id for a in animals]
+    assert all(s.kennel_id == kennel_id and s.reason == "Narozeno" for s in stays)
+    assert [i.animal_id for i in intakes] == [a.id for a in animals]
+    assert all(i.reason == IntakeReason.BIRTH for i in intakes)
+
+    assert svc.audit.log_action.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_estimates_weight_from_breed(mock_db):
+    breed = SimpleNamespace(
+        weight_male_min=4, weight_male_max=6, weight_female_min=3, weight_female_max=5
+    )
+    mock_db.execute.side_effect = [_scalar_result(0), _scalar_result(breed)]
+    svc = _service(mock_db)
+
+    animals = await svc.create_animals_batch(
+        ORG_ID,
+        [{"name": "A", "sex": "female"}, {"name": "B", "sex": "male"}],
+        species="cat",
+        breed_ids=[uuid4()],
+        estimate_weight=True,
+    )
+
+    assert [float(a.weight_estimated_kg) for a in animals] == [4.0, 5.0]
+    assert mock_db.add_all.call_count == 2
+    assert len(_added(mock_db, 1)) == 2  # breed links only, no stays or intakes
+    svc.audit.log_action.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batch_with_no_animals_does_nothing(mock_db):
+    svc = _service(mock_db)
+
+    assert await svc.create_animals_batch(ORG_ID, [], species="dog") == []
+    mock_db.execute.assert_not_awaited()
+    mock_db.flush.assert_not_awaited()
@@ -0,0 +1,106 @@
+"""Unit tests for the animal activity timeline"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.services.animal_timeline_service import (
+    EVENT_TYPES,
+    AnimalTimelineService,
+    decode_cursor,
+    encode_cursor,
+    timeline_query,
+)
+
+ORG_ID = uuid4()
+ANIMAL_ID = uuid4()
+NOW = datetime(2026, 10, 1, 12, tzinfo=timezone.utc)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    event_id = uuid4()
+
+    assert decode_cursor(encode_cursor(NOW, event_id)) == (NOW, event_id)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_timeline_query_unions_every_source():
+    sql = _sql(timeline_query(ANIMAL_ID, ORG_ID, 51))
+
+    assert sql.count("UNION ALL") == len(EVENT_TYPES) - 1
+    for type_ in EVENT_TYPES:
+        assert f"'{type_}' AS type" in sql
+    assert "walk_logs.animal_ids @> ARRAY[" in sql
+    assert "tasks.type != " in sql
+    assert "ORDER BY events.occurred_at DESC, events.id DESC" in sql
+
+
+def test_timeline_query_filters_types_and_pushes_cursor_into_branches():
+    stmt = timeline_query(ANIMAL_ID, ORG_ID, 51, types=["weight", "incident"], cursor=(NOW, uuid4()))
+
+    sql = _sql(stmt)
+    assert sql.count("UNION ALL") == 1
+    assert "kennel_stays" not in sql
+    assert "(animal_weight_logs.measured_at, animal_weight_logs.id) < (" in sql
+    # Same expression as ix_animal_incidents_animal_timeline
+    assert (
+        "(timezone('UTC', CAST(animal_incidents.incident_date AS TIMESTAMP WITHOUT TIME ZONE)), "
+        "animal_incidents.id) < (" in sql
+    )
+    assert sql.count("DESC \n LIMIT") == 3  # both branches and the outer query
+
+
+def _rows(count):
+    return [
+        SimpleNamespace(
+            _mapping={
+                "id": uuid4(),
+                "type": "weight",
+                "occurred_at": NOW - timedelta(days=i),
+                "ended_at": None,
+                "data": {"weight_kg": 10 + i},
+            }
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_timeline_returns_next_cursor_only_when_more_rows():
+    mock_db = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    rows = _rows(4)
+    result.all.return_value = rows
+    mock_db.execute.return_value = result
+    svc = AnimalTimelineService(mock_db)
+
+    page = await svc.timeline(ORG_ID, ANIMAL_ID, limit=3)
+
+    assert [item["id"] for item in page["items"]] == [r._mapping["id"] for r in rows[:3]]
+    last = rows[2]._mapping
+    assert decode_cursor(page["next_cursor"]) == (last["occurred_at"], last["id"])
+
+    result.all.return_value = rows[:3]
+    page = await svc.timeline(ORG_ID, ANIMAL_ID, limit=3, cursor=encode_cursor(NOW, uuid4()))
+
+    assert len(page["items"]) == 3
+    assert page["next_cursor"] is None
+    assert mock_db.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_timeline_rejects_bad_cursor_without_querying():
+    mock_db = AsyncMock(spec=AsyncSession)
+
+    with pytest.raises(ValueError):
+        await AnimalTimelineService(mock_db).timeline(ORG_ID, ANIMAL_ID, cursor="%%%")
+    mock_db.execute.assert_not_awaited()
@@ -0,0 +1,148 @@
+"""Unit tests for AuditService buffering and diff compaction"""
+
+import pytest
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.config import settings
+from src.app.services.audit_service import (
+    AuditService,
+    compact_diff,
+    _write_buffered_entries,
+    _BUFFER_KEY,
+)
+
+
+@pytest.fixture
+def mock_db():
+    """Mock async session with a real info dict"""
+    db = AsyncMock(spec=AsyncSession)
+    db.info = {}
+    db.add = MagicMock()
+    return db
+
+
+class TestAuditService:
+    """Test deferred audit logging"""
+
+    @pytest.mark.asyncio
+    async def test_log_action_buffers_without_flush(self, mock_db):
+        """Deferred entries are collected on the session, not flushed"""
+        svc = AuditService(mock_db)
+        org_id = uuid4()
+
+        for action in ("create", "update", "complete"):
+            await svc.log_action(
+                organization_id=org_id,
+                actor_user_id=None,
+                action=action,
+                entity_type="task",
+                entity_id=uuid4(),
+            )
+
+        assert svc.pending_count() == 3
+        assert [row["action"] for row in mock_db.info[_BUFFER_KEY]] == [
+            "create",
+            "update",
+            "complete",
+        ]
+        mock_db.add.assert_not_called()
+        mock_db.flush.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_log_action_returns_entry_with_id(self, mock_db):
+        """Returned AuditLog carries the id that will be inserted"""
+        svc = AuditService(mock_db)
+        log = await svc.log_action(
+            organization_id=uuid4(),
+            actor_user_id=None,
+            action="create",
+            entity_type="animal",
+            entity_id=uuid4(),
+            after={"name": "Rex"},
+        )
+
+        assert log.id == mock_db.info[_BUFFER_KEY][0]["id"]
+        assert log.after == {"name": "Rex"}
+
+    @pytest.mark.asyncio
+    async def test_immediate_mode_flushes(self, mock_db):
+        """deferred=False keeps the old add + flush behaviour"""
+        svc = AuditService(mock_db, deferred=False)
+        await svc.log_action(
+            organization_id=uuid4(),
+            actor_user_id=None,
+            action="create",
+            entity_type="animal",
+            entity_id=uuid4(),
+        )
+
+        mock_db.add.assert_called_once()
+        mock_db.flush.assert_called_once()
+        assert _BUFFER_KEY not in mock_db.info
+
+    def test_write_buffered_entries_single_insert(self):
+        """All buffered rows go out in one execute call"""
+        session = MagicMock()
+        session.info = {_BUFFER_KEY: [{"id": uuid4()}, {"id": uuid4()}]}
+
+        written = _write_buffered_entries(session)
+
+        assert written == 2
+        session.flush.assert_called_once()
+        session.execute.assert_called_once()
+        assert len(session.execute.call_args.args[1]) == 2
+        assert _BUFFER_KEY not in session.info
+
+    def test_write_buffered_entries_empty_is_noop(self):
+        session = MagicMock()
+        session.info = {}
+
+        assert _write_buffered_entries(session) == 0
+        session.flush.assert_not_called()
+        session.execute.assert_not_called()
+
+
+class TestCompactDiff:
+    """Test before/after compaction"""
+
+    def test_small_diff_untouched(self):
+        before, after = compact_diff({"a": 1}, {"a": 2}, max_bytes=1024)
+        assert before == {"a": 1}
+        assert after == {"a": 2}
+
+    def test_unchanged_keys_dropped(self):
+        big = "x" * 500
+        before, after = compact_diff(
+            {"name": "Rex", "notes": big},
+            {"name": "Max", "notes": big},
+            max_bytes=200,
+        )
+        assert before == {"name": "Rex"}
+        assert after == {"name": "Max"}
+
+    def test_oversized_values_replaced(self):
+        before, after = compact_diff(None, {"blob": "y" * 5000, "ok": 1}, max_bytes=1024)
+        assert before is None
+        assert after["ok"] == 1
+        assert after["blob"].endswith("bytes omitted>")
+
+    @pytest.mark.asyncio
+    async def test_log_action_compacts_when_enabled(self, mock_db):
+        svc = AuditService(mock_db)
+        with patch.object(settings, "AUDIT_DIFF_MAX_BYTES", 200):
+            await svc.log_action(
+                organization_id=uuid4(),
+                actor_user_id=None,
+                action="update",
+                entity_type="organization_settings",
+                entity_id=uuid4(),
+                before={"legal": "z" * 400, "locale": "cs"},
+                after={"legal": "z" * 400, "locale": "en"},
+                compact=True,
+            )
+
+        row = mock_db.info[_BUFFER_KEY][0]
+        assert row["before"] == {"locale": "cs"}
+        assert row["after"] == {"locale": "en"}
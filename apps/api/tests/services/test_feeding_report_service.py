@@ -0,0 +1,149 @@
+"""Unit tests for FeedingReportService"""
+
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.animal import Species
+from src.app.services.feeding_report_service import FeedingReportService
+
+ReportRow = namedtuple(
+    "ReportRow",
+    "animal_id animal_name public_code species food_id food_name "
+    "total_grams feeding_count animal_total_grams",
+)
+
+
+@pytest.fixture
+def mock_db():
+    return AsyncMock(spec=AsyncSession)
+
+
+def _result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def _stream(rows):
+    result = MagicMock()
+    result.__aiter__.return_value = rows
+    result.close = AsyncMock()
+    return result
+
+
+def _compiled_sql(mock_db) -> str:
+    stmt = mock_db.execute.call_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+SINCE = datetime.now(timezone.utc) - timedelta(days=30)
+
+
+class TestConsumptionReport:
+    @pytest.mark.asyncio
+    async def test_folds_rows_per_animal(self, mock_db):
+        rex, mia = uuid.uuid4(), uuid.uuid4()
+        kibble = uuid.uuid4()
+        mock_db.execute.return_value = _result([
+            ReportRow(rex, "Rex", "A1", Species.DOG, kibble, "Kibble", Decimal("900"), 6, Decimal("1000")),
+            ReportRow(rex, "Rex", "A1", Species.DOG, None, None, Decimal("100"), 1, Decimal("1000")),
+            ReportRow(mia, "Mia", "A2", Species.CAT, None, None, Decimal("50"), 2, Decimal("50")),
+        ])
+
+        items = await FeedingReportService(mock_db).consumption_report(uuid.uuid4(), SINCE)
+
+        assert [i["animal_id"] for i in items] == [str(rex), str(mia)]
+        assert items[0]["total_grams"] == 1000.0
+        assert items[0]["total_feedings"] == 7
+        assert items[0]["species"] == "dog"
+        # Feedings without an inventory item count toward totals only
+        assert items[0]["by_food"] == [
+            {"food_id": str(kibble), "food_name": "Kibble", "total_grams": 900.0, "feeding_count": 6}
+        ]
+        assert items[1]["by_food"] == []
+
+    @pytest.mark.asyncio
+    async def test_aggregates_in_sql(self, mock_db):
+        mock_db.execute.return_value = _result([])
+
+        await FeedingReportService(mock_db).consumption_report(uuid.uuid4(), SINCE)
+
+        sql = _compiled_sql(mock_db)
+        assert "GROUP BY" in sql
+        assert "sum(" in sql
+        assert "tasks.amount_g" in sql
+        # Only the needed columns, never whole task rows
+        assert "tasks.title" not in sql
+        assert "tasks.id" not in sql
+
+
+class TestStreamConsumptionRows:
+    @pytest.mark.asyncio
+    async def test_flattens_rows_per_food(self, mock_db):
+        rex, mia = uuid.uuid4(), uuid.uuid4()
+        kibble = uuid.uuid4()
+        result = _stream([
+            ReportRow(rex, "Rex", "A1", Species.DOG, None, None, Decimal("100"), 1, Decimal("1000")),
+            ReportRow(rex, "Rex", "A1", Species.DOG, kibble, "Kibble", Decimal("900"), 6, Decimal("1000")),
+            ReportRow(mia, "Mia", "A2", Species.CAT, None, None, Decimal("50"), 2, Decimal("50")),
+        ])
+        mock_db.stream.return_value = result
+
+        rows = [
+            row
+            async for row in FeedingReportService(mock_db).stream_consumption_rows(
+                uuid.uuid4(), SINCE
+            )
+        ]
+
+        # Feedings without an item only show up for animals with no other food
+        assert rows == [
+            [str(rex), "Rex", "A1", "dog", "Kibble", 900.0, 6],
+            [str(mia), "Mia", "A2", "cat", "", 0, 0],
+        ]
+        stmt = mock_db.stream.call_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] > 0
+        mock_db.execute.assert_not_called()
+        result.close.assert_awaited_once()
+
+
+class TestBreakdowns:
+    @pytest.mark.asyncio
+    async def test_by_species_reports_missing_animals_as_unknown(self, mock_db):
+        Row = namedtuple("Row", "species total_grams animal_count")
+        mock_db.execute.return_value = _result([
+            Row(Species.DOG, Decimal("500"), 2),
+            Row(None, Decimal("20"), 1),
+        ])
+
+        rows = await FeedingReportService(mock_db).consumption_by_species(uuid.uuid4(), SINCE)
+
+        assert rows == [
+            {"species": "dog", "total_grams": 500.0, "animal_count": 2},
+            {"species": "unknown", "total_grams": 20.0, "animal_count": 1},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_history_filters_on_animal(self, mock_db):
+        Row = namedtuple("Row", "food_id food_name total_grams feeding_count")
+        food_id = uuid.uuid4()
+        mock_db.execute.return_value = _result([
+            Row(food_id, "Kibble", Decimal("300"), 2),
+            Row(None, None, Decimal("40"), 1),
+        ])
+
+        history = await FeedingReportService(mock_db).animal_history(
+            uuid.uuid4(), uuid.uuid4(), SINCE
+        )
+
+        assert history["total_grams"] == 340.0
+        assert history["total_feedings"] == 3
+        assert len(history["by_food"]) == 1
+        assert "tasks.animal_id =" in _compiled_sql(mock_db)
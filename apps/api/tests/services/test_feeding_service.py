@@ -1062,3 +1062,67 @@ class TestKrmenickoEpic:
 
         assert result == {"updated": 0, "cancelled": 0}
         mock_db.flush.assert_not_called()
+
+
+class TestTypedFeedingColumns:
+    """Typed feeding columns mirror task_metadata and drive the lookups."""
+
+    def test_metadata_populates_typed_columns(self, sample_org):
+        plan_id, animal_id = uuid4(), uuid4()
+        task = _make_pending_task(
+            sample_org.id, plan_id, animal_id, "08:30",
+            datetime(2026, 3, 5, 8, 30, tzinfo=timezone.utc), 150.5,
+        )
+
+        assert task.feeding_plan_id == plan_id
+        assert task.animal_id == animal_id
+        assert task.scheduled_time.strftime("%H:%M") == "08:30"
+        assert task.amount_g == 150.5
+
+    def test_malformed_metadata_leaves_columns_empty(self, sample_org):
+        task = Task(
+            id=uuid4(), organization_id=sample_org.id, title="Feed",
+            type=TaskType.FEEDING,
+            task_metadata={"feeding_plan_id": "nope", "scheduled_time": "late", "amount_g": "lots"},
+        )
+
+        assert task.feeding_plan_id is None
+        assert task.scheduled_time is None
+        assert task.amount_g is None
+
+    def test_metadata_update_resyncs_amount(self, sample_org):
+        task = _make_pending_task(
+            sample_org.id, uuid4(), uuid4(), "08:00",
+            datetime(2026, 3, 5, 8, 0, tzinfo=timezone.utc), 100.0,
+        )
+        task.task_metadata = {**task.task_metadata, "amount_g": 175.0}
+
+        assert task.amount_g == 175.0
+
+    @pytest.mark.asyncio
+    async def test_window_skips_slots_with_existing_typed_key(
+        self, feeding_service, mock_db, sample_org
+    ):
+        plan, plan_id, _ = _make_plan(sample_org.id, amount_g=200, times=["08:00", "18:00"])
+        from_dt = datetime(2026, 3, 5, 6, 0, tzinfo=timezone.utc)
+        to_dt = from_dt + timedelta(hours=13)
+
+        plans_result = MagicMock()
+        plans_result.scalars.return_value.all.return_value = [plan]
+        existing_result = MagicMock()
+        existing_result.all.return_value = [
+            (plan_id, datetime(2026, 3, 5, 8, 0, tzinfo=timezone.utc))
+        ]
+        mock_db.execute = AsyncMock(side_effect=[plans_result, existing_result])
+        mock_db.add_all = MagicMock()
+        mock_db.flush = AsyncMock()
+
+        created = await feeding_service.ensure_feeding_tasks_window(
+            organization_id=sample_org.id, from_dt=from_dt, to_dt=to_dt
+        )
+
+        assert [t.due_at.hour for t in created] == [18]
+        assert created[0].feeding_plan_id == plan_id
+        sql = str(mock_db.execute.call_args_list[1].args[0])
+        assert "tasks.feeding_plan_id" in sql
+        assert "task_metadata" not in sql
@@ -0,0 +1,85 @@
+"""Unit tests for the streaming GDPR export writer"""
+
+import io
+import tracemalloc
+import uuid
+import zipfile
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.app.services.gdpr_export_service import (
+    CsvEntry,
+    _no_batches,
+    login_logs_query,
+    stream_csv_zip,
+)
+
+
+def _entry(name: str, n_rows: int, batch_size: int = 2000) -> CsvEntry:
+    async def batches():
+        for start in range(0, n_rows, batch_size):
+            yield [
+                (i, "update", "animal", f"Mozilla/5.0 client-{i % 13}")
+                for i in range(start, min(n_rows, start + batch_size))
+            ]
+
+    return CsvEntry(
+        filename=name,
+        headers=["id", "action", "entity_type", "user_agent"],
+        batches=batches,
+        format_row=lambda r: [str(v) for v in r],
+    )
+
+
+async def _collect(entries) -> list[bytes]:
+    return [chunk async for chunk in stream_csv_zip(entries)]
+
+
+class TestStreamCsvZip:
+    @pytest.mark.asyncio
+    async def test_produces_valid_zip_with_bom_csv(self):
+        empty = CsvEntry("login_logs.csv", ["id", "email"], _no_batches, list)
+        chunks = await _collect([_entry("audit_logs.csv", 5000), empty])
+
+        assert len(chunks) > 1
+        zf = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+        assert zf.namelist() == ["audit_logs.csv", "login_logs.csv"]
+
+        audit = zf.read("audit_logs.csv")
+        assert audit.startswith(b"\xef\xbb\xbfid,action,entity_type,user_agent\r\n")
+        assert len(audit.splitlines()) == 5001
+        assert zf.read("login_logs.csv") == b"\xef\xbb\xbfid,email\r\n"
+
+    @pytest.mark.asyncio
+    async def test_memory_stays_flat_for_a_million_rows(self):
+        tracemalloc.start()
+        try:
+            total = 0
+            async for chunk in stream_csv_zip([_entry("audit_logs.csv", 1_000_000)]):
+                total += len(chunk)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert total > 1_000_000
+        # One batch of rows plus the deflate state, not the whole export
+        assert peak < 16 * 1024 * 1024
+
+
+def test_login_logs_query_applies_api_filters():
+    since = datetime(2025, 10, 1, tzinfo=timezone.utc)
+    export_sql = str(login_logs_query([uuid.uuid4()], since).compile(dialect=postgresql.dialect()))
+    api_sql = str(
+        login_logs_query(
+            [uuid.uuid4()], since, until=datetime.now(timezone.utc), user_id=uuid.uuid4(), success=False
+        ).compile(dialect=postgresql.dialect())
+    )
+
+    assert "login_logs.created_at >= %(created_at_1)s" in export_sql
+    assert "ORDER BY login_logs.created_at DESC" in export_sql
+    assert "success" not in export_sql.split("WHERE")[1]
+    assert "login_logs.created_at <= %(created_at_2)s" in api_sql
+    assert "login_logs.user_id = %(user_id_2)s" in api_sql
+    assert "login_logs.success = false" in api_sql
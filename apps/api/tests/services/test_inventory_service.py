@@ -38,6 +38,8 @@ def inventory_service(mock_db, mock_audit):
     """Create InventoryService instance with mocks"""
     service = InventoryService(mock_db)
     service.audit = mock_audit
+    service.snapshots = MagicMock()
+    service.snapshots.record = AsyncMock()
     return service
 
 
@@ -577,3 +579,152 @@ class TestInventoryService:
         assert abs(float(sample_lot.quantity) - 15.0) < 0.001
         # item.quantity_current should be 20 - 5 = 15
         assert abs(float(sample_item.quantity_current) - 15.0) < 0.001
+
+
+class TestFifoDeduction:
+    """FIFO allocation locks the item and its lots and writes in one flush."""
+
+    @staticmethod
+    def _results(item, lots):
+        item_result = MagicMock()
+        item_result.scalar_one_or_none.return_value = item
+        lots_result = MagicMock()
+        lots_result.scalars.return_value.all.return_value = lots
+        return [item_result, lots_result]
+
+    @pytest.mark.asyncio
+    async def test_deduct_for_task_spans_lots_in_one_flush(
+        self, inventory_service, mock_db, mock_audit, sample_org, sample_item, sample_user
+    ):
+        sample_item.quantity_current = Decimal("0.50")
+        soon = InventoryLot(id=uuid4(), item_id=sample_item.id, lot_number="SOON", quantity=Decimal("0.20"))
+        later = InventoryLot(id=uuid4(), item_id=sample_item.id, lot_number="LATER", quantity=Decimal("0.30"))
+        mock_db.execute = AsyncMock(side_effect=self._results(sample_item, [soon, later]))
+        mock_db.add_all = MagicMock()
+
+        result = await inventory_service.deduct_for_task(
+            organization_id=sample_org.id,
+            item_id=sample_item.id,
+            amount_g=300,  # 0.3 kg
+            task_id=uuid4(),
+            user_id=sample_user.id,
+        )
+
+        assert [d["lot_number"] for d in result] == ["SOON", "LATER"]
+        assert result[0]["lot_emptied"] is True
+        assert abs(float(later.quantity) - 0.2) < 1e-9
+        assert abs(float(sample_item.quantity_current) - 0.2) < 1e-9
+        # All transactions added together and written by a single flush
+        (transactions,) = mock_db.add_all.call_args.args
+        assert len(transactions) == 2
+        mock_db.flush.assert_called_once()
+        assert mock_audit.log_action.await_count == 2
+        inventory_service.snapshots.record.assert_awaited_once_with(
+            sample_item, transactions, [soon, later]
+        )
+
+    @pytest.mark.asyncio
+    async def test_item_and_lots_are_locked_in_fifo_order(
+        self, inventory_service, mock_db, sample_org, sample_item, sample_lot, sample_user
+    ):
+        mock_db.execute = AsyncMock(side_effect=self._results(sample_item, [sample_lot]))
+        mock_db.add_all = MagicMock()
+
+        await inventory_service.deduct_for_task(
+            organization_id=sample_org.id,
+            item_id=sample_item.id,
+            amount_g=100,
+            task_id=uuid4(),
+            user_id=sample_user.id,
+        )
+
+        item_sql, lots_sql = (str(c.args[0]) for c in mock_db.execute.call_args_list)
+        assert "inventory_items" in item_sql and "FOR UPDATE" in item_sql
+        assert "inventory_lots" in lots_sql and "FOR UPDATE" in lots_sql
+        assert "ORDER BY inventory_lots.expires_at ASC NULLS LAST, inventory_lots.id" in lots_sql
+
+    @pytest.mark.asyncio
+    async def test_deduction_beyond_cached_stock_raises(
+        self, inventory_service, mock_db, sample_org, sample_item, sample_lot, sample_user
+    ):
+        sample_item.quantity_current = Decimal("0.05")
+        mock_db.execute = AsyncMock(side_effect=self._results(sample_item, [sample_lot]))
+
+        with pytest.raises(ValueError, match="stock would be negative"):
+            await inventory_service.deduct_for_task(
+                organization_id=sample_org.id,
+                item_id=sample_item.id,
+                amount_g=100,
+                task_id=uuid4(),
+                user_id=sample_user.id,
+            )
+        mock_db.flush.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deduction_beyond_lot_stock_raises(
+        self, inventory_service, mock_db, sample_org, sample_item, sample_user
+    ):
+        # Cached item stock covers the request, the lots do not
+        sample_item.quantity_current = Decimal("1.00")
+        lot = InventoryLot(id=uuid4(), item_id=sample_item.id, lot_number="LAST", quantity=Decimal("0.10"))
+        mock_db.execute = AsyncMock(side_effect=self._results(sample_item, [lot]))
+
+        with pytest.raises(ValueError, match="Insufficient stock in lots"):
+            await inventory_service.deduct_for_task(
+                organization_id=sample_org.id,
+                item_id=sample_item.id,
+                amount_g=300,
+                task_id=uuid4(),
+                user_id=sample_user.id,
+            )
+        assert lot.quantity == Decimal("0.10")
+        mock_db.flush.assert_not_called()
+
+
+class TestItemsWithStock:
+    """Stock listing aggregates lots and open purchase orders in one query."""
+
+    @pytest.mark.asyncio
+    async def test_single_query_with_on_order_quantity(
+        self, inventory_service, mock_db, sample_org, sample_item
+    ):
+        row = MagicMock(
+            InventoryItem=sample_item,
+            total_quantity=Decimal("12.50"),
+            lots_count=2,
+            oldest_expiry=date(2026, 12, 1),
+            quantity_on_order=Decimal("5.00"),
+        )
+        result = MagicMock()
+        result.all.return_value = [row]
+        mock_db.execute = AsyncMock(return_value=result)
+
+        items = await inventory_service.get_items_with_stock(sample_org.id)
+
+        assert items == [
+            {
+                "item": sample_item,
+                "total_quantity": 12.5,
+                "lots_count": 2,
+                "oldest_expiry": date(2026, 12, 1),
+                "quantity_on_order": 5.0,
+            }
+        ]
+        mock_db.execute.assert_awaited_once()
+        sql = str(mock_db.execute.call_args.args[0])
+        assert "purchase_order_items" in sql
+        assert "GROUP BY inventory_lots.item_id" in sql
+
+    @pytest.mark.asyncio
+    async def test_low_stock_filter_is_in_sql(
+        self, inventory_service, mock_db, sample_org
+    ):
+        result = MagicMock()
+        result.all.return_value = []
+        mock_db.execute = AsyncMock(return_value=result)
+
+        await inventory_service.get_items_with_stock(sample_org.id, low_stock_only=True)
+
+        sql = str(mock_db.execute.call_args.args[0])
+        assert "inventory_items.reorder_threshold IS NOT NULL" in sql
+        assert "< inventory_items.reorder_threshold" in sql
@@ -0,0 +1,140 @@
+"""Unit tests for InventorySnapshotService"""
+
+import pytest
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.inventory_item import InventoryCategory, InventoryItem
+from src.app.models.inventory_lot import InventoryLot
+from src.app.models.inventory_transaction import (
+    InventoryTransaction,
+    TransactionReason,
+    TransactionType,
+)
+from src.app.services.inventory_snapshot_service import InventorySnapshotService
+
+
+@pytest.fixture
+def mock_db():
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture
+def item():
+    return InventoryItem(
+        id=uuid4(),
+        organization_id=uuid4(),
+        name="Granule",
+        category=InventoryCategory.FOOD,
+        unit="kg",
+        price_per_unit=Decimal("40.00"),
+        quantity_current=Decimal("7.00"),
+    )
+
+
+def _txn(item, lot, direction, reason, quantity):
+    return InventoryTransaction(
+        id=uuid4(),
+        organization_id=item.organization_id,
+        item_id=item.id,
+        lot_id=lot.id if lot else None,
+        direction=direction,
+        reason=reason,
+        quantity=quantity,
+    )
+
+
+def _compiled(call) -> tuple[str, list[dict]]:
+    """SQL text and the inserted rows (multi-VALUES params are suffixed _m<n>)."""
+    compiled = call.args[0].compile(dialect=postgresql.dialect())
+    rows: dict[int, dict] = {}
+    for name, value in compiled.params.items():
+        column, _, index = name.rpartition("_m")
+        if column and index.isdigit():
+            rows.setdefault(int(index), {})[column] = value
+    return str(compiled), [rows[i] for i in sorted(rows)]
+
+
+class TestRecord:
+    @pytest.mark.asyncio
+    async def test_upserts_item_and_lot_rows(self, mock_db, item):
+        cheap = InventoryLot(id=uuid4(), item_id=item.id, quantity=Decimal("0"), cost_per_unit=Decimal("30.00"))
+        unpriced = InventoryLot(id=uuid4(), item_id=item.id, quantity=Decimal("7.00"))
+        transactions = [
+            _txn(item, cheap, TransactionType.OUT, TransactionReason.CONSUMPTION, 2),
+            _txn(item, unpriced, TransactionType.OUT, TransactionReason.CONSUMPTION, 1),
+        ]
+
+        await InventorySnapshotService(mock_db).record(
+            item, transactions, [cheap, unpriced], day=date(2026, 10, 18)
+        )
+
+        assert mock_db.execute.await_count == 2
+        item_sql, (item_row,) = _compiled(mock_db.execute.call_args_list[0])
+        assert "ON CONFLICT (item_id, snapshot_date) WHERE lot_id IS NULL" in item_sql
+        assert "quantity_out = (inventory_balance_snapshots.quantity_out + excluded.quantity_out)" in item_sql
+        assert "closing_quantity = excluded.closing_quantity" in item_sql
+        assert item_row["lot_id"] is None
+        assert item_row["quantity_out"] == 3
+        assert item_row["consumed_quantity"] == 3
+        # Lot cost where known, item price otherwise
+        assert item_row["consumed_cost"] == 2 * 30 + 1 * 40
+        assert item_row["closing_quantity"] == 7
+
+        lot_sql, lot_rows = _compiled(mock_db.execute.call_args_list[1])
+        assert "ON CONFLICT (lot_id, snapshot_date) WHERE lot_id IS NOT NULL" in lot_sql
+        assert [(r["lot_id"], r["quantity_out"], r["closing_quantity"]) for r in lot_rows] == [
+            (cheap.id, 2, 0),
+            (unpriced.id, 1, 7),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_purchase_without_lot_writes_item_row_only(self, mock_db, item):
+        await InventorySnapshotService(mock_db).record(
+            item, [_txn(item, None, TransactionType.IN, TransactionReason.PURCHASE, 5)]
+        )
+
+        mock_db.execute.assert_awaited_once()
+        _, (row,) = _compiled(mock_db.execute.call_args)
+        assert row["quantity_in"] == 5
+        assert row["consumed_quantity"] == 0
+
+    @pytest.mark.asyncio
+    async def test_no_transactions_is_a_noop(self, mock_db, item):
+        await InventorySnapshotService(mock_db).record(item, [])
+        mock_db.execute.assert_not_called()
+
+
+class TestReads:
+    @pytest.mark.asyncio
+    async def test_stock_at_uses_latest_item_snapshot(self, mock_db):
+        result = MagicMock()
+        result.all.return_value = []
+        mock_db.execute = AsyncMock(return_value=result)
+
+        await InventorySnapshotService(mock_db).stock_at(uuid4(), date(2026, 3, 31))
+
+        sql = str(mock_db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "DISTINCT ON (inventory_balance_snapshots.item_id)" in sql
+        assert "inventory_balance_snapshots.lot_id IS NULL" in sql
+        assert "inventory_balance_snapshots.snapshot_date <=" in sql
+
+    @pytest.mark.asyncio
+    async def test_monthly_consumption_filters_by_date_range(self, mock_db):
+        result = MagicMock()
+        result.all.return_value = []
+        mock_db.execute = AsyncMock(return_value=result)
+
+        await InventorySnapshotService(mock_db).monthly_consumption(uuid4(), 2026)
+
+        stmt = mock_db.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        # Range predicates (index-friendly), not EXTRACT(year ...) = :year
+        assert "EXTRACT(year" not in sql
+        assert date(2026, 1, 1) in params.values()
+        assert date(2027, 1, 1) in params.values()
@@ -0,0 +1,92 @@
+"""Unit tests for kennel placement checks"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.services.kennel_service import (
+    CapacityError,
+    InvalidStateError,
+    NotFoundError,
+    lock_kennel_for_placement,
+)
+
+ORG_ID = uuid4()
+
+
+@pytest.fixture
+def mock_db():
+    return AsyncMock(spec=AsyncSession)
+
+
+def _kennel(**overrides):
+    values = dict(
+        id=uuid4(),
+        status="available",
+        capacity=4,
+        capacity_rules=None,
+        maintenance_start_at=None,
+        maintenance_end_at=None,
+    )
+    return SimpleNamespace(**{**values, **overrides})
+
+
+def _results(mock_db, kennel, occupied=0):
+    kennel_result = MagicMock()
+    kennel_result.scalar_one_or_none.return_value = kennel
+    occupancy_result = MagicMock()
+    occupancy_result.scalar.return_value = occupied
+    mock_db.execute.side_effect = [kennel_result, occupancy_result]
+
+
+async def _place(mock_db, count=1, species="cat"):
+    return await lock_kennel_for_placement(
+        mock_db, organization_id=ORG_ID, kennel_id=uuid4(), species=species, count=count
+    )
+
+
+@pytest.mark.asyncio
+async def test_placement_locks_organizations_live_kennel(mock_db):
+    kennel = _kennel(capacity_rules={"by_species": {"cat": 6}})
+    _results(mock_db, kennel, occupied=2)
+
+    assert await _place(mock_db, count=4) == (kennel, 2, 6)
+
+    sql = str(mock_db.execute.await_args_list[0].args[0].compile(dialect=postgresql.dialect()))
+    assert "kennels.organization_id = %(organization_id_1)s" in sql
+    assert "kennels.deleted_at IS NULL" in sql
+    assert "FOR UPDATE" in sql
+
+
+@pytest.mark.asyncio
+async def test_placement_rejects_count_over_free_capacity(mock_db):
+    _results(mock_db, _kennel(), occupied=2)
+
+    with pytest.raises(CapacityError, match=r"\(2/4\)"):
+        await _place(mock_db, count=3)
+
+
+@pytest.mark.asyncio
+async def test_placement_rejects_unknown_or_unavailable_kennel(mock_db):
+    _results(mock_db, None)
+    with pytest.raises(NotFoundError):
+        await _place(mock_db)
+
+    _results(mock_db, _kennel(status="closed"))
+    with pytest.raises(InvalidStateError):
+        await _place(mock_db)
+
+    now = datetime.now(timezone.utc)
+    _results(
+        mock_db,
+        _kennel(
+            maintenance_start_at=now - timedelta(hours=1),
+            maintenance_end_at=now + timedelta(hours=1),
+        ),
+    )
+    with pytest.raises(InvalidStateError, match="maintenance"):
+        await _place(mock_db)
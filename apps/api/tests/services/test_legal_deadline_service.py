@@ -0,0 +1,139 @@
+"""Unit tests for LegalDeadlineService and the persisted-deadline helpers"""
+
+import pytest
+from datetime import date, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.services.legal_deadline import (
+    compute_animal_legal_deadline,
+    describe_legal_deadline,
+)
+from src.app.services.legal_deadline_service import LegalDeadlineService
+
+
+@pytest.fixture
+def mock_db():
+    db = AsyncMock(spec=AsyncSession)
+    db.get.return_value = None  # no org settings -> legacy rules
+    return db
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _row(notice, stored_at=None, stored_type=None, stored_state=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        legal_notice_published_at=None,
+        legal_finder_claims_ownership=None,
+        legal_municipality_transferred=None,
+        legal_deadline_at=stored_at,
+        legal_deadline_type=stored_type,
+        legal_deadline_state=stored_state,
+        legal_deadline_label=None,
+        legal_deadline_missing_fields=None,
+        intake_date=notice,
+        notice_published_at=notice,
+        finder_claims_ownership=True,
+        municipality_irrevocably_transferred=False,
+    )
+
+
+class TestComputeAnimalLegalDeadline:
+    def test_falls_back_to_animal_fields(self):
+        notice = date.today() - timedelta(days=10)
+        info = compute_animal_legal_deadline(
+            intake_notice_published_at=None,
+            intake_date=None,
+            intake_finder_claims_ownership=None,
+            intake_municipality_transferred=None,
+            animal_notice_published_at=notice,
+            animal_finder_claims_ownership=True,
+            animal_municipality_transferred=None,
+        )
+        assert info.deadline_type == "2m_notice"
+        assert info.deadline_state == "running"
+
+    def test_none_without_notice_date(self):
+        assert compute_animal_legal_deadline(
+            None, date.today(), True, False, None, None, None
+        ) is None
+
+
+class TestDescribeLegalDeadline:
+    def test_dated_deadline_is_recomputed_for_today(self):
+        info = describe_legal_deadline(
+            date.today() - timedelta(days=3), "2m_notice", "running", None
+        )
+        assert info.deadline_state == "expired"
+        assert info.days_left == -3
+
+    def test_undated_deadline_is_returned_as_stored(self):
+        info = describe_legal_deadline(
+            None, "custody", "missing_data", "Chybí startovní datum", ["received_at"]
+        )
+        assert info.days_left is None
+        assert info.label == "Chybí startovní datum"
+        assert info.missing_fields == ["received_at"]
+
+
+class TestRefresh:
+    @pytest.mark.asyncio
+    async def test_writes_only_changed_rows_in_one_update(self, mock_db):
+        notice = date.today() - timedelta(days=10)
+        current = compute_animal_legal_deadline(notice, notice, True, False, None, None, None)
+        unchanged = _row(notice, current.deadline_at, current.deadline_type, "running")
+        stale = _row(notice)
+        result = MagicMock()
+        result.all.return_value = [unchanged, stale]
+        mock_db.execute = AsyncMock(side_effect=[result, MagicMock()])
+
+        updated = await LegalDeadlineService(mock_db).refresh(uuid4())
+
+        assert updated == 1
+        select_call, update_call = mock_db.execute.call_args_list
+        assert "DISTINCT ON (intakes.animal_id)" in _sql(select_call.args[0])
+        params = update_call.args[1]
+        assert [p["id"] for p in params] == [stale.id]
+        assert params[0]["legal_deadline_at"] == current.deadline_at
+        assert params[0]["legal_deadline_label"] is None
+        assert params[0]["legal_deadline_missing_fields"] is None
+
+    @pytest.mark.asyncio
+    async def test_stores_missing_fields_of_undated_deadline(self, mock_db):
+        row = _row(date.today() - timedelta(days=10))
+        row.finder_claims_ownership = row.municipality_irrevocably_transferred = None
+        result = MagicMock()
+        result.all.return_value = [row]
+        mock_db.execute = AsyncMock(side_effect=[result, MagicMock()])
+
+        await LegalDeadlineService(mock_db).refresh(uuid4())
+
+        (params,) = mock_db.execute.call_args_list[1].args[1:]
+        assert params[0]["legal_deadline_state"] == "missing_data"
+        assert params[0]["legal_deadline_missing_fields"] == [
+            "finder_claims_ownership",
+            "municipality_irrevocably_transferred",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_animal_ids_is_a_noop(self, mock_db):
+        assert await LegalDeadlineService(mock_db).refresh(uuid4(), animal_ids=[]) == 0
+        mock_db.execute.assert_not_called()
+
+
+class TestExpireElapsed:
+    @pytest.mark.asyncio
+    async def test_flips_running_deadlines_in_the_past(self, mock_db):
+        mock_db.execute.return_value = MagicMock(rowcount=4)
+
+        assert await LegalDeadlineService(mock_db).expire_elapsed(date(2026, 10, 18)) == 4
+
+        sql = _sql(mock_db.execute.call_args.args[0])
+        assert "UPDATE animals SET legal_deadline_state=" in sql
+        assert "animals.legal_deadline_at <" in sql
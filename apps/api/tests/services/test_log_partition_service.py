@@ -0,0 +1,93 @@
+"""Unit tests for LogPartitionService"""
+
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.services.log_partition_service import (
+    LogPartitionService,
+    add_months,
+    parse_partition_month,
+    partition_name,
+)
+
+
+@pytest.fixture
+def mock_db():
+    return AsyncMock(spec=AsyncSession)
+
+
+def _executed_sql(mock_db) -> list[str]:
+    return [str(call.args[0]) for call in mock_db.execute.call_args_list]
+
+
+class TestPartitionHelpers:
+    def test_add_months_wraps_year(self):
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_partition_name_roundtrip(self):
+        name = partition_name("audit_logs", date(2026, 3, 1))
+        assert name == "audit_logs_p2026_03"
+        assert parse_partition_month("audit_logs", name) == date(2026, 3, 1)
+
+    def test_parse_ignores_foreign_names(self):
+        assert parse_partition_month("audit_logs", "login_logs_p2026_03") is None
+        assert parse_partition_month("audit_logs", "audit_logs_default") is None
+
+
+class TestLogPartitionService:
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_table(self, mock_db):
+        svc = LogPartitionService(mock_db)
+        with pytest.raises(ValueError):
+            await svc.ensure_future_partitions("animals")
+
+    @pytest.mark.asyncio
+    async def test_ensure_future_partitions_creates_missing_only(self, mock_db):
+        svc = LogPartitionService(mock_db)
+        svc.list_partitions = AsyncMock(return_value=["audit_logs_p2026_10"])
+
+        created = await svc.ensure_future_partitions(
+            "audit_logs", months_ahead=2, today=date(2026, 10, 18)
+        )
+
+        assert created == ["audit_logs_p2026_11", "audit_logs_p2026_12"]
+        sql = _executed_sql(mock_db)
+        assert len(sql) == 2
+        assert "FROM ('2026-11-01T00:00:00+00:00') TO ('2026-12-01T00:00:00+00:00')" in sql[0]
+
+    @pytest.mark.asyncio
+    async def test_expire_partitions_drops_whole_months_before_cutoff(self, mock_db):
+        svc = LogPartitionService(mock_db)
+        svc.list_partitions = AsyncMock(
+            return_value=[
+                "login_logs_p2025_08",
+                "login_logs_p2025_09",
+                "login_logs_p2025_10",
+                "login_logs_p2026_10",
+            ]
+        )
+
+        retired = await svc.expire_partitions(
+            "login_logs", retention_months=13, archive=False, today=date(2026, 10, 18)
+        )
+
+        # cutoff = 2025-09-01: only August 2025 ends before it
+        assert retired == ["login_logs_p2025_08"]
+        assert _executed_sql(mock_db) == ['DROP TABLE IF EXISTS "login_logs_p2025_08"']
+
+    @pytest.mark.asyncio
+    async def test_expire_partitions_archive_detaches(self, mock_db):
+        svc = LogPartitionService(mock_db)
+        svc.list_partitions = AsyncMock(return_value=["audit_logs_p2024_01"])
+
+        retired = await svc.expire_partitions(
+            "audit_logs", retention_months=24, archive=True, today=date(2026, 10, 18)
+        )
+
+        assert retired == ["audit_logs_p2024_01"]
+        sql = _executed_sql(mock_db)
+        assert any("DETACH PARTITION" in s for s in sql)
+        assert not any(s.startswith("DROP") for s in sql)
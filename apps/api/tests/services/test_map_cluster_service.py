@@ -0,0 +1,117 @@
+"""Unit tests for the map viewport clustering"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.services.map_cluster_service import (
+    BoundingBox,
+    MapSource,
+    encode_geohash,
+    precision_for_zoom,
+    viewport,
+)
+
+SOURCE = MapSource(
+    from_clause="places p",
+    lat="p.lat",
+    lng="p.lng",
+    geohash="p.geohash",
+    id="p.id",
+    point_columns="p.id, p.name",
+    point_joins="LEFT JOIN owners o ON o.id = p.owner_id",
+    where="p.org_id = :org_id",
+    point_order="p.name",
+)
+
+
+@pytest.fixture
+def mock_db():
+    return AsyncMock(spec=AsyncSession)
+
+
+def _result(rows):
+    result = MagicMock()
+    result.all.return_value = [MagicMock(_mapping=row) for row in rows]
+    return result
+
+
+def _executed(mock_db):
+    stmt, params = mock_db.execute.call_args.args
+    return " ".join(str(stmt).split()), params
+
+
+class TestGeohash:
+    def test_known_value(self):
+        assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+    def test_prefix_of_longer_hash(self):
+        assert encode_geohash(50.08, 14.42).startswith(encode_geohash(50.08, 14.42, 5))
+        assert len(encode_geohash(50.08, 14.42)) == 12
+
+    def test_precision_for_zoom(self):
+        assert precision_for_zoom(0) == 1
+        assert precision_for_zoom(13) == 7
+        assert precision_for_zoom(40) == 12
+
+    def test_enclosing_geohash_contains_all_corners(self):
+        box = BoundingBox(south=50.0, west=14.3, north=50.15, east=14.6)
+        prefix = box.enclosing_geohash()
+        assert prefix
+        for lat in (box.south, box.north):
+            for lng in (box.west, box.east):
+                assert encode_geohash(lat, lng).startswith(prefix)
+
+    def test_enclosing_geohash_across_antimeridian(self):
+        box = BoundingBox(south=-20.0, west=170.0, north=-10.0, east=-170.0)
+        assert box.crosses_antimeridian
+        assert box.enclosing_geohash() == ""
+
+
+class TestViewport:
+    @pytest.mark.asyncio
+    async def test_clusters_below_points_zoom(self, mock_db):
+        mock_db.execute.return_value = _result(
+            [{"geohash": "u2fk", "count": 3, "lat": 50.1, "lng": 14.4, "id": None}]
+        )
+        box = BoundingBox(south=50.0, west=14.3, north=50.15, east=14.6)
+
+        data = await viewport(mock_db, SOURCE, box, zoom=8, params={"org_id": "x"})
+
+        sql, params = _executed(mock_db)
+        assert "GROUP BY 1" in sql
+        assert "left(p.geohash, :precision)" in sql
+        assert "LEFT JOIN owners" not in sql
+        assert "p.geohash LIKE :geohash_prefix" in sql
+        assert params["precision"] == 4
+        assert params["geohash_prefix"] == box.enclosing_geohash() + "%"
+        assert params["org_id"] == "x"
+        assert data["precision"] == 4
+        assert data["clusters"][0]["count"] == 3
+        assert data["points"] == []
+
+    @pytest.mark.asyncio
+    async def test_points_at_street_zoom_are_capped(self, mock_db):
+        mock_db.execute.return_value = _result([{"id": i, "name": str(i)} for i in range(4)])
+        box = BoundingBox(south=50.08, west=14.41, north=50.09, east=14.43)
+
+        data = await viewport(mock_db, SOURCE, box, zoom=16, max_points=3)
+
+        sql, params = _executed(mock_db)
+        assert "LEFT JOIN owners" in sql
+        assert "ORDER BY p.name LIMIT :limit" in sql
+        assert params["limit"] == 4
+        assert len(data["points"]) == 3
+        assert data["truncated"] is True
+        assert data["clusters"] == []
+
+    @pytest.mark.asyncio
+    async def test_antimeridian_box_uses_or_without_prefix(self, mock_db):
+        mock_db.execute.return_value = _result([])
+        box = BoundingBox(south=-20.0, west=170.0, north=-10.0, east=-170.0)
+
+        await viewport(mock_db, SOURCE, box, zoom=5)
+
+        sql, params = _executed(mock_db)
+        assert "(p.lng >= :west OR p.lng <= :east)" in sql
+        assert "geohash_prefix" not in params
@@ -0,0 +1,120 @@
+"""Unit tests for the downsampled measurement series"""
+
+import random
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.services.measurement_series_service import (
+    METRICS,
+    MeasurementSeriesService,
+    bucket_query,
+    lttb,
+)
+
+ORG_ID = uuid4()
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _points(count, rng):
+    return [(START + timedelta(hours=i), rng.uniform(2, 40)) for i in range(count)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_lttb_keeps_ends_order_and_size(seed):
+    rng = random.Random(seed)
+    points = _points(rng.randrange(3, 2000), rng)
+    threshold = rng.randrange(3, 200)
+
+    sampled = lttb(points, threshold)
+
+    assert len(sampled) == min(threshold, len(points))
+    assert sampled[0] == points[0] and sampled[-1] == points[-1]
+    assert [t for t, _ in sampled] == sorted({t for t, _ in sampled})
+    assert set(sampled) <= set(points)
+
+
+def test_lttb_keeps_spike():
+    points = [(START + timedelta(days=i), 10.0) for i in range(100)]
+    points[57] = (points[57][0], 30.0)
+
+    assert points[57] in lttb(points, 10)
+
+
+def test_lttb_returns_short_series_unchanged():
+    points = _points(5, random.Random(0))
+
+    assert lttb(points, 10) == points
+    assert lttb(points, 5) == points
+
+
+def test_lttb_threshold_two_keeps_only_ends():
+    points = _points(5, random.Random(0))
+
+    assert lttb(points, 2) == [points[0], points[-1]]
+
+
+def test_bucket_query_aggregates_in_one_statement():
+    stmt = bucket_query(
+        METRICS["weight"], ORG_ID, [uuid4(), uuid4()], START, START + timedelta(days=10), 3600.0
+    )
+
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "floor((EXTRACT(epoch FROM animal_weight_logs.measured_at)" in sql
+    assert "avg(CAST(animal_weight_logs.weight_kg AS FLOAT))" in sql
+    assert "JOIN animals ON animals.id = animal_weight_logs.animal_id" in sql
+    assert "animals.organization_id = " in sql
+    assert "GROUP BY animal_weight_logs.animal_id, bucket" in sql
+
+
+def _db(rows):
+    mock_db = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    result.all.return_value = rows
+    mock_db.execute.return_value = result
+    return mock_db
+
+
+@pytest.mark.asyncio
+async def test_series_avg_groups_buckets_per_animal():
+    rex, max_, empty = uuid4(), uuid4(), uuid4()
+    rows = [
+        SimpleNamespace(animal_id=rex, t=START, value=10.5, min=10.0, max=11.0, count=2),
+        SimpleNamespace(animal_id=rex, t=START, value=12.0, min=12.0, max=12.0, count=1),
+        SimpleNamespace(animal_id=max_, t=START, value=30.0, min=30.0, max=30.0, count=1),
+    ]
+    mock_db = _db(rows)
+
+    result = await MeasurementSeriesService(mock_db).series(
+        ORG_ID, [rex, max_, empty], "weight", START, START + timedelta(days=100), 100
+    )
+
+    mock_db.execute.assert_awaited_once()
+    assert result["bucket_seconds"] == 86400.0
+    assert [(s["animal_id"], s["total"], len(s["points"])) for s in result["series"]] == [
+        (rex, 3, 2),
+        (max_, 1, 1),
+        (empty, 0, 0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_series_lttb_downsamples_each_animal():
+    rex, micka = uuid4(), uuid4()
+    rng = random.Random(1)
+    rows = [SimpleNamespace(animal_id=rex, measured_at=t, value=v) for t, v in _points(500, rng)]
+    rows += [SimpleNamespace(animal_id=micka, measured_at=t, value=v) for t, v in _points(4, rng)]
+    mock_db = _db(rows)
+
+    result = await MeasurementSeriesService(mock_db).series(
+        ORG_ID, [rex, micka], "bcs", START, START + timedelta(days=30), 50, method="lttb"
+    )
+
+    mock_db.execute.assert_awaited_once()
+    assert result["bucket_seconds"] is None
+    assert [(s["total"], len(s["points"])) for s in result["series"]] == [(500, 50), (4, 4)]
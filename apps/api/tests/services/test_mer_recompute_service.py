@@ -0,0 +1,164 @@
+"""Unit tests for the batch MER calculator and the stored MER recompute"""
+
+import random
+
+import pytest
+from types import SimpleNamespace
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.animal import AgeGroup, AlteredStatus, Species
+from src.app.services.mer_calculator import (
+    BREED_SIZE_FACTORS,
+    ENVIRONMENT_FACTORS,
+    HEALTH_FACTORS,
+    WEIGHT_GOAL_FACTORS,
+    calculate_mer,
+    calculate_mer_batch,
+)
+from src.app.services.mer_recompute_service import (
+    MerRecomputeService,
+    mer_kcal_per_day,
+    update_statement,
+)
+
+SPECIES = [s.value for s in Species]
+ALTERED = [a.value for a in AlteredStatus] + ["bogus"]
+AGE_GROUPS = [a.value for a in AgeGroup] + ["bogus"]
+
+
+def _sample(rng: random.Random) -> dict:
+    return {
+        "weight_kg": rng.choice([0.05, 0.5, 1, 4.2, 12.75, 33.3, 80, rng.uniform(0.1, 90)]),
+        "species": rng.choice(SPECIES),
+        "altered_status": rng.choice(ALTERED),
+        "age_group": rng.choice(AGE_GROUPS),
+        "bcs": rng.choice([None, 0, 10] + list(range(1, 10))),
+        "health_modifier": rng.choice(list(HEALTH_FACTORS) + ["bogus"]),
+        "environment": rng.choice(list(ENVIRONMENT_FACTORS) + ["bogus"]),
+        "breed_size": rng.choice(list(BREED_SIZE_FACTORS) + ["bogus"]),
+        "weight_goal": rng.choice(list(WEIGHT_GOAL_FACTORS) + ["bogus"]),
+    }
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_matches_scalar_on_random_samples(seed):
+    rng = random.Random(seed)
+    samples = [_sample(rng) for _ in range(400)]
+
+    batch = calculate_mer_batch(
+        weights_kg=[s["weight_kg"] for s in samples],
+        species=[s["species"] for s in samples],
+        altered_statuses=[s["altered_status"] for s in samples],
+        age_groups=[s["age_group"] for s in samples],
+        bcs=[s["bcs"] for s in samples],
+        health_modifiers=[s["health_modifier"] for s in samples],
+        environments=[s["environment"] for s in samples],
+        breed_sizes=[s["breed_size"] for s in samples],
+        weight_goals=[s["weight_goal"] for s in samples],
+    )
+
+    scalar = [calculate_mer(**s)["mer_kcal"] for s in samples]
+    assert batch == scalar
+
+
+def test_batch_defaults_and_missing_weights():
+    batch = calculate_mer_batch(
+        weights_kg=[10, None, 0, -1],
+        species=["dog"] * 4,
+        altered_statuses=["neutered"] * 4,
+        age_groups=["adult"] * 4,
+    )
+
+    expected = calculate_mer(
+        weight_kg=10,
+        species="dog",
+        altered_status="neutered",
+        age_group="adult",
+        bcs=None,
+        health_modifier="healthy",
+        environment="indoor",
+        breed_size="unknown",
+        weight_goal="maintain",
+    )["mer_kcal"]
+    assert batch == [expected, None, None, None]
+
+
+def _animal(**overrides):
+    values = {
+        "weight_current_kg": 4,
+        "species": Species.CAT,
+        "altered_status": AlteredStatus.SPAYED,
+        "age_group": AgeGroup.ADULT,
+        "bcs": 7,
+        "is_lactating": False,
+        "is_pregnant": False,
+        "is_critical": False,
+        "is_cancer": False,
+        "is_diabetic": False,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_stored_mer_uses_bcs_and_health_flags():
+    healthy, pregnant, no_weight = mer_kcal_per_day(
+        [_animal(), _animal(is_pregnant=True, is_critical=True), _animal(weight_current_kg=None)]
+    )
+
+    rer = 70 * 4**0.75
+    assert healthy == round(rer * 1.2 * 0.85)
+    assert pregnant == round(rer * 1.2 * 0.85 * 1.5)  # pregnancy outranks critical
+    assert no_weight is None
+
+
+def test_update_statement_joins_values_list():
+    stmt = update_statement([(uuid4(), 250), (uuid4(), None)])
+
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE animals SET mer_kcal_per_day=mer_values.mer")
+    assert "FROM (VALUES" in sql
+    assert "AS mer_values (id, mer)" in sql
+    assert "WHERE animals.id = mer_values.id" in sql
+
+
+def _row(mer, **overrides):
+    row = _animal(**overrides)
+    row.id = uuid4()
+    row.mer_kcal_per_day = mer
+    return row
+
+
+@pytest.mark.asyncio
+async def test_recompute_pages_by_id_and_writes_only_changes():
+    current = mer_kcal_per_day([_animal()])[0]
+    first = [_row(current), _row(None)]
+    second = [_row(current - 1)]
+    mock_db = AsyncMock(spec=AsyncSession)
+    executed = []
+
+    async def execute(stmt, *args, **kwargs):
+        executed.append(stmt)
+        result = MagicMock()
+        if stmt.is_select:
+            result.all.return_value = [first, second][len([s for s in executed if s.is_select]) - 1]
+        return result
+
+    mock_db.execute.side_effect = execute
+
+    changed = await MerRecomputeService(mock_db).recompute(batch_size=2)
+
+    assert changed == 2
+    selects = [s for s in executed if s.is_select]
+    updates = [s for s in executed if s.is_dml]
+    assert len(selects) == 2
+    second_sql = str(selects[1].compile(dialect=postgresql.dialect()))
+    assert "animals.id > " in second_sql
+    assert "animals.deleted_at IS NULL" in second_sql
+    assert len(updates) == 2
+    # Page 1: only the row without a stored value; page 2: the stale value
+    written = [set(u.compile().params.values()) for u in updates]
+    assert written[0] == {first[1].id, current}
+    assert written[1] == {second[0].id, current}
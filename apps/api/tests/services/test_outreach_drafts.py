@@ -0,0 +1,140 @@
+"""Unit tests for outreach draft generation, with a fake Claude client"""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.outreach import OutreachEmail
+from src.app.services.outreach_drafts import (
+    DraftGenerator,
+    DraftTarget,
+    prompt_hash,
+    render_prompt,
+)
+
+
+class FakeMessages:
+    def __init__(self, fail_for=()):
+        self.fail_for = set(fail_for)
+        self.prompts = []
+        self.in_flight = self.peak = 0
+
+    async def create(self, model, max_tokens, messages):
+        prompt = messages[0]["content"]
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if any(name in prompt for name in self.fail_for):
+            raise TimeoutError("model timed out")
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=f" Dobrý den, {len(self.prompts)} ")],
+            usage=SimpleNamespace(input_tokens=100, output_tokens=50),
+        )
+
+
+def _campaign():
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        subject_template="Nabídka pro {shelter_name}",
+        body_template="Napiš email pro {shelter_name} ({shelter_region}, {shelter_species})",
+    )
+
+
+def _shelter(name, region="Jihomoravský kraj"):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        name=name,
+        region=region,
+        address="Adresa",
+        website=None,
+        accepts_dogs=True,
+        accepts_cats=False,
+    )
+
+
+def _session_factory():
+    db = AsyncMock(spec=AsyncSession)
+    db.add = MagicMock()
+    db.scalar.return_value = 3
+
+    @asynccontextmanager
+    async def factory():
+        yield db
+
+    return factory, db
+
+
+def test_prompt_hash_changes_with_shelter_fields_and_template():
+    campaign = _campaign()
+    shelter = _shelter("Útulek A")
+    key = prompt_hash("m", *render_prompt(campaign, shelter))
+
+    assert key == prompt_hash("m", *render_prompt(campaign, shelter))
+    assert key != prompt_hash("m", *render_prompt(campaign, _shelter("Útulek A", "Praha")))
+    campaign.body_template += " krátce"
+    assert key != prompt_hash("m", *render_prompt(campaign, shelter))
+
+
+@pytest.mark.asyncio
+async def test_generates_in_parallel_and_commits_each_draft():
+    factory, db = _session_factory()
+    messages = FakeMessages(fail_for=["Útulek C"])
+    generator = DraftGenerator(factory, SimpleNamespace(messages=messages), _campaign())
+    targets = [DraftTarget(_shelter(f"Útulek {c}")) for c in "ABCD"]
+
+    stats = await generator.run(targets, concurrency=2)
+
+    assert messages.peak == 2
+    assert (stats.generated, stats.failed) == (3, 1)
+    assert stats.errors == {"TimeoutError": 1}
+    assert stats.input_tokens == 300
+    added = [call.args[0] for call in db.add.call_args_list]
+    assert all(isinstance(email, OutreachEmail) for email in added)
+    assert sorted(email.status for email in added) == ["draft", "draft", "draft", "pending"]
+    assert all(email.prompt_hash for email in added if email.status == "draft")
+    # one commit per shelter + the total_targets update
+    assert db.commit.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_regenerate_skips_unchanged_drafts():
+    factory, db = _session_factory()
+    messages = FakeMessages()
+    campaign = _campaign()
+    generator = DraftGenerator(factory, SimpleNamespace(messages=messages), campaign)
+    unchanged, changed = _shelter("Útulek A"), _shelter("Útulek B")
+    targets = [
+        DraftTarget(unchanged, uuid.uuid4(), prompt_hash(generator.model, *render_prompt(campaign, unchanged))),
+        DraftTarget(changed, uuid.uuid4(), "stale"),
+    ]
+
+    stats = await generator.run(targets, concurrency=4)
+
+    assert (stats.generated, stats.unchanged) == (1, 1)
+    assert len(messages.prompts) == 1 and "Útulek B" in messages.prompts[0]
+    db.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_template_error_is_recorded_as_failure():
+    factory, db = _session_factory()
+    messages = FakeMessages()
+    campaign = _campaign()
+    campaign.subject_template = "Nabídka pro {shelter_nmae}"
+    generator = DraftGenerator(factory, SimpleNamespace(messages=messages), campaign)
+
+    stats = await generator.run([DraftTarget(_shelter("Útulek A"))], concurrency=1)
+
+    assert (stats.generated, stats.failed) == (0, 1)
+    assert stats.errors == {"KeyError": 1}
+    assert messages.prompts == []
+    (email,) = [call.args[0] for call in db.add.call_args_list]
+    assert email.status == "pending"
+    assert "shelter_nmae" in email.error_message
@@ -0,0 +1,175 @@
+"""Unit tests for the outreach sender, against a local Resend stand-in server"""
+
+import json
+import threading
+import uuid
+from contextlib import asynccontextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.services.outreach_sender import (
+    OutreachSender,
+    ResendClient,
+    claim_statement,
+    idempotency_key,
+)
+from src.app.services.web_crawler import TokenBucket
+
+
+class _Resend(BaseHTTPRequestHandler):
+    requests: list = []
+    fail_first_with: int | None = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append((self.path, self.headers.get("Idempotency-Key"), body))
+        if self.fail_first_with and len(self.requests) == 1:
+            status, data = self.fail_first_with, {"message": "slow down"}
+        elif body and isinstance(body, dict) and body["to"] == ["invalid@"]:
+            status, data = 422, {"message": "invalid to"}
+        elif self.path == "/emails/batch":
+            status, data = 200, {"data": [{"id": f"msg-{i}"} for i in range(len(body))]}
+        else:
+            status, data = 200, {"id": "msg-single"}
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def resend_url():
+    _Resend.requests = []
+    _Resend.fail_first_with = None
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Resend)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _client(http, url):
+    return ResendClient(http, "key", TokenBucket(1000, 10), base_url=url, retry_backoff=(0, 0))
+
+
+def _email(address="shelter@example.cz"):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        status="approved",
+        generated_subject="Hello",
+        generated_body="Body",
+        shelter=SimpleNamespace(name="Shelter", email=address),
+        sent_at=None,
+        resend_message_id=None,
+        error_message=None,
+    )
+
+
+def _session_factory(claims):
+    """Session whose claim queries return ``claims`` one after another."""
+    db = AsyncMock(spec=AsyncSession)
+    results = []
+    for emails in claims:
+        result = MagicMock()
+        result.scalars.return_value = emails
+        results.append(result)
+    empty = MagicMock()
+    empty.scalars.return_value = []
+
+    def execute(stmt, *args, **kwargs):
+        if not stmt.is_select:
+            return MagicMock()
+        return results.pop(0) if results else empty
+
+    db.execute.side_effect = execute
+
+    @asynccontextmanager
+    async def begin():
+        yield
+
+    db.begin = begin
+
+    @asynccontextmanager
+    async def factory():
+        yield db
+
+    return factory, db
+
+
+@pytest.mark.asyncio
+async def test_retries_rate_limited_send_with_same_idempotency_key(resend_url):
+    _Resend.fail_first_with = 429
+    async with httpx.AsyncClient() as http:
+        message_id = await _client(http, resend_url).send({"to": ["a@b.cz"]}, "key-1")
+
+    assert message_id == "msg-single"
+    assert [(path, key) for path, key, _ in _Resend.requests] == [
+        ("/emails", "key-1"),
+        ("/emails", "key-1"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(resend_url):
+    async with httpx.AsyncClient() as http:
+        with pytest.raises(httpx.HTTPStatusError):
+            await _client(http, resend_url).send({"to": ["invalid@"]}, "key-2")
+    assert len(_Resend.requests) == 1
+
+
+def test_claim_skips_locked_rows():
+    sql = str(claim_statement(uuid.uuid4(), 10, {uuid.uuid4()}).compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE OF outreach_emails SKIP LOCKED" in sql
+    assert "NOT IN" in sql
+
+
+def test_idempotency_key_ignores_order():
+    a, b = uuid.uuid4(), uuid.uuid4()
+    assert idempotency_key([a, b]) == idempotency_key([b, a])
+
+
+def test_single_send_is_keyed_by_email_id():
+    email_id = uuid.uuid4()
+    assert idempotency_key([email_id]) == f"outreach-{email_id}"
+
+
+@pytest.mark.asyncio
+async def test_batch_send_marks_emails_sent_and_skips_missing_addresses(resend_url):
+    emails = [_email(), _email(None), _email()]
+    factory, db = _session_factory([emails])
+    campaign = SimpleNamespace(id=uuid.uuid4(), from_email="info@pets-log.com", reply_to=None)
+
+    async with httpx.AsyncClient() as http:
+        sender = OutreachSender(factory, _client(http, resend_url), campaign, batch_size=10)
+        stats = await sender.run(limit=100, concurrency=1)
+
+    assert (stats.sent, stats.skipped_no_email, stats.failed) == (2, 1, 0)
+    assert [e.status for e in emails] == ["sent", "skipped", "sent"]
+    assert [e.resend_message_id for e in (emails[0], emails[2])] == ["msg-0", "msg-1"]
+    assert len(_Resend.requests) == 1 and _Resend.requests[0][0] == "/emails/batch"
+
+
+@pytest.mark.asyncio
+async def test_failed_send_stays_approved(resend_url):
+    email = _email("invalid@")
+    factory, db = _session_factory([[email]])
+    campaign = SimpleNamespace(id=uuid.uuid4(), from_email="info@pets-log.com", reply_to=None)
+
+    async with httpx.AsyncClient() as http:
+        stats = await OutreachSender(factory, _client(http, resend_url), campaign).run(10, 2)
+
+    assert stats.failed == 1
+    assert email.status == "approved"
+    assert "422" in email.error_message
+    assert email.id in stats.attempted
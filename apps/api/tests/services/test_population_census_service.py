@@ -0,0 +1,179 @@
+"""Unit tests for PopulationCensusService"""
+
+import pytest
+from datetime import date, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.services.population_census_service import PopulationCensusService
+
+TODAY = date(2026, 10, 18)
+
+
+@pytest.fixture
+def mock_db():
+    return AsyncMock(spec=AsyncSession)
+
+
+def _result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def _state(last_closed, today=TODAY):
+    result = MagicMock()
+    result.one.return_value = SimpleNamespace(today=today, last_closed=last_closed)
+    return result
+
+
+class TestDailyCounts:
+    @pytest.mark.asyncio
+    async def test_closed_days_from_snapshots_and_today_live(self, mock_db):
+        snapshots = _result(
+            [
+                SimpleNamespace(snapshot_date=TODAY - timedelta(days=2), count=12),
+                SimpleNamespace(snapshot_date=TODAY - timedelta(days=1), count=14),
+            ]
+        )
+        live = _result(
+            [
+                SimpleNamespace(day=TODAY, species="dog", status="available", count=9),
+                SimpleNamespace(day=TODAY, species="cat", status="intake", count=6),
+            ]
+        )
+        mock_db.execute = AsyncMock(
+            side_effect=[_state(TODAY - timedelta(days=1)), snapshots, live]
+        )
+
+        counts = await PopulationCensusService(mock_db).daily_counts(uuid4(), 7)
+
+        assert counts == [
+            {"date": "2026-10-16", "count": 12},
+            {"date": "2026-10-17", "count": 14},
+            {"date": "2026-10-18", "count": 15},
+        ]
+        state_sql, snapshot_sql = (
+            str(c.args[0].compile(dialect=postgresql.dialect()))
+            for c in mock_db.execute.call_args_list[:2]
+        )
+        assert "CURRENT_DATE" in state_sql
+        assert "FROM animal_population_snapshots" in snapshot_sql
+        assert "GROUP BY animal_population_snapshots.snapshot_date" in snapshot_sql
+        live_params = mock_db.execute.call_args_list[2].args[1]
+        assert live_params["start"] == live_params["end"] == TODAY
+
+    @pytest.mark.asyncio
+    async def test_days_after_last_snapshot_are_counted_live(self, mock_db):
+        # The nightly run has not closed the last two days yet
+        live = _result(
+            [
+                SimpleNamespace(day=TODAY - timedelta(days=2), species="dog", status="available", count=4),
+                SimpleNamespace(day=TODAY - timedelta(days=1), species="dog", status="available", count=5),
+                SimpleNamespace(day=TODAY - timedelta(days=1), species="cat", status="intake", count=1),
+            ]
+        )
+        mock_db.execute = AsyncMock(
+            side_effect=[
+                _state(TODAY - timedelta(days=3)),
+                _result([SimpleNamespace(snapshot_date=TODAY - timedelta(days=3), count=3)]),
+                live,
+            ]
+        )
+
+        counts = await PopulationCensusService(mock_db).daily_counts(uuid4(), 7, today=TODAY)
+
+        assert counts == [
+            {"date": "2026-10-15", "count": 3},
+            {"date": "2026-10-16", "count": 4},
+            {"date": "2026-10-17", "count": 6},
+        ]
+        live_params = mock_db.execute.call_args_list[2].args[1]
+        assert (live_params["start"], live_params["end"]) == (TODAY - timedelta(days=2), TODAY)
+
+    @pytest.mark.asyncio
+    async def test_without_snapshots_the_whole_range_is_live(self, mock_db):
+        mock_db.execute = AsyncMock(side_effect=[_state(None), _result([])])
+
+        assert await PopulationCensusService(mock_db).daily_counts(uuid4(), 7, today=TODAY) == []
+        live_params = mock_db.execute.call_args_list[1].args[1]
+        assert (live_params["start"], live_params["end"]) == (TODAY - timedelta(days=6), TODAY)
+
+
+class TestClosePending:
+    @pytest.mark.asyncio
+    async def test_closes_only_missing_days(self, mock_db):
+        yesterday = TODAY - timedelta(days=1)
+        caught_up, behind, new, empty = uuid4(), uuid4(), uuid4(), uuid4()
+        mock_db.execute = AsyncMock(
+            return_value=_result(
+                [
+                    SimpleNamespace(id=caught_up, last_closed=yesterday, first_intake=date(2020, 1, 1)),
+                    SimpleNamespace(id=behind, last_closed=TODAY - timedelta(days=4), first_intake=date(2020, 1, 1)),
+                    SimpleNamespace(id=new, last_closed=None, first_intake=date(2016, 5, 2)),
+                    SimpleNamespace(id=empty, last_closed=None, first_intake=None),
+                ]
+            )
+        )
+        service = PopulationCensusService(mock_db)
+        service.close_days = AsyncMock(return_value=3)
+
+        assert await service.close_pending(until=yesterday) == 6
+
+        assert [c.args for c in service.close_days.call_args_list] == [
+            (behind, TODAY - timedelta(days=3), yesterday),
+            (new, date(2016, 5, 2), yesterday),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_closes_up_to_the_databases_yesterday(self, mock_db):
+        org_id = uuid4()
+        today = MagicMock()
+        today.scalar_one.return_value = TODAY
+        orgs = _result([SimpleNamespace(id=org_id, last_closed=None, first_intake=date(2026, 1, 1))])
+        mock_db.execute = AsyncMock(side_effect=[today, orgs])
+        service = PopulationCensusService(mock_db)
+        service.close_days = AsyncMock(return_value=0)
+
+        await service.close_pending()
+
+        assert "CURRENT_DATE" in str(
+            mock_db.execute.call_args_list[0].args[0].compile(dialect=postgresql.dialect())
+        )
+        service.close_days.assert_awaited_once_with(
+            org_id, date(2026, 1, 1), TODAY - timedelta(days=1)
+        )
+
+    @pytest.mark.asyncio
+    async def test_rebuild_starts_from_first_intake(self, mock_db):
+        org_id = uuid4()
+        mock_db.execute = AsyncMock(
+            return_value=_result(
+                [SimpleNamespace(id=org_id, last_closed=TODAY, first_intake=date(2018, 3, 1))]
+            )
+        )
+        service = PopulationCensusService(mock_db)
+        service.close_days = AsyncMock(return_value=0)
+
+        await service.close_pending(until=TODAY - timedelta(days=1), rebuild=True)
+
+        service.close_days.assert_awaited_once_with(
+            org_id, date(2018, 3, 1), TODAY - timedelta(days=1)
+        )
+
+
+class TestCloseDays:
+    @pytest.mark.asyncio
+    async def test_rewrites_range_with_insert_select(self, mock_db):
+        mock_db.execute = AsyncMock(side_effect=[MagicMock(), MagicMock(rowcount=42)])
+
+        rows = await PopulationCensusService(mock_db).close_days(uuid4(), TODAY, TODAY)
+
+        assert rows == 42
+        delete_sql, insert_sql = (str(c.args[0]) for c in mock_db.execute.call_args_list)
+        assert "DELETE FROM animal_population_snapshots" in delete_sql
+        assert "INSERT INTO animal_population_snapshots" in insert_sql
+        assert "generate_series" in insert_sql
@@ -0,0 +1,171 @@
+"""Unit tests for the org-scoped read cache"""
+
+import pytest
+from uuid import uuid4
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.app.core import read_cache as read_cache_module
+from src.app.core.read_cache import (
+    LRUBackend,
+    ReadCache,
+    _bump_versions,
+    _collect_changes,
+    _discard_changes,
+    cached_read,
+)
+from src.app.models.breed import Breed
+from src.app.models.organization import Organization
+from src.app.models.tag import Tag
+from src.app.perf.cache import CacheMetrics
+
+ORG_ID = uuid4()
+
+
+class Clock:
+    now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_backend_evicts_oldest_and_expires():
+    clock = Clock()
+    metrics = CacheMetrics()
+    backend = LRUBackend(max_entries=2, ttl_seconds=10, metrics=metrics, clock=clock)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.get("a") == 1  # "b" is now the least recently used
+    backend.set("c", 3)
+
+    assert backend.get("b") is read_cache_module._MISSING
+    assert (backend.get("a"), backend.get("c")) == (1, 3)
+    assert metrics.evictions == 1
+
+    clock.now = 10
+    assert backend.get("a") is read_cache_module._MISSING
+    assert len(backend) == 1
+
+
+def _cache():
+    metrics = CacheMetrics()
+    return ReadCache(LRUBackend(100, 300, metrics=metrics), metrics=metrics)
+
+
+def _endpoint(cache, resource="tags", **kwargs):
+    calls = []
+
+    @cached_read(resource, cache=cache, **kwargs)
+    async def list_things(q=None, **dependencies):
+        calls.append(q)
+        return [{"q": q, "n": len(calls)}]
+
+    return list_things, calls
+
+
+@pytest.mark.asyncio
+async def test_cached_read_serves_hits_until_version_bump():
+    cache = _cache()
+    endpoint, calls = _endpoint(cache)
+
+    first = await endpoint(session=object(), organization_id=ORG_ID, q="a")
+    again = await endpoint(session=object(), organization_id=ORG_ID, q="a")
+    assert again is first
+    await endpoint(organization_id=ORG_ID, q="b")
+    await endpoint(organization_id=uuid4(), q="a")
+    assert len(calls) == 3
+
+    cache.bump(uuid4(), ["tags"])  # another organization
+    await endpoint(organization_id=ORG_ID, q="a")
+    assert len(calls) == 3
+
+    cache.bump(ORG_ID, ["tags"])
+    fresh = await endpoint(organization_id=ORG_ID, q="a")
+    assert fresh is not first and len(calls) == 4
+
+    snapshot = cache.metrics.snapshot()
+    assert snapshot["resources"]["tags"]["hits"] == 2
+    assert snapshot["resources"]["tags"]["misses"] == 4
+    assert snapshot["hit_rate"] == round(2 / 6, 4)
+
+
+@pytest.mark.asyncio
+async def test_global_bump_invalidates_every_organization():
+    cache = _cache()
+    endpoint, calls = _endpoint(cache, resource="document_templates", org_param="x_org")
+    org = str(uuid4())
+
+    await endpoint(x_org=org)
+    await endpoint(x_org=org)
+    cache.bump(None, ["document_templates"])
+    await endpoint(x_org=org)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_read_disabled(monkeypatch):
+    monkeypatch.setattr(read_cache_module.settings, "READ_CACHE_ENABLED", False)
+    endpoint, calls = _endpoint(_cache())
+
+    await endpoint(organization_id=ORG_ID)
+    await endpoint(organization_id=ORG_ID)
+
+    assert len(calls) == 2
+
+
+def _persistent(session: Session, obj):
+    make_transient_to_detached(obj)
+    session.add(obj)
+    return obj
+
+
+def _versions(monkeypatch):
+    cache = _cache()
+    monkeypatch.setattr(read_cache_module, "read_cache", cache)
+    return cache
+
+
+def test_flush_hook_buffers_and_commit_bumps(monkeypatch):
+    cache = _versions(monkeypatch)
+    other_org = uuid4()
+    session = Session()
+    session.add(Tag(id=uuid4(), organization_id=ORG_ID, name="new"))
+    edited = _persistent(session, Tag(id=uuid4(), organization_id=other_org, name="old"))
+    edited.name = "renamed"
+    session.delete(
+        _persistent(session, Breed(id=uuid4(), species="dog", name="x", translations=[]))
+    )
+    _persistent(session, Tag(id=uuid4(), organization_id=uuid4(), name="untouched"))
+
+    _collect_changes(session, None)
+    assert cache.version(ORG_ID, "tags") == (0, 0)  # nothing before the commit
+
+    _bump_versions(session)
+    assert cache.version(ORG_ID, "tags") == (1, 0)
+    assert cache.version(other_org, "tags") == (1, 0)
+    assert cache.version(uuid4(), "breeds") == (0, 1)
+    assert cache.version(uuid4(), "tags") == (0, 0)
+
+
+def test_organization_row_bumps_its_settings(monkeypatch):
+    cache = _versions(monkeypatch)
+    session = Session()
+    org = _persistent(session, Organization(id=ORG_ID, name="Shelter", slug="shelter"))
+    org.settings = {"legal": {}}
+
+    _collect_changes(session, None)
+    _bump_versions(session)
+
+    assert cache.version(ORG_ID, "org_settings") == (1, 0)
+
+
+def test_rollback_discards_buffered_changes(monkeypatch):
+    cache = _versions(monkeypatch)
+    session = Session()
+    session.add(Tag(id=uuid4(), organization_id=ORG_ID, name="new"))
+    _collect_changes(session, None)
+
+    _discard_changes(session, session.get_transaction())
+    _bump_versions(session)
+
+    assert cache.version(ORG_ID, "tags") == (0, 0)
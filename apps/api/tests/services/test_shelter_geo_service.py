@@ -0,0 +1,160 @@
+"""Unit tests for the registered-shelter geo lookups"""
+
+import random
+import pytest
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.services import shelter_geo_service
+from src.app.services.shelter_geo_service import (
+    ShelterGeoIndex,
+    ShelterGeoService,
+    ShelterPoint,
+    bounding_box,
+    distance_km,
+    nearest,
+)
+
+
+@pytest.fixture
+def mock_db():
+    return AsyncMock(spec=AsyncSession)
+
+
+def _shelters(rng, n, lat_range=(48.5, 51.1), lng_range=(12.0, 18.9)):
+    """Shelter rows as the details query returns them."""
+    return [
+        {
+            "id": uuid4(),
+            "name": f"Shelter {i}",
+            "address": "Address",
+            "lat": rng.uniform(*lat_range),
+            "lng": rng.uniform(*lng_range),
+            "accepts_dogs": rng.choice([True, False, None]),
+            "accepts_cats": rng.choice([True, False, None]),
+            "phone": None,
+            "website": None,
+        }
+        for i in range(n)
+    ]
+
+
+def _accepts(row, species):
+    return species is None or row[f"accepts_{species}s"] is True
+
+
+def _index(shelters):
+    return ShelterGeoIndex([ShelterPoint(s["id"], s["lat"], s["lng"]) for s in shelters])
+
+
+def _via_index(index, shelters, lat, lng, radius_km, species=None, limit=None):
+    """The index path: candidates, their rows (species filtered), exact filter."""
+    by_id = {s["id"]: s for s in shelters}
+    rows = [
+        by_id[i] for i in index.candidates(lat, lng, radius_km) if _accepts(by_id[i], species)
+    ]
+    return [(r["distance_km"], r["id"]) for r in nearest(rows, lat, lng, radius_km, limit)]
+
+
+def _brute_force(shelters, lat, lng, radius_km, species=None, limit=None):
+    """The original query: distance for every row, filter, order."""
+    rows = []
+    for s in shelters:
+        if not _accepts(s, species):
+            continue
+        d = distance_km(lat, lng, s["lat"], s["lng"])
+        if d <= radius_km:
+            rows.append((d, s["id"]))
+    rows.sort()
+    return rows[:limit] if limit else rows
+
+
+class TestShelterGeoIndex:
+    def test_matches_full_scan(self):
+        rng = random.Random(7)
+        shelters = _shelters(rng, 2000)
+        index = _index(shelters)
+        for _ in range(200):
+            lat, lng = rng.uniform(48.5, 51.1), rng.uniform(12.0, 18.9)
+            radius = rng.choice([1, 5, 25, 100, 400])
+            species = rng.choice([None, "dog", "cat"])
+            limit = rng.choice([None, 1, 10])
+            got = _via_index(index, shelters, lat, lng, radius, species, limit)
+            assert got == _brute_force(shelters, lat, lng, radius, species, limit)
+
+    def test_matches_full_scan_worldwide(self):
+        rng = random.Random(11)
+        shelters = _shelters(rng, 500, lat_range=(-89.9, 89.9), lng_range=(-180, 180))
+        index = _index(shelters)
+        for _ in range(100):
+            lat, lng = rng.uniform(-89.9, 89.9), rng.uniform(-180, 180)
+            radius = rng.choice([100, 2000, 20000])
+            got = _via_index(index, shelters, lat, lng, radius)
+            assert got == _brute_force(shelters, lat, lng, radius)
+
+    def test_empty_index(self):
+        assert ShelterGeoIndex([]).candidates(50.0, 14.4, 25) == []
+
+
+class TestBoundingBox:
+    def test_contains_every_point_within_radius(self):
+        rng = random.Random(3)
+        for _ in range(2000):
+            lat, lng = rng.uniform(-80, 80), rng.uniform(-170, 170)
+            radius = rng.uniform(0.1, 300)
+            box = bounding_box(lat, lng, radius)
+            if box is None:
+                continue
+            plat, plng = rng.uniform(box[0] - 1, box[1] + 1), rng.uniform(box[2] - 1, box[3] + 1)
+            if distance_km(lat, lng, plat, plng) <= radius:
+                assert box[0] <= plat <= box[1] and box[2] <= plng <= box[3]
+
+    def test_no_box_across_pole_or_antimeridian(self):
+        assert bounding_box(89.9, 14.0, 50) is None
+        assert bounding_box(50.0, 179.9, 50) is None
+
+
+class TestShelterGeoService:
+    @pytest.mark.asyncio
+    async def test_sql_path_uses_bounding_box_and_limit(self, mock_db, monkeypatch):
+        monkeypatch.setattr(shelter_geo_service.settings, "SHELTER_GEO_INDEX_TTL_SECONDS", 0)
+        result = MagicMock()
+        result.all.return_value = []
+        mock_db.execute.return_value = result
+
+        await ShelterGeoService(mock_db).nearby(50.08, 14.43, 25, "dog", limit=5)
+
+        stmt, params = mock_db.execute.call_args.args
+        sql = str(stmt)
+        assert "lat BETWEEN :min_lat AND :max_lat" in sql
+        assert "accepts_dogs = true" in sql
+        assert "ORDER BY distance_km, id" in sql
+        assert params["limit"] == 5
+        assert params["min_lat"] < 50.08 < params["max_lat"]
+
+    @pytest.mark.asyncio
+    async def test_index_is_loaded_once_and_invalidated(self, mock_db, monkeypatch):
+        monkeypatch.setattr(shelter_geo_service.settings, "SHELTER_GEO_INDEX_TTL_SECONDS", 600)
+        shelter_geo_service.invalidate_shelter_geo_index()
+        shelter = _shelters(random.Random(1), 1)[0]
+        points = MagicMock()
+        points.all.return_value = [(shelter["id"], shelter["lat"], shelter["lng"])]
+        details = MagicMock()
+        details.all.return_value = [MagicMock(_mapping={**shelter, "phone": "+420 1"})]
+        mock_db.execute.side_effect = [points, details, details, points, details]
+        service = ShelterGeoService(mock_db)
+
+        first = await service.nearby(shelter["lat"], shelter["lng"], 1, "dog")
+        await service.nearby(shelter["lat"], shelter["lng"], 1)
+        # The index is loaded once; details are read for every lookup
+        assert mock_db.execute.await_count == 3
+        assert [(row["id"], row["phone"]) for row in first] == [(shelter["id"], "+420 1")]
+        stmt, params = mock_db.execute.await_args_list[1].args
+        assert "id = ANY(:ids)" in str(stmt) and "accepts_dogs = true" in str(stmt)
+        assert params == {"ids": [shelter["id"]]}
+
+        shelter_geo_service.invalidate_shelter_geo_index()
+        await service.nearby(shelter["lat"], shelter["lng"], 1)
+        assert mock_db.execute.await_count == 5
+        shelter_geo_service.invalidate_shelter_geo_index()
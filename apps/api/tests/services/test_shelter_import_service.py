@@ -0,0 +1,87 @@
+"""Unit tests for the registered-shelters CSV import"""
+
+import io
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.services.shelter_import_service import (
+    ShelterImportService,
+    parse_dms_to_decimal,
+    parse_rows,
+)
+
+HEADER = '"registrační číslo","název","adresa","kraj","druh činnosti","kapacita","GPS","datum registrace"\n'
+ROW = (
+    '"CZ 81C05153","Kočka pro tebe z.s.","Prokopa Velikého 260/17, 70300 Ostrava",'
+    '"Moravskoslezský kraj","útulek","kočka 120","49°48\'49.582""N,18°16\'17.731""E","22.10.2025"\n'
+)
+MISSING_NAME = '"CZ 1","","Adresa","Kraj","","","",""\n'
+
+
+@pytest.fixture
+def mock_db():
+    return AsyncMock(spec=AsyncSession)
+
+
+def test_parse_dms_to_decimal():
+    lat, lng = parse_dms_to_decimal('49°48\'49.582"N,18°16\'17.731"E')
+    assert lat == pytest.approx(49.813773, abs=1e-6)
+    assert lng == pytest.approx(18.271592, abs=1e-6)
+    assert parse_dms_to_decimal("") == (None, None)
+
+
+def test_parse_rows_skips_rows_without_name():
+    import csv
+
+    errors = []
+    records = list(parse_rows(csv.DictReader(io.StringIO(HEADER + ROW + MISSING_NAME)), errors))
+
+    assert len(records) == 1
+    seq, reg_number, name, *_, reg_date = records[0]
+    assert (seq, reg_number, name) == (2, "CZ 81C05153", "Kočka pro tebe z.s.")
+    assert reg_date == date(2025, 10, 22)
+    assert errors == [
+        {"row": 3, "error": "Missing required fields (registration_number or name)"}
+    ]
+
+
+
+def test_parse_rows_reports_values_too_long_for_their_column():
+    import csv
+
+    too_long = f'"CZ 2","{"x" * 256}","Adresa","Kraj","","","",""\n'
+    errors = []
+    records = list(parse_rows(csv.DictReader(io.StringIO(HEADER + too_long + ROW)), errors))
+
+    assert [r[1] for r in records] == ["CZ 81C05153"]
+    assert errors == [{"row": 2, "error": "Value too long for name (max 255)"}]
+
+@pytest.mark.asyncio
+async def test_import_copies_in_batches_and_merges_once(mock_db):
+    summary_row = MagicMock(_mapping={"inserted": 2, "updated": 1, "unchanged": 0})
+    result = MagicMock()
+    result.one.return_value = summary_row
+    mock_db.execute.return_value = result
+    svc = ShelterImportService(mock_db)
+    csv_text = HEADER + ROW * 3 + MISSING_NAME
+
+    with patch.object(svc, "_copy", new=AsyncMock()) as copy:
+        summary = await svc.import_csv(io.StringIO(csv_text), batch_size=2)
+
+    assert [len(call.args[0]) for call in copy.await_args_list] == [2, 1]
+    # staging table, truncate, merge
+    assert mock_db.execute.await_count == 3
+    assert summary["inserted"] == 2
+    assert summary["imported"] == 3
+    assert summary["skipped"] == 1
+    mock_db.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_missing_columns(mock_db):
+    with pytest.raises(ValueError, match="kraj"):
+        await ShelterImportService(mock_db).import_csv(
+            io.StringIO('"registrační číslo","název","adresa"\n')
+        )
@@ -0,0 +1,150 @@
+"""Unit tests for request coalescing (single flight)"""
+
+import asyncio
+
+import pytest
+from uuid import uuid4
+from unittest.mock import AsyncMock
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core import single_flight
+from src.app.core.single_flight import SingleFlight, coalesce_requests, flight_key
+
+ORG_ID = uuid4()
+
+
+def _endpoint(group: SingleFlight):
+    @coalesce_requests(group=group)
+    async def kennels_board(
+        zone_id=None, status=None, organization_id=None, db=None, current_user=None
+    ):
+        await db.execute("SELECT kennels")
+        await asyncio.sleep(0.01)
+        await db.execute("SELECT animals")
+        return {"zone_id": zone_id, "status": status}
+
+    return kennels_board
+
+
+def _burst(endpoint, count, **params):
+    """``count`` concurrent requests, each with its own session."""
+    sessions = [AsyncMock(spec=AsyncSession) for _ in range(count)]
+    calls = [
+        endpoint(organization_id=ORG_ID, db=db, current_user=object(), **params)
+        for db in sessions
+    ]
+    return sessions, asyncio.gather(*calls)
+
+
+def _queries(sessions) -> int:
+    return sum(db.execute.await_count for db in sessions)
+
+
+@pytest.mark.asyncio
+async def test_burst_of_identical_requests_runs_queries_once():
+    group = SingleFlight()
+    sessions, burst = _burst(_endpoint(group), 50, zone_id="A")
+
+    results = await burst
+
+    assert _queries(sessions) == 2
+    assert all(r == {"zone_id": "A", "status": None} for r in results)
+    assert (group.stats.leaders, group.stats.followers) == (1, 49)
+    assert group.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_burst_without_coalescing_runs_queries_per_request(monkeypatch):
+    monkeypatch.setattr(single_flight.settings, "REQUEST_COALESCING_ENABLED", False)
+    sessions, burst = _burst(_endpoint(SingleFlight()), 50, zone_id="A")
+
+    await burst
+
+    assert _queries(sessions) == 100
+
+
+@pytest.mark.asyncio
+async def test_different_params_or_orgs_do_not_share():
+    group = SingleFlight()
+    endpoint = _endpoint(group)
+    db = AsyncMock(spec=AsyncSession)
+
+    await asyncio.gather(
+        endpoint(organization_id=ORG_ID, db=db, zone_id="A"),
+        endpoint(organization_id=ORG_ID, db=db, zone_id="B"),
+        endpoint(organization_id=uuid4(), db=db, zone_id="A"),
+    )
+
+    assert group.stats.leaders == 3
+    # Sequential identical calls run again; nothing is cached
+    await endpoint(organization_id=ORG_ID, db=db, zone_id="A")
+    assert group.stats.leaders == 4
+
+
+def test_flight_key_ignores_dependencies_and_normalizes():
+    key = flight_key(
+        "e", ORG_ID, {"types": ["b", "a"], "db": object(), "q": None}, ["db"]
+    )
+
+    assert key == flight_key("e", ORG_ID, {"q": None, "types": ["a", "b"]}, ["db"])
+
+
+@pytest.mark.asyncio
+async def test_leader_error_is_raised_in_followers():
+    group = SingleFlight()
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        *(group.do("k", failing) for _ in range(5)), return_exceptions=True
+    )
+
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert group.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_hands_over_to_follower():
+    group = SingleFlight()
+    runs = 0
+
+    async def compute():
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.02)
+        return runs
+
+    leader = asyncio.create_task(group.do("k", compute))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(group.do("k", compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_cancelled_follower_does_not_cancel_flight():
+    group = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    leader = asyncio.create_task(group.do("k", compute))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(group.do("k", compute))
+    await asyncio.sleep(0)
+    follower.cancel()
+
+    assert await leader == "ok"
+    with pytest.raises(asyncio.CancelledError):
+        await follower
@@ -0,0 +1,88 @@
+"""Unit tests for VaccinationService"""
+
+import pytest
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.schemas.animal_passport import VaccinationExpirationSummary
+from src.app.services.vaccination_service import VaccinationService
+
+TODAY = date(2026, 10, 18)
+
+
+@pytest.fixture
+def mock_db():
+    return AsyncMock(spec=AsyncSession)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _vaccination(valid_until: date):
+    return SimpleNamespace(
+        id=uuid4(),
+        animal_id=uuid4(),
+        vaccination_type="rabies",
+        administered_at=datetime(2025, 10, 1, 9, 0, tzinfo=timezone.utc),
+        valid_until=valid_until,
+        animal_name="Rex",
+        public_code="A-001",
+    )
+
+
+class TestExpirySummary:
+    @pytest.mark.asyncio
+    async def test_counts_and_upcoming_come_from_sql(self, mock_db):
+        counts = MagicMock()
+        counts.one.return_value = SimpleNamespace(total=40, expired=3, within_14=2, within_30=5)
+        expiring = MagicMock()
+        expiring.all.return_value = [_vaccination(date(2026, 10, 25))]
+        expired = MagicMock()
+        expired.all.return_value = [_vaccination(date(2026, 9, 1))]
+        mock_db.execute = AsyncMock(side_effect=[counts, expiring, expired])
+
+        summary = await VaccinationService(mock_db).expiry_summary(uuid4(), 14, today=TODAY)
+
+        parsed = VaccinationExpirationSummary(**summary)
+        assert parsed.total_vaccinations == 40
+        assert parsed.expiring_within_14_days == 2
+        assert parsed.expiring_within_30_days == 5
+        assert parsed.expired == 3
+        assert [(v.status, v.days_until_expiration) for v in parsed.upcoming] == [
+            ("expiring_soon", 7),
+            ("expired", -47),
+        ]
+        assert parsed.upcoming[0].administered_at == date(2025, 10, 1)
+
+        count_sql, expiring_sql, expired_sql = (
+            _sql(c.args[0]) for c in mock_db.execute.call_args_list
+        )
+        assert "count(*) FILTER (WHERE animal_vaccinations.valid_until <" in count_sql
+        assert "animal_vaccinations.organization_id =" in count_sql
+        assert "animal_vaccinations.valid_until BETWEEN" in expiring_sql
+        assert "LIMIT" in expired_sql
+
+
+class TestRevaccinationTasks:
+    @pytest.mark.asyncio
+    async def test_single_insert_select_skips_existing(self, mock_db):
+        result = MagicMock()
+        result.all.return_value = [(uuid4(),), (uuid4(),)]
+        mock_db.execute = AsyncMock(return_value=result)
+
+        created = await VaccinationService(mock_db).create_revaccination_tasks(14, today=TODAY)
+
+        assert created == 2
+        mock_db.execute.assert_awaited_once()
+        sql = _sql(mock_db.execute.call_args.args[0])
+        assert sql.startswith("INSERT INTO tasks")
+        assert "SELECT gen_random_uuid()" in sql
+        assert "ON CONFLICT DO NOTHING" in sql
+        # Superseded by a newer vaccination of the same type
+        assert "NOT (EXISTS (SELECT animal_vaccinations_1.id" in sql
+        assert "animals.deleted_at IS NULL" in sql
@@ -0,0 +1,155 @@
+"""Unit tests for the enrichment crawler, against a local HTTP stand-in server"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from src.app.services.web_crawler import (
+    AsyncCrawler,
+    Checkpoint,
+    HostRateLimiter,
+    PageCache,
+    run_pool,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits: dict = {}
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        hits = self.hits[path] = self.hits.get(path, 0) + 1
+        if path == "/page":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = "<a href='tel:+420777123456'>Volejte</a>".encode()
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+        elif path == "/flaky" and hits == 1:
+            self.send_response(503)
+            self.end_headers()
+            return
+        elif path == "/flaky":
+            body = b"ok"
+            self.send_response(200)
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    _Handler.hits = {}
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _crawler(client, cache=None, max_age=0):
+    return AsyncCrawler(
+        client, HostRateLimiter(1000, 10), cache=cache, max_age=max_age, retry_backoff=(0, 0, 0)
+    )
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_reuses_cached_page(server, tmp_path):
+    cache = PageCache(str(tmp_path))
+    async with httpx.AsyncClient() as client:
+        first = await _crawler(client, cache).fetch(f"{server}/page")
+        # New crawler on the same cache directory: a later run
+        second = await _crawler(client, cache).fetch(f"{server}/page")
+
+    assert not first.from_cache and first.etag == '"v1"'
+    assert second.from_cache and second.text == first.text
+    assert _Handler.hits["/page"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fresh_cached_page_is_not_requested(server, tmp_path):
+    cache = PageCache(str(tmp_path))
+    async with httpx.AsyncClient() as client:
+        crawler = _crawler(client, cache, max_age=3600)
+        await crawler.fetch(f"{server}/page")
+        page = await crawler.fetch(f"{server}/page")
+
+    assert page.from_cache
+    assert _Handler.hits["/page"] == 1
+    assert crawler.stats["cache_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_server_errors_but_not_404(server):
+    async with httpx.AsyncClient() as client:
+        crawler = _crawler(client)
+        flaky = await crawler.fetch(f"{server}/flaky")
+        missing = await crawler.fetch(f"{server}/missing")
+
+    assert flaky.text == "ok"
+    assert missing is None
+    assert _Handler.hits == {"/flaky": 2, "/missing": 1}
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_is_per_host():
+    limiter = HostRateLimiter(rate=20, burst=1)
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire("http://a.example/x") for _ in range(4)))
+    same_host = time.monotonic() - start
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire(f"http://h{i}.example/") for i in range(4)))
+    other_hosts = time.monotonic() - start
+
+    assert same_host >= 0.14  # 3 waits of 50 ms after the first token
+    assert other_hosts < 0.05
+
+
+@pytest.mark.asyncio
+async def test_run_pool_bounds_concurrency():
+    in_flight = peak = 0
+    seen = []
+
+    async def worker(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if item == 3:
+            raise RuntimeError("boom")
+        seen.append(item)
+
+    await run_pool(range(10), worker, concurrency=3)
+
+    assert peak == 3
+    assert sorted(seen) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+
+
+def test_checkpoint_resumes(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    checkpoint = Checkpoint(path, every=2)
+    checkpoint.mark("search", "a")
+    checkpoint.mark("search", "b")  # flushed
+    checkpoint.mark("scrape", "c")  # not yet flushed
+
+    assert Checkpoint(path).done("search") == {"a", "b"}
+    assert Checkpoint(path).done("scrape") == set()
+    checkpoint.save()
+    assert Checkpoint(path).done("scrape") == {"c"}
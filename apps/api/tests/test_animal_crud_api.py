@@ -543,6 +543,33 @@ async def test_delete_animal_soft(
     assert animal.deleted_at is not None
 
 
+async def test_status_counters_follow_create_update_delete(
+    client, auth_headers, test_org_with_write_permission
+):
+    org, _, _ = test_org_with_write_permission
+    headers = {**auth_headers, "x-organization-id": str(org.id)}
+    create_resp = await client.post(
+        "/animals",
+        json={"name": "Counted", "species": "dog"},
+        headers=headers,
+    )
+    animal_id = create_resp.json()["id"]
+
+    counts = (await client.get("/animals/stats/counts", headers=headers)).json()
+    assert counts["total"] == 1
+    assert counts["intake"] == 1
+    assert counts["by_species"] == {"dog": 1}
+
+    await client.patch(f"/animals/{animal_id}", json={"status": "available"}, headers=headers)
+    counts = (await client.get("/animals/stats/counts", headers=headers)).json()
+    assert (counts["intake"], counts["available"]) == (0, 1)
+
+    await client.delete(f"/animals/{animal_id}", headers=headers)
+    counts = (await client.get("/animals/stats/counts", headers=headers)).json()
+    assert counts["total"] == 0
+    assert counts["by_status"] == {}
+
+
 # ---- Audit log ----
 
 
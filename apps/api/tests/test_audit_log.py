@@ -68,3 +68,53 @@ async def test_audit_log_with_before_after(db_session, test_user, test_org_with_
     finally:
         await db_session.execute(delete(AuditLog).where(AuditLog.id == log.id))
         await db_session.commit()
+
+
+async def test_audit_log_written_on_commit_in_one_batch(
+    db_session, test_user, test_org_with_membership
+):
+    org, membership, role = test_org_with_membership
+
+    svc = AuditService(db_session)
+    logs = [
+        await svc.log_action(
+            organization_id=org.id,
+            actor_user_id=test_user.id,
+            action="update",
+            entity_type="task",
+            entity_id=uuid.uuid4(),
+            after={"step": i},
+        )
+        for i in range(5)
+    ]
+    assert svc.pending_count() == 5
+    await db_session.commit()
+    assert svc.pending_count() == 0
+
+    ids = [log.id for log in logs]
+    try:
+        result = await db_session.execute(select(AuditLog).where(AuditLog.id.in_(ids)))
+        assert len(result.scalars().all()) == 5
+    finally:
+        await db_session.execute(delete(AuditLog).where(AuditLog.id.in_(ids)))
+        await db_session.commit()
+
+
+async def test_audit_log_discarded_on_rollback(
+    db_session, test_user, test_org_with_membership
+):
+    org, membership, role = test_org_with_membership
+
+    svc = AuditService(db_session)
+    log = await svc.log_action(
+        organization_id=org.id,
+        actor_user_id=test_user.id,
+        action="delete",
+        entity_type="animal",
+        entity_id=uuid.uuid4(),
+    )
+    await db_session.rollback()
+    assert svc.pending_count() == 0
+
+    result = await db_session.execute(select(AuditLog).where(AuditLog.id == log.id))
+    assert result.scalar_one_or_none() is None
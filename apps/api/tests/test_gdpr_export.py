@@ -0,0 +1,95 @@
+"""GDPR export streaming against a seeded organization.
+
+Seeds one million audit rows with generate_series, so this is slow (tens of
+seconds) and needs a database migrated past a7c1e9d4f2b3.
+"""
+
+import io
+import tracemalloc
+import uuid
+import zipfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import delete, select, text
+
+from src.app.models.audit_log import AuditLog
+from src.app.models.permission import Permission
+from src.app.models.role_permission import RolePermission
+from src.app.services.gdpr_export_service import GdprExportService
+from src.app.services.log_partition_service import LogPartitionService
+from tests.conftest import make_org_headers
+
+pytestmark = pytest.mark.anyio
+
+SEEDED_AUDIT_ROWS = 1_000_000
+
+
+async def _grant_org_manage(db_session, role_id):
+    perm = (
+        await db_session.execute(select(Permission).where(Permission.key == "org.manage"))
+    ).scalar_one_or_none()
+    if perm is None:
+        pytest.skip("org.manage permission is not seeded")
+    db_session.add(RolePermission(role_id=role_id, permission_id=perm.id, allowed=True))
+    await db_session.commit()
+
+
+async def test_export_endpoint_returns_zip_with_four_csvs(
+    client, db_session, auth_headers, test_org_with_membership
+):
+    org, membership, role = test_org_with_membership
+    await _grant_org_manage(db_session, role.id)
+
+    resp = await client.get(
+        "/admin/gdpr/export", headers=make_org_headers(auth_headers, org.id)
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/zip"
+    zf = zipfile.ZipFile(io.BytesIO(resp.content))
+    assert zf.namelist() == ["contacts.csv", "users.csv", "audit_logs.csv", "login_logs.csv"]
+    users_csv = zf.read("users.csv").decode("utf-8-sig")
+    assert str(membership.user_id) in users_csv
+
+
+async def test_export_memory_ceiling_with_million_audit_rows(
+    db_session, test_org_with_membership
+):
+    org, _, _ = test_org_with_membership
+    await LogPartitionService(db_session).ensure_future_partitions("audit_logs")
+    # Spread rows over the last ~11 months so they all fall inside the window
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO audit_logs (id, organization_id, action, entity_type, entity_id,
+                                    ip, user_agent, created_at)
+            SELECT gen_random_uuid(), :org_id, 'update', 'animal', gen_random_uuid(),
+                   '10.0.0.1', 'Mozilla/5.0 (seed)',
+                   now() - (g % 330) * interval '1 day'
+            FROM generate_series(1, :n) AS g
+            """
+        ),
+        {"org_id": org.id, "n": SEEDED_AUDIT_ROWS},
+    )
+    await db_session.commit()
+
+    try:
+        since = datetime.now(timezone.utc) - timedelta(days=365)
+        tracemalloc.start()
+        try:
+            total_bytes = 0
+            async for chunk in GdprExportService(db_session).stream_zip(org.id, since):
+                total_bytes += len(chunk)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # ~1M CSV rows compress to tens of MB; the process never holds more
+        # than a few cursor batches at once.
+        assert total_bytes > 1_000_000
+        assert peak < 64 * 1024 * 1024
+    finally:
+        await db_session.rollback()
+        await db_session.execute(delete(AuditLog).where(AuditLog.organization_id == org.id))
+        await db_session.commit()
@@ -8,6 +8,7 @@ from sqlalchemy import delete, select
 from src.app.core.security import create_access_token
 from src.app.models.animal import Animal
 from src.app.models.intake import Intake, IntakeReason
+from src.app.models.kennel import Kennel
 from src.app.models.organization import Organization
 from src.app.models.role import Role
 from src.app.models.permission import Permission
@@ -331,3 +332,59 @@ async def test_hotel_end_sets_animal_status_to_with_owner(client, intake_env):
     assert animal_resp.status_code == 200
     animal_data = animal_resp.json()
     assert animal_data["status"] == "with_owner"
+
+
+@pytest.mark.anyio
+async def test_bulk_intake_rejects_another_organizations_kennel(
+    client, intake_env, db_session
+):
+    """Animals cannot be placed into a kennel of another tenant."""
+    other_org_id = uuid.uuid4()
+    kennel_id = uuid.uuid4()
+    db_session.add(
+        Organization(id=other_org_id, name="Other Org", slug=f"other-{other_org_id.hex[:8]}")
+    )
+    await db_session.flush()
+    db_session.add(
+        Kennel(
+            id=kennel_id, organization_id=other_org_id,
+            name="Foreign", code="F1", capacity=10,
+            status="available", type="indoor", size_category="medium",
+        )
+    )
+    await db_session.commit()
+    payload = {
+        "count": 3,
+        "name_prefix": "Kotě",
+        "species": "cat",
+        "reason": "found",
+        "intake_date": "2026-10-18",
+    }
+    try:
+        resp = await client.post(
+            "/intakes/bulk",
+            json={**payload, "kennel_id": str(kennel_id)},
+            headers=intake_env["headers"],
+        )
+        assert resp.status_code == 404
+
+        resp = await client.post(
+            "/intakes/bulk",
+            json={**payload, "breed_ids": [str(uuid.uuid4())]},
+            headers=intake_env["headers"],
+        )
+        assert resp.status_code == 400
+
+        db_session.expire_all()
+        created = await db_session.execute(
+            select(Animal.id).where(
+                Animal.organization_id == intake_env["org_id"], Animal.species == "cat"
+            )
+        )
+        assert created.first() is None
+    finally:
+        await db_session.execute(delete(Kennel).where(Kennel.id == kennel_id))
+        await db_session.execute(
+            delete(Organization).where(Organization.id == other_org_id)
+        )
+        await db_session.commit()
@@ -0,0 +1,117 @@
+"""Concurrent FIFO deductions against a single inventory item.
+
+Each completion runs in its own session/connection, so the row locks taken by
+InventoryService are what keeps stock from being oversold.
+"""
+
+import asyncio
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from src.app.models.audit_log import AuditLog
+from src.app.models.inventory_item import InventoryCategory, InventoryItem
+from src.app.models.inventory_lot import InventoryLot
+from src.app.models.inventory_transaction import InventoryTransaction
+from src.app.services.inventory_service import InventoryService
+from tests.conftest import _TestSessionLocal
+
+pytestmark = pytest.mark.anyio
+
+PARALLEL_COMPLETIONS = 50
+GRAMS_PER_COMPLETION = 300  # 0.3 kg; 50 x 0.3 kg = 15 kg > 10 kg in stock
+
+
+async def test_parallel_completions_never_oversell(
+    db_session, test_user, test_org_with_membership
+):
+    org, _, _ = test_org_with_membership
+    item = InventoryItem(
+        id=uuid.uuid4(),
+        organization_id=org.id,
+        name="Concurrency kibble",
+        category=InventoryCategory.FOOD,
+        unit="kg",
+        quantity_current=Decimal("10.00"),
+    )
+    db_session.add(item)
+    await db_session.flush()
+    lots = [
+        InventoryLot(
+            id=uuid.uuid4(),
+            organization_id=org.id,
+            item_id=item.id,
+            lot_number=f"LOT-{i}",
+            expires_at=date.today() + timedelta(days=30 * (i + 1)),
+            quantity=Decimal(qty),
+        )
+        for i, qty in enumerate(["2.50", "3.50", "4.00"])
+    ]
+    db_session.add_all(lots)
+    await db_session.commit()
+
+    async def complete_one() -> bool:
+        async with _TestSessionLocal() as session:
+            try:
+                await InventoryService(session).deduct_for_task(
+                    organization_id=org.id,
+                    item_id=item.id,
+                    amount_g=GRAMS_PER_COMPLETION,
+                    task_id=uuid.uuid4(),
+                    user_id=test_user.id,
+                )
+                await session.commit()
+                return True
+            except ValueError:
+                await session.rollback()
+                return False
+
+    try:
+        outcomes = await asyncio.gather(
+            *(complete_one() for _ in range(PARALLEL_COMPLETIONS))
+        )
+
+        db_session.expire_all()
+        stock = (
+            await db_session.execute(
+                select(InventoryItem.quantity_current).where(InventoryItem.id == item.id)
+            )
+        ).scalar_one()
+        lot_total = (
+            await db_session.execute(
+                select(func.sum(InventoryLot.quantity)).where(InventoryLot.item_id == item.id)
+            )
+        ).scalar_one()
+        deducted = (
+            await db_session.execute(
+                select(func.sum(InventoryTransaction.quantity)).where(
+                    InventoryTransaction.item_id == item.id
+                )
+            )
+        ).scalar_one()
+
+        succeeded = sum(outcomes)
+        # 10 kg / 0.3 kg -> 33 full deductions fit; the 34th finds 0.1 kg and fails
+        assert succeeded == 33
+        assert Decimal(stock) == Decimal("10.00") - Decimal("0.3") * succeeded
+        assert Decimal(lot_total) == Decimal(stock)
+        assert Decimal(deducted) == Decimal("10.00") - Decimal(stock)
+        assert all(
+            q >= 0
+            for q in (
+                await db_session.execute(
+                    select(InventoryLot.quantity).where(InventoryLot.item_id == item.id)
+                )
+            ).scalars()
+        )
+    finally:
+        await db_session.execute(
+            delete(InventoryTransaction).where(InventoryTransaction.item_id == item.id)
+        )
+        await db_session.execute(delete(InventoryLot).where(InventoryLot.item_id == item.id))
+        await db_session.execute(delete(InventoryItem).where(InventoryItem.id == item.id))
+        await db_session.execute(delete(AuditLog).where(AuditLog.organization_id == org.id))
+        await db_session.commit()
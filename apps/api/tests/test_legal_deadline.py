@@ -465,6 +465,43 @@ async def test_update_intake_legal_deadline_fields(client, legal_deadline_env):
     assert animal_data["legal_deadline_type"] == "finder_keeps"
 
 
+@pytest.mark.anyio
+async def test_animal_list_filters_by_legal_deadline_state(client, legal_deadline_env):
+    """The persisted deadline is refreshed on intake create and filterable."""
+    today = date.today()
+
+    await client.post(
+        "/intakes",
+        json={
+            "animal_id": str(legal_deadline_env["animal"].id),
+            "reason": "found",
+            "intake_date": today.isoformat(),
+            "notice_published_at": today.isoformat(),
+            "finder_claims_ownership": True,
+            "municipality_irrevocably_transferred": False,
+        },
+        headers=legal_deadline_env["headers"],
+    )
+
+    running = await client.get(
+        "/animals",
+        params={"legal_deadline_state": "running", "sort_by": "legal_deadline"},
+        headers=legal_deadline_env["headers"],
+    )
+    assert running.status_code == 200
+    ids = [item["id"] for item in running.json()["items"]]
+    assert str(legal_deadline_env["animal"].id) in ids
+
+    expired = await client.get(
+        "/animals",
+        params={"legal_deadline_state": "expired"},
+        headers=legal_deadline_env["headers"],
+    )
+    assert str(legal_deadline_env["animal"].id) not in [
+        item["id"] for item in expired.json()["items"]
+    ]
+
+
 @pytest.mark.anyio
 async def test_missing_legal_deadline_fields_returns_missing_data_state(
     client, legal_deadline_env
@@ -0,0 +1,68 @@
+"""Partition pruning checks for the GDPR export and login-log queries.
+
+Requires a database migrated past a7c1e9d4f2b3 (partitioned audit/login logs).
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+
+from src.app.api.routes.gdpr import GDPR_LOG_WINDOW_DAYS
+from src.app.services.gdpr_export_service import audit_export_query, login_logs_query
+from src.app.services.log_partition_service import LogPartitionService
+
+pytestmark = pytest.mark.anyio
+
+
+async def _scanned_relations(db_session, stmt) -> set[str]:
+    compiled = stmt.compile(
+        dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True}
+    )
+    result = await db_session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+    plan = result.scalar_one()
+
+    relations: set[str] = set()
+
+    def _walk(node):
+        if "Relation Name" in node:
+            relations.add(node["Relation Name"])
+        for child in node.get("Plans", []):
+            _walk(child)
+
+    _walk(plan[0]["Plan"])
+    return relations
+
+
+async def test_ensure_future_partitions_is_idempotent(db_session):
+    svc = LogPartitionService(db_session)
+    await svc.ensure_future_partitions("audit_logs")
+    assert await svc.ensure_future_partitions("audit_logs") == []
+    await db_session.rollback()
+
+
+async def test_audit_export_prunes_old_partitions(db_session):
+    since = datetime.now(timezone.utc) - timedelta(days=GDPR_LOG_WINDOW_DAYS)
+    scanned = await _scanned_relations(
+        db_session, audit_export_query(uuid.uuid4(), since)
+    )
+    partitions = await LogPartitionService(db_session).list_partitions("audit_logs")
+
+    # 12-month window touches at most 13 monthly partitions (+ future ones)
+    assert scanned
+    assert all(name.startswith("audit_logs_p") for name in scanned)
+    old = {p for p in partitions if p < f"audit_logs_p{since.year:04d}_{since.month:02d}"}
+    assert not scanned & old
+
+
+async def test_login_logs_query_prunes_old_partitions(db_session):
+    since = datetime.now(timezone.utc) - timedelta(days=GDPR_LOG_WINDOW_DAYS)
+    scanned = await _scanned_relations(
+        db_session, login_logs_query([uuid.uuid4()], since)
+    )
+    partitions = await LogPartitionService(db_session).list_partitions("login_logs")
+
+    assert scanned
+    old = {p for p in partitions if p < f"login_logs_p{since.year:04d}_{since.month:02d}"}
+    assert not scanned & old
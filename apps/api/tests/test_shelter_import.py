@@ -0,0 +1,97 @@
+"""Registered-shelters CSV import against the database (COPY + merge)."""
+
+import io
+from datetime import date
+
+import pytest
+from sqlalchemy import delete, select
+
+from src.app.models.registered_shelter import RegisteredShelter
+from src.app.services.shelter_import_service import ShelterImportService
+
+pytestmark = pytest.mark.anyio
+
+HEADER = '"registrační číslo","název","adresa","kraj","druh činnosti","kapacita","GPS","datum registrace"\n'
+PREFIX = "CZ TEST"
+
+
+def _row(reg_number: str, name: str, region: str = "Kraj Vysočina") -> str:
+    return (
+        f'"{reg_number}","{name}","Hlavní 1, 58601 Jihlava","{region}","útulek",'
+        '"pes 20","49°24\'0.000""N,15°35\'0.000""E","01.02.2020"\n'
+    )
+
+
+async def test_import_inserts_updates_and_keeps_manual_columns(db_session):
+    await db_session.execute(
+        delete(RegisteredShelter).where(RegisteredShelter.registration_number.like(f"{PREFIX}%"))
+    )
+    db_session.add_all(
+        [
+            RegisteredShelter(
+                registration_number=f"{PREFIX} 1",
+                name="Old name",
+                address="Hlavní 1, 58601 Jihlava",
+                region="Kraj Vysočina",
+                phone="+420 123 456 789",
+            ),
+            RegisteredShelter(
+                registration_number=f"{PREFIX} 2",
+                name="Same",
+                address="Hlavní 1, 58601 Jihlava",
+                region="Kraj Vysočina",
+                activity_type="útulek",
+                capacity="pes 20",
+                lat=49.4,
+                lng=15.583333333333334,
+                registration_date=date(2020, 2, 1),
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    csv_text = (
+        HEADER
+        + _row(f"{PREFIX} 1", "Renamed early")
+        + _row(f"{PREFIX} 2", "Same")
+        + _row(f"{PREFIX} 3", "New shelter")
+        + _row(f"{PREFIX} 1", "Renamed")  # last occurrence wins
+    )
+    try:
+        summary = await ShelterImportService(db_session).import_csv(
+            io.StringIO(csv_text), batch_size=2
+        )
+        await db_session.commit()
+
+        assert (summary["inserted"], summary["updated"], summary["unchanged"]) == (1, 1, 1)
+        assert summary["imported"] == 3
+        assert summary["skipped"] == 0
+
+        db_session.expire_all()
+        shelters = {
+            s.registration_number: s
+            for s in (
+                await db_session.execute(
+                    select(RegisteredShelter).where(
+                        RegisteredShelter.registration_number.like(f"{PREFIX}%")
+                    )
+                )
+            ).scalars()
+        }
+        assert set(shelters) == {f"{PREFIX} 1", f"{PREFIX} 2", f"{PREFIX} 3"}
+        updated = shelters[f"{PREFIX} 1"]
+        assert updated.name == "Renamed"
+        assert updated.capacity == "pes 20"
+        assert updated.registration_date == date(2020, 2, 1)
+        assert updated.phone == "+420 123 456 789"  # maintained by hand
+        inserted = shelters[f"{PREFIX} 3"]
+        assert (inserted.name, inserted.region) == ("New shelter", "Kraj Vysočina")
+        assert inserted.lat == pytest.approx(49.4)
+        assert inserted.lng == pytest.approx(15.583333, abs=1e-6)
+    finally:
+        await db_session.execute(
+            delete(RegisteredShelter).where(
+                RegisteredShelter.registration_number.like(f"{PREFIX}%")
+            )
+        )
+        await db_session.commit()